@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Backfill Cycle/Wheel lookup keys (layer_key, rotation_signature).
+
+Cycles and Wheels committed before these keys existed have neither property,
+so the indexed repository lookups (CycleRepository.find_by_perspectives /
+find_by_layer, WheelRepository.find_by_component_sequence / find_by_layer)
+cannot see them: an existing wheel would be rebuilt instead of reused, and
+layer normalization would skip old wheels.
+
+Keys are derived exactly as at commit time (dialectical_framework.graph.rotation_keys):
+    Cycle.layer_key          = layer_key(perspective_hashes)
+    Cycle.rotation_signature = rotation_signature(perspective_hashes)
+    Wheel.layer_key          = layer_key(parent Cycle perspective_hashes)
+    Wheel.rotation_signature = rotation_signature(component Statement hashes,
+                               read by following the wheel's edge chain)
+
+Both properties are outside the Merkle hash, so setting them leaves every
+node's identity untouched. Schema setup (DialecticalReasoning._ensure_schema)
+runs the same backfill for the whole graph on startup; this script previews
+it, or runs it for one case. A whole-graph run also creates the schema
+indexes if missing.
+
+Safety:
+    - dry-run by default; pass --execute to write
+    - only committed nodes (hash IS NOT NULL) missing a key are touched
+    - --sid limits the run to one Case; omit it to migrate the whole graph
+
+Usage:
+    python scripts/backfill_rotation_keys.py                        # dry run, all cases
+    python scripts/backfill_rotation_keys.py --sid <case-uuid>      # dry run, one case
+    python scripts/backfill_rotation_keys.py --execute              # write
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from dotenv import load_dotenv
+
+from dialectical_framework.graph.rotation_keys import (missing_rotation_keys,
+                                                       write_rotation_keys)
+
+
+def _connect():
+    from dialectical_framework.settings import Settings
+
+    settings = Settings.from_env()
+
+    if settings.graph_db_vendor == "neo4j":
+        from gqlalchemy import Neo4j
+
+        return Neo4j(
+            host=settings.graph_db_host,
+            port=settings.graph_db_port,
+            username=settings.graph_db_username or "",
+            password=settings.graph_db_password or "",
+            encrypted=settings.graph_db_encrypted,
+        )
+
+    from gqlalchemy import Memgraph
+
+    return Memgraph(host=settings.graph_db_host, port=settings.graph_db_port)
+
+
+def main() -> int:
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(
+        description="Backfill layer_key / rotation_signature on Cycles and Wheels."
+    )
+    parser.add_argument(
+        "--sid",
+        type=str,
+        default=None,
+        help="Case ID (sid) to limit the backfill to. Default: every case.",
+    )
+    parser.add_argument(
+        "--execute",
+        action="store_true",
+        help="Actually write. Without this flag the script only reports (dry run).",
+    )
+    args = parser.parse_args()
+
+    db = _connect()
+    cycle_rows, wheel_rows, skipped_wheels = missing_rotation_keys(db, args.sid)
+
+    print(f"Scope: {'sid=' + args.sid if args.sid else 'all cases'}")
+    print(f"  Cycles to backfill: {len(cycle_rows)}")
+    print(f"  Wheels to backfill: {len(wheel_rows)}")
+    if skipped_wheels:
+        print(f"  Wheels SKIPPED (no parent cycle or broken edge chain): {skipped_wheels}")
+
+    if not args.execute:
+        print("\nDry run — nothing written. Re-run with --execute to backfill.")
+        return 0
+
+    if not args.sid:
+        from dialectical_framework.dialectical_reasoning import \
+            DialecticalReasoning
+
+        # Indexes, plus the same backfill over every case
+        DialecticalReasoning._ensure_schema(db)
+
+    write_rotation_keys(db, "Cycle", cycle_rows)
+    write_rotation_keys(db, "Wheel", wheel_rows)
+
+    print(f"\nBackfilled {len(cycle_rows)} cycles and {len(wheel_rows)} wheels.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
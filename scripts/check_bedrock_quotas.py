@@ -190,12 +190,15 @@ def main() -> None:
         print()
         print(f"  Suggested DIALEXITY_MAX_CONCURRENT_LLM_CALLS = {suggested}")
         print(f"    (RPM / 3, assuming ~20s avg response time)")
+        print(f"  Suggested DIALEXITY_LLM_RPM = {int(our_rpm_value)}")
+        if our_tpm_value:
+            print(f"  Suggested DIALEXITY_LLM_TPM = {int(our_tpm_value)}")
         print()
         if our_rpm_value >= 5000:
             print(f"  Your RPM is very high ({our_rpm_value:,.0f}). The semaphore at 40")
             print(f"  is purely for runaway protection — you won't hit RPM limits.")
             print(f"  TPM ({our_tpm_value:,.0f}) is more likely to be your binding constraint" if our_tpm_value else "")
-            print(f"  under heavy parallel load. Rate-limit retry handles this dynamically.")
+            print(f"  under heavy parallel load. The scheduler's adaptive window handles this dynamically.")
     else:
         print("  Could not determine your model's RPM limit.")
         print("  Look at the quotas above and divide RPM by 3.")
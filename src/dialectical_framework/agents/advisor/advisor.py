@@ -17,15 +17,17 @@ from typing import AsyncGenerator, Optional
 
 from pydantic import BaseModel, Field
 
-from dialectical_framework.agents.advisor.system_prompts import \
-    system_prompt
+from dialectical_framework.agents.advisor.system_prompts import (
+    CONTEXT_HEADING, system_prompt)
 from dialectical_framework.agents.agent_context import agent_scope
+from dialectical_framework.graph.graph_session import graph_session
 from dialectical_framework.graph.scope_context import require_current_sid
 from dialectical_framework.agents.conversation_facilitator import \
     ConversationFacilitator
 from dialectical_framework.agents.app_spec import AppSpec, resolve_app_layer
 from dialectical_framework.agents.stream_events import StreamEvent
 from dialectical_framework.agents.toolsets import merge_app_tools
+from dialectical_framework.utils.llm_scheduler import LLMPriority, llm_priority
 
 logger = logging.getLogger(__name__)
 
@@ -157,9 +159,7 @@ class Advisor:
         # lazily on turn 1 (init is sync; resolve() is async). One-shot —
         # the system prompt is static after its first render.
         self._pending_context_render = bool(nexus_hash and not dialectical_context)
-        self._conversation.set_system_prompt(
-            self._build_system_prompt(app_preamble, dialectical_context)
-        )
+        self._set_system_prompt(app_preamble, dialectical_context)
 
     @staticmethod
     def _validate_nexus(nexus_hash: str) -> None:
@@ -169,6 +169,20 @@ class Advisor:
         if NexusRepository().find_by_hash_prefix(nexus_hash) is None:
             raise ValueError(f"Nexus not found: {nexus_hash}")
 
+    def _set_system_prompt(
+        self,
+        app_preamble: Optional[str] = None,
+        dialectical_context: Optional[str] = None,
+    ) -> None:
+        prompt = self._build_system_prompt(app_preamble, dialectical_context)
+        # Preamble + engine prompt come first and are cached on their own:
+        # a context re-render (or another conversation on the same app)
+        # reuses that prefix; only the Current Understanding dump is re-read.
+        stable = prompt.find(f"\n\n{CONTEXT_HEADING}\n")
+        self._conversation.set_system_prompt(
+            prompt, cache_prefix=stable if stable > 0 else None
+        )
+
     def _build_system_prompt(
         self,
         app_preamble: Optional[str] = None,
@@ -195,14 +209,14 @@ class Advisor:
 
     async def chat(self, user_message: str) -> str:
         require_current_sid()  # unscoped turns silently drop all work
-        with agent_scope(self.AGENT_NAME):
+        with agent_scope(self.AGENT_NAME), graph_session(), llm_priority(LLMPriority.INTERACTIVE):
             await self._render_pending_context()
             result = await self._conversation.submit(ChatResponse, user_message)
             return result.message
 
     async def chat_stream(self, user_message: str) -> AsyncGenerator[StreamEvent, None]:
         require_current_sid()  # unscoped turns silently drop all work
-        with agent_scope(self.AGENT_NAME):
+        with agent_scope(self.AGENT_NAME), graph_session(), llm_priority(LLMPriority.INTERACTIVE):
             await self._render_pending_context()
             async for event in self._conversation.submit_stream(
                 ChatResponse, user_message
@@ -226,9 +240,7 @@ class Advisor:
             context = await DialecticalContext(
                 nexus_hash=self._nexus_hash
             ).resolve()
-            self._conversation.set_system_prompt(
-                self._build_system_prompt(self._app_preamble, context)
-            )
+            self._set_system_prompt(self._app_preamble, context)
             self._pending_context_render = False
         except ValueError:
             # Nexus disappeared — not transient, don't retry forever.
@@ -778,7 +778,11 @@ don't re-filter.
    new vs what you already knew — don't re-present old insights as new
    discoveries."""
 
-_CONTEXT_SLOT = """## Current Understanding
+# The per-nexus dump is the LAST section: everything above it is a stable,
+# provider-cacheable prefix (see Advisor._set_system_prompt)
+CONTEXT_HEADING = "## Current Understanding"
+
+_CONTEXT_SLOT = CONTEXT_HEADING + """
 
 {dialectical_context}"""
 
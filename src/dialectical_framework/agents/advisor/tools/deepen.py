@@ -25,7 +25,10 @@ from typing import Annotated
 from mirascope import llm
 from pydantic import Field
 
+from dialectical_framework.utils.llm_scheduler import LLMPriority, with_llm_priority
 
+
+@with_llm_priority(LLMPriority.BACKGROUND)
 async def run_deepen(wheel_hash: str) -> str:
     """
     Shared deepen body: generate transformations for the wheel, then
@@ -17,6 +17,7 @@ from mirascope import llm
 from pydantic import Field
 
 from dialectical_framework.protocols.has_config import SettingsAware
+from dialectical_framework.utils.llm_scheduler import LLMPriority, with_llm_priority
 
 # The Advisor's explore is LAZY and budgeted: every valid wheel is built and
 # estimated (structural, cheap), but the expensive stage — transformations +
@@ -47,6 +48,7 @@ class _ExploreBudget(SettingsAware):
         return self.settings.advisor_max_perspectives_per_exploration
 
 
+@with_llm_priority(LLMPriority.BACKGROUND)
 async def run_exploration(
     perspective_hashes: list[str],
     intent: str,
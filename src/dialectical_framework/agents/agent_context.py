@@ -15,13 +15,26 @@ Read usage (inside ExecutionReport, EffectLogger):
     from dialectical_framework.agents.agent_context import get_current_agent
 
     agent = get_current_agent()  # "analyst" or None
+
+Every agent_scope also profiles the graph queries issued inside it
+(`scope.queries`) and tracks LLM prompt-cache usage (`scope.prompt_cache`);
+the summaries are logged at debug level and attached to the active Langfuse
+span, if any.
 """
 
 from __future__ import annotations
 
 import contextvars
+import logging
+from contextlib import ExitStack
 from typing import Optional
 
+from dialectical_framework.graph.query_profiler import (QueryProfile, profile_queries,
+                                                      publish_queries)
+from dialectical_framework.utils.prompt_cache import PromptCacheUsage, track_prompt_cache
+
+logger = logging.getLogger(__name__)
+
 
 _current_agent: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
     'current_agent', default=None
@@ -37,14 +50,39 @@ class _AgentContextManager:
     def __init__(self, name: str) -> None:
         self._name = name
         self._token: Optional[contextvars.Token] = None
+        self._stack = ExitStack()
+        self.queries: Optional[QueryProfile] = None
+        self.prompt_cache: Optional[PromptCacheUsage] = None
 
     def __enter__(self) -> str:
         self._token = _current_agent.set(self._name)
+        self.queries = self._stack.enter_context(profile_queries(self._name))
+        self.prompt_cache = self._stack.enter_context(track_prompt_cache(self._name))
         return self._name
 
     def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        self._stack.close()
         if self._token is not None:
             _current_agent.reset(self._token)
+        if self.queries is not None:
+            publish_queries(self.queries)
+        if self.prompt_cache is not None and self.prompt_cache.calls:
+            _publish_prompt_cache(self._name, self.prompt_cache)
+
+
+def _publish_prompt_cache(name: str, usage: PromptCacheUsage) -> None:
+    summary = usage.summary()
+    logger.debug(
+        "Agent %s made %d LLM calls, %d of %d input tokens from the prompt cache",
+        name, summary["calls"], summary["cache_read_tokens"], summary["input_tokens"],
+    )
+    try:
+        from langfuse import get_client
+
+        if get_client().get_current_trace_id():
+            get_client().update_current_span(metadata={"prompt_cache": summary})
+    except Exception as e:
+        logger.debug("Langfuse trace failed: %s", e)
 
 
 def agent_scope(name: str) -> _AgentContextManager:
@@ -3,7 +3,8 @@ ConversationFacilitator: Helper for managing LLM conversation with tool calling.
 
 Facilitator that:
 - Maintains conversation message history
-- Supports tool calling with automatic execution loop
+- Supports tool calling with automatic execution loop (independent calls of a
+  round run concurrently, see ToolScheduler)
 - Provides easy LLM calls with structured responses
 - Can be composed into tools, services, or agents
 """
@@ -17,8 +18,13 @@ from typing import TYPE_CHECKING, Any, AsyncGenerator, Optional, TypeVar
 
 from langfuse import observe
 from mirascope import llm
+from mirascope.llm import AsyncToolkit
+from pydantic import BaseModel
 
 from dialectical_framework.agents.execution_report import ExecutionReport
+from dialectical_framework.agents.respond_tool import (RESPOND_TOOL_NAME,
+                                                       is_respond_round,
+                                                       respond_tool)
 from dialectical_framework.agents.stream_events import (
     ResponseComplete,
     StreamEvent,
@@ -27,7 +33,10 @@ from dialectical_framework.agents.stream_events import (
     ToolResult,
     ToolStart,
 )
+from dialectical_framework.agents.tool_scheduler import ToolScheduler
 from dialectical_framework.protocols.has_config import SettingsAware
+from dialectical_framework.utils.prompt_cache import (cache_breakpoint,
+                                                      record_prompt_cache)
 from dialectical_framework.utils.use_brain import use_brain
 
 from mirascope.llm import TextChunk, ThoughtChunk
@@ -71,13 +80,24 @@ class ConversationFacilitator(SettingsAware):
         # observe what the model chose to do this turn.
         self.last_tool_calls: list[str] = []
 
-    def set_system_prompt(self, system_prompt: str) -> None:
+    def set_system_prompt(
+        self, system_prompt: str, cache_prefix: Optional[int] = None
+    ) -> None:
         """
         Set or replace the system prompt for this conversation.
 
         Replaces any existing system message at position 0, or inserts one.
+
+        Args:
+            system_prompt: The full system prompt
+            cache_prefix: Length of its leading part that is identical across
+                conversations (e.g. app preamble + engine prompt ahead of a
+                per-case context dump); cached separately by providers that
+                support prompt-caching breakpoints
         """
         system_msg = llm.messages.system(system_prompt)
+        if cache_prefix is not None:
+            cache_breakpoint(system_msg, at=cache_prefix)
 
         if not self._messages:
             self._messages.append(system_msg)
@@ -104,6 +124,8 @@ class ConversationFacilitator(SettingsAware):
 
         Use for parallel calls to avoid race conditions on self._messages.
         The isolated copy can use submit() normally with full tool support.
+        The shared history is marked as a cacheable prompt prefix, so a
+        fan-out of isolated calls pays for it once.
 
         Example:
             # Parallel calls that don't interfere with each other
@@ -115,6 +137,8 @@ class ConversationFacilitator(SettingsAware):
         """
         isolated = ConversationFacilitator(tools=self._tools)
         isolated._messages = [*self._messages]  # Copy messages
+        if isolated._messages and getattr(isolated._messages[-1], "role", None) != "system":
+            cache_breakpoint(isolated._messages[-1])
         return isolated
 
     @observe()
@@ -133,6 +157,11 @@ class ConversationFacilitator(SettingsAware):
         3. Repeat until LLM returns final response (no tool calls)
         4. Extract structured response from final message
 
+        With settings.single_pass_responses, the LLM can instead end the loop
+        by calling the terminal `respond` tool, whose arguments are the
+        structured response; step 4 is then skipped. Arguments that don't
+        validate fall back to step 4.
+
         Args:
             response_model: Pydantic model for structured output
             user_content: User message to submit
@@ -147,16 +176,26 @@ class ConversationFacilitator(SettingsAware):
         if not self._tools:
             return await self._call_with_response_model(response_model)
 
+        tools = self._round_tools(response_model)
+
         # Agentic loop: resume() accumulates messages internally
-        response = await self._call_with_tools()
+        response = await self._call_with_tools(tools)
         for _ in range(max_tool_rounds):
             if not response.tool_calls:
                 break
+            if is_respond_round(response.tool_calls):
+                result = self._take_response(response, response_model)
+                if result is None:
+                    result = await self._call_with_response_model(response_model)
+                return result
             self.last_tool_calls.extend(tc.name for tc in response.tool_calls)
             self._log_tool_calls(response.tool_calls)
-            tool_outputs = await response.execute_tools()
+            tool_outputs: list = []
+            async for _ in self._execute_tools(response, tool_outputs):
+                pass
             self._strip_caller_from_messages(response.messages)
             response = await response.resume(tool_outputs)
+            record_prompt_cache(getattr(response, "usage", None))
 
         # Sync full conversation history from the response chain
         self._messages = list(response.messages)
@@ -177,8 +216,9 @@ class ConversationFacilitator(SettingsAware):
 
         Yields:
             TextDelta: token-by-token text from intermediate LLM rounds
-            ToolStart: when LLM invokes a tool
-            ToolResult: after tool execution (with optional ExecutionReport)
+            ToolStart: when a tool call starts executing
+            ToolResult: as each tool call finishes (with optional ExecutionReport);
+                calls of one round may overlap, so starts and results interleave
             ResponseComplete: final structured message
         """
         self._messages.append(llm.messages.user(user_content))
@@ -189,7 +229,9 @@ class ConversationFacilitator(SettingsAware):
             yield ResponseComplete(result=result)
             return
 
-        stream = await self._open_stream_with_retry()
+        stream = await self._open_stream_with_retry(
+            tools=self._round_tools(response_model)
+        )
 
         for _ in range(max_tool_rounds):
             async for chunk in stream.chunk_stream():
@@ -197,25 +239,22 @@ class ConversationFacilitator(SettingsAware):
                     yield ThinkingDelta(text=chunk.delta)
                 elif isinstance(chunk, TextChunk):
                     yield TextDelta(text=chunk.delta)
+            record_prompt_cache(getattr(stream, "usage", None))
 
             if not stream.tool_calls:
                 break
-
-            for tc in stream.tool_calls:
-                yield ToolStart(
-                    tool_name=tc.name,
-                    tool_args=json.loads(tc.args) if tc.args else {},
-                )
+            if is_respond_round(stream.tool_calls):
+                result = self._take_response(stream, response_model)
+                if result is None:
+                    result = await self._call_with_response_model(response_model)
+                yield ResponseComplete(result=result)
+                return
 
             self.last_tool_calls.extend(tc.name for tc in stream.tool_calls)
             self._log_tool_calls(stream.tool_calls)
-            tool_outputs = await stream.execute_tools()
-
-            for i, output in enumerate(tool_outputs):
-                tool_name = stream.tool_calls[i].name if i < len(stream.tool_calls) else "unknown"
-                raw_str = str(output)
-                report = self._try_parse_execution_report(raw_str)
-                yield ToolResult(tool_name=tool_name, report=report, raw_output=raw_str)
+            tool_outputs: list = []
+            async for event in self._execute_tools(stream, tool_outputs):
+                yield event
 
             self._strip_caller_from_messages(stream.messages)
             stream = await stream.resume(tool_outputs)
@@ -227,6 +266,94 @@ class ConversationFacilitator(SettingsAware):
 
     # --- Internal helpers ---
 
+    def _round_tools(self, response_model: type) -> list[Any]:
+        """Tools offered during the loop: the agent's, plus `respond` in single-pass mode."""
+        if (
+            self.settings.single_pass_responses
+            and isinstance(response_model, type)
+            and issubclass(response_model, BaseModel)
+        ):
+            return [*self._tools, respond_tool(response_model)]
+        return self._tools
+
+    def _take_response(self, response: Any, response_model: type[T]) -> Optional[T]:
+        """
+        Take the structured response from a round that called only `respond`.
+
+        History keeps the answer the way _call_with_response_model records
+        it, in place of the (unanswered) respond call. Returns None when the
+        arguments don't validate; the respond call is then dropped from the
+        history, ready for the extraction fallback.
+        """
+        messages = list(response.messages)
+        try:
+            result = response_model.model_validate_json(response.tool_calls[0].args)
+        except ValueError as e:
+            logging.getLogger(__name__).warning(
+                "%s arguments did not validate as %s, extracting instead: %s",
+                RESPOND_TOOL_NAME, response_model.__name__, e,
+            )
+            self._messages = messages[:-1]
+            self._strip_unsupported_input_fields()
+            return None
+
+        self._messages = [
+            *messages[:-1],
+            llm.messages.assistant(
+                self._assistant_history_text(result),
+                model_id=None,
+                provider_id=None,
+            ),
+        ]
+        self._strip_unsupported_input_fields()
+        return result
+
+    async def _execute_tools(
+        self, response: Any, outputs: list
+    ) -> AsyncGenerator[StreamEvent, None]:
+        """
+        Execute a round's tool calls, yielding ToolStart/ToolResult as each
+        call starts and finishes.
+
+        Calls run through a ToolScheduler: independent calls overlap (up to
+        settings.tool_concurrency), conflicting ones keep their order.
+        `outputs` receives the outputs in call order, as resume() expects.
+        """
+        tool_calls = list(response.tool_calls)
+        toolkit = getattr(response, "toolkit", None)
+        if not isinstance(toolkit, AsyncToolkit):
+            # Sync toolkits (and responses without one) execute as a batch
+            for tc in tool_calls:
+                yield self._tool_start(tc)
+            outputs.extend(await response.execute_tools())
+            for i, output in enumerate(outputs):
+                tool_name = tool_calls[i].name if i < len(tool_calls) else "unknown"
+                yield self._tool_result(tool_name, output)
+            return
+
+        outputs.extend([None] * len(tool_calls))
+        scheduler = ToolScheduler(toolkit, limit=self.settings.tool_concurrency)
+        async for event in scheduler.run(tool_calls):
+            tc = tool_calls[event.index]
+            if not event.finished:
+                yield self._tool_start(tc)
+                continue
+            outputs[event.index] = event.output
+            yield self._tool_result(tc.name, event.output)
+
+    @staticmethod
+    def _tool_start(tool_call: Any) -> ToolStart:
+        return ToolStart(
+            tool_name=tool_call.name,
+            tool_args=json.loads(tool_call.args) if tool_call.args else {},
+        )
+
+    @classmethod
+    def _tool_result(cls, tool_name: str, output: Any) -> ToolResult:
+        raw_str = str(output)
+        report = cls._try_parse_execution_report(raw_str)
+        return ToolResult(tool_name=tool_name, report=report, raw_output=raw_str)
+
     def _strip_unsupported_input_fields(self) -> None:
         """Strip output-only fields from self._messages before the next API call."""
         self._strip_caller_from_messages(self._messages)
@@ -266,7 +393,9 @@ class ConversationFacilitator(SettingsAware):
             args = json.loads(tc.args) if tc.args else {}
             logger.log_tool_call(sid, agent, tc.name, args)
 
-    async def _open_stream_with_retry(self, max_attempts: int = 3) -> Any:
+    async def _open_stream_with_retry(
+        self, max_attempts: int = 3, tools: Optional[list[Any]] = None
+    ) -> Any:
         """Open a streaming connection with retry on transient failures.
 
         Retries the initial stream connection (provider errors, network blips).
@@ -277,7 +406,7 @@ class ConversationFacilitator(SettingsAware):
         last_error: Optional[Exception] = None
         for attempt in range(max_attempts):
             try:
-                call = await self._get_tools_call()
+                call = await self._get_tools_call(tools)
                 return await call.stream()
             except Exception as e:
                 last_error = e
@@ -290,11 +419,11 @@ class ConversationFacilitator(SettingsAware):
                     delay = min(delay * 2.0, 30.0)
         raise last_error  # type: ignore[misc]
 
-    async def _get_tools_call(self) -> AsyncCall:
+    async def _get_tools_call(self, tools: Optional[list[Any]] = None) -> AsyncCall:
         """Get AsyncCall object for streaming tool-calling mode."""
         messages = self._messages
 
-        @use_brain(tools=self._tools, raw_call=True, **self._thinking_kwargs())
+        @use_brain(tools=tools or self._tools, raw_call=True, **self._thinking_kwargs())
         async def _llm_call():
             return messages
 
@@ -315,11 +444,11 @@ class ConversationFacilitator(SettingsAware):
             return {"thinking": thinking_level}
         return {}
 
-    async def _call_with_tools(self) -> AsyncResponse:
+    async def _call_with_tools(self, tools: Optional[list[Any]] = None) -> AsyncResponse:
         """Call LLM with tools available (no format)."""
         messages = self._messages
 
-        @use_brain(tools=self._tools, **self._thinking_kwargs())
+        @use_brain(tools=tools or self._tools, **self._thinking_kwargs())
         async def _llm_call():
             return messages
 
@@ -15,7 +15,10 @@ When the DI container starts, it calls `ExecutionReport.set_event_bus(bus)`.
 After that, every mutation method (node_created, etc.) automatically publishes
 the Effect to subscribers on the matching sid channel.
 
-Publishing is fire-and-forget via `loop.create_task()`. It's a no-op when:
+Publishing is non-blocking: effects are buffered on the bus per sid and sent
+as one ordered envelope per flush window, or when the report finalizes —
+whichever comes first. Subscribers still see one event per effect. It's a
+no-op when:
 - No event bus is configured (tests, CLI usage)
 - No asyncio event loop is running (rare edge case)
 - No sid is set in the scope context (code running outside `with scope(...)`)
@@ -200,27 +203,20 @@ class ExecutionReport(BaseModel):
 
     def _emit(self, effect: Effect) -> None:
         """
-        Publish an effect to the event bus (fire-and-forget).
+        Buffer an effect on the event bus for the current sid's next envelope.
 
-        Reads the current sid from scope context and schedules an async
-        publish on the running event loop. Safe to call from sync code
-        since it only schedules — doesn't await.
+        Safe to call from sync code — nothing is awaited; the bus flushes
+        on its own timer.
 
         No-op when: bus is None, no running loop, or no sid in scope.
         """
         if self._event_bus is None:
             return
-        import asyncio
-
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            return
         from dialectical_framework.graph.scope_context import get_current_sid
 
         sid = get_current_sid()
         if sid:
-            loop.create_task(self._event_bus.publish(sid, effect))
+            self._event_bus.emit(sid, effect)
 
     def _log(self, effect: Effect) -> None:
         """Write effect to file log. No-op when logger is None or sid is missing."""
@@ -236,18 +232,23 @@ class ExecutionReport(BaseModel):
         self._effect_logger.log_effect(sid, agent, self.tool, effect)
 
     def finalize(self) -> None:
-        """Log report-complete marker. Idempotent — only logs once."""
+        """
+        Log report-complete marker and close the report's event envelope.
+        Idempotent — only runs once.
+        """
         if self._finalized:
             return
         self._finalized = True
-        if self._effect_logger is None:
-            return
         from dialectical_framework.agents.agent_context import get_current_agent
         from dialectical_framework.graph.scope_context import get_current_sid
 
         sid = get_current_sid()
         if not sid:
             return
+        if self._event_bus is not None:
+            self._event_bus.flush(sid)
+        if self._effect_logger is None:
+            return
         agent = get_current_agent() or "pipeline"
         self._effect_logger.log_tool_result(
             sid, agent, self.tool, self.ok, self.summary, len(self.effects)
@@ -421,7 +422,12 @@ class ExecutionReport(BaseModel):
     def __str__(self) -> str:
         """JSON representation returned to the LLM as tool output."""
         self.finalize()
-        return self.model_dump_json(indent=2, exclude_none=True)
+        # Query profiling and cache accounting are for traces and developers, not the model
+        return self.model_dump_json(
+            indent=2,
+            exclude_none=True,
+            exclude={"artifacts": {"graph_queries", "prompt_cache"}},
+        )
 
     def merge(self, other: ExecutionReport) -> ExecutionReport:
         """
@@ -16,6 +16,7 @@ from mirascope import llm
 from pydantic import BaseModel, Field
 
 from dialectical_framework.agents.agent_context import agent_scope
+from dialectical_framework.graph.graph_session import graph_session
 from dialectical_framework.graph.scope_context import require_current_sid
 from dialectical_framework.agents.conversation_facilitator import \
     ConversationFacilitator
@@ -111,13 +112,13 @@ class Explorer:
 
     async def chat(self, user_message: str) -> str:
         require_current_sid()  # unscoped turns silently drop all work
-        with agent_scope(self.AGENT_NAME):
+        with agent_scope(self.AGENT_NAME), graph_session():
             result = await self._conversation.submit(ChatResponse, user_message)
             return result.message
 
     async def chat_stream(self, user_message: str) -> AsyncGenerator[StreamEvent, None]:
         require_current_sid()  # unscoped turns silently drop all work
-        with agent_scope(self.AGENT_NAME):
+        with agent_scope(self.AGENT_NAME), graph_session():
             async for event in self._conversation.submit_stream(
                 ChatResponse, user_message
             ):
@@ -344,10 +345,8 @@ class ExplorationPipeline(ReasonableConcern[ExplorationResult]):
             CausalityProbabilityEstimation
 
         def _probability(wheel) -> float:
-            for est, _ in wheel.estimations.all():
-                if isinstance(est, CausalityProbabilityEstimation):
-                    return est.value if est.value is not None else -1.0
-            return -1.0
+            value = wheel.estimation_value(CausalityProbabilityEstimation)
+            return value if value is not None else -1.0
 
         def _layer(wheel) -> int:
             try:
@@ -13,6 +13,11 @@ The Nexus has two separate concerns:
 When preset is "preset:auto", the LLM resolves the best assessment strategy
 from the intent — either matching a system preset or formulating custom criteria.
 
+With settings.wheel_beam_width set, layers are built progressively: each layer
+is estimated before the next, and only the Perspective sets of its best-scored
+cycles and wheels are extended. Pruned branches are reported and can be
+expanded later by passing them back as `branches`.
+
 Usage:
     agent = BuildWheels(
         nexus_hash="abc123...",
@@ -27,7 +32,7 @@ Usage:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Annotated, Optional
 
 from mirascope import llm
@@ -40,9 +45,14 @@ from dialectical_framework.graph.nodes.nexus import Nexus
 from dialectical_framework.graph.nodes.wheel import Wheel
 from dialectical_framework.graph.repositories.nexus_repository import NexusRepository
 from dialectical_framework.graph.repositories.node_repository import NodeRepository
+from dialectical_framework.protocols.has_config import SettingsAware
 from dialectical_framework.utils.use_brain import use_brain
 
 if TYPE_CHECKING:
+    from dialectical_framework.concerns.perspective_combination import (
+        CombinationResult,
+        PrunedBranch,
+    )
     from dialectical_framework.graph.nodes.perspective import Perspective
 
 
@@ -105,9 +115,10 @@ class BuildWheelsResult:
     nexus: Optional[Nexus]
     new_cycles: list[Cycle]
     new_wheels: list[Wheel]
+    pruned_branches: list[PrunedBranch] = field(default_factory=list)
 
 
-class BuildWheels(ReasonableConcern[BuildWheelsResult]):
+class BuildWheels(ReasonableConcern[BuildWheelsResult], SettingsAware):
     """
     Main LLM-facing entry point for dialectical exploration.
 
@@ -121,12 +132,21 @@ class BuildWheels(ReasonableConcern[BuildWheelsResult]):
     3. Create all Cycle/Wheel combinations (via PerspectiveCombination)
     4. Estimate new structures (via CausalityEstimation)
 
+    Steps 3-4 alternate layer by layer when a beam is configured
+    (settings.wheel_beam_width) or `branches` are given to expand.
+
     Idempotent: re-running with same inputs creates no duplicates.
     """
 
-    def __init__(self, nexus_hash: str, perspective_hashes: Optional[list[str]] = None) -> None:
+    def __init__(
+        self,
+        nexus_hash: str,
+        perspective_hashes: Optional[list[str]] = None,
+        branches: Optional[list[list[str]]] = None,
+    ) -> None:
         self.nexus_hash = nexus_hash
         self.perspective_hashes = perspective_hashes or []
+        self.branches = branches or []
 
     async def resolve(self) -> BuildWheelsResult:
         """
@@ -185,33 +205,36 @@ class BuildWheels(ReasonableConcern[BuildWheelsResult]):
 
         self._report.artifacts["perspective_count"] = len(perspectives)
 
-        # 4. Create structural combinations (Cycles + Wheels)
+        # 4-5. Create structural combinations (Cycles + Wheels) and estimate
+        #    them — all layers at once, or layer by layer behind a beam.
         #    cycle_intent flows onto Cycle.intent — never "preset:auto"
-        from dialectical_framework.concerns.perspective_combination import (
-            PerspectiveCombination,
-        )
+        pruned_branches: list[PrunedBranch] = []
+        if self.settings.wheel_beam_width > 0 or self.branches:
+            new_cycles, new_wheels, pruned_branches = await self._build_progressively(
+                nexus, perspectives, cycle_intent
+            )
+        else:
+            from dialectical_framework.concerns.perspective_combination import (
+                PerspectiveCombination,
+            )
 
-        combination = PerspectiveCombination()
-        combination_result = combination.resolve(
-            nexus=nexus, perspectives=perspectives, preset=cycle_intent,
-        )
-        self._report = self._report.merge(combination.report)
+            combination = PerspectiveCombination()
+            combination_result = combination.resolve(
+                nexus=nexus, perspectives=perspectives, preset=cycle_intent,
+            )
+            self._report = self._report.merge(combination.report)
 
-        new_cycles = combination_result.cycles
-        new_wheels = combination_result.wheels
+            new_cycles = combination_result.cycles
+            new_wheels = combination_result.wheels
+            await self._estimate_causal(new_cycles, new_wheels)
 
         self._report.artifacts["new_cycles"] = len(new_cycles)
         self._report.artifacts["new_wheels"] = len(new_wheels)
-
-        # 5. Estimate causality ordering (layer 2+ only — 1-PP has nothing to order)
-        #    Estimation determines which PP causes which — requires 2+ PPs.
-        causal_cycles = [c for c in new_cycles if c.perspective_count >= 2]
-        causal_wheels = [
-            w for w in new_wheels
-            if self._safe_polarity_count(w) >= 2
-        ]
-        if causal_cycles or causal_wheels:
-            await self._run_estimation(causal_cycles, causal_wheels)
+        if pruned_branches:
+            self._report.artifacts["pruned_branches"] = [
+                [h[:7] for h in branch.perspective_hashes]
+                for branch in pruned_branches
+            ]
 
         # 6. Build summary
         if not new_cycles and not new_wheels:
@@ -225,13 +248,177 @@ class BuildWheels(ReasonableConcern[BuildWheelsResult]):
                 f"for Nexus {nexus.short_hash} "
                 f"(intent: {cycle_intent})"
             )
+        if pruned_branches:
+            self._report.summary += (
+                f"; pruned {len(pruned_branches)} branches "
+                f"(beam width {self.settings.wheel_beam_width})"
+            )
 
         return BuildWheelsResult(
             nexus=nexus,
             new_cycles=new_cycles,
             new_wheels=new_wheels,
+            pruned_branches=pruned_branches,
+        )
+
+    async def _build_progressively(
+        self,
+        nexus: Nexus,
+        perspectives: list[Perspective],
+        cycle_intent: str,
+    ) -> tuple[list[Cycle], list[Wheel], list[PrunedBranch]]:
+        """
+        Build and estimate one layer at a time, extending only the beam.
+
+        Layers 1-2 are built in full (unless expanding given branches). From
+        layer 2 on, the top settings.wheel_beam_width cycles and wheels of
+        each estimated layer select the PP sets the next layer extends by one
+        Perspective; the other PP sets are returned as pruned branches.
+
+        Returns:
+            Tuple of (new_cycles, new_wheels, pruned_branches)
+        """
+        from dialectical_framework.concerns.perspective_combination import (
+            PerspectiveCombination,
+            PrunedBranch,
         )
 
+        width = self.settings.wheel_beam_width
+        seeds = self._resolve_branches(nexus)
+        if width > 0:
+            self._report.artifacts["beam_width"] = width
+
+        # None = build the layer in full; a set = extend only these PP sets
+        survivors: Optional[set[frozenset[str]]] = set() if seeds else None
+        start = min((len(seed) for seed in seeds), default=0) + 1
+
+        new_cycles: list[Cycle] = []
+        new_wheels: list[Wheel] = []
+        pruned: list[PrunedBranch] = []
+        top_layer: Optional[int] = None
+
+        for layer in range(start, self.settings.max_wheel_layer + 1):
+            extending = None
+            if survivors is not None:
+                extending = survivors | {s for s in seeds if len(s) == layer - 1}
+                if not extending:
+                    break
+
+            combination = PerspectiveCombination()
+            result = combination.resolve(
+                nexus=nexus,
+                perspectives=perspectives,
+                preset=cycle_intent,
+                layer=layer,
+                extending=extending,
+            )
+            self._report = self._report.merge(combination.report)
+            if not result.branches:
+                break
+
+            new_cycles.extend(result.cycles)
+            new_wheels.extend(result.wheels)
+            await self._estimate_causal(result.cycles, result.wheels)
+
+            # PPs are in the Nexus once the first layer is built
+            if top_layer is None:
+                nexus_pps = {pp.hash for pp, _ in nexus.perspectives.all()}
+                top_layer = min(len(nexus_pps), self.settings.max_wheel_layer)
+
+            # Layer 1 has no causality to rank by; the top layer has no
+            # extensions to spare
+            if layer < 2 or layer >= top_layer:
+                continue
+            if width <= 0:
+                survivors = set(result.branches.values())
+                continue
+
+            surviving, layer_pruned = self._rank_layer(result, width)
+            survivors = {result.branches[key] for key in surviving}
+            pruned.extend(
+                PrunedBranch(
+                    layer=layer,
+                    perspective_hashes=tuple(sorted(result.branches[key])),
+                    score=round(score, 3),
+                )
+                for key, score in layer_pruned.items()
+            )
+
+        return new_cycles, new_wheels, pruned
+
+    @staticmethod
+    def _rank_layer(
+        result: CombinationResult, width: int
+    ) -> tuple[set[str], dict[str, float]]:
+        """
+        Beam over one built layer: a PP set survives if one of its cycles or
+        wheels is among the top `width` of its type.
+
+        Returns:
+            Tuple of (surviving layer_keys, pruned layer_key -> best score)
+        """
+        from dialectical_framework.concerns.perspective_combination import (
+            select_beam,
+        )
+
+        structures = [*result.all_cycles, *result.all_wheels]
+        scores = NodeRepository().find_causality_scores([s.hash for s in structures])
+
+        surviving: set[str] = set()
+        candidates: dict[str, float] = {}
+        for group in (result.all_cycles, result.all_wheels):
+            kept, dropped = select_beam(
+                (
+                    (s.layer_key, scores.get(s.hash))
+                    for s in group
+                    if s.layer_key in result.branches
+                ),
+                width,
+            )
+            surviving.update(kept)
+            for key, score in dropped.items():
+                candidates[key] = max(score, candidates.get(key, 0.0))
+
+        pruned = {k: s for k, s in candidates.items() if k not in surviving}
+        return surviving, pruned
+
+    def _resolve_branches(self, nexus: Nexus) -> list[frozenset[str]]:
+        """Resolve `branches` (Perspective hash prefixes) to full hash sets."""
+        if not self.branches:
+            return []
+
+        nexus_hashes = [pp.hash for pp, _ in nexus.perspectives.all()]
+        resolved: list[frozenset[str]] = []
+        for branch in self.branches:
+            full: set[str] = set()
+            for prefix in branch:
+                matches = {h for h in nexus_hashes if h.startswith(prefix)}
+                if len(matches) != 1:
+                    raise ValueError(
+                        f"Perspective not in Nexus or ambiguous: {prefix}"
+                    )
+                full.update(matches)
+            resolved.append(frozenset(full))
+        return resolved
+
+    async def _estimate_causal(
+        self,
+        cycles: list[Cycle],
+        wheels: list[Wheel],
+    ) -> None:
+        """
+        Estimate causality ordering (layer 2+ only — 1-PP has nothing to order).
+
+        Estimation determines which PP causes which — requires 2+ PPs.
+        """
+        causal_cycles = [c for c in cycles if c.perspective_count >= 2]
+        causal_wheels = [
+            w for w in wheels
+            if self._safe_polarity_count(w) >= 2
+        ]
+        if causal_cycles or causal_wheels:
+            await self._run_estimation(causal_cycles, causal_wheels)
+
     async def _run_estimation(
         self,
         cycles: list[Cycle],
@@ -348,8 +535,9 @@ class BuildWheels(ReasonableConcern[BuildWheelsResult]):
 async def build_wheels(
     nexus_hash: Annotated[str, Field(description="Hash of the Nexus to build combinations in")],
     perspective_hashes: Annotated[list[str] | None, Field(description="Perspective hashes to add to Nexus before building")] = None,
+    branches: Annotated[list[list[str]] | None, Field(description="Pruned branches to expand (Perspective hash lists from a previous pruned_branches artifact)")] = None,
 ) -> str:
     """Generate causal structures from a Nexus: Cycles (ordered sequences of Perspectives forming circular causality chains) and Wheels (concrete thesis-antithesis arrangements implementing those cycles). Estimates each structure's plausibility."""
-    concern = BuildWheels(nexus_hash=nexus_hash, perspective_hashes=perspective_hashes or [])
+    concern = BuildWheels(nexus_hash=nexus_hash, perspective_hashes=perspective_hashes or [], branches=branches or [])
     await concern.resolve()
     return str(concern.report)
@@ -39,6 +39,8 @@ from dialectical_framework.concerns.positive_ac_re_apex_derivation import (
     ApexDerivation, ApexDerivationResultDto)
 from dialectical_framework.concerns.transformation_generation import (
     TransformationGeneration, TransformationTetradDto)
+from dialectical_framework.graph.batch_committer import BatchCommitter
+from dialectical_framework.graph.graph_db_pool import AsyncGraphDb
 from dialectical_framework.graph.nodes.statement import Statement
 from dialectical_framework.graph.nodes.rationale import Rationale
 from dialectical_framework.graph.nodes.transformation import (
@@ -68,6 +70,15 @@ class _EdgeProcessingData:
     target_segment: Optional[WheelSegment] = None
 
 
+@dataclass
+class _WrittenTransformation:
+    """Graph writes of one Transformation, reported back on the event loop."""
+
+    transformation: Transformation
+    rationales: list[Rationale]
+    positions: list[tuple[Any, Transition, str]]
+
+
 @dataclass
 class ExploreTransformationsResult:
     """Result from the ExploreTransformations."""
@@ -297,7 +308,7 @@ class ExploreTransformations(ReasonableConcern[ExploreTransformationsResult]):
                 self._report = self._report.merge(report)
                 assert data.source_segment is not None
                 assert data.target_segment is not None
-                transformation = self._create_transformation(
+                transformation = await self._create_transformation(
                     nexus, edge, data.source_segment, data.target_segment, tetrad,
                 )
                 all_new.append(transformation)
@@ -450,17 +461,52 @@ class ExploreTransformations(ReasonableConcern[ExploreTransformationsResult]):
 
         return await input_context(inputs, input_resolver)
 
-    def _create_transformation(
+    @inject
+    async def _create_transformation(
         self,
         nexus: Nexus,
         ac_edge: Transition,
         source_segment: WheelSegment,
         target_segment: WheelSegment,
         tetrad: TransformationTetradDto,
+        async_graph_db: AsyncGraphDb = Provide[DI.async_graph_db],
     ) -> Transformation:
         """
         Create a Transformation node with all 6 positions, scoped to Nexus and edge.
 
+        The graph writes run off the event loop (sibling edge pairs keep
+        generating meanwhile); effects are reported here, on the loop.
+        """
+        written = await async_graph_db.run(
+            self._write_transformation,
+            nexus, ac_edge, source_segment, target_segment, tetrad,
+        )
+        transformation = written.transformation
+
+        self._report.node_created(transformation)
+        for rationale in written.rationales:
+            self._report.node_created(rationale)
+        for manager, transition, position in written.positions:
+            self._report.node_created(transition, meta={"position": position})
+            self._report.relationship_created(
+                manager, transformation, transition,
+                meta={"position": position},
+            )
+        self._report.node_committed(transformation)
+
+        return transformation
+
+    def _write_transformation(
+        self,
+        nexus: Nexus,
+        ac_edge: Transition,
+        source_segment: WheelSegment,
+        target_segment: WheelSegment,
+        tetrad: TransformationTetradDto,
+    ) -> _WrittenTransformation:
+        """
+        Write a Transformation node with all 6 positions (graph only, no reporting).
+
         Ac-side (Ac, Ac+, Ac-) uses this edge's segments:
         - source_segment → T-side, target_segment → A-side
 
@@ -527,173 +573,171 @@ class ExploreTransformations(ReasonableConcern[ExploreTransformationsResult]):
         transformation.set_nexus(nexus)
         transformation.set_on_edge(ac_edge)
         transformation.save()
-        self._report.node_created(transformation)
 
-        # === Ac-side (this edge's segments) ===
-
-        # Ac (neutral): T → A
-        # Note: tetrad.ac has insight/proactiveness from generation, but we intentionally
-        # don't store them. Neutral positions are category reference points — their
-        # proactiveness is derivable from Ac+'s label, and insight is less meaningful here.
-        # AcRelationship/ReRelationship extend PolarityRelationship (no scoring fields)
-        # to preserve the semantic distinction from scored +/- positions.
-        ac_transition = self._create_transition(
-            headline=tetrad.ac.headline,
-            statement=tetrad.ac.statement,
-            source=t,
-            target=a,
-            explanation=tetrad.ac.explanation,
-            haiku=tetrad.ac.haiku,
-        )
-        transformation.ac.connect(
-            ac_transition,
-            relationship=AcRelationship(
-                alias=POSITION_AC,
-                heuristic_similarity=None,
-            ),
-        )
-        self._report.node_created(ac_transition, meta={"position": POSITION_AC})
-        self._report.relationship_created(
-            transformation.ac, transformation, ac_transition,
-            meta={"position": POSITION_AC},
-        )
-
-        # Ac+: T- → A+
-        ac_plus_transition = self._create_transition(
-            headline=tetrad.ac_plus.headline,
-            statement=tetrad.ac_plus.statement,
-            source=t_minus,
-            target=a_plus,
-            explanation=tetrad.ac_plus.explanation,
-            haiku=tetrad.ac_plus.haiku,
-        )
-        transformation.ac_plus.connect(
-            ac_plus_transition,
-            relationship=AcPlusRelationship(
-                alias=POSITION_AC_PLUS,
-                heuristic_similarity=tetrad.ac_plus_hs,
-                insight=tetrad.ac_plus.insight,
-                proactiveness=tetrad.ac_plus.proactiveness,
-            ),
-        )
-        self._report.node_created(
-            ac_plus_transition, meta={"position": POSITION_AC_PLUS}
-        )
-        self._report.relationship_created(
-            transformation.ac_plus, transformation, ac_plus_transition,
-            meta={"position": POSITION_AC_PLUS},
-        )
+        staged_positions: list[tuple[Any, Transition, str]] = []
+        with BatchCommitter() as batch:
+            # === Ac-side (this edge's segments) ===
+
+            # Ac (neutral): T → A
+            # Note: tetrad.ac has insight/proactiveness from generation, but we intentionally
+            # don't store them. Neutral positions are category reference points — their
+            # proactiveness is derivable from Ac+'s label, and insight is less meaningful here.
+            # AcRelationship/ReRelationship extend PolarityRelationship (no scoring fields)
+            # to preserve the semantic distinction from scored +/- positions.
+            ac_transition = self._create_transition(
+                batch,
+                headline=tetrad.ac.headline,
+                statement=tetrad.ac.statement,
+                source=t,
+                target=a,
+                explanation=tetrad.ac.explanation,
+                haiku=tetrad.ac.haiku,
+            )
+            batch.connect(
+                transformation.ac,
+                ac_transition,
+                relationship=AcRelationship(
+                    alias=POSITION_AC,
+                    heuristic_similarity=None,
+                ),
+            )
+            staged_positions.append(
+                (transformation.ac, ac_transition, POSITION_AC)
+            )
 
-        # Ac-: T+ → A-
-        ac_minus_transition = self._create_transition(
-            headline=tetrad.ac_minus.headline,
-            statement=tetrad.ac_minus.statement,
-            source=t_plus,
-            target=a_minus,
-            explanation=tetrad.ac_minus.explanation,
-            haiku=tetrad.ac_minus.haiku,
-        )
-        transformation.ac_minus.connect(
-            ac_minus_transition,
-            relationship=AcMinusRelationship(
-                alias=POSITION_AC_MINUS,
-                heuristic_similarity=None,
-                insight=tetrad.ac_minus.insight,
-                proactiveness=tetrad.ac_minus.proactiveness,
-            ),
-        )
-        self._report.node_created(
-            ac_minus_transition, meta={"position": POSITION_AC_MINUS}
-        )
-        self._report.relationship_created(
-            transformation.ac_minus, transformation, ac_minus_transition,
-            meta={"position": POSITION_AC_MINUS},
-        )
+            # Ac+: T- → A+
+            ac_plus_transition = self._create_transition(
+                batch,
+                headline=tetrad.ac_plus.headline,
+                statement=tetrad.ac_plus.statement,
+                source=t_minus,
+                target=a_plus,
+                explanation=tetrad.ac_plus.explanation,
+                haiku=tetrad.ac_plus.haiku,
+            )
+            batch.connect(
+                transformation.ac_plus,
+                ac_plus_transition,
+                relationship=AcPlusRelationship(
+                    alias=POSITION_AC_PLUS,
+                    heuristic_similarity=tetrad.ac_plus_hs,
+                    insight=tetrad.ac_plus.insight,
+                    proactiveness=tetrad.ac_plus.proactiveness,
+                ),
+            )
+            staged_positions.append(
+                (transformation.ac_plus, ac_plus_transition, POSITION_AC_PLUS)
+            )
 
-        # === Re-side (opposite edge's segments) ===
+            # Ac-: T+ → A-
+            ac_minus_transition = self._create_transition(
+                batch,
+                headline=tetrad.ac_minus.headline,
+                statement=tetrad.ac_minus.statement,
+                source=t_plus,
+                target=a_minus,
+                explanation=tetrad.ac_minus.explanation,
+                haiku=tetrad.ac_minus.haiku,
+            )
+            batch.connect(
+                transformation.ac_minus,
+                ac_minus_transition,
+                relationship=AcMinusRelationship(
+                    alias=POSITION_AC_MINUS,
+                    heuristic_similarity=None,
+                    insight=tetrad.ac_minus.insight,
+                    proactiveness=tetrad.ac_minus.proactiveness,
+                ),
+            )
+            staged_positions.append(
+                (transformation.ac_minus, ac_minus_transition, POSITION_AC_MINUS)
+            )
 
-        # Re (neutral): opp_source → opp_target
-        re_transition = self._create_transition(
-            headline=tetrad.re.headline,
-            statement=tetrad.re.statement,
-            source=re_src,
-            target=re_tgt,
-            explanation=tetrad.re.explanation,
-            haiku=tetrad.re.haiku,
-        )
-        transformation.re.connect(
-            re_transition,
-            relationship=ReRelationship(
-                alias=POSITION_RE,
-                heuristic_similarity=None,
-            ),
-        )
-        self._report.node_created(re_transition, meta={"position": POSITION_RE})
-        self._report.relationship_created(
-            transformation.re, transformation, re_transition,
-            meta={"position": POSITION_RE},
-        )
+            # === Re-side (opposite edge's segments) ===
+
+            # Re (neutral): opp_source → opp_target
+            re_transition = self._create_transition(
+                batch,
+                headline=tetrad.re.headline,
+                statement=tetrad.re.statement,
+                source=re_src,
+                target=re_tgt,
+                explanation=tetrad.re.explanation,
+                haiku=tetrad.re.haiku,
+            )
+            batch.connect(
+                transformation.re,
+                re_transition,
+                relationship=ReRelationship(
+                    alias=POSITION_RE,
+                    heuristic_similarity=None,
+                ),
+            )
+            staged_positions.append(
+                (transformation.re, re_transition, POSITION_RE)
+            )
 
-        # Re+: opp_source.neg → opp_target.pos
-        re_plus_transition = self._create_transition(
-            headline=tetrad.re_plus.headline,
-            statement=tetrad.re_plus.statement,
-            source=re_src_minus,
-            target=re_tgt_plus,
-            explanation=tetrad.re_plus.explanation,
-            haiku=tetrad.re_plus.haiku,
-        )
-        transformation.re_plus.connect(
-            re_plus_transition,
-            relationship=RePlusRelationship(
-                alias=POSITION_RE_PLUS,
-                heuristic_similarity=tetrad.re_plus_hs,
-                insight=tetrad.re_plus.insight,
-                proactiveness=tetrad.re_plus.proactiveness,
-            ),
-        )
-        self._report.node_created(
-            re_plus_transition, meta={"position": POSITION_RE_PLUS}
-        )
-        self._report.relationship_created(
-            transformation.re_plus, transformation, re_plus_transition,
-            meta={"position": POSITION_RE_PLUS},
-        )
+            # Re+: opp_source.neg → opp_target.pos
+            re_plus_transition = self._create_transition(
+                batch,
+                headline=tetrad.re_plus.headline,
+                statement=tetrad.re_plus.statement,
+                source=re_src_minus,
+                target=re_tgt_plus,
+                explanation=tetrad.re_plus.explanation,
+                haiku=tetrad.re_plus.haiku,
+            )
+            batch.connect(
+                transformation.re_plus,
+                re_plus_transition,
+                relationship=RePlusRelationship(
+                    alias=POSITION_RE_PLUS,
+                    heuristic_similarity=tetrad.re_plus_hs,
+                    insight=tetrad.re_plus.insight,
+                    proactiveness=tetrad.re_plus.proactiveness,
+                ),
+            )
+            staged_positions.append(
+                (transformation.re_plus, re_plus_transition, POSITION_RE_PLUS)
+            )
 
-        # Re-: opp_source.pos → opp_target.neg
-        re_minus_transition = self._create_transition(
-            headline=tetrad.re_minus.headline,
-            statement=tetrad.re_minus.statement,
-            source=re_src_plus,
-            target=re_tgt_minus,
-            explanation=tetrad.re_minus.explanation,
-            haiku=tetrad.re_minus.haiku,
-        )
-        transformation.re_minus.connect(
-            re_minus_transition,
-            relationship=ReMinusRelationship(
-                alias=POSITION_RE_MINUS,
-                heuristic_similarity=None,
-                insight=tetrad.re_minus.insight,
-                proactiveness=tetrad.re_minus.proactiveness,
-            ),
-        )
-        self._report.node_created(
-            re_minus_transition, meta={"position": POSITION_RE_MINUS}
-        )
-        self._report.relationship_created(
-            transformation.re_minus, transformation, re_minus_transition,
-            meta={"position": POSITION_RE_MINUS},
-        )
+            # Re-: opp_source.pos → opp_target.neg
+            re_minus_transition = self._create_transition(
+                batch,
+                headline=tetrad.re_minus.headline,
+                statement=tetrad.re_minus.statement,
+                source=re_src_plus,
+                target=re_tgt_minus,
+                explanation=tetrad.re_minus.explanation,
+                haiku=tetrad.re_minus.haiku,
+            )
+            batch.connect(
+                transformation.re_minus,
+                re_minus_transition,
+                relationship=ReMinusRelationship(
+                    alias=POSITION_RE_MINUS,
+                    heuristic_similarity=None,
+                    insight=tetrad.re_minus.insight,
+                    proactiveness=tetrad.re_minus.proactiveness,
+                ),
+            )
+            staged_positions.append(
+                (transformation.re_minus, re_minus_transition, POSITION_RE_MINUS)
+            )
+            staged_nodes = batch.staged_nodes
 
-        # Commit transformation
+        # Transitions and rationales are persisted now
         transformation.commit()
-        self._report.node_committed(transformation)
 
-        return transformation
+        return _WrittenTransformation(
+            transformation=transformation,
+            rationales=[n for n in staged_nodes if isinstance(n, Rationale)],
+            positions=staged_positions,
+        )
 
     def _create_transition(
         self,
+        batch: BatchCommitter,
         headline: str,
         statement: str,
         source: Statement,
@@ -702,9 +746,10 @@ class ExploreTransformations(ReasonableConcern[ExploreTransformationsResult]):
         haiku: str,
     ) -> Transition:
         """
-        Create a Transition node between components.
+        Create a Transition node between components, committed into the batch.
 
         Args:
+            batch: Batch the Transition and its Rationale are committed into
             headline: Short headline (~7 words) - stored on Transition.instruction
             statement: Fuller statement (longer than headline) - stored on Transition.summary
             source: The source component (e.g., T-)
@@ -713,7 +758,7 @@ class ExploreTransformations(ReasonableConcern[ExploreTransformationsResult]):
             haiku: 3-line poem - stored on Transition.haiku
 
         Returns:
-            The committed Transition node
+            The Transition (hashed; persisted when the batch flushes)
         """
         transition = Transition(
             instruction=headline,
@@ -722,12 +767,11 @@ class ExploreTransformations(ReasonableConcern[ExploreTransformationsResult]):
         )
         transition.set_source(source)
         transition.set_target(target)
-        transition.commit()
+        batch.commit(transition)
 
         rationale = Rationale(text=explanation)
         rationale.set_explanation_target(transition)
-        rationale.commit()
-        self._report.node_created(rationale)
+        batch.commit(rationale)
 
         return transition
 
@@ -163,7 +163,7 @@ lead with — this is the reasoning that separates you from generic advice.
 
 ## Tools
 
-- `build_wheels` — Generate causal structures (Cycles + Wheels) from this Nexus. Use nexus_hash: "{nexus_hash}".
+- `build_wheels` — Generate causal structures (Cycles + Wheels) from this Nexus. Use nexus_hash: "{nexus_hash}". If it reports `pruned_branches` (weaker combinations not extended), pass one back as `branches` only when the user wants that combination explored.
 - `explore_transformations` — Generate Action-Reflection transformations for a specific Wheel the user chose.
 - `generate_synthesis` — Generate S+/S- synthesis for a Wheel. Requires transformations first.
 - `expand_nexus` — Add more Perspectives to this Nexus.
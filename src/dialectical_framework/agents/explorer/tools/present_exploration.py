@@ -2,7 +2,7 @@
 PresentExploration: Concern + tool for showing exploration state within a Nexus.
 
 Shows:
-- Nexus intent and perspectives
+- Nexus intent and perspectives (with batch-loaded quality scores)
 - Wheels (with edge summaries)
 - Transformations (Ac+ and Re+ highlights — the synthetic wisdom)
 """
@@ -18,8 +18,11 @@ from dialectical_framework.agents.reasonable_concern import ReasonableConcern
 from dialectical_framework.graph.nodes.nexus import Nexus
 from dialectical_framework.graph.nodes.transformation import Transformation
 from dialectical_framework.graph.nodes.wheel import Wheel
+from dialectical_framework.graph.perspective_metrics import PerspectiveMetrics
 from dialectical_framework.graph.repositories.nexus_repository import \
     NexusRepository
+from dialectical_framework.graph.repositories.perspective_repository import \
+    PerspectiveRepository
 from dialectical_framework.graph.repositories.transformation_repository import \
     TransformationRepository
 from dialectical_framework.graph.repositories.wheel_repository import \
@@ -56,7 +59,10 @@ class PresentExploration(ReasonableConcern[str]):
             (pp, rel) for pp, rel in nexus.perspectives.all() if not pp.discarded
         ]
         if perspectives:
-            sections.append(self._format_perspectives(perspectives))
+            metrics = PerspectiveRepository().load_metrics(
+                [pp for pp, _ in perspectives]
+            )
+            sections.append(self._format_perspectives(perspectives, metrics))
 
         wheel_repo = WheelRepository()
         tr_repo = TransformationRepository()
@@ -91,11 +97,22 @@ class PresentExploration(ReasonableConcern[str]):
         return "\n".join(lines)
 
     @staticmethod
-    def _format_perspectives(perspectives: list) -> str:
+    def _format_perspectives(
+        perspectives: list, metrics: PerspectiveMetrics | None = None
+    ) -> str:
         lines = [f"## Perspectives ({len(perspectives)})"]
         for i, (pp, _) in enumerate(perspectives, 1):
             intent_str = f" ({pp.intent})" if pp.intent else ""
             lines.append(f"  Perspective {i} [{pp.short_hash}]{intent_str}: {pp:positions:0}")
+            scores = metrics.row(pp._id) if metrics is not None else None
+            if scores is not None and scores.area is not None:
+                quality = (
+                    f"    Quality: area={scores.area:.2f}, "
+                    f"rectangularity={scores.rectangularity:.2f}"
+                )
+                if scores.dv is not None:
+                    quality += f", DV={scores.dv:.2f}"
+                lines.append(quality)
         return "\n".join(lines)
 
     @staticmethod
@@ -115,6 +132,8 @@ class PresentExploration(ReasonableConcern[str]):
                 for w in wheels:
                     if w._id not in seen_ids:
                         seen_ids.add(w._id)
+                        if w.is_committed:
+                            w.prefetch()
                         all_wheels.append(w)
 
         return all_wheels
@@ -150,15 +169,10 @@ class PresentExploration(ReasonableConcern[str]):
         from dialectical_framework.graph.nodes.estimation import \
             CausalityProbabilityEstimation
 
-        probs: dict = {}
-        for wheel in wheels:
-            value = None
-            for est, _ in wheel.estimations.all():
-                if isinstance(est, CausalityProbabilityEstimation):
-                    value = est.value
-                    break
-            probs[wheel._id] = value
-        return probs
+        return {
+            wheel._id: wheel.estimation_value(CausalityProbabilityEstimation)
+            for wheel in wheels
+        }
 
     @staticmethod
     def _format_wheels(
@@ -210,11 +224,9 @@ class PresentExploration(ReasonableConcern[str]):
             if edges:
                 edge_strs = []
                 for edge in edges:
-                    source_result = edge.source.get()
-                    target_result = edge.target.get()
-                    if source_result and target_result:
-                        src, _ = source_result
-                        tgt, _ = target_result
+                    src = wheel._edge_source(edge)
+                    tgt = wheel._edge_target(edge)
+                    if src is not None and tgt is not None:
                         edge_strs.append(f"{src.text} -> {tgt.text}")
                 if edge_strs:
                     lines.append(f"    Edges: {' | '.join(edge_strs)}")
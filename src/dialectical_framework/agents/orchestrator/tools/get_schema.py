@@ -7,11 +7,20 @@ when needed — typically before writing raw Cypher queries.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from dependency_injector.wiring import Provide, inject
 from mirascope import llm
 
 from dialectical_framework.agents.reasonable_concern import ReasonableConcern
+from dialectical_framework.agents.tool_scheduler import tool_concurrency
+from dialectical_framework.enums.di import DI
+from dialectical_framework.enums.tool_concurrency import ToolConcurrency
 from dialectical_framework.graph.repositories.schema_repository import SchemaRepository
 
+if TYPE_CHECKING:
+    from dialectical_framework.graph.graph_db_pool import AsyncGraphDb
+
 
 GRAPH_SCHEMA = """## Graph Schema
 
@@ -35,7 +44,7 @@ GRAPH_SCHEMA = """## Graph Schema
 | Rationale | Explanation attached to any node | `text` |
 | Estimation | Numeric assessment (probability, relevance, feasibility) | `value` |
 
-All nodes share: `hash` (content-addressable ID), `sid` (scope ID), `committed_at`.
+All nodes share: `hash` (content-addressable ID), `short_hash` (its first 7 characters — the short hashes you see quoted; indexed, match it with `=`), `sid` (scope ID), `committed_at`.
 
 **Important:** Only query committed nodes. Always add `WHERE n.hash IS NOT NULL` to filter out incomplete (in-progress or abandoned) nodes. Nodes with `hash IS NULL` are not yet finalized and must not be included in results.
 
@@ -121,7 +130,7 @@ MATCH (a:Statement)-[:A]->(pol)
 RETURN pp.hash, t.text AS thesis, a.text AS antithesis
 
 -- Full Perspective (all 6 positions)
-MATCH (pp:Perspective) WHERE pp.hash STARTS WITH "abc"
+MATCH (pp:Perspective) WHERE pp.short_hash = "abc1234"
 MATCH (pp)-[:HAS_POLARITY]->(pol)
 MATCH (t:Statement)-[:T]->(pol), (a:Statement)-[:A]->(pol)
 OPTIONAL MATCH (tp:Statement)-[:T_PLUS]->(pp)
@@ -131,14 +140,14 @@ OPTIONAL MATCH (am:Statement)-[:A_MINUS]->(pp)
 RETURN t.text, a.text, tp.text, tm.text, ap.text, am.text
 
 -- Wheel edges (transitions in order)
-MATCH (w:Wheel) WHERE w.hash STARTS WITH "abc"
+MATCH (w:Wheel) WHERE w.short_hash = "abc1234"
 MATCH (t:Transition)-[:BELONGS_TO_CYCLE]->(w)
 MATCH (src:Statement)-[:IS_SOURCE_OF]->(t)
 MATCH (t)-[:IS_TARGET_OF]->(tgt:Statement)
 RETURN src.text AS source, tgt.text AS target
 
 -- Transformations for a Wheel
-MATCH (w:Wheel) WHERE w.hash STARTS WITH "abc"
+MATCH (w:Wheel) WHERE w.short_hash = "abc1234"
 MATCH (edge:Transition)-[:BELONGS_TO_CYCLE]->(w)
 MATCH (tr:Transformation)-[:ACTION_REFLECTION]->(edge)
 MATCH (ac_t:Transition)-[:AC_PLUS]->(tr)
@@ -165,9 +174,13 @@ RETURN t.statement, r.insight, r.proactiveness
 class GetSchema(ReasonableConcern[str]):
     """Loads the graph schema for the LLM to reference."""
 
-    async def resolve(self) -> str:
+    @inject
+    async def resolve(
+        self,
+        async_graph_db: AsyncGraphDb = Provide[DI.async_graph_db],
+    ) -> str:
         repo = SchemaRepository()
-        live_schema = self._query_live_schema(repo)
+        live_schema = await async_graph_db.run(self._query_live_schema, repo)
         return GRAPH_SCHEMA + "\n\n" + live_schema
 
     def _query_live_schema(self, repo: SchemaRepository) -> str:
@@ -188,6 +201,7 @@ class GetSchema(ReasonableConcern[str]):
         return "\n".join(lines)
 
 
+@tool_concurrency(ToolConcurrency.READ_ONLY)
 @llm.tool
 async def get_schema() -> str:
     """Load the full graph schema — node types, relationship directions, edge properties, and Cypher query patterns. Call this before using query_graph or when you need to understand the graph structure."""
@@ -148,7 +148,9 @@ from mirascope import llm
 from pydantic import Field
 
 from dialectical_framework.agents.reasonable_concern import ReasonableConcern
+from dialectical_framework.agents.tool_scheduler import tool_concurrency
 from dialectical_framework.enums.di import DI
+from dialectical_framework.enums.tool_concurrency import ToolConcurrency
 from dialectical_framework.graph.nodes.estimation import \
     DialecticalValidityEstimation
 from dialectical_framework.graph.rendering import (
@@ -164,6 +166,7 @@ from dialectical_framework.graph.repositories.node_repository import NodeReposit
 from dialectical_framework.graph.repositories.perspective_repository import PerspectiveRepository
 
 if TYPE_CHECKING:
+    from dialectical_framework.graph.graph_db_pool import AsyncGraphDb
     from dialectical_framework.graph.nodes.cycle import Cycle
     from dialectical_framework.graph.nodes.decision import Decision
     from dialectical_framework.graph.nodes.nexus import Nexus
@@ -235,10 +238,9 @@ def _inspect_perspective(pp: Perspective) -> str:
         metrics.append(f"rect={rect:.4f}")
     # DV (Dialectical Validity, paper's naturalness companion to SP) — read
     # from the persisted estimation, annotation only.
-    for est, _ in pp.estimations.all():
-        if isinstance(est, DialecticalValidityEstimation):
-            metrics.append(f"DV={est.value:.3f}")
-            break
+    dv = pp.estimation_value(DialecticalValidityEstimation)
+    if dv is not None:
+        metrics.append(f"DV={dv:.3f}")
     if metrics:
         lines.append(f"Quality: {', '.join(metrics)}")
 
@@ -432,10 +434,9 @@ def _inspect_cycle(cycle: Cycle) -> str:
 
     # Causality probability
     from dialectical_framework.graph.nodes.estimation import CausalityProbabilityEstimation
-    for est, _ in cycle.estimations.all():
-        if isinstance(est, CausalityProbabilityEstimation):
-            lines.append(f"Causality probability: {est.value:.3f}")
-            break
+    probability = cycle.estimation_value(CausalityProbabilityEstimation)
+    if probability is not None:
+        lines.append(f"Causality probability: {probability:.3f}")
 
     # Rationales
     rationales = list(cycle.rationales.all())
@@ -463,6 +464,9 @@ def _inspect_wheel(wheel: Wheel) -> str:
     lines.append(f"## Wheel [{_node_id(wheel)}]{_status_tag(wheel)}")
     lines.append("")
 
+    if wheel.is_committed:
+        wheel.prefetch()
+
     # Resolve nexus for consistent indexing
     nexus = find_nexus_for_wheel(wheel)
     pp_index = build_pp_index(nexus) if nexus else None
@@ -516,10 +520,9 @@ def _inspect_wheel(wheel: Wheel) -> str:
 
     # Causality probability
     from dialectical_framework.graph.nodes.estimation import CausalityProbabilityEstimation
-    for est, _ in wheel.estimations.all():
-        if isinstance(est, CausalityProbabilityEstimation):
-            lines.append(f"Causality probability: {est.value:.3f}")
-            break
+    probability = wheel.estimation_value(CausalityProbabilityEstimation)
+    if probability is not None:
+        lines.append(f"Causality probability: {probability:.3f}")
 
     lines.append("")
 
@@ -610,10 +613,9 @@ def _inspect_transformation(tr: Transformation) -> str:
                 scores.append(f"proactiveness={rel.proactiveness:.2f}")
             if hasattr(rel, "heuristic_similarity") and rel.heuristic_similarity is not None:
                 scores.append(f"HS={rel.heuristic_similarity:.2f}")
-            for est, _ in transition.estimations.all():
-                if isinstance(est, FeasibilityEstimation):
-                    scores.append(f"feasibility={est.value:.2f}")
-                    break
+            feasibility = transition.estimation_value(FeasibilityEstimation)
+            if feasibility is not None:
+                scores.append(f"feasibility={feasibility:.2f}")
             if scores:
                 lines.append(f"  scores: {', '.join(scores)}")
 
@@ -744,6 +746,14 @@ class InspectNode(ReasonableConcern[str]):
 
     @inject
     async def resolve(
+        self,
+        node_hash: str,
+        async_graph_db: AsyncGraphDb = Provide[DI.async_graph_db],
+    ) -> str:
+        return await async_graph_db.run(self._inspect, node_hash)
+
+    @inject
+    def _inspect(
         self,
         node_hash: str,
         graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db],
@@ -800,6 +810,7 @@ class InspectNode(ReasonableConcern[str]):
         return result
 
 
+@tool_concurrency(ToolConcurrency.READ_ONLY)
 @llm.tool
 async def inspect_node(
     node_hash: Annotated[str, Field(description="Full hash or unique prefix (7+ chars) of the node to inspect")],
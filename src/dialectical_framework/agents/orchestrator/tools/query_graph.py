@@ -10,15 +10,19 @@ All tools are stateless - the current `sid` flows via DI.
 from __future__ import annotations
 
 import re
-from typing import Annotated, Optional, Union
+from typing import TYPE_CHECKING, Annotated, Optional
 
 from dependency_injector.wiring import Provide, inject
-from gqlalchemy import Memgraph, Neo4j
 from mirascope import llm
 from pydantic import Field
 
 from dialectical_framework.agents.reasonable_concern import ReasonableConcern
+from dialectical_framework.agents.tool_scheduler import tool_concurrency
 from dialectical_framework.enums.di import DI
+from dialectical_framework.enums.tool_concurrency import ToolConcurrency
+
+if TYPE_CHECKING:
+    from dialectical_framework.graph.graph_db_pool import AsyncGraphDb
 
 
 def _is_schema_query(query: str) -> bool:
@@ -112,7 +116,7 @@ class QueryGraph(ReasonableConcern[str]):
         self,
         cypher: str,
         limit: int = 50,
-        graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db],
+        async_graph_db: AsyncGraphDb = Provide[DI.async_graph_db],
         sid: Optional[str] = Provide[DI.sid],
     ) -> str:
         query_upper = cypher.upper()
@@ -155,7 +159,7 @@ class QueryGraph(ReasonableConcern[str]):
                 query = f"{query} LIMIT {limit}"
 
         try:
-            results = list(graph_db.execute_and_fetch(query, {"sid": sid}))
+            results = await async_graph_db.execute_and_fetch(query, {"sid": sid})
         except Exception as e:
             return f"Query error: {e}"
 
@@ -187,6 +191,7 @@ class QueryGraph(ReasonableConcern[str]):
         return "\n".join(lines)
 
 
+@tool_concurrency(ToolConcurrency.READ_ONLY)
 @llm.tool
 async def query_graph(
     cypher: Annotated[str, Field(description="Read-only Cypher query. Do not include sid — it's injected automatically.")],
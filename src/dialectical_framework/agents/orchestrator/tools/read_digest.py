@@ -7,18 +7,23 @@ whether to refine it or pull full content.
 
 from __future__ import annotations
 
-from typing import Annotated, Union
+from typing import TYPE_CHECKING, Annotated, Union
 
 from dependency_injector.wiring import Provide, inject
 from gqlalchemy import Memgraph, Neo4j
 from mirascope import llm
 from pydantic import Field
 
+from dialectical_framework.agents.tool_scheduler import tool_concurrency
 from dialectical_framework.enums.di import DI
+from dialectical_framework.enums.tool_concurrency import ToolConcurrency
 from dialectical_framework.graph.nodes.input import Input
 from dialectical_framework.graph.repositories.node_repository import \
     NodeRepository
 
+if TYPE_CHECKING:
+    from dialectical_framework.graph.graph_db_pool import AsyncGraphDb
+
 
 @inject
 def _read_digest(
@@ -37,9 +42,18 @@ def _read_digest(
     return input_node.digest
 
 
+@inject
+async def _read_digest_async(
+    input_hash: str,
+    async_graph_db: AsyncGraphDb = Provide[DI.async_graph_db],
+) -> str:
+    return await async_graph_db.run(_read_digest, input_hash)
+
+
+@tool_concurrency(ToolConcurrency.READ_ONLY)
 @llm.tool
 async def read_digest(
     input_hash: Annotated[str, Field(description="Hash of the Input node")],
 ) -> str:
     """Read the current analytical digest of an input source. Use to see what the framework currently understands about a source before deciding to refine or pull full content."""
-    return _read_digest(input_hash)
+    return await _read_digest_async(input_hash)
@@ -6,28 +6,40 @@ Used when the LLM decides the digest isn't enough and needs the full source text
 
 from __future__ import annotations
 
-from typing import Annotated, Union
+from typing import TYPE_CHECKING, Annotated, Optional, Union
 
 from dependency_injector.wiring import Provide, inject
 from gqlalchemy import Memgraph, Neo4j
 from mirascope import llm
 from pydantic import Field
 
+from dialectical_framework.agents.tool_scheduler import tool_concurrency
 from dialectical_framework.enums.di import DI
+from dialectical_framework.enums.tool_concurrency import ToolConcurrency
 from dialectical_framework.graph.nodes.input import Input
 from dialectical_framework.graph.repositories.node_repository import \
     NodeRepository
 from dialectical_framework.protocols.input_resolver import InputResolver
 
+if TYPE_CHECKING:
+    from dialectical_framework.graph.graph_db_pool import AsyncGraphDb
+
+
+@inject
+def _find_input(
+    input_hash: str,
+    graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db],
+) -> Optional[Input]:
+    return NodeRepository().find_by_hash(input_hash, node_type=Input)
+
 
 @inject
 async def _resolve_input(
     input_hash: str,
     input_resolver: InputResolver = Provide[DI.input_resolver],
-    graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db],
+    async_graph_db: AsyncGraphDb = Provide[DI.async_graph_db],
 ) -> str:
-    repo = NodeRepository()
-    input_node = repo.find_by_hash(input_hash, node_type=Input)
+    input_node = await async_graph_db.run(_find_input, input_hash)
 
     if not input_node:
         return f"Input not found: {input_hash}"
@@ -39,6 +51,7 @@ async def _resolve_input(
     return resolved
 
 
+@tool_concurrency(ToolConcurrency.READ_ONLY)
 @llm.tool
 async def read_input(
     input_hash: Annotated[str, Field(description="Hash of the Input node to read")],
@@ -18,6 +18,9 @@ from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from langfuse import get_client, observe
 
+from dialectical_framework.graph.query_profiler import profile_queries, publish_queries
+from dialectical_framework.utils.prompt_cache import PromptCacheUsage, track_prompt_cache
+
 if TYPE_CHECKING:
     from dialectical_framework.agents.execution_report import ExecutionReport
 
@@ -44,6 +47,42 @@ def _conditional_observe(name: str, fn: Any) -> Any:
     return wrapper
 
 
+def _publish_prompt_cache(concern: Any, usage: PromptCacheUsage) -> None:
+    """Attach the prompt-cache token summary to the report and the Langfuse span."""
+    if not usage.calls:
+        return
+    summary = usage.summary()
+    concern._report.artifacts["prompt_cache"] = summary
+    if get_client().get_current_trace_id():
+        get_client().update_current_span(metadata={"prompt_cache": summary})
+
+
+def _profile_queries(fn: Any) -> Any:
+    """Wrap resolve() to profile the graph queries and LLM prompt caching it incurs."""
+    if asyncio.iscoroutinefunction(fn):
+        @wraps(fn)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            name = type(self).__name__
+            with profile_queries(name) as profile, track_prompt_cache(name) as usage:
+                try:
+                    return await fn(self, *args, **kwargs)
+                finally:
+                    publish_queries(profile, self._report.artifacts)
+                    _publish_prompt_cache(self, usage)
+    else:
+        @wraps(fn)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            name = type(self).__name__
+            with profile_queries(name) as profile, track_prompt_cache(name) as usage:
+                try:
+                    return fn(self, *args, **kwargs)
+                finally:
+                    publish_queries(profile, self._report.artifacts)
+                    _publish_prompt_cache(self, usage)
+
+    return wrapper
+
+
 class ReasonableConcern(ABC, Generic[R_co]):
     """
     Base class for concerns, skills, and tools.
@@ -63,7 +102,9 @@ class ReasonableConcern(ABC, Generic[R_co]):
         super().__init_subclass__(**kwargs)
         if "resolve" in cls.__dict__:
             original = cls.__dict__["resolve"]
-            cls.resolve = _conditional_observe(cls.__name__, original)  # type: ignore[assignment]
+            cls.resolve = _conditional_observe(  # type: ignore[assignment]
+                cls.__name__, _profile_queries(original)
+            )
 
     def __getattr__(self, name: str) -> Any:
         if name == "_report":
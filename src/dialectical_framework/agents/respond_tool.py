@@ -0,0 +1,65 @@
+"""
+respond: terminal tool through which an agent delivers its structured final answer.
+
+With settings.single_pass_responses, ConversationFacilitator offers `respond`
+next to the agent's tools, its parameters being the response model's fields.
+A round that calls only `respond` ends the turn: the arguments are the answer,
+and no separate extraction call is made.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+from mirascope.llm import AsyncTool
+from mirascope.llm.tools.tool_schema import ToolParameterSchema
+from pydantic import BaseModel
+
+RESPOND_TOOL_NAME = "respond"
+
+_RESPOND_DESCRIPTION = (
+    "Deliver your final answer and end your turn. Call it on its own, once no "
+    "other tool is needed; its arguments are your complete answer."
+)
+
+
+async def _respond(**_: Any) -> str:
+    # Only executed when called alongside other tools; a lone call ends the turn
+    # before execution.
+    return (
+        f"Not delivered: call {RESPOND_TOOL_NAME} on its own, after your other "
+        "tool calls have returned."
+    )
+
+
+@lru_cache(maxsize=None)
+def respond_tool(response_model: type[BaseModel]) -> AsyncTool:
+    """
+    The `respond` tool for a response model (one instance per model, so
+    providers' tool-encoding caches keep hitting).
+
+    Args:
+        response_model: Pydantic model of the final answer
+
+    Returns:
+        AsyncTool whose parameters are the model's fields
+    """
+    schema = response_model.model_json_schema()
+    parameters = {
+        "properties": schema.get("properties", {}),
+        "required": schema.get("required", []),
+    }
+    if "$defs" in schema:
+        parameters["$defs"] = schema["$defs"]
+    return AsyncTool(
+        fn=_respond,
+        name=RESPOND_TOOL_NAME,
+        description=_RESPOND_DESCRIPTION,
+        parameters=ToolParameterSchema.model_validate(parameters),
+    )
+
+
+def is_respond_round(tool_calls: list) -> bool:
+    """True when a round's only tool call is `respond`."""
+    return len(tool_calls) == 1 and tool_calls[0].name == RESPOND_TOOL_NAME
@@ -0,0 +1,164 @@
+"""
+ToolScheduler: runs the independent tool calls of one agentic round concurrently.
+
+Tools declare how their calls may overlap with @tool_concurrency:
+- READ_ONLY: overlaps with other reads; such tools push their synchronous
+  graph work through AsyncGraphDb.run so it doesn't block the event loop
+- NODE_WRITE: writes the node named by one of its arguments; overlaps with
+  writes to other nodes
+- EXCLUSIVE (undeclared tools): runs alone
+
+A call waits for every earlier call in the round it conflicts with, so the
+model's ordering holds wherever it matters. Every call runs on the caller's
+event loop, where loop-bound singletons (the event bus, the LLM scheduler)
+live. Outputs are reported by call index; callers hand them to resume() in
+call order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import (TYPE_CHECKING, AsyncGenerator, Callable, NamedTuple,
+                    Optional, Sequence, TypeVar)
+
+from dialectical_framework.enums.tool_concurrency import ToolConcurrency
+from dialectical_framework.graph.nodes.base_node import SHORT_HASH_LENGTH
+
+if TYPE_CHECKING:
+    from mirascope.llm import AsyncToolkit, ToolCall, ToolOutput
+
+ToolT = TypeVar("ToolT")
+
+
+def tool_concurrency(
+    mode: ToolConcurrency, key: Optional[str] = None
+) -> Callable[[ToolT], ToolT]:
+    """
+    Declare how calls of a tool may overlap with other calls. Apply above @llm.tool.
+
+    Args:
+        mode: Concurrency class of the tool
+        key: For NODE_WRITE, the argument holding the hash of the node written
+
+    Example:
+        @tool_concurrency(ToolConcurrency.NODE_WRITE, key="wheel_hash")
+        @llm.tool
+        async def refine_wheel(wheel_hash: str, ...) -> str: ...
+    """
+    if mode is ToolConcurrency.NODE_WRITE and not key:
+        raise ValueError("NODE_WRITE tools must name the argument holding the node hash")
+
+    def decorate(tool: ToolT) -> ToolT:
+        tool.concurrency = mode
+        tool.concurrency_key = key
+        return tool
+
+    return decorate
+
+
+class ToolClaim(NamedTuple):
+    """What a single tool call touches."""
+
+    mode: ToolConcurrency
+    node: Optional[str] = None
+
+    def conflicts_with(self, other: ToolClaim) -> bool:
+        if self.mode is ToolConcurrency.READ_ONLY and other.mode is ToolConcurrency.READ_ONLY:
+            return False
+        if self.mode is ToolConcurrency.NODE_WRITE and other.mode is ToolConcurrency.NODE_WRITE:
+            return self.node == other.node
+        return True
+
+
+class ToolCallEvent(NamedTuple):
+    """A scheduled call started (finished=False) or finished with its output."""
+
+    index: int
+    finished: bool
+    output: Optional[ToolOutput] = None
+
+
+class ToolScheduler:
+    """
+    Executes a round of tool calls, overlapping those that don't conflict.
+
+    Example:
+        scheduler = ToolScheduler(response.toolkit, limit=4)
+        async for event in scheduler.run(response.tool_calls):
+            ...
+    """
+
+    def __init__(self, toolkit: AsyncToolkit, limit: int) -> None:
+        """
+        Args:
+            toolkit: Toolkit that executes the calls
+            limit: Max calls running at once
+        """
+        self._toolkit = toolkit
+        self._limit = max(1, limit)
+
+    def claim(self, tool_call: ToolCall) -> ToolClaim:
+        """
+        Claim of a call, from its tool's declaration. Undeclared and unknown
+        tools, and NODE_WRITE calls without the node argument, are EXCLUSIVE.
+        """
+        tool = self._toolkit.tools_dict.get(tool_call.name)
+        mode = getattr(tool, "concurrency", ToolConcurrency.EXCLUSIVE)
+        if mode is not ToolConcurrency.NODE_WRITE:
+            return ToolClaim(mode)
+
+        try:
+            args = json.loads(tool_call.args) if tool_call.args else {}
+        except ValueError:
+            args = {}
+        node = args.get(tool.concurrency_key) if isinstance(args, dict) else None
+        if not isinstance(node, str) or not node:
+            return ToolClaim(ToolConcurrency.EXCLUSIVE)
+        # Calls may name one node by prefixes of different lengths; compare
+        # on the short hash (a collision only costs serialization).
+        return ToolClaim(mode, node[:SHORT_HASH_LENGTH])
+
+    async def run(
+        self, tool_calls: Sequence[ToolCall]
+    ) -> AsyncGenerator[ToolCallEvent, None]:
+        """
+        Execute the calls, yielding an event as each starts and finishes.
+
+        Raises:
+            The first exception raised while executing a call (tools report
+            their own failures as outputs; this covers e.g. pool timeouts)
+        """
+        claims = [self.claim(tc) for tc in tool_calls]
+        done = [asyncio.Event() for _ in tool_calls]
+        semaphore = asyncio.Semaphore(self._limit)
+        queue: asyncio.Queue[tuple[int, Optional[ToolOutput], Optional[BaseException], bool]] = asyncio.Queue()
+
+        async def _run(index: int) -> None:
+            try:
+                for earlier in range(index):
+                    if claims[index].conflicts_with(claims[earlier]):
+                        await done[earlier].wait()
+                async with semaphore:
+                    queue.put_nowait((index, None, None, False))
+                    output = await self._toolkit.execute(tool_calls[index])
+                queue.put_nowait((index, output, None, True))
+            except Exception as e:
+                queue.put_nowait((index, None, e, True))
+            finally:
+                done[index].set()
+
+        tasks = [asyncio.create_task(_run(i)) for i in range(len(tool_calls))]
+        try:
+            finished = 0
+            while finished < len(tasks):
+                index, output, error, is_finished = await queue.get()
+                if error is not None:
+                    raise error
+                if is_finished:
+                    finished += 1
+                yield ToolCallEvent(index, is_finished, output)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
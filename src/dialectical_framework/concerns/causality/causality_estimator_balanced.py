@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Optional, Union
+import logging
+from typing import Optional, Sequence, Union
 
 from dependency_injector.wiring import Provide, inject
 from mirascope import llm
@@ -19,11 +20,21 @@ from dialectical_framework.concerns.causality.causality_estimator import (
     EstimationStructured,
     StepCausation,
 )
+from dialectical_framework.protocols.has_config import SettingsAware
 from dialectical_framework.protocols.input_resolver import InputResolver
 
 from dialectical_framework.utils.dc_replace import dc_replace
+from dialectical_framework.utils.prompt_cache import cache_breakpoint
 from dialectical_framework.utils.use_brain import use_brain
 
+logger = logging.getLogger(__name__)
+
+# Rough token accounting for the batch packer (no tokenizer dependency):
+# ~4 characters per token, plus the expected assessment output per sequence
+_CHARS_PER_TOKEN = 4
+_OUTPUT_TOKENS_PER_STEP = 40
+_OUTPUT_TOKENS_PER_SEQUENCE = 200
+
 
 class StepCausationDto(BaseModel):
     from_alias: str = Field(
@@ -66,6 +77,22 @@ class CausalCycleAssessmentDto(BaseModel):
     )
 
 
+class SequenceAssessmentDto(CausalCycleAssessmentDto):
+    # Required: an unlabelled assessment fails validation, and the batch
+    # falls back to per-sequence calls instead of misattributing it
+    sequence: int = Field(
+        ...,
+        description="Number of the assessed sequence, exactly as labelled (e.g. 2 for 'Sequence 2').",
+    )
+
+
+class CausalCyclesAssessmentDto(BaseModel):
+    assessments: list[SequenceAssessmentDto] = Field(
+        default_factory=list,
+        description="One assessment per sequence, each assessed independently, in the order given.",
+    )
+
+
 class CausalCycleDto(CausalCycleAssessmentDto):
     aliases: list[str] = Field(
         ...,
@@ -128,6 +155,43 @@ def _resolve_steps(
     return resolved
 
 
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of prompt text."""
+    return len(text) // _CHARS_PER_TOKEN + 1
+
+
+def pack_sequences(
+    costs: Sequence[int], *, shared: int, budget: int
+) -> list[list[int]]:
+    """
+    Pack sequences into batched estimation calls under a token budget.
+
+    Greedy and order-preserving: a batch grows while the shared context plus
+    its sequences' costs fit the budget. A sequence that does not fit even
+    alone gets a batch of its own (a per-sequence call).
+
+    Args:
+        costs: Token cost per sequence (prompt line + expected output)
+        shared: Token cost of the context every call repeats
+        budget: Token budget per call
+
+    Returns:
+        Batches of indices into `costs`
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    used = shared
+    for index, cost in enumerate(costs):
+        if current and used + cost > budget:
+            batches.append(current)
+            current, used = [], shared
+        current.append(index)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
 class CausalCyclesDeckDto(BaseModel):
     causal_cycles: list[CausalCycleDto] = Field(
         ...,
@@ -141,7 +205,9 @@ def _prompt_input_text(*, text: str) -> list:
             f"Consider the following text as the initial context for further analysis:\n\n"
             f"<context>{text}</context>"
         ),
-        llm.messages.assistant("OK, let's start.", model_id=None, provider_id=None),
+        cache_breakpoint(
+            llm.messages.assistant("OK, let's start.", model_id=None, provider_id=None)
+        ),
     ]
 
 
@@ -151,14 +217,21 @@ def _prompt_input_theses(*, statements: list[list[str]]) -> list:
         llm.messages.user(
             f"Consider these statements:\n\n{formatted}"
         ),
-        llm.messages.assistant("OK, let's proceed.", model_id=None, provider_id=None),
+        cache_breakpoint(
+            llm.messages.assistant("OK, let's proceed.", model_id=None, provider_id=None)
+        ),
     ]
 
 
 def _build_thesis_context(
     theses: list[StatementDto], text: Optional[str] = None
 ) -> list:
-    """Build prompt context from thesis DTOs and optional source text."""
+    """
+    Build prompt context from thesis DTOs and optional source text.
+
+    Both parts end in a cache breakpoint: every sequence of a layer re-sends
+    the source text, and every sequence of one Perspective set the theses.
+    """
     tpl: list = []
 
     if text:
@@ -177,7 +250,7 @@ def _build_thesis_context(
     return tpl
 
 
-class CausalityEstimatorBalanced(CausalityEstimator):
+class CausalityEstimatorBalanced(CausalityEstimator, SettingsAware):
     """
     Causality estimator that estimates probabilities for Cycles and Wheels.
 
@@ -189,6 +262,12 @@ class CausalityEstimatorBalanced(CausalityEstimator):
 
     The CausalityEstimation concern handles all the smart orchestration.
 
+    By default every sequence is one LLM call. With
+    settings.causality_batch_token_budget set, sequences over the same
+    statements (one Perspective set) are packed into multi-sequence calls
+    that share the context; sequences a batch fails to return fall back to
+    single calls.
+
     Subclasses (Desirable, Feasible, Realistic, Criteria) override prompt
     templates to change the assessment perspective.
     """
@@ -222,16 +301,52 @@ class CausalityEstimatorBalanced(CausalityEstimator):
         Subclasses customize only _lens_phrase() and _probability_instruction();
         the sequence handling, instructions, and formatting rules stay identical.
         """
+        return self._prompt_assess(
+            subject="the following circular causality sequence",
+            wrap_around="the final step cycles back to the first step",
+            sequences=sequence,
+        )
+
+    def prompt_assess_sequences(self, *, sequences: list[tuple[int, str]]) -> list:
+        """
+        Multi-sequence variant of prompt_assess_single_sequence: the same
+        lens, instructions and formatting, applied to each numbered sequence.
+        """
+        return self._prompt_assess(
+            subject=f"each of the following {len(sequences)} circular causality sequences",
+            wrap_around="the final step of each cycles back to its first step",
+            sequences="\n".join(f"Sequence {number}: {sequence}" for number, sequence in sequences),
+            preamble=(
+                "Assess every sequence independently, on its own merits — do not rank "
+                "them against each other. For each sequence:\n"
+            ),
+            which="each sequence",
+            extra_rules="- Return exactly one assessment per sequence, labelled with its sequence number.\n",
+        )
+
+    def _prompt_assess(
+        self,
+        *,
+        subject: str,
+        wrap_around: str,
+        sequences: str,
+        preamble: str = "",
+        which: str = "the sequence",
+        extra_rules: str = "",
+    ) -> list:
+        """The assessment prompt both public variants are rendered from."""
         return [llm.messages.user(
-            f"Assess the following circular causality sequence {self._lens_phrase()}\n"
-            f"(given that the final step cycles back to the first step):\n"
-            f"{sequence}\n\n"
+            f"Assess {subject} {self._lens_phrase()}\n"
+            f"(given that {wrap_around}):\n"
+            f"{sequences}\n\n"
             f"<instructions>\n"
+            f"{preamble}"
             f"1) For each consecutive step of the sequence (including the final wrap-around step back to the first element), state in one sentence the causal mechanism: why does the source naturally lead to the target?\n"
             f"2) Only then, informed by the step-by-step causation, estimate the numeric probability (0 to 1) {self._probability_instruction()}\n"
             f"3) Explain why this sequence might occur (or already occurs) in reality\n"
             f"4) Describe circumstances or contexts where this sequence would be most applicable or useful\n\n"
-            f"- Only use the sequence **exactly as provided**, do not shorten, skip, collapse, or reorder steps.\n"
+            f"- Only use {which} **exactly as provided**, do not shorten, skip, collapse, or reorder steps.\n"
+            f"{extra_rules}"
             f"</instructions>\n\n"
             f"<formatting>\n"
             f"- In each step, identify source and target by their technical aliases exactly as given in the sequence; write the causation sentence itself using the actual statement wording, never aliases.\n"
@@ -308,6 +423,8 @@ class CausalityEstimatorBalanced(CausalityEstimator):
             CausalCyclesDeckDto with assessments for each sequence
         """
         sequences_str: dict[str, list[str]] = {}
+        # Statement set per sequence: sequences sharing one can be batched
+        statement_sets: dict[str, frozenset[str]] = {}
 
         # Build DTOs for AI boundary
         component_dtos: dict[str, StatementDto] = {}
@@ -346,6 +463,9 @@ class CausalityEstimatorBalanced(CausalityEstimator):
 
             full_cycle_str = f"{cycle_str} ({readable_cycle})"
             sequences_str[full_cycle_str] = sequence_aliases
+            statement_sets[full_cycle_str] = frozenset(
+                component.hash for component in sequence if component.hash
+            )
 
         # Create DTO deck for AI boundary
         statements_deck_dto = StatementsDeckDto(
@@ -374,16 +494,104 @@ class CausalityEstimatorBalanced(CausalityEstimator):
                 argumentation=assessment.argumentation,
             )
 
-        # Execute all async estimators concurrently
-        async_estimators = []
-        for sequence, als in sequences_str.items():
-            async_estimators.append(
-                _estimate_single(sequence_str=sequence, aliases=als)
+        async def _estimate_batch(batch: list[str]) -> list[CausalCycleDto]:
+            if len(batch) == 1:
+                return [await _estimate_single(batch[0], sequences_str[batch[0]])]
+
+            numbered = {
+                int(sequences_str[seq][0].split("_")[0][1:]): seq for seq in batch
+            }
+
+            @use_brain(format=CausalCyclesAssessmentDto)
+            async def _estimate_batch_call() -> list:
+                prompt = self.prompt_assess_sequences(sequences=list(numbered.items()))
+                tpl = _build_thesis_context(
+                    theses=statements_deck_dto.statements,
+                    text=text,
+                )
+                tpl.extend(prompt)
+                return tpl
+
+            assessed: dict[int, SequenceAssessmentDto] = {}
+            try:
+                deck: CausalCyclesAssessmentDto = await _estimate_batch_call()
+                for assessment in deck.assessments:
+                    if assessment.sequence in numbered:
+                        assessed.setdefault(assessment.sequence, assessment)
+            except Exception:
+                logger.warning(
+                    "Batched causality estimation of %d sequences failed; "
+                    "estimating them one by one",
+                    len(batch),
+                    exc_info=True,
+                )
+
+            results = [
+                CausalCycleDto(
+                    aliases=sequences_str[numbered[number]],
+                    steps=assessment.steps,
+                    probability=assessment.probability,
+                    reasoning_explanation=assessment.reasoning_explanation,
+                    argumentation=assessment.argumentation,
+                )
+                for number, assessment in assessed.items()
+            ]
+            missing = [seq for number, seq in numbered.items() if number not in assessed]
+            if missing:
+                results.extend(await asyncio.gather(
+                    *(_estimate_single(seq, sequences_str[seq]) for seq in missing)
+                ))
+            return results
+
+        # Execute all async estimators concurrently: one call per sequence,
+        # or one per packed batch of sequences over the same statements
+        budget = self.settings.causality_batch_token_budget
+        if budget > 0:
+            batches = self._pack_batches(
+                sequences_str, statement_sets, statements_deck_dto, text, budget
             )
+        else:
+            batches = [[seq] for seq in sequences_str]
 
-        causal_cycles = list(await asyncio.gather(*async_estimators))
+        causal_cycles = [
+            dto
+            for batch_results in await asyncio.gather(
+                *(_estimate_batch(batch) for batch in batches)
+            )
+            for dto in batch_results
+        ]
         return CausalCyclesDeckDto(causal_cycles=causal_cycles)
 
+    @staticmethod
+    def _pack_batches(
+        sequences_str: dict[str, list[str]],
+        statement_sets: dict[str, frozenset[str]],
+        statements_deck_dto: StatementsDeckDto,
+        text: str,
+        budget: int,
+    ) -> list[list[str]]:
+        """Group sequences by statement set, then pack each group under `budget`."""
+        shared = estimate_tokens(text) + sum(
+            estimate_tokens(f"{dto.alias} {dto.text} {dto.explanation}")
+            for dto in statements_deck_dto.statements
+        )
+
+        groups: dict[frozenset[str], list[str]] = {}
+        for seq in sequences_str:
+            groups.setdefault(statement_sets[seq], []).append(seq)
+
+        batches: list[list[str]] = []
+        for group in groups.values():
+            costs = [
+                estimate_tokens(seq)
+                + _OUTPUT_TOKENS_PER_SEQUENCE
+                + _OUTPUT_TOKENS_PER_STEP * len(sequences_str[seq])
+                for seq in group
+            ]
+            for indices in pack_sequences(costs, shared=shared, budget=budget):
+                batches.append([group[i] for i in indices])
+        return batches
+
     async def _get_source_text(
         self, sequences: list[list[Statement]]
     ) -> str:
@@ -14,21 +14,31 @@ Usage:
 
     # Normalize Wheels
     normalizer.normalize(wheels)
+
+    # Incremental: normalize a whole wheel layer read in one query, writing
+    # only the Transitions whose value changed (one batched statement)
+    layer = WheelRepository().find_layer_causality(perspectives)
+    changed = normalizer.normalize_layer(layer)
 """
 
 from __future__ import annotations
 
 from decimal import ROUND_HALF_UP, Decimal, getcontext
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 from dialectical_framework.graph.estimation_manager import EstimationManager
 from dialectical_framework.graph.nodes.cycle import Cycle
 from dialectical_framework.graph.nodes.estimation import CausalityProbabilityEstimation
 from dialectical_framework.graph.nodes.wheel import Wheel
+from dialectical_framework.graph.repositories.estimation_repository import EstimationRepository
 from dialectical_framework.utils.decompose_probability_uniformly import (
     decompose_probability_uniformly,
 )
 
+if TYPE_CHECKING:
+    from dialectical_framework.graph.nodes.transition import Transition
+    from dialectical_framework.graph.repositories.wheel_repository import WheelCausality
+
 
 class CausalityNormalizer:
     """
@@ -66,9 +76,12 @@ class CausalityNormalizer:
             )
 
         # Collect raw scores (CausalityProbabilityEstimation on structures)
+        raw_scores = EstimationRepository().get_values(
+            structures, [CausalityProbabilityEstimation]
+        )
         scores: dict[str, Decimal] = {}
         for structure in structures:
-            raw_score = self._get_raw_score(structure)
+            raw_score = raw_scores.get(structure._id, {}).get(CausalityProbabilityEstimation)
             if raw_score is None:
                 raise ValueError(
                     f"Structure {structure.short_hash} is missing CausalityProbabilityEstimation. "
@@ -85,12 +98,42 @@ class CausalityNormalizer:
                 prob_value = float(normalized[structure.hash])
                 self._decompose_probability_into_transitions(structure, prob_value)
 
-    def _get_raw_score(self, structure: Union[Cycle, Wheel]) -> float | None:
-        """Get CausalityProbabilityEstimation value from structure."""
-        for est, _ in structure.estimations.all():
-            if isinstance(est, CausalityProbabilityEstimation):
-                return est.value
-        return None
+    def normalize_layer(self, layer: list[WheelCausality]) -> list[Transition]:
+        """
+        Incrementally normalize a Wheel layer read by find_layer_causality().
+
+        Same result as normalize() over the layer's estimated wheels, but
+        computed in memory from the prefetched raw scores and current edge
+        values: only Transitions whose decomposed value differs from what is
+        stored are rewritten, all in one batched statement. Wheels without a
+        raw score are skipped.
+
+        Args:
+            layer: WheelCausality rows for every Wheel in the layer
+
+        Returns:
+            The Transitions whose CausalityProbabilityEstimation was rewritten
+        """
+        scored = [entry for entry in layer if entry.raw_score is not None]
+        if not scored:
+            return []
+
+        scores = {entry.wheel.hash: Decimal(str(entry.raw_score)) for entry in scored}
+        normalized = self._normalize_scores(scores)
+
+        updates: list[tuple[Transition, float]] = []
+        for entry in scored:
+            if not entry.edges:
+                continue
+            individual_prob = decompose_probability_uniformly(
+                float(normalized[entry.wheel.hash]), len(entry.edges)
+            )
+            for transition, current in entry.edges:
+                if current != [individual_prob]:
+                    updates.append((transition, individual_prob))
+
+        EstimationManager().replace_estimations_bulk(CausalityProbabilityEstimation, updates)
+        return [transition for transition, _ in updates]
 
     def _normalize_scores(self, scores: dict[str, Decimal]) -> dict[str, Decimal]:
         """
@@ -21,17 +21,22 @@ import asyncio
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Union
 
+from dependency_injector.wiring import Provide, inject
+
 from dialectical_framework.agents.reasonable_concern import ReasonableConcern
 from dialectical_framework.agents.execution_report import ExecutionReport
 from dialectical_framework.concerns.causality.causality_normalizer import (
     CausalityNormalizer,
 )
+from dialectical_framework.enums.di import DI
+from dialectical_framework.graph.graph_db_pool import AsyncGraphDb
 from dialectical_framework.graph.estimation_manager import EstimationManager
 from dialectical_framework.graph.nodes.cycle import Cycle
 from dialectical_framework.graph.nodes.estimation import CausalityProbabilityEstimation
 from dialectical_framework.graph.nodes.rationale import Rationale
 from dialectical_framework.graph.nodes.wheel import Wheel
 from dialectical_framework.graph.repositories.cycle_repository import CycleRepository
+from dialectical_framework.graph.repositories.estimation_repository import EstimationRepository
 from dialectical_framework.protocols.has_config import SettingsAware
 
 if TYPE_CHECKING:
@@ -64,8 +69,15 @@ class CausalityEstimation(ReasonableConcern[EstimationResult], SettingsAware):
     - Normalization covers everything of same type+size in the DB
     """
 
-    def __init__(self) -> None:
+    def __init__(self, incremental: bool = True) -> None:
+        """
+        Args:
+            incremental: Normalize Wheel layers in memory from one read and
+                rewrite only the edge estimations that changed. False falls
+                back to re-reading and rewriting every Wheel of the layer.
+        """
         self._report: ExecutionReport
+        self._incremental = incremental
 
     @property
     def report(self) -> ExecutionReport:
@@ -152,11 +164,13 @@ class CausalityEstimation(ReasonableConcern[EstimationResult], SettingsAware):
 
         return groups
 
+    @inject
     async def _estimate_group(
         self,
         key: tuple[str, int],
         requested: list[Union[Cycle, Wheel]],
         estimator: CausalityEstimator,
+        async_graph_db: AsyncGraphDb = Provide[DI.async_graph_db],
     ) -> list[Union[Cycle, Wheel]]:
         """
         Estimate a group of same-type, same-size structures.
@@ -165,10 +179,20 @@ class CausalityEstimation(ReasonableConcern[EstimationResult], SettingsAware):
         - (Re-)estimate exactly the requested structures
         - Normalize probabilities across all structures of same type+size in DB
 
+        The layer reads and the normalization run off the event loop (the
+        other groups keep estimating meanwhile); persisting reports effects,
+        so it stays on the loop.
+
         Returns list of structures that were estimated.
         """
-        # Find all structures of same type+size in DB
-        all_in_db = self._find_all_in_layer(requested)
+        incremental = self._incremental and isinstance(requested[0], Wheel)
+
+        # Find all structures of same type+size in DB (the incremental path
+        # reads the layer in one query after persisting instead)
+        all_in_db = (
+            [] if incremental
+            else await async_graph_db.run(self._find_all_in_layer, requested)
+        )
 
         # Always (re-)estimate exactly what was requested; normalization
         # below covers everything in the DB layer.
@@ -185,7 +209,18 @@ class CausalityEstimation(ReasonableConcern[EstimationResult], SettingsAware):
 
         # Normalize probabilities across ALL structures in DB for this layer
         # (includes both newly estimated and previously estimated)
-        self._normalize_layer(all_in_db)
+        if incremental:
+            normalized, renormalized = await async_graph_db.run(
+                self._normalize_layer_incremental, requested
+            )
+            # Groups run concurrently: accumulate, don't overwrite
+            artifacts = self._report.artifacts
+            artifacts["normalized_wheels"] = artifacts.get("normalized_wheels", 0) + normalized
+            artifacts["renormalized_transitions"] = (
+                artifacts.get("renormalized_transitions", 0) + renormalized
+            )
+        else:
+            await async_graph_db.run(self._normalize_layer, all_in_db)
 
         return to_estimate
 
@@ -223,8 +258,12 @@ class CausalityEstimation(ReasonableConcern[EstimationResult], SettingsAware):
         unlike CausalityNormalizer which raises).
         """
         # Filter to only structures with CausalityProbabilityEstimation
+        raw_scores = EstimationRepository().get_values(
+            all_structures, [CausalityProbabilityEstimation]
+        )
         with_estimation = [
-            s for s in all_structures if self._has_estimation(s)
+            s for s in all_structures
+            if raw_scores.get(s._id, {}).get(CausalityProbabilityEstimation) is not None
         ]
 
         if not with_estimation:
@@ -233,12 +272,21 @@ class CausalityEstimation(ReasonableConcern[EstimationResult], SettingsAware):
         normalizer = CausalityNormalizer()
         normalizer.normalize(with_estimation)
 
-    def _has_estimation(self, structure: Union[Cycle, Wheel]) -> bool:
-        """Check if a structure has a CausalityProbabilityEstimation."""
-        for est, _ in structure.estimations.all():
-            if isinstance(est, CausalityProbabilityEstimation):
-                return True
-        return False
+    def _normalize_layer_incremental(self, wheels: list[Wheel]) -> tuple[int, int]:
+        """
+        Normalize a Wheel layer from a single read, rewriting only the edge
+        estimations whose value changed.
+
+        Returns:
+            (wheels in the layer, edge estimations rewritten)
+        """
+        from dialectical_framework.graph.repositories.wheel_repository import (
+            WheelRepository,
+        )
+
+        layer = WheelRepository().find_layer_causality(wheels[0]._perspectives)
+        changed = CausalityNormalizer().normalize_layer(layer)
+        return len(layer), len(changed)
 
     def _persist_estimations(
         self,
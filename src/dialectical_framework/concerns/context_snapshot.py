@@ -0,0 +1,290 @@
+"""
+Materialized DialecticalContext dumps, patched from graph events.
+
+A full DialecticalContext render walks the whole Case (perspectives, nexuses,
+cycles, wheels, transformations, synthesis). The Advisor re-reads it on every
+`sync` and construction, while most turns change one exploration at most.
+
+ContextSnapshotStore keeps one rendered ContextSnapshot per (sid, nexus_hash)
+and listens on the GraphEventBus channel of each sid it serves. Every section
+of a snapshot remembers the node ids it rendered; an incoming Effect marks
+only the sections it touches as dirty, and DialecticalContext re-renders just
+those on the next resolve. Structural effects (perspectives, polarities,
+statements, nexus membership, discards) mark the whole snapshot stale.
+
+Correctness first: snapshots are only served while the sid's listener is
+live (the bus must be connected — tests and CLI usage always render in
+full) and has applied every Effect emitted for the sid so far (catch_up),
+and a cheap graph fingerprint catches mutations that never emitted an
+Effect.
+
+Usage (app layer — the bus is connected at startup):
+    with scope(case.sid):
+        dump = await DialecticalContext().resolve()   # full render, cached
+        ...                                           # tools mutate the graph
+        dump = await DialecticalContext().resolve()   # dirty sections only
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+
+from dialectical_framework.events.graph_event_bus import (GraphEventBus,
+                                                          SubscriberOverflow)
+
+if TYPE_CHECKING:
+    from dialectical_framework.agents.execution_report import Effect
+
+logger = logging.getLogger(__name__)
+
+# Nodes whose changes reshape the dump globally: standalone vs nexus split,
+# perspective indices, cross-nexus references, the quality floor.
+_STRUCTURAL_LABELS = frozenset({"Case", "Nexus", "Perspective", "Polarity", "Statement"})
+
+# Nodes with a dedicated section of their own
+_SECTION_LABELS = {"Input": "inputs", "Decision": "decisions"}
+
+# Nodes that only ever render inside one nexus section (cycles, wheels and
+# what hangs off them). An unseen one may belong to any nexus.
+_NEXUS_LOCAL_LABELS = frozenset(
+    {"Cycle", "Wheel", "Transition", "Transformation", "Synthesis", "Rationale"}
+)
+
+NEXUS_SECTION_PREFIX = "nexus:"
+
+
+def nexus_section_key(short_hash: str) -> str:
+    return f"{NEXUS_SECTION_PREFIX}{short_hash}"
+
+
+@dataclass
+class ContextSnapshot:
+    """
+    One rendered dump, split into ordered sections.
+
+    Fields:
+        order: Section keys in render order.
+        sections: Rendered text per key (None = section renders empty).
+        deps: Node `_id`s each section rendered — an Effect on any of them
+            dirties the section.
+        dirty: Sections to re-render on the next resolve.
+        stale: The whole snapshot must be re-rendered.
+        volatile: Any Effect makes it stale (e.g. the empty-graph message).
+        fingerprint: Graph fingerprint at render time.
+        summary: Report summary of the render.
+        cross_refs: Cross-nexus reference lines, reused by nexus re-renders
+            (they only change with structural effects).
+    """
+
+    order: list[str] = field(default_factory=list)
+    sections: dict[str, Optional[str]] = field(default_factory=dict)
+    deps: dict[str, set[int]] = field(default_factory=dict)
+    dirty: set[str] = field(default_factory=set)
+    stale: bool = False
+    volatile: bool = False
+    fingerprint: Any = None
+    summary: str = ""
+    cross_refs: dict = field(default_factory=dict)
+
+    def add(self, key: str, text: Optional[str], deps: Optional[set[int]] = None) -> None:
+        self.order.append(key)
+        self.sections[key] = text
+        self.deps[key] = set(deps or ())
+
+    def replace(self, key: str, text: Optional[str], deps: Optional[set[int]] = None) -> None:
+        self.sections[key] = text
+        self.deps[key] = set(deps or ())
+        self.dirty.discard(key)
+
+    @property
+    def text(self) -> str:
+        return "\n\n".join(
+            text for key in self.order if (text := self.sections.get(key))
+        )
+
+    def apply(self, effect: Effect) -> None:
+        """Mark what `effect` invalidates: a few sections, or everything."""
+        if self.stale:
+            return
+        if self.volatile or effect.effect_type == "node_deleted":
+            self.stale = True
+            return
+        if "discarded" in effect.patch or "discarded" in (effect.previous or {}):
+            self.stale = True
+            return
+
+        refs = [effect.node] if effect.node is not None else []
+        if effect.relationship is not None:
+            refs += [effect.relationship.from_node, effect.relationship.to_node]
+        labels = {ref.label for ref in refs}
+
+        if labels & _STRUCTURAL_LABELS:
+            self.stale = True
+            return
+
+        local = set()
+        for label in labels:
+            section = _SECTION_LABELS.get(label)
+            if section is not None:
+                if section in self.sections:
+                    self.dirty.add(section)
+                else:
+                    self.stale = True
+                    return
+            elif label in _NEXUS_LOCAL_LABELS or label.endswith("Estimation"):
+                local.add(label)
+            else:
+                # Unknown node type — don't guess
+                self.stale = True
+                return
+        if not local:
+            return
+
+        ids = {ref.db_id for ref in refs if ref.db_id is not None}
+        hit = [key for key, deps in self.deps.items() if deps & ids]
+        if hit:
+            self.dirty.update(hit)
+            return
+
+        # Not rendered yet (e.g. a fresh wheel): it may belong to any nexus
+        nexus_keys = [k for k in self.order if k.startswith(NEXUS_SECTION_PREFIX)]
+        if nexus_keys:
+            self.dirty.update(nexus_keys)
+        else:
+            self.stale = True
+
+
+class ContextSnapshotStore:
+    """
+    Per-(sid, nexus_hash) ContextSnapshot cache fed by the GraphEventBus.
+
+    `watch(sid)` starts (once) a listener task on the sid's channel and
+    returns whether snapshots may be served for it. Snapshots of a sid are
+    dropped when its listener ends, so a dead subscription can never serve
+    a stale dump.
+
+    Effects travel through the bus asynchronously (flush window, sender,
+    pump, listener queue), so a write made just before a read may not have
+    reached the listener yet. `catch_up(sid)` waits until it has.
+    """
+
+    def __init__(self, event_bus: GraphEventBus, catch_up_timeout: float = 1.0) -> None:
+        self._event_bus = event_bus
+        self._catch_up_timeout = catch_up_timeout
+        self._snapshots: dict[tuple[str, Optional[str]], ContextSnapshot] = {}
+        self._listeners: dict[str, asyncio.Task] = {}
+        # Last envelope seq applied per sid, and a wake-up for catch_up()
+        self._applied: dict[str, int] = {}
+        self._progress: dict[str, asyncio.Event] = {}
+
+    async def watch(self, sid: str) -> bool:
+        if not self._event_bus.connected:
+            return False
+        loop = asyncio.get_running_loop()
+        task = self._listeners.get(sid)
+        if task is not None and not task.done():
+            if task.get_loop() is loop:
+                return True
+            # Listener belongs to another (likely closed) loop
+            try:
+                task.cancel()
+            except RuntimeError:
+                pass
+            self.invalidate(sid)
+
+        ready = asyncio.Event()
+        self._progress[sid] = asyncio.Event()
+        task = loop.create_task(self._listen(sid, ready))
+        self._listeners[sid] = task
+        waiter = asyncio.ensure_future(ready.wait())
+        await asyncio.wait({task, waiter}, return_when=asyncio.FIRST_COMPLETED)
+        waiter.cancel()
+        return ready.is_set() and not task.done()
+
+    async def _listen(self, sid: str, ready: asyncio.Event) -> None:
+        try:
+            # A dropped or coalesced effect would leave a snapshot silently
+            # stale: fall behind -> disconnect, invalidate, resubscribe on demand
+            async with self._event_bus.subscribe(sid, overflow="disconnect") as subscriber:
+                # Envelopes sent before the subscription can't be seen;
+                # snapshots are rendered after it anyway
+                self._applied[sid] = self._event_bus.last_seq(sid)
+                ready.set()
+                while True:
+                    try:
+                        events = await subscriber.get_batch()
+                    except StopAsyncIteration:
+                        break
+                    for event in events:
+                        self.apply(sid, event.effect)
+                    self._applied[sid] = max(self._applied[sid], events[-1].seq)
+                    self._progress[sid].set()
+        except SubscriberOverflow:
+            logger.info("Context snapshot listener for %s fell behind; snapshots dropped", sid)
+        except Exception:
+            logger.exception("Context snapshot listener for %s failed", sid)
+        finally:
+            self.invalidate(sid)
+            self._applied.pop(sid, None)
+            progress = self._progress.get(sid)
+            if progress is not None:
+                progress.set()
+
+    async def catch_up(self, sid: str) -> bool:
+        """
+        Wait until the sid's listener has applied every Effect emitted for it
+        so far (buffered ones are flushed first).
+
+        Returns:
+            False — with the sid's snapshots dropped — when the listener is
+            gone or doesn't catch up within the timeout
+        """
+        target = await self._event_bus.settle(sid)
+        try:
+            await asyncio.wait_for(self._applied_up_to(sid, target), self._catch_up_timeout)
+        except asyncio.TimeoutError:
+            logger.info("Context snapshot listener for %s did not catch up; snapshots dropped", sid)
+            self.invalidate(sid)
+            return False
+        if sid not in self._applied:
+            self.invalidate(sid)
+            return False
+        return True
+
+    async def _applied_up_to(self, sid: str, seq: int) -> None:
+        while sid in self._applied and self._applied[sid] < seq:
+            progress = self._progress[sid]
+            progress.clear()
+            await progress.wait()
+
+    def applied(self, sid: str) -> Optional[int]:
+        """Seq of the last envelope applied for the sid; None without a listener."""
+        return self._applied.get(sid)
+
+    def apply(self, sid: str, effect: Effect) -> None:
+        for (snapshot_sid, _), snapshot in self._snapshots.items():
+            if snapshot_sid == sid:
+                snapshot.apply(effect)
+
+    def get(self, sid: str, nexus_hash: Optional[str]) -> Optional[ContextSnapshot]:
+        return self._snapshots.get((sid, nexus_hash))
+
+    def put(self, sid: str, nexus_hash: Optional[str], snapshot: ContextSnapshot) -> None:
+        self._snapshots[(sid, nexus_hash)] = snapshot
+
+    def invalidate(self, sid: Optional[str] = None) -> None:
+        """Drop cached snapshots of one sid (or all)."""
+        for key in [k for k in self._snapshots if sid is None or k[0] == sid]:
+            del self._snapshots[key]
+
+    async def close(self) -> None:
+        """Stop all listeners and drop every snapshot."""
+        tasks = list(self._listeners.values())
+        self._listeners.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.invalidate()
@@ -41,6 +41,7 @@ from dialectical_framework.agents.conversation_facilitator import \
 from dialectical_framework.agents.reasonable_concern import \
     ReasonableConcern
 from dialectical_framework.agents.execution_report import ExecutionReport
+from dialectical_framework.graph.estimation_manager import EstimationManager
 from dialectical_framework.graph.nodes.estimation import (
     CONCEPTUAL_COHERENCE_THRESHOLD, ConceptualCoherenceEstimation,
     DialecticalValidityEstimation)
@@ -195,16 +196,16 @@ class ControlStatementsCheck(ReasonableConcern[ControlStatementsCheckResult]):
         avg_score = (result_1.coherence_score + result_2.coherence_score) / 2
         avg_dv = (result_1.dialectical_validity + result_2.dialectical_validity) / 2
 
-        estimation = ConceptualCoherenceEstimation(
-            value=avg_score,
-            t_plus_without_a_plus_yields_t_minus=result_1.coherence_score,
-            a_plus_without_t_plus_yields_a_minus=result_2.coherence_score,
-        )
-        dv_estimation = DialecticalValidityEstimation(
-            value=avg_dv,
-            t_plus_without_a_plus_yields_t_minus=result_1.dialectical_validity,
-            a_plus_without_t_plus_yields_a_minus=result_2.dialectical_validity,
-        )
+        cc_scores = {
+            "t_plus_without_a_plus_yields_t_minus": result_1.coherence_score,
+            "a_plus_without_t_plus_yields_a_minus": result_2.coherence_score,
+        }
+        dv_scores = {
+            "t_plus_without_a_plus_yields_t_minus": result_1.dialectical_validity,
+            "a_plus_without_t_plus_yields_a_minus": result_2.dialectical_validity,
+        }
+        estimation = ConceptualCoherenceEstimation(value=avg_score, **cc_scores)
+        dv_estimation = DialecticalValidityEstimation(value=avg_dv, **dv_scores)
         status = "COHERENT" if estimation.is_coherent else "NOT COHERENT"
 
         rationale_text = (
@@ -224,18 +225,22 @@ class ControlStatementsCheck(ReasonableConcern[ControlStatementsCheckResult]):
 
         # Only commit and attach if PP is committed
         if perspective.is_committed:
-            estimation.set_target(perspective)
-            dv_estimation.set_target(perspective)
             rationale.set_explanation_target(perspective)
             rationale.commit()
             self._report.node_created(rationale)
 
-            estimation.set_provider(rationale)
-            estimation.commit()
+            # Through the manager, so est_* on the perspective stays in step
+            manager = EstimationManager()
+            estimation = manager.upsert_estimation(
+                perspective, ConceptualCoherenceEstimation, avg_score,
+                provider=rationale, attributes=cc_scores,
+            )
             self._report.node_created(estimation)
 
-            dv_estimation.set_provider(rationale)
-            dv_estimation.commit()
+            dv_estimation = manager.upsert_estimation(
+                perspective, DialecticalValidityEstimation, avg_dv,
+                provider=rationale, attributes=dv_scores,
+            )
             self._report.node_created(dv_estimation)
 
         result = ControlStatementsCheckResult(
@@ -35,6 +35,7 @@ from dialectical_framework.agents.conversation_facilitator import \
 from dialectical_framework.agents.reasonable_concern import \
     ReasonableConcern
 from dialectical_framework.agents.execution_report import ExecutionReport
+from dialectical_framework.graph.estimation_manager import EstimationManager
 from dialectical_framework.graph.nodes.estimation import (
     ORTHOGONALITY_THRESHOLD, DiagonalContradictionEstimation)
 from dialectical_framework.graph.nodes.rationale import Rationale
@@ -174,11 +175,11 @@ class DiagonalOppositionsCheck(ReasonableConcern[DiagonalOppositionsCheckResult]
         )
         status = "VALID" if is_valid else "WEAK"
 
-        estimation = DiagonalContradictionEstimation(
-            value=avg_score,
-            t_plus_vs_a_minus=result_t_plus_a_minus.contradiction_score,
-            a_plus_vs_t_minus=result_a_plus_t_minus.contradiction_score,
-        )
+        scores = {
+            "t_plus_vs_a_minus": result_t_plus_a_minus.contradiction_score,
+            "a_plus_vs_t_minus": result_a_plus_t_minus.contradiction_score,
+        }
+        estimation = DiagonalContradictionEstimation(value=avg_score, **scores)
 
         rationale_text = (
             f"Diagonal Contradiction Evaluation: {status}\n\n"
@@ -194,13 +195,15 @@ class DiagonalOppositionsCheck(ReasonableConcern[DiagonalOppositionsCheckResult]
 
         # Only commit and attach if PP is committed
         if perspective.is_committed:
-            estimation.set_target(perspective)
             rationale.set_explanation_target(perspective)
             rationale.commit()
             self._report.node_created(rationale)
 
-            estimation.set_provider(rationale)
-            estimation.commit()
+            # Through the manager, so est_* on the perspective stays in step
+            estimation = EstimationManager().upsert_estimation(
+                perspective, DiagonalContradictionEstimation, avg_score,
+                provider=rationale, attributes=scores,
+            )
             self._report.node_created(estimation)
 
         result = DiagonalOppositionsCheckResult(
@@ -11,19 +11,40 @@ top-% few per cycle (settings.advisor_wheel_quality_top_plausible). Pre-computed
 beats prioritization rules the model must self-apply; a weak tetrad
 delivered with full counsel choreography is confident bad advice.
 inspect_node still reaches everything suppressed.
+
+The dump is rendered as keyed sections (inputs, decisions, standalone, one
+per nexus). While the event bus is connected, the rendered sections are
+kept in the ContextSnapshotStore and only the ones touched by graph
+effects are re-rendered on the next resolve (see concerns/context_snapshot.py).
+Rendering runs off the event loop through AsyncGraphDb; the snapshot store is
+only touched on the loop.
 """
 
 from __future__ import annotations
 
 from typing import Optional
 
+from dependency_injector.wiring import Provide, inject
+
 from dialectical_framework.agents.reasonable_concern import ReasonableConcern
+from dialectical_framework.concerns.context_snapshot import (
+    NEXUS_SECTION_PREFIX,
+    ContextSnapshot,
+    ContextSnapshotStore,
+    nexus_section_key,
+)
+from dialectical_framework.enums.di import DI
+from dialectical_framework.graph.graph_db_pool import AsyncGraphDb
 from dialectical_framework.protocols.has_config import SettingsAware
 from dialectical_framework.graph.nodes.cycle import Cycle
 from dialectical_framework.graph.nodes.nexus import Nexus
 from dialectical_framework.graph.nodes.perspective import Perspective
 from dialectical_framework.graph.nodes.transformation import Transformation
 from dialectical_framework.graph.nodes.wheel import Wheel
+from dialectical_framework.graph.perspective_metrics import (
+    PerspectiveMetrics,
+    PerspectiveMetricsRow,
+)
 from dialectical_framework.graph.rendering import (
     build_pp_index,
     format_edge_label,
@@ -33,12 +54,28 @@ from dialectical_framework.graph.repositories.cycle_repository import CycleRepos
 from dialectical_framework.graph.repositories.decision_repository import (
     DecisionRepository,
 )
+from dialectical_framework.graph.repositories.estimation_repository import EstimationRepository
 from dialectical_framework.graph.repositories.input_repository import InputRepository
 from dialectical_framework.graph.repositories.nexus_repository import NexusRepository
 from dialectical_framework.graph.repositories.perspective_repository import (
     PerspectiveRepository,
 )
 from dialectical_framework.graph.repositories.wheel_repository import WheelRepository
+from dialectical_framework.graph.scope_context import get_current_sid
+
+
+@inject
+def _di_context_snapshots(
+    snapshots: ContextSnapshotStore = Provide[DI.context_snapshots],
+) -> ContextSnapshotStore:
+    return snapshots
+
+
+@inject
+def _di_async_graph_db(
+    async_graph_db: AsyncGraphDb = Provide[DI.async_graph_db],
+) -> AsyncGraphDb:
+    return async_graph_db
 
 
 class DialecticalContext(ReasonableConcern[str], SettingsAware):
@@ -64,35 +101,105 @@ class DialecticalContext(ReasonableConcern[str], SettingsAware):
 
     def __init__(self, nexus_hash: str | None = None) -> None:
         self._nexus_hash = nexus_hash
+        # Batch score table (one query) shared by the quality floor and
+        # the per-perspective Quality lines
+        self._metrics: PerspectiveMetrics | None = None
+        # Node ids rendered by the section in progress (see _depend)
+        self._deps: set[int] | None = None
 
     async def resolve(self) -> str:
+        sid = get_current_sid()
+        snapshots = _di_context_snapshots()
+        if sid and await snapshots.watch(sid) and await snapshots.catch_up(sid):
+            snapshot = await self._resolve_snapshot(snapshots, sid)
+        else:
+            snapshot = await _di_async_graph_db().run(self._render)
+            self._report.artifacts["context_snapshot"] = "rendered"
+
+        self._report.ok = True
+        self._report.summary = snapshot.summary
+        return snapshot.text
+
+    async def _resolve_snapshot(
+        self, snapshots: ContextSnapshotStore, sid: str
+    ) -> ContextSnapshot:
+        """
+        Serve the materialized dump: as-is when nothing changed, with only
+        the dirty sections re-rendered when effects arrived, in full when
+        it is stale or the graph changed without any effect explaining it.
+
+        Effects applied while a render was off the loop may have been read
+        or missed by it; the result is served but marked stale.
+        """
+        from dialectical_framework.graph.repositories.case_repository import \
+            CaseRepository
+
+        async_graph_db = _di_async_graph_db()
+        applied = snapshots.applied(sid)
+        fingerprint = await async_graph_db.run(CaseRepository().fingerprint)
+        snapshot = snapshots.get(sid, self._nexus_hash)
+        if (
+            snapshot is not None
+            and not snapshot.stale
+            and (snapshot.dirty or snapshot.fingerprint == fingerprint)
+        ):
+            dirty = sorted(snapshot.dirty)
+            sections = await async_graph_db.run(
+                self._render_sections, dirty, snapshot.cross_refs
+            )
+            if sections is not None:
+                for key, (text, deps) in sections.items():
+                    snapshot.replace(key, text, deps)
+                snapshot.fingerprint = fingerprint
+                snapshot.stale = snapshot.stale or snapshots.applied(sid) != applied
+                self._report.artifacts["context_snapshot"] = (
+                    "patched" if dirty else "cached"
+                )
+                self._report.artifacts["rerendered_sections"] = dirty
+                return snapshot
+
+        snapshot = await async_graph_db.run(self._render)
+        snapshot.fingerprint = fingerprint
+        snapshot.stale = snapshots.applied(sid) != applied
+        snapshots.put(sid, self._nexus_hash, snapshot)
+        self._report.artifacts["context_snapshot"] = "rendered"
+        return snapshot
+
+    def _render(self) -> ContextSnapshot:
         if self._nexus_hash:
-            return await self._resolve_scoped()
+            return self._render_scoped()
+        return self._render_unscoped()
 
+    def _render_unscoped(self) -> ContextSnapshot:
         pp_repo = PerspectiveRepository()
         nexus_repo = NexusRepository()
+        snapshot = ContextSnapshot()
 
         perspectives = pp_repo.find_all_active()
+        if perspectives:
+            self._metrics = pp_repo.load_metrics(perspectives)
         inputs_dump = self._dump_inputs()
         decisions_dump = self._dump_decisions()
 
         if not perspectives:
+            # Whole-dump messages: any change re-renders
+            snapshot.volatile = True
             if inputs_dump or decisions_dump:
                 # No structure yet, but captured material and/or recorded
                 # decisions exist — surface them so the model can pick them
                 # up instead of assuming a blank slate.
-                self._report.ok = True
-                self._report.summary = "No perspectives yet, inputs/decisions pending"
+                snapshot.summary = "No perspectives yet, inputs/decisions pending"
                 parts = [p for p in (inputs_dump, decisions_dump) if p]
                 parts.append(
                     "No tensions identified yet — sources above (if any) are "
                     "captured but not yet analyzed; standing decisions (if "
                     "any) remain in force."
                 )
-                return "\n\n".join(parts)
-            self._report.ok = True
-            self._report.summary = "Empty graph"
-            return "No prior understanding — this is a fresh conversation."
+                snapshot.add("body", "\n\n".join(parts))
+                return snapshot
+            snapshot.summary = "Empty graph"
+            snapshot.add("body", "No prior understanding — this is a fresh conversation.")
+            return snapshot
 
         nexuses = nexus_repo.find_all()
 
@@ -103,13 +210,10 @@ class DialecticalContext(ReasonableConcern[str], SettingsAware):
                     nexused_pp_ids.add(pp._id)
 
         standalone = [pp for pp in perspectives if pp._id not in nexused_pp_ids]
+        standalone_ids = {pp._id for pp in standalone}
 
-        sections: list[str] = []
-
-        if inputs_dump:
-            sections.append(inputs_dump)
-        if decisions_dump:
-            sections.append(decisions_dump)
+        snapshot.add("inputs", inputs_dump)
+        snapshot.add("decisions", decisions_dump)
 
         # Quality floor applies to standalone (unexplored) perspectives only —
         # nexus members are load-bearing (wheels reference their indices) and
@@ -123,76 +227,120 @@ class DialecticalContext(ReasonableConcern[str], SettingsAware):
         cross_refs: dict = {}
         if len(nexuses) > 1 or (nexuses and standalone):
             cross_refs = self._build_cross_nexus_refs(nexuses, standalone)
+        snapshot.cross_refs = cross_refs
 
+        standalone_parts: list[str] = []
         if standalone:
-            sections.append(
+            standalone_parts.append(
                 self._dump_standalone_perspectives(standalone, cross_refs)
             )
         if suppressed_count:
-            sections.append(
+            standalone_parts.append(
                 f"{suppressed_count} unexplored tension(s) suppressed for low "
                 f"quality (weak opposition, blurred structure, unnatural/"
                 f"distorted framing, or failed validation) — reachable via "
                 f"inspect_node if needed."
             )
+        snapshot.add("standalone", "\n\n".join(standalone_parts), standalone_ids)
 
         if len(nexuses) > 1:
-            sections.append(
+            snapshot.add(
+                "note",
                 "Multiple explorations below. Indices (T1, A1, ...) are "
                 "per-exploration — T1 in one nexus is unrelated to T1 in "
                 "another. When referring across explorations, qualify the "
-                "index with its nexus: \"T2 in [[hash]]\"."
+                "index with its nexus: \"T2 in [[hash]]\".",
             )
 
         for nexus in nexuses:
-            nexus_dump = self._dump_nexus(nexus, cross_refs)
-            if nexus_dump:
-                sections.append(nexus_dump)
+            text, deps = self._render_nexus_section(nexus, cross_refs)
+            snapshot.add(nexus_section_key(nexus.short_hash), text, deps)
 
-        self._report.ok = True
-        self._report.summary = f"{len(perspectives)} perspectives, {len(nexuses)} nexuses"
-        return "\n\n".join(sections)
+        snapshot.summary = f"{len(perspectives)} perspectives, {len(nexuses)} nexuses"
+        return snapshot
 
-    async def _resolve_scoped(self) -> str:
+    def _render_scoped(self) -> ContextSnapshot:
         """Render one nexus only; outside tensions appear as a count line."""
         nexus_repo = NexusRepository()
         nexus = nexus_repo.find_by_hash_prefix(self._nexus_hash)
         if nexus is None:
             raise ValueError(f"Nexus not found: {self._nexus_hash}")
 
-        sections: list[str] = []
-
-        inputs_dump = self._dump_inputs()
-        if inputs_dump:
-            sections.append(inputs_dump)
+        snapshot = ContextSnapshot()
+        snapshot.add("inputs", self._dump_inputs())
 
         # Decisions are Case-level facts — the counsel head must see them
         # even when pinned to one exploration.
-        decisions_dump = self._dump_decisions()
-        if decisions_dump:
-            sections.append(decisions_dump)
+        snapshot.add("decisions", self._dump_decisions())
 
-        nexus_dump = self._dump_nexus(nexus)
-        if nexus_dump:
-            sections.append(nexus_dump)
+        members = [pp for pp, _ in nexus.perspectives.all() if not pp.discarded]
+        self._metrics = PerspectiveRepository().load_metrics(members)
+        text, deps = self._render_nexus_section(nexus)
+        snapshot.add(nexus_section_key(nexus.short_hash), text, deps)
 
-        member_ids = {
-            pp._id for pp, _ in nexus.perspectives.all() if not pp.discarded
-        }
+        member_ids = {pp._id for pp in members}
         all_active = PerspectiveRepository().find_all_active()
         outside_count = sum(1 for pp in all_active if pp._id not in member_ids)
         if outside_count:
-            sections.append(
+            snapshot.add(
+                "outside",
                 f"{outside_count} other tension(s) exist outside this "
-                f"exploration (not shown)."
+                f"exploration (not shown).",
             )
 
-        self._report.ok = True
-        self._report.summary = (
+        snapshot.summary = (
             f"Nexus [[{nexus.short_hash}]]: {len(member_ids)} perspectives, "
             f"{outside_count} outside"
         )
-        return "\n\n".join(sections)
+        return snapshot
+
+    def _render_sections(
+        self, keys: list[str], cross_refs: dict
+    ) -> Optional[dict[str, tuple[Optional[str], set[int]]]]:
+        """Re-render sections of a snapshot as {key: (text, deps)}. None when
+        a section cannot be re-rendered alone (caller renders in full)."""
+        sections: dict[str, tuple[Optional[str], set[int]]] = {}
+        for key in keys:
+            deps: set[int] = set()
+            if key == "inputs":
+                text = self._dump_inputs()
+            elif key == "decisions":
+                text = self._dump_decisions()
+            elif key.startswith(NEXUS_SECTION_PREFIX):
+                nexus = NexusRepository().find_by_hash_prefix(
+                    key[len(NEXUS_SECTION_PREFIX):]
+                )
+                if nexus is None:
+                    return None
+                self._metrics = PerspectiveRepository().load_metrics(
+                    [pp for pp, _ in nexus.perspectives.all() if not pp.discarded]
+                )
+                text, deps = self._render_nexus_section(nexus, cross_refs)
+            else:
+                return None
+            sections[key] = (text, deps)
+        return sections
+
+    def _render_nexus_section(
+        self,
+        nexus: Nexus,
+        cross_refs: dict[tuple[str, int], list[str]] | None = None,
+    ) -> tuple[Optional[str], set[int]]:
+        """Dump one nexus and collect the node ids it rendered."""
+        self._deps = set()
+        try:
+            text = self._dump_nexus(nexus, cross_refs)
+            return text, self._deps
+        finally:
+            self._deps = None
+
+    def _depend(self, *nodes) -> None:
+        """Record nodes the section being rendered depends on."""
+        if self._deps is None:
+            return
+        for node in nodes:
+            if node is not None and node._id is not None:
+                self._deps.add(node._id)
 
     @staticmethod
     def _dump_inputs() -> Optional[str]:
@@ -332,11 +480,13 @@ class DialecticalContext(ReasonableConcern[str], SettingsAware):
                 scores = self._format_aspect_scores(rel)
                 lines.append(f"{position}: \"{stmt.text}\"{scores}")
 
-        if pp.area is not None:
-            quality = f"Quality: area={pp.area:.2f}, rectangularity={pp.rectangularity:.2f}"
-            dv = self._get_dialectical_validity(pp)
-            if dv is not None:
-                quality += f", DV={dv:.2f}"
+        scores = self._metrics_row(pp)
+        if scores is None:
+            scores = PerspectiveRepository().load_metrics([pp]).row(pp._id)
+        if scores is not None and scores.area is not None:
+            quality = f"Quality: area={scores.area:.2f}, rectangularity={scores.rectangularity:.2f}"
+            if scores.dv is not None:
+                quality += f", DV={scores.dv:.2f}"
             lines.append(quality)
 
         # Post-generation validation verdict (CC + empirical inequalities).
@@ -458,6 +608,7 @@ class DialecticalContext(ReasonableConcern[str], SettingsAware):
         pp_index = build_pp_index(nexus)
 
         pp_list = [pp for pp, _ in nexus.perspectives.all() if not pp.discarded]
+        self._depend(nexus, *pp_list)
 
         # Perspectives indexed under nexus
         for pp in pp_list:
@@ -492,6 +643,7 @@ class DialecticalContext(ReasonableConcern[str], SettingsAware):
         pp_index: dict[int, int],
     ) -> Optional[str]:
         lines = [f"## Cycle [[{cycle.short_hash}]]"]
+        self._depend(cycle)
 
         # T-causality sequence using nexus indices
         pps = cycle.perspectives
@@ -517,6 +669,8 @@ class DialecticalContext(ReasonableConcern[str], SettingsAware):
         # floor; the counsel head must not be blind to parts of the
         # deliverable the user assembled deliberately.
         wheels = self._get_cycle_wheels(cycle, wheel_repo)
+        # Hidden wheels still shape the % denominator
+        self._depend(*wheels)
         if wheels:
             wheel_probs = self._collect_raw_probabilities(wheels)
             total_wheel_prob = sum(p for p in wheel_probs.values() if p is not None)
@@ -589,7 +743,9 @@ class DialecticalContext(ReasonableConcern[str], SettingsAware):
     ) -> Optional[str]:
         edge_result = tr.edge.get()
         edge_label = ""
+        self._depend(tr)
         if edge_result:
+            self._depend(edge_result[0])
             edge_label = format_edge_label(edge_result[0], pp_index)
 
         header = f"#### Transformation [[{tr.short_hash}]]"
@@ -606,6 +762,7 @@ class DialecticalContext(ReasonableConcern[str], SettingsAware):
             result = manager.get()
             if result:
                 transition, rel = result
+                self._depend(transition)
                 text = transition.instruction or transition.summary or ""
                 if not text:
                     continue
@@ -620,6 +777,7 @@ class DialecticalContext(ReasonableConcern[str], SettingsAware):
         lines = []
         spiral = format_spiral(wheel, pp_index)
         for synth, _ in wheel.synthesis.all():
+            self._depend(synth)
             header = f"#### Synthesis [[{synth.short_hash}]]"
             if spiral:
                 header += f" ({spiral})"
@@ -689,73 +847,52 @@ class DialecticalContext(ReasonableConcern[str], SettingsAware):
         [P0 p.12]) as soft context-pruning. Missing scores never suppress
         (unscored ≠ bad). Floors of 0 disable the respective check.
         """
-        min_hs = self.settings.advisor_polarity_quality_min_hs
-        min_sp = self.settings.advisor_perspective_quality_min_sp
-        min_dv = self.settings.advisor_perspective_quality_min_dv
+        if not perspectives:
+            return [], 0
 
-        kept: list[Perspective] = []
-        suppressed = 0
-        for pp in perspectives:
-            if pp.validation and pp.validation.startswith("failed"):
-                suppressed += 1
-                continue
-            hs = self._get_antithesis_hs(pp)
-            if min_hs > 0 and hs is not None and hs < min_hs:
-                suppressed += 1
-                continue
-            sp = pp.area
-            if min_sp > 0 and sp is not None and sp < min_sp:
-                suppressed += 1
-                continue
-            dv = self._get_dialectical_validity(pp)
-            if min_dv > 0 and dv is not None and dv < min_dv:
-                suppressed += 1
-                continue
-            kept.append(pp)
-        return kept, suppressed
-
-    def _get_antithesis_hs(self, pp: Perspective) -> Optional[float]:
-        """HS on the A relationship (how genuine the opposition is)."""
-        a_result = self._safe_get(pp.a)
-        if not a_result:
+        metrics = self._metrics_for(perspectives)
+        keep = metrics.quality_mask(
+            min_hs=self.settings.advisor_polarity_quality_min_hs,
+            min_sp=self.settings.advisor_perspective_quality_min_sp,
+            min_dv=self.settings.advisor_perspective_quality_min_dv,
+        )
+        kept_ids = {int(pp_id) for pp_id in metrics.ids[keep]}
+        # Rows absent from the table (no _id) are unscored and never suppressed
+        kept = [
+            pp for pp in perspectives
+            if pp._id in kept_ids or pp._id not in metrics
+        ]
+        return kept, len(perspectives) - len(kept)
+
+    def _metrics_for(self, perspectives: list[Perspective]) -> PerspectiveMetrics:
+        """The shared score table, reloaded if it does not cover `perspectives`."""
+        if self._metrics is None or any(
+            pp._id not in self._metrics for pp in perspectives
+        ):
+            self._metrics = PerspectiveRepository().load_metrics(perspectives)
+        return self._metrics
+
+    def _metrics_row(self, pp: Perspective) -> Optional[PerspectiveMetricsRow]:
+        if self._metrics is None:
             return None
-        _, rel = a_result
-        return rel.heuristic_similarity
-
-    def _collect_raw_probabilities(self, entities: list) -> dict:
-        """Collect raw CausalityProbabilityEstimation values keyed by _id."""
-        result = {}
-        for entity in entities:
-            result[entity._id] = self._get_causality_probability(entity)
-        return result
+        return self._metrics.row(pp._id)
 
     @staticmethod
-    def _get_causality_probability(entity) -> Optional[float]:
+    def _collect_raw_probabilities(entities: list) -> dict:
+        """Collect raw CausalityProbabilityEstimation values keyed by _id (one query)."""
         from dialectical_framework.graph.nodes.estimation import CausalityProbabilityEstimation
 
-        for est, _ in entity.estimations.all():
-            if isinstance(est, CausalityProbabilityEstimation):
-                return est.value
-        return None
+        values = EstimationRepository().get_values(entities, [CausalityProbabilityEstimation])
+        return {
+            entity._id: values.get(entity._id, {}).get(CausalityProbabilityEstimation)
+            for entity in entities
+        }
 
     @staticmethod
     def _get_feasibility(transition) -> Optional[float]:
         from dialectical_framework.graph.nodes.estimation import FeasibilityEstimation
 
-        for est, _ in transition.estimations.all():
-            if isinstance(est, FeasibilityEstimation):
-                return est.value
-        return None
-
-    @staticmethod
-    def _get_dialectical_validity(perspective) -> Optional[float]:
-        from dialectical_framework.graph.nodes.estimation import \
-            DialecticalValidityEstimation
-
-        for est, _ in perspective.estimations.all():
-            if isinstance(est, DialecticalValidityEstimation):
-                return est.value
-        return None
+        return transition.estimation_value(FeasibilityEstimation)
 
     @staticmethod
     def _find_top_layer_cycles(
@@ -785,6 +922,10 @@ class DialecticalContext(ReasonableConcern[str], SettingsAware):
         """Get all wheels belonging to a cycle."""
         wheels = []
         for wheel, _ in cycle.wheels.all():
+            # Committed wheels are immutable: load their edges and
+            # perspectives in one round trip instead of per edge.
+            if wheel.is_committed:
+                wheel.prefetch()
             wheels.append(wheel)
         return wheels
 
@@ -10,7 +10,15 @@ then creates all layer-by-layer combinations:
 - Layer 3: Triplets → more orderings → more wheel arrangements
 - etc.
 
-Existing Cycles and Wheels are reused (no duplicates).
+Existing Cycles and Wheels are reused (no duplicates). Wheel arrangements are
+enumerated lazily (ArrangementEnumerator): an optional prefilter and the
+settings.max_wheels_per_cycle cap keep uninteresting arrangements from ever
+being persisted, and opposite-direction twins are paired by signature lookup
+as they are built.
+
+A single layer can be built on its own, restricted to the PP sets that extend
+given lower-layer branches by one Perspective — BuildWheels uses this for
+beam-pruned progressive building (select_beam keeps the best-scored branches).
 
 Usage:
     from dialectical_framework.concerns.perspective_combination import PerspectiveCombination
@@ -29,24 +37,27 @@ Usage:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from itertools import combinations
-from typing import Optional, TYPE_CHECKING
+from typing import Iterable, Iterator, Optional, TYPE_CHECKING
 
 from dialectical_framework.agents.reasonable_concern import ReasonableConcern
 from dialectical_framework.agents.execution_report import ExecutionReport
+from dialectical_framework.graph.batch_committer import BatchCommitter
 from dialectical_framework.graph.nodes.cycle import Cycle
 from dialectical_framework.graph.nodes.nexus import Nexus
 from dialectical_framework.graph.nodes.transition import Transition
 from dialectical_framework.graph.nodes.wheel import Wheel
 from dialectical_framework.graph.repositories.wheel_repository import WheelRepository
+from dialectical_framework.graph.rotation_keys import rotation_signature
 from dialectical_framework.protocols.has_config import SettingsAware
 from dialectical_framework.utils.sequence_generation import (
-    generate_compatible_sequences,
+    Arrangement,
+    ArrangementEnumerator,
+    ArrangementFilter,
 )
 
 if TYPE_CHECKING:
-    from dialectical_framework.graph.nodes.statement import Statement
     from dialectical_framework.graph.nodes.perspective import Perspective
 
 
@@ -59,6 +70,16 @@ class LayerResult:
     wheels: list[Wheel]
     new_cycles: list[Cycle]
     new_wheels: list[Wheel]
+    branches: dict[str, frozenset[str]] = field(default_factory=dict)
+
+
+@dataclass
+class _LayerWheels:
+    """Wheels of one PP set during a build: by rotation signature, and the
+    opposite-direction pairs already connected."""
+
+    by_signature: dict[str, Wheel] = field(default_factory=dict)
+    paired: set[tuple[str, str]] = field(default_factory=set)
 
 
 @dataclass
@@ -70,6 +91,85 @@ class CombinationResult:
     wheels: list[Wheel]
     cycles_by_layer: dict[int, list[Cycle]]
     wheels_by_layer: dict[int, list[Wheel]]
+    # Every structure of the built layers (reused ones included) and the PP
+    # set behind each layer_key — what a beam ranks and extends
+    all_cycles: list[Cycle] = field(default_factory=list)
+    all_wheels: list[Wheel] = field(default_factory=list)
+    branches: dict[str, frozenset[str]] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class PrunedBranch:
+    """A PP set left out of the beam: its next-layer extensions were not built."""
+
+    layer: int
+    perspective_hashes: tuple[str, ...]
+    score: float
+
+
+def select_beam(
+    scored: Iterable[tuple[str, Optional[float]]],
+    width: int,
+) -> tuple[dict[str, float], dict[str, float]]:
+    """
+    Keep the top-`width` structures of one type on a layer.
+
+    Raw scores are normalized across the whole layer (not per PP set, where
+    a lone 2-PP cycle always normalizes to 1.0) so branches compare. Missing
+    scores count as 0. Ties keep input order.
+
+    Args:
+        scored: (layer_key, raw CausalityProbability) per Cycle or Wheel
+        width: Beam width; 0 keeps everything
+
+    Returns:
+        Tuple of (surviving, pruned) branches — best normalized score by layer_key
+    """
+    entries = [(key, score or 0.0) for key, score in scored]
+    if not entries:
+        return {}, {}
+
+    total = sum(score for _, score in entries)
+    normalized = [
+        (key, score / total if total > 0 else 1.0 / len(entries))
+        for key, score in entries
+    ]
+    ranked = sorted(range(len(normalized)), key=lambda i: -normalized[i][1])
+    keep = ranked if width <= 0 else ranked[:width]
+
+    best: dict[str, float] = {}
+    for key, score in normalized:
+        best[key] = max(score, best.get(key, 0.0))
+    surviving = {normalized[i][0]: best[normalized[i][0]] for i in keep}
+    pruned = {key: score for key, score in best.items() if key not in surviving}
+    return surviving, pruned
+
+
+def _extensions(
+    perspectives: list[Perspective],
+    branches: Iterable[frozenset[str]],
+    size: int,
+) -> Iterator[tuple[Perspective, ...]]:
+    """
+    PP combinations of `size` that add one Perspective to a branch.
+
+    Each combination is yielded once, in nexus order — the same tuple
+    combinations() would produce, so cycle orderings are found, not rebuilt.
+    """
+    position = {pp.hash: i for i, pp in enumerate(perspectives)}
+    seen: set[frozenset[str]] = set()
+    for branch in branches:
+        if len(branch) != size - 1 or not branch <= position.keys():
+            continue
+        for pp in perspectives:
+            combo = branch | {pp.hash}
+            if pp.hash in branch or combo in seen:
+                continue
+            seen.add(combo)
+            yield tuple(sorted(
+                (p for p in perspectives if p.hash in combo),
+                key=lambda p: position[p.hash],
+            ))
 
 
 class PerspectiveCombination(ReasonableConcern[CombinationResult], SettingsAware):
@@ -85,10 +185,16 @@ class PerspectiveCombination(ReasonableConcern[CombinationResult], SettingsAware
     - Reuses existing Cycles and Wheels where possible
 
     Idempotent: calling multiple times with same inputs produces no duplicates.
+
+    Args:
+        prefilter: Optional predicate over wheel arrangements (e.g. one that
+            consults already-scored sub-cycles); arrangements it rejects are
+            never persisted.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, prefilter: Optional[ArrangementFilter] = None) -> None:
         self._report: ExecutionReport
+        self._prefilter = prefilter
 
     @property
     def report(self) -> ExecutionReport:
@@ -100,6 +206,8 @@ class PerspectiveCombination(ReasonableConcern[CombinationResult], SettingsAware
         nexus: Nexus,
         perspectives: list[Perspective],
         preset: Optional[str] = None,
+        layer: Optional[int] = None,
+        extending: Optional[Iterable[frozenset[str]]] = None,
     ) -> CombinationResult:
         """
         Combine Perspectives into Cycles and Wheels.
@@ -112,6 +220,9 @@ class PerspectiveCombination(ReasonableConcern[CombinationResult], SettingsAware
             perspectives: WUs to combine (must be committed)
             preset: Concrete preset for Cycle intent. If None, reads from nexus.preset.
                 Must not be "preset:auto" — caller resolves that first.
+            layer: Build only this layer (progressive building). None = all layers.
+            extending: With `layer`, restrict it to the PP sets that add one
+                Perspective to one of these (hash sets of layer - 1 PPs).
 
         Returns:
             CombinationResult with newly created Cycles and Wheels
@@ -182,20 +293,38 @@ class PerspectiveCombination(ReasonableConcern[CombinationResult], SettingsAware
         cycles_by_layer: dict[int, list[Cycle]] = {}
         wheels_by_layer: dict[int, list[Wheel]] = {}
 
+        all_cycles: list[Cycle] = []
+        all_wheels: list[Wheel] = []
+        branches: dict[str, frozenset[str]] = {}
+
         top_layer = min(total_pps, self.settings.max_wheel_layer)
-        for layer in range(1, top_layer + 1):
-            layer_result = self._build_layer(nexus, all_nexus_pps, layer)
+        if layer is None:
+            layers = range(1, top_layer + 1)
+        else:
+            layers = range(layer, min(layer, top_layer) + 1)
+            if extending is not None:
+                extending = list(extending)
+                self._report.artifacts["extended_branches"] = len(extending)
+
+        for current in layers:
+            layer_result = self._build_layer(
+                nexus, all_nexus_pps, current,
+                extending=extending if layer is not None else None,
+            )
 
             if layer_result.new_cycles:
-                cycles_by_layer[layer] = layer_result.new_cycles
+                cycles_by_layer[current] = layer_result.new_cycles
             if layer_result.new_wheels:
-                wheels_by_layer[layer] = layer_result.new_wheels
+                wheels_by_layer[current] = layer_result.new_wheels
             new_cycles.extend(layer_result.new_cycles)
             new_wheels.extend(layer_result.new_wheels)
+            all_cycles.extend(layer_result.cycles)
+            all_wheels.extend(layer_result.wheels)
+            branches.update(layer_result.branches)
 
         self._report.artifacts["new_cycles"] = len(new_cycles)
         self._report.artifacts["new_wheels"] = len(new_wheels)
-        self._report.artifacts["layers_built"] = top_layer
+        self._report.artifacts["layers_built"] = layers[-1] if layers else 0
 
         self._report.summary = (
             f"Combined {total_pps} Perspectives: created {len(new_cycles)} new Cycles "
@@ -208,6 +337,9 @@ class PerspectiveCombination(ReasonableConcern[CombinationResult], SettingsAware
             wheels=new_wheels,
             cycles_by_layer=cycles_by_layer,
             wheels_by_layer=wheels_by_layer,
+            all_cycles=all_cycles,
+            all_wheels=all_wheels,
+            branches=branches,
         )
 
     def _add_perspectives_to_nexus(
@@ -231,44 +363,75 @@ class PerspectiveCombination(ReasonableConcern[CombinationResult], SettingsAware
         nexus: Nexus,
         perspectives: list[Perspective],
         layer: int,
+        extending: Optional[list[frozenset[str]]] = None,
     ) -> LayerResult:
         """
         Build all Cycles and Wheels for a specific layer.
 
-        For each PP combination of size `layer`:
+        For each PP combination of size `layer` (only those extending one of
+        the `extending` branches, when given):
         1. Generate T-cycle permutations
-        2. Create missing Cycle nodes (connected to Nexus)
-        3. For each Cycle, generate Wheel arrangements
-        4. Create missing Wheel nodes
+        2. Create missing Cycle nodes (connected to Nexus), pair opposite cycles
+        3. For each Cycle, enumerate Wheel arrangements (prefiltered, capped)
+        4. Create missing Wheel nodes, pair opposite wheels
         """
         all_cycles: list[Cycle] = []
         all_wheels: list[Wheel] = []
         new_cycles: list[Cycle] = []
         new_wheels: list[Wheel] = []
+        branches: dict[str, frozenset[str]] = {}
+
+        enumerator = ArrangementEnumerator(
+            prefilter=self._prefilter,
+            max_per_cycle=self.settings.max_wheels_per_cycle,
+        )
+        wheel_repo = WheelRepository()
+
+        if extending is None:
+            pp_combos: Iterable[tuple[Perspective, ...]] = combinations(perspectives, layer)
+        else:
+            pp_combos = _extensions(perspectives, extending, layer)
 
-        # Generate all combinations of PPs for this layer size
-        pp_combinations = list(combinations(perspectives, layer))
+        # Combinations are consumed lazily, one PP set at a time
+        for pp_combo in pp_combos:
+            combo = list(pp_combo)
 
-        for pp_combo in pp_combinations:
             # Generate T-cycle permutations for this combination
             cycles_for_combo, new_for_combo = self._build_cycles_for_perspectives(
-                nexus, list(pp_combo)
+                nexus, combo
             )
             all_cycles.extend(cycles_for_combo)
             new_cycles.extend(new_for_combo)
+            if cycles_for_combo and cycles_for_combo[0].layer_key:
+                branches[cycles_for_combo[0].layer_key] = frozenset(
+                    pp.hash for pp in combo
+                )
+
+            # Opposite-direction cycles: reversal needs 3+ PPs (2-element
+            # circular sequences have no distinct reverse)
+            if len(combo) >= 3:
+                self._connect_opposite_direction_cycles(nexus, combo)
+
+            # Wheels of this PP set already in the graph (any cycle, earlier
+            # runs included), by rotation signature — reuse and twin lookup
+            layer_wheels = _LayerWheels()
+            for wheel in wheel_repo.find_by_layer(combo, nexus=nexus):
+                if wheel.rotation_signature:
+                    layer_wheels.by_signature.setdefault(wheel.rotation_signature, wheel)
 
             # For each Cycle, generate Wheels
             for cycle in cycles_for_combo:
                 wheels_for_cycle, new_wheels_for_cycle = self._build_wheels_for_cycle(
-                    cycle
+                    cycle, enumerator, layer_wheels
                 )
                 all_wheels.extend(wheels_for_cycle)
                 new_wheels.extend(new_wheels_for_cycle)
 
-        # Connect opposite-direction pairs (queries DB for full layer scope)
-        self._connect_opposite_direction_pairs(
-            nexus, [list(combo) for combo in pp_combinations]
-        )
+        if enumerator.pruned or enumerator.capped:
+            pruned = self._report.artifacts.get("pruned_arrangements", 0)
+            self._report.artifacts["pruned_arrangements"] = pruned + enumerator.pruned
+            capped = self._report.artifacts.get("capped_cycles", 0)
+            self._report.artifacts["capped_cycles"] = capped + enumerator.capped
 
         return LayerResult(
             layer=layer,
@@ -276,6 +439,7 @@ class PerspectiveCombination(ReasonableConcern[CombinationResult], SettingsAware
             wheels=all_wheels,
             new_cycles=new_cycles,
             new_wheels=new_wheels,
+            branches=branches,
         )
 
     def _build_cycles_for_perspectives(
@@ -363,12 +527,21 @@ class PerspectiveCombination(ReasonableConcern[CombinationResult], SettingsAware
     def _build_wheels_for_cycle(
         self,
         cycle: Cycle,
+        enumerator: ArrangementEnumerator,
+        layer_wheels: _LayerWheels,
     ) -> tuple[list[Wheel], list[Wheel]]:
         """
         Generate Wheel arrangements for a Cycle.
 
-        Uses generate_compatible_sequences to produce all valid TA-wheel
-        arrangements with diagonal symmetry (T and A neutral components).
+        Consumes the enumerator's canonical TA-wheel arrangements (diagonal
+        symmetry, T and A neutral components) for this cycle ordering, reusing
+        wheels already known by signature, then connects each wheel to its
+        opposite-direction twin found by signature in `layer_wheels`.
+
+        Args:
+            cycle: Committed Cycle to build wheels for
+            enumerator: Layer-wide arrangement stream (prefilter, cap)
+            layer_wheels: Wheels of the cycle's PP set; new wheels are added
 
         Returns:
             Tuple of (all_wheels, new_wheels)
@@ -380,148 +553,123 @@ class PerspectiveCombination(ReasonableConcern[CombinationResult], SettingsAware
         if not perspectives:
             return all_wheels, new_wheels
 
-        # Generate all compatible TA arrangements
-        arrangements = generate_compatible_sequences(perspectives)
-
-        if not arrangements:
-            return all_wheels, new_wheels
-
         wheel_repo = WheelRepository()
-
-        for components in arrangements:
-            # Check for existing wheel with same component sequence
-            existing_wheel = wheel_repo.find_by_component_sequence(components)
-            if existing_wheel:
-                # Reuse existing wheel — connect to this cycle if not already
-                cycle_result = existing_wheel.cycle.get()
-                if not cycle_result or cycle_result[0].hash != cycle.hash:
-                    cycle.wheels.connect(existing_wheel)
-                    self._report.relationship_created(
-                        cycle.wheels, cycle, existing_wheel
-                    )
-                all_wheels.append(existing_wheel)
-                continue
-
-            # Create new wheel
-            wheel = Wheel(intent=cycle.intent)
-            wheel.save()
+        staged: list[tuple[Wheel, list[Transition]]] = []
+        built: list[tuple[Wheel, Arrangement]] = []
+
+        with BatchCommitter() as batch:
+            for arrangement in enumerator.arrangements(perspectives):
+                components = arrangement.components
+                signature = arrangement.signature
+
+                # Known wheel: this PP set's (by signature), else any in scope
+                existing_wheel = layer_wheels.by_signature.get(
+                    signature
+                ) or wheel_repo.find_by_component_sequence(list(components))
+                if existing_wheel:
+                    # Reuse existing wheel — connect to this cycle if not already
+                    cycle_result = existing_wheel.cycle.get()
+                    if not cycle_result or cycle_result[0].hash != cycle.hash:
+                        cycle.wheels.connect(existing_wheel)
+                        self._report.relationship_created(
+                            cycle.wheels, cycle, existing_wheel
+                        )
+                    layer_wheels.by_signature[signature] = existing_wheel
+                    built.append((existing_wheel, arrangement))
+                    all_wheels.append(existing_wheel)
+                    continue
+
+                # Create new wheel (lookup keys are known here — spare commit
+                # from re-deriving them)
+                wheel = Wheel(
+                    intent=cycle.intent,
+                    layer_key=cycle.layer_key,
+                    rotation_signature=signature,
+                )
+                wheel.save()
+
+                # Stage transitions forming the circular causality sequence
+                transitions: list[Transition] = []
+                for i in range(len(components)):
+                    source_comp = components[i]
+                    target_comp = components[(i + 1) % len(components)]
+
+                    transition = Transition()
+                    transition.set_source(source_comp)
+                    transition.set_target(target_comp)
+                    batch.commit(transition)
+                    batch.connect(transition.cycle, wheel)
+                    transitions.append(transition)
+
+                layer_wheels.by_signature[signature] = wheel
+                staged.append((wheel, transitions))
+                built.append((wheel, arrangement))
+                all_wheels.append(wheel)
+                new_wheels.append(wheel)
+
+        # Transitions are persisted now: connect and commit the wheels
+        for wheel, transitions in staged:
             self._report.node_created(wheel)
-
-            # Create transitions forming the circular causality sequence
-            for i in range(len(components)):
-                source_comp = components[i]
-                target_comp = components[(i + 1) % len(components)]
-
-                transition = Transition()
-                transition.set_source(source_comp)
-                transition.set_target(target_comp)
-                transition.commit()
-                transition.cycle.connect(wheel)
+            for transition in transitions:
                 self._report.node_created(transition)
                 self._report.relationship_created(transition.cycle, transition, wheel)
 
-            # Connect to cycle
             cycle.wheels.connect(wheel)
 
             wheel.commit()
             self._report.node_committed(wheel)
             self._report.relationship_created(cycle.wheels, cycle, wheel)
 
-            all_wheels.append(wheel)
-            new_wheels.append(wheel)
+        # Opposite-direction twins: one hash lookup per wheel. A twin built
+        # later (sibling cycle) pairs up when its own turn comes.
+        for wheel, arrangement in built:
+            if arrangement.is_self_reverse:
+                continue
+            twin = layer_wheels.by_signature.get(arrangement.reverse_signature)
+            if twin is None or not twin.is_committed:
+                continue
+            pair_id = tuple(sorted([wheel.hash, twin.hash]))
+            if pair_id in layer_wheels.paired:
+                continue
+            wheel.opposite_direction.connect(twin)
+            self._report.relationship_created(wheel.opposite_direction, wheel, twin)
+            layer_wheels.paired.add(pair_id)
 
         return all_wheels, new_wheels
 
-    def _connect_opposite_direction_pairs(
+    def _connect_opposite_direction_cycles(
         self,
         nexus: Nexus,
-        pp_combo_list: list[list[Perspective]],
+        perspectives: list[Perspective],
     ) -> None:
         """
-        Detect and connect opposite-direction pairs among cycles and wheels.
+        Connect the layer's cycles that are circular reverses of each other.
 
-        Queries the DB for ALL cycles/wheels in each PP combo's layer scope,
-        so pairs are connected even if one side was created in a previous run.
-
-        Two sequences are opposite-direction if one is a circular reverse of the other.
-        Connects pairs via the OPPOSITE_DIRECTION symmetric relationship.
+        Queries ALL cycles of the PP set (any intent, earlier runs included),
+        indexes them by rotation signature and looks up each one's reverse —
+        linear in the number of cycles. Connects pairs via the symmetric
+        OPPOSITE_DIRECTION relationship (idempotent).
         """
         from dialectical_framework.graph.repositories.cycle_repository import (
             CycleRepository,
         )
 
-        cycle_repo = CycleRepository()
-        wheel_repo = WheelRepository()
+        cycles = CycleRepository().find_by_layer(perspectives, nexus=nexus)
 
-        for pp_combo in pp_combo_list:
-            if len(pp_combo) <= 1:
-                continue  # Single PP has no opposite direction
-
-            # Get ALL cycles and wheels for this PP set from DB
-            all_layer_cycles = cycle_repo.find_by_layer(pp_combo, nexus=nexus)
-            all_layer_wheels = wheel_repo.find_by_layer(pp_combo, nexus=nexus)
-
-            # Cycles: reversal needs 3+ PPs (2-element circular sequences
-            # have no distinct reverse). Wheels always have 2n components,
-            # so 2 PPs → 4-component sequences which can have reversals.
-            if len(pp_combo) >= 3:
-                _connect_opposite_direction_cycles(all_layer_cycles, self._report)
-            _connect_opposite_direction_wheels(all_layer_wheels, self._report)
-
-
-def _connect_opposite_direction_cycles(
-    cycles: list[Cycle], report: ExecutionReport
-) -> None:
-    """Connect cycles that are circular reverses of each other."""
-    connected: set[tuple[str, str]] = set()
-
-    for i, cycle_a in enumerate(cycles):
-        seq_a = cycle_a.perspective_hashes
-        for cycle_b in cycles[i + 1 :]:
-            seq_b = cycle_b.perspective_hashes
-            if _is_circular_reverse(seq_a, seq_b):
-                pair_id = tuple(sorted([cycle_a.hash, cycle_b.hash]))
-                if pair_id not in connected:
-                    cycle_a.opposite_direction.connect(cycle_b)
-                    report.relationship_created(
-                        cycle_a.opposite_direction, cycle_a, cycle_b
-                    )
-                    connected.add(pair_id)
-
-
-def _connect_opposite_direction_wheels(
-    wheels: list[Wheel], report: ExecutionReport
-) -> None:
-    """Connect wheels that are circular reverses of each other."""
-    connected: set[tuple[str, str]] = set()
-
-    # Pre-compute component hash sequences
-    wheel_sequences: list[tuple[Wheel, list[str]]] = []
-    for wheel in wheels:
-        comp_hashes = [c.hash for c in wheel.statements]
-        wheel_sequences.append((wheel, comp_hashes))
-
-    for i, (wheel_a, seq_a) in enumerate(wheel_sequences):
-        for wheel_b, seq_b in wheel_sequences[i + 1 :]:
-            if _is_circular_reverse(seq_a, seq_b):
-                pair_id = tuple(sorted([wheel_a.hash, wheel_b.hash]))
-                if pair_id not in connected:
-                    wheel_a.opposite_direction.connect(wheel_b)
-                    report.relationship_created(
-                        wheel_a.opposite_direction, wheel_a, wheel_b
-                    )
-                    connected.add(pair_id)
-
-
-def _is_circular_reverse(seq_a: list[str], seq_b: list[str]) -> bool:
-    """
-    Check if seq_b is any rotation of the reverse of seq_a.
-
-    Returns False for sequences of length <= 2 (no distinct reversal).
-    """
-    if len(seq_a) != len(seq_b) or set(seq_a) != set(seq_b):
-        return False
-    if len(seq_a) <= 2:
-        return False
-    reversed_a = list(reversed(seq_a))
-    return any(reversed_a[i:] + reversed_a[:i] == seq_b for i in range(len(reversed_a)))
+        by_signature: dict[str, list[Cycle]] = {}
+        for cycle in cycles:
+            signature = cycle.rotation_signature or rotation_signature(
+                cycle.perspective_hashes
+            )
+            by_signature.setdefault(signature, []).append(cycle)
+
+        connected: set[tuple[str, str]] = set()
+        for cycle in cycles:
+            reverse = rotation_signature(cycle.perspective_hashes[::-1])
+            for twin in by_signature.get(reverse, []):
+                pair_id = tuple(sorted([cycle.hash, twin.hash]))
+                if twin.hash == cycle.hash or pair_id in connected:
+                    continue
+                cycle.opposite_direction.connect(twin)
+                self._report.relationship_created(cycle.opposite_direction, cycle, twin)
+                connected.add(pair_id)
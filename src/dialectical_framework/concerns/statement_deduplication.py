@@ -4,6 +4,9 @@ SemanticDeduplicator: Service for semantic deduplication of components.
 Compares newly extracted components against existing vocabulary using LLM
 to find semantic duplicates (same assertion/claim, different wording).
 Statements about the same topic but taking different stances are NOT duplicates.
+
+Only the nearest existing statements (per StatementSimilarityIndex, top
+`dedup_top_k` per extraction) are shown to the LLM, however large the case.
 """
 
 from __future__ import annotations
@@ -11,6 +14,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
 
+from dependency_injector.wiring import Provide, inject
 from pydantic import BaseModel, Field
 
 from dialectical_framework.agents.conversation_facilitator import \
@@ -18,12 +22,17 @@ from dialectical_framework.agents.conversation_facilitator import \
 from dialectical_framework.agents.reasonable_concern import \
     ReasonableConcern
 from dialectical_framework.agents.execution_report import ExecutionReport
+from dialectical_framework.concerns.statement_similarity import (
+    StatementIndexStore, StatementSimilarityIndex)
+from dialectical_framework.enums.di import DI
+from dialectical_framework.graph.scope_context import get_current_sid
 from dialectical_framework.graph.nodes.statement import \
     Statement
 from dialectical_framework.graph.repositories.statement_repository import \
     StatementRepository
 from dialectical_framework.graph.repositories.node_repository import \
     NodeRepository
+from dialectical_framework.protocols.has_config import SettingsAware
 
 if TYPE_CHECKING:
     pass
@@ -88,6 +97,13 @@ def _extract_meaning_prefix(meaning: Optional[str]) -> Optional[str]:
     return meaning[:last_slash]
 
 
+@inject
+def _di_statement_index(
+    store: StatementIndexStore = Provide[DI.statement_index],
+) -> StatementIndexStore:
+    return store
+
+
 # --- DTOs ---
 
 
@@ -165,7 +181,7 @@ class DedupResult:
 # --- Service ---
 
 
-class StatementDeduplication(ReasonableConcern[DedupResult]):
+class StatementDeduplication(ReasonableConcern[DedupResult], SettingsAware):
     """
     Concern for semantic deduplication of components against vocabulary.
 
@@ -269,6 +285,7 @@ class StatementDeduplication(ReasonableConcern[DedupResult]):
         """Call LLM to find semantic equivalents."""
         # Build extraction descriptions and collect meaning prefixes
         extraction_lines = []
+        extracted: list[Statement] = []
         extracted_prefixes: set[Optional[str]] = set()
         for h in extracted_hashes:
             comp = self._resolve_component(h)
@@ -276,6 +293,7 @@ class StatementDeduplication(ReasonableConcern[DedupResult]):
                 extraction_lines.append(
                     f"[{comp.short_hash}] {comp.prompt_text} (meaning: {comp.meaning or 'none'})"
                 )
+                extracted.append(comp)
                 extracted_prefixes.add(_extract_meaning_prefix(comp.meaning))
 
         # Filter vocabulary by meaning prefix
@@ -292,9 +310,13 @@ class StatementDeduplication(ReasonableConcern[DedupResult]):
                 or _extract_meaning_prefix(v.get("meaning")) in extracted_prefixes
             ]
 
-        # Build vocabulary descriptions (limit tokens)
+        # Only the nearest statements of each extraction (bounded prompt)
+        non_discarded = self._nearest(
+            vocabulary, non_discarded, [(c.text or "", c.meaning) for c in extracted]
+        )
+
         vocab_lines = []
-        for v in non_discarded[:100]:
+        for v in non_discarded:
             rationale_hint = (
                 f" - {v['rationale'][:80]}..." if v.get("rationale") else ""
             )
@@ -381,6 +403,41 @@ If no match, set db_hash to null."""
             originals=originals,
         )
 
+    def _similarity_index(self, vocabulary: list[dict]) -> StatementSimilarityIndex:
+        """The sid's similarity index, synced with the vocabulary."""
+        sid = get_current_sid()
+        index = _di_statement_index().get(sid) if sid else StatementSimilarityIndex()
+        index.sync(vocabulary)
+        return index
+
+    def _nearest(
+        self,
+        vocabulary: list[dict],
+        candidates: list[dict],
+        queries: list[tuple[str, Optional[str]]],
+    ) -> list[dict]:
+        """
+        The candidates nearest to any query (top-k each), best matches first.
+
+        Args:
+            vocabulary: Full vocabulary the index is synced with
+            candidates: Vocabulary entries eligible for the prompt
+            queries: (text, meaning) of the statements to deduplicate
+        """
+        by_hash = {v["hash"]: v for v in candidates if v.get("hash")}
+        if not by_hash or not queries:
+            return []
+        index = self._similarity_index(vocabulary)
+        allowed = set(by_hash)
+        best: dict[str, float] = {}
+        for text, meaning in queries:
+            for h, score in index.query(
+                text, meaning, k=self.settings.dedup_top_k, allowed=allowed
+            ):
+                best[h] = max(score, best.get(h, 0.0))
+        ranked = sorted(best, key=lambda h: (-best[h], h))
+        return [by_hash[h] for h in ranked]
+
     def _find_match(
         self, ext_hash: str, matches: list[SemanticMatchDto]
     ) -> Optional[SemanticMatchDto]:
@@ -431,8 +488,9 @@ If no match, set db_hash to null."""
 
         # Build vocabulary descriptions (no meaning filtering - check ALL)
         non_discarded = [v for v in vocabulary if not v.get("discarded")]
+        non_discarded = self._nearest(vocabulary, non_discarded, [(idea, None)])
         vocab_lines = []
-        for v in non_discarded[:100]:  # Limit for token budget
+        for v in non_discarded:
             meaning_hint = (
                 f" (meaning: {v.get('meaning', 'none')})" if v.get("meaning") else ""
             )
@@ -0,0 +1,224 @@
+"""
+Lexical candidate index for statement deduplication.
+
+The deduplicator used to hand the LLM the first 100 vocabulary entries: big
+cases paid for huge prompts and duplicates past the cap were never seen.
+Instead, every statement of a sid is kept as a MinHash signature over its
+text shingles (character 4-grams + words) and meaning URI, bucketed by LSH
+bands. For each new statement only the top-k nearest existing statements go
+to the LLM, so the prompt size no longer depends on the case size.
+
+Pure Python, no dependencies. Signatures use a stable hash, so they are the
+same in every process.
+
+The index of a sid lives in the StatementIndexStore (DI singleton) and is
+kept up to date incrementally: `sync(vocabulary)` signs only statements it
+has not seen and forgets deleted ones, so the cost of a dedup call is
+proportional to what changed since the previous one.
+
+    index = store.get(sid)
+    index.sync(vocabulary)
+    nearest = index.query(text, meaning, k=8)  # [(hash, similarity), ...]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+# 64 permutations in 32 bands of 2 rows: pairs with a Jaccard similarity of
+# ~0.2 already share a bucket with probability > 0.7. Recall matters more
+# than precision here — the LLM makes the final call.
+NUM_PERM = 64
+BANDS = 32
+_ROWS = NUM_PERM // BANDS
+
+_MERSENNE = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE), _rng.randrange(0, _MERSENNE)) for _ in range(NUM_PERM)
+]
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+_SHINGLE = 4
+
+
+def shingles(text: str, meaning: Optional[str] = None) -> set[str]:
+    """Character 4-grams of the normalized text, its words, and meaning tokens."""
+    words = _WORD.findall(text.lower())
+    normalized = " ".join(words)
+    features = {f"w:{w}" for w in words}
+    if len(normalized) <= _SHINGLE:
+        if normalized:
+            features.add(f"c:{normalized}")
+    else:
+        features.update(
+            f"c:{normalized[i:i + _SHINGLE]}" for i in range(len(normalized) - _SHINGLE + 1)
+        )
+    if meaning:
+        # Every level of the taxonomy path: same branch counts, same leaf more
+        meaning = meaning.rstrip("/")
+        parts = meaning.split("/")
+        features.update(f"m:{'/'.join(parts[:i])}" for i in range(3, len(parts) + 1))
+    return features
+
+
+def signature(features: Iterable[str]) -> tuple[int, ...]:
+    """MinHash signature of a feature set (stable across processes)."""
+    hashes = [
+        int.from_bytes(hashlib.blake2b(f.encode(), digest_size=8).digest(), "big")
+        for f in features
+    ]
+    if not hashes:
+        return (_MERSENNE,) * NUM_PERM
+    return tuple(min((a * h + b) % _MERSENNE for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def similarity(a: tuple[int, ...], b: tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_PERM
+
+
+class StatementSimilarityIndex:
+    """
+    MinHash/LSH index over the statements of one sid.
+
+    Thread-safe. Entries are keyed by statement hash; a statement whose text
+    or meaning changed under the same hash (never, in practice — hashes are
+    content-addressed) is re-signed on the next sync.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[str, tuple[int, ...]]] = {}
+        self._buckets: dict[tuple[int, int], set[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, statement_hash: str) -> bool:
+        return statement_hash in self._entries
+
+    def add(self, statement_hash: str, text: str, meaning: Optional[str] = None) -> None:
+        fingerprint = f"{text}\x00{meaning or ''}"
+        with self._lock:
+            current = self._entries.get(statement_hash)
+            if current is not None and current[0] == fingerprint:
+                return
+        sig = signature(shingles(text, meaning))
+        with self._lock:
+            self._discard(statement_hash)
+            self._entries[statement_hash] = (fingerprint, sig)
+            for key in _band_keys(sig):
+                self._buckets.setdefault(key, set()).add(statement_hash)
+
+    def remove(self, statement_hash: str) -> None:
+        with self._lock:
+            self._discard(statement_hash)
+
+    def sync(self, vocabulary: list[dict]) -> None:
+        """
+        Bring the index in line with a vocabulary (dicts with hash, statement,
+        meaning): sign new statements, forget the ones no longer there.
+        """
+        present = {v["hash"] for v in vocabulary if v.get("hash")}
+        with self._lock:
+            stale = [h for h in self._entries if h not in present]
+            for h in stale:
+                self._discard(h)
+        for v in vocabulary:
+            if v.get("hash"):
+                self.add(v["hash"], v.get("statement") or "", v.get("meaning"))
+
+    def query(
+        self,
+        text: str,
+        meaning: Optional[str] = None,
+        k: int = 8,
+        allowed: Optional[set[str]] = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Top-k most similar statements, best first.
+
+        LSH bucket-mates are ranked first; when they are fewer than k, the
+        rest of the index is scanned so small cases still get k candidates.
+
+        Args:
+            text: Statement text to look up
+            meaning: Its meaning URI, if any
+            k: Number of candidates
+            allowed: Restrict results to these statement hashes
+        """
+        if k <= 0:
+            return []
+        sig = signature(shingles(text, meaning))
+        with self._lock:
+            candidates: set[str] = set()
+            for key in _band_keys(sig):
+                candidates.update(self._buckets.get(key, ()))
+            if allowed is not None:
+                candidates &= allowed
+            ranked = self._rank(sig, candidates)
+            if len(ranked) < k:
+                rest = (
+                    h for h in self._entries
+                    if h not in candidates and (allowed is None or h in allowed)
+                )
+                ranked += self._rank(sig, rest)
+        return ranked[:k]
+
+    def _rank(self, sig: tuple[int, ...], hashes: Iterable[str]) -> list[tuple[str, float]]:
+        scored = [(h, similarity(sig, self._entries[h][1])) for h in hashes]
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored
+
+    def _discard(self, statement_hash: str) -> None:
+        entry = self._entries.pop(statement_hash, None)
+        if entry is None:
+            return
+        for key in _band_keys(entry[1]):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(statement_hash)
+                if not bucket:
+                    del self._buckets[key]
+
+
+def _band_keys(sig: tuple[int, ...]) -> list[tuple[int, int]]:
+    return [(band, hash(sig[band * _ROWS:(band + 1) * _ROWS])) for band in range(BANDS)]
+
+
+class StatementIndexStore:
+    """
+    Per-sid StatementSimilarityIndex registry (DI singleton).
+
+    Keeps the indexes of the `max_sids` most recently used cases.
+    """
+
+    def __init__(self, max_sids: int = 256) -> None:
+        self._max_sids = max_sids
+        self._indexes: OrderedDict[str, StatementSimilarityIndex] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, sid: str) -> StatementSimilarityIndex:
+        with self._lock:
+            index = self._indexes.get(sid)
+            if index is None:
+                index = self._indexes[sid] = StatementSimilarityIndex()
+                while len(self._indexes) > self._max_sids:
+                    self._indexes.popitem(last=False)
+            else:
+                self._indexes.move_to_end(sid)
+            return index
+
+    def invalidate(self, sid: Optional[str] = None) -> None:
+        """Drop the index of one sid (or all)."""
+        with self._lock:
+            if sid is None:
+                self._indexes.clear()
+            else:
+                self._indexes.pop(sid, None)
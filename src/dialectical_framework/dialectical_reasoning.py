@@ -12,7 +12,16 @@ from dialectical_framework.graph.dialexity_input_resolver import DialexityInputR
 from dialectical_framework.graph.composite_input_resolver import CompositeInputResolver
 from dialectical_framework.agents.execution_report import ExecutionReport
 from dialectical_framework.events.graph_event_bus import GraphEventBus
+from dialectical_framework.concerns.context_snapshot import ContextSnapshotStore
+from dialectical_framework.concerns.statement_similarity import StatementIndexStore
 from dialectical_framework.graph.scope_context import get_current_sid
+from dialectical_framework.graph.graph_session import GraphSession, get_current_session
+from dialectical_framework.graph.graph_db_pool import AsyncGraphDb, GraphDbPool, get_bound_graph_db
+from dialectical_framework.graph.query_profiler import instrument_graph_db
+from dialectical_framework.protocols.llm_response_cache import LlmResponseCache
+from dialectical_framework.utils.llm_response_cache import MemoryLlmCache, SqliteLlmCache
+from dialectical_framework.utils.resolved_input_cache import ResolvedInputCache
+from dialectical_framework.utils import lazy_wiring
 
 
 class DialecticalReasoning(containers.DeclarativeContainer):
@@ -31,10 +40,22 @@ class DialecticalReasoning(containers.DeclarativeContainer):
         """Create a new container instance with user-specific settings."""
         container = cls()
         container.settings.override(settings)
+        if settings.di_wiring == "eager":
+            container.wire(modules=cls._discover_modules())
+        else:
+            lazy_wiring.register(container)
         ExecutionReport.set_event_bus(container.event_bus())
         if settings.effect_log_dir:
             from dialectical_framework.utils.effect_logger import EffectLogger
-            ExecutionReport.set_effect_logger(EffectLogger(settings.effect_log_dir))
+            ExecutionReport.set_effect_logger(EffectLogger(
+                settings.effect_log_dir,
+                max_queue=settings.effect_log_queue_size,
+                batch_size=settings.effect_log_batch_size,
+                flush_interval=settings.effect_log_flush_interval,
+                max_bytes=settings.effect_log_max_bytes,
+                max_age=settings.effect_log_max_age,
+                compression=settings.effect_log_compression,
+            ))
         return container
 
     # It will be the same settings for all services in the container
@@ -42,6 +63,15 @@ class DialecticalReasoning(containers.DeclarativeContainer):
 
     @staticmethod
     def _create_graph_db(settings: Settings) -> Union[Memgraph, Neo4j]:
+        """
+        Create the shared graph database client and ensure schema indexes exist.
+        """
+        db = DialecticalReasoning._connect_graph_db(settings)
+        DialecticalReasoning._ensure_schema(db)
+        return db
+
+    @staticmethod
+    def _connect_graph_db(settings: Settings) -> Union[Memgraph, Neo4j]:
         """
         Factory method to create the appropriate graph database connection based on vendor.
 
@@ -81,53 +111,64 @@ class DialecticalReasoning(containers.DeclarativeContainer):
                 f"Supported vendors: 'memgraph', 'neo4j'"
             )
 
-        # Ensure schema indexes exist
-        DialecticalReasoning._ensure_schema(db)
-        return db
+        # Query counts/timings for ExecutionReport and agent_scope profiles
+        return instrument_graph_db(db)
 
     @staticmethod
     def _ensure_schema(graph_db: Union[Memgraph, Neo4j]) -> None:
         """
         Ensure required indexes and constraints exist on the graph database.
 
-        Creates indexes on :Node for Merkle identity fields (hash, sid).
+        Creates indexes on :Node for Merkle identity fields (hash, sid, short_hash),
+        and on :Cycle/:Wheel for their lookup keys (layer_key, rotation_signature).
+        Backfills short_hash, and the Cycle/Wheel lookup keys, on nodes committed
+        before they were stored.
         Creates a unique constraint on :Node(hash, sid) - composite constraint ensures
         uniqueness within scope while allowing same content in different scopes.
         Works with both Memgraph and Neo4j by detecting DB type and using appropriate syntax.
         """
-        required_indexes = {"hash", "sid"}
+        required_indexes = {
+            ("Node", "hash"),
+            ("Node", "short_hash"),
+            ("Node", "sid"),
+            ("Cycle", "layer_key"),
+            ("Cycle", "rotation_signature"),
+            ("Wheel", "layer_key"),
+            ("Wheel", "rotation_signature"),
+        }
         is_neo4j = isinstance(graph_db, Neo4j)
 
-        # Get existing indexes
-        existing_indexes: set[str] = set()
+        # Get existing (label, property) indexes
+        existing_indexes: set[tuple[str, str]] = set()
         try:
             if is_neo4j:
                 # Neo4j: SHOW INDEXES returns labelsOrTypes, properties
                 results = graph_db.execute_and_fetch("SHOW INDEXES")
                 for row in results:
-                    labels = row.get("labelsOrTypes", [])
-                    props = row.get("properties", [])
-                    if "Node" in labels and props:
-                        existing_indexes.update(props)
+                    for label in row.get("labelsOrTypes") or []:
+                        for prop in row.get("properties") or []:
+                            existing_indexes.add((label, prop))
             else:
                 # Memgraph: SHOW INDEX INFO returns label, property
                 results = graph_db.execute_and_fetch("SHOW INDEX INFO")
                 for row in results:
-                    if row.get("label") == "Node":
-                        existing_indexes.add(row.get("property"))
+                    existing_indexes.add((row.get("label"), row.get("property")))
         except Exception:
             pass  # Fresh DB - no indexes yet
 
         # Create missing indexes
-        for prop in required_indexes - existing_indexes:
+        for label, prop in sorted(required_indexes - existing_indexes):
             if is_neo4j:
                 # Neo4j 4.x+ syntax with IF NOT EXISTS
                 graph_db.execute(
-                    f"CREATE INDEX IF NOT EXISTS FOR (n:Node) ON (n.{prop})"
+                    f"CREATE INDEX IF NOT EXISTS FOR (n:{label}) ON (n.{prop})"
                 )
             else:
                 # Memgraph syntax
-                graph_db.execute(f"CREATE INDEX ON :Node({prop})")
+                graph_db.execute(f"CREATE INDEX ON :{label}({prop})")
+
+        DialecticalReasoning._backfill_short_hashes(graph_db)
+        DialecticalReasoning._backfill_rotation_keys(graph_db)
 
         # Check for existing unique constraint on (hash, sid)
         # This composite constraint ensures uniqueness within scope while allowing
@@ -181,12 +222,127 @@ class DialecticalReasoning(containers.DeclarativeContainer):
                     e,
                 )
 
-    # Graph database (Memgraph or Neo4j) for graph-native dialectical structures
-    graph_db: providers.Singleton[Union[Memgraph, Neo4j]] = providers.Singleton(
+    @staticmethod
+    def _backfill_short_hashes(
+        graph_db: Union[Memgraph, Neo4j], batch_size: int = 10_000
+    ) -> int:
+        """
+        Migration: store short_hash on committed nodes that lack it.
+
+        Short-hash lookups match on the indexed short_hash property, so nodes
+        committed before it was stored would be unreachable by short hash.
+        Runs in batches; a no-op once every committed node has one.
+
+        Returns:
+            Number of nodes updated
+        """
+        from dialectical_framework.graph.nodes.base_node import SHORT_HASH_LENGTH
+
+        query = f"""
+            MATCH (n:Node)
+            WHERE n.hash IS NOT NULL AND n.short_hash IS NULL
+            WITH n LIMIT $batch_size
+            SET n.short_hash = substring(n.hash, 0, {SHORT_HASH_LENGTH})
+            RETURN count(n) AS updated
+        """
+        total = 0
+        while True:
+            rows = list(graph_db.execute_and_fetch(query, {"batch_size": batch_size}))
+            updated = rows[0]["updated"] if rows else 0
+            total += updated
+            if updated < batch_size:
+                return total
+
+    @staticmethod
+    def _backfill_rotation_keys(graph_db: Union[Memgraph, Neo4j]) -> int:
+        """
+        Migration: store layer_key / rotation_signature on committed Cycles
+        and Wheels that lack them.
+
+        Repository lookups match on these indexed keys, so unkeyed nodes
+        would be invisible to them and get rebuilt as duplicates. Wheels
+        without a parent Cycle or a complete edge chain can't be keyed and
+        are left as they are. A no-op once every keyable node has its keys.
+
+        Returns:
+            Number of nodes updated
+        """
+        from dialectical_framework.graph.rotation_keys import (
+            missing_rotation_keys, write_rotation_keys)
+
+        cycle_rows, wheel_rows, _ = missing_rotation_keys(graph_db)
+        write_rotation_keys(graph_db, "Cycle", cycle_rows)
+        write_rotation_keys(graph_db, "Wheel", wheel_rows)
+        return len(cycle_rows) + len(wheel_rows)
+
+    @staticmethod
+    def _create_llm_cache(settings: Settings) -> Optional[LlmResponseCache]:
+        """Create the configured LLM response cache backend, or None when disabled."""
+        backend = settings.llm_cache_backend
+        if not backend:
+            return None
+        if backend == "memory":
+            return MemoryLlmCache(max_entries=settings.llm_cache_max_entries, ttl=settings.llm_cache_ttl)
+        if backend == "sqlite":
+            if not settings.llm_cache_path:
+                raise ValueError("llm_cache_path is required for the 'sqlite' LLM cache backend")
+            return SqliteLlmCache(
+                settings.llm_cache_path,
+                max_entries=settings.llm_cache_max_entries,
+                ttl=settings.llm_cache_ttl,
+            )
+        raise ValueError(f"Unsupported LLM cache backend: {backend}")
+
+    @staticmethod
+    def _create_input_cache(settings: Settings) -> Optional[ResolvedInputCache]:
+        """Create the resolved-input cache, or None when disabled."""
+        if settings.input_cache_max_bytes <= 0:
+            return None
+        return ResolvedInputCache(max_bytes=settings.input_cache_max_bytes)
+
+    # Graph database (Memgraph or Neo4j) for graph-native dialectical structures.
+    # Resolves to the shared client, or — inside work offloaded through
+    # async_graph_db — to the pooled connection bound to that call.
+    shared_graph_db: providers.Singleton[Union[Memgraph, Neo4j]] = providers.Singleton(
         _create_graph_db,
         settings=settings
     )
 
+    graph_db: providers.Callable[Union[Memgraph, Neo4j]] = providers.Callable(
+        get_bound_graph_db,
+        default=shared_graph_db,
+    )
+
+    # -- Connection Pool / Async Graph Access --
+    # Fresh (unshared) clients for the pool; schema is ensured by shared_graph_db.
+    graph_db_connection: providers.Factory[Union[Memgraph, Neo4j]] = providers.Factory(
+        _connect_graph_db,
+        settings=settings
+    )
+
+    graph_db_pool: providers.Singleton[GraphDbPool] = providers.Singleton(
+        GraphDbPool,
+        connect=graph_db_connection.provider,
+        size=settings.provided.graph_db_pool_size,
+        acquire_timeout=settings.provided.graph_db_pool_acquire_timeout,
+        max_lifetime=settings.provided.graph_db_pool_max_lifetime,
+    )
+
+    # Offloads synchronous graph work (repositories, RelationshipManager,
+    # concerns' write paths) so it doesn't block the event loop.
+    async_graph_db: providers.Singleton[AsyncGraphDb] = providers.Singleton(
+        AsyncGraphDb,
+        pool=graph_db_pool,
+    )
+
+    # -- LLM Response Cache --
+    # None unless settings.llm_cache_backend is set. Apps can override with
+    # any LlmResponseCache (e.g. a shared Redis-backed one).
+    llm_cache: providers.Singleton[Optional[LlmResponseCache]] = providers.Singleton(
+        _create_llm_cache,
+        settings=settings
+    )
+
     # -- Content Resolution --
     # Composite resolver delegates to scheme-specific resolvers:
     # - dx://  -> DialexityInputResolver (internal graph references)
@@ -213,17 +369,42 @@ class DialecticalReasoning(containers.DeclarativeContainer):
         DialexityInputResolver
     )
 
+    resolved_input_cache: providers.Singleton[Optional[ResolvedInputCache]] = providers.Singleton(
+        _create_input_cache,
+        settings=settings,
+    )
+
     input_resolver: providers.Singleton[InputResolver] = providers.Singleton(
         CompositeInputResolver,
         verbatim_resolver=verbatim_resolver,
-        dialexity_resolver=dialexity_resolver
+        dialexity_resolver=dialexity_resolver,
+        cache=resolved_input_cache,
+        max_concurrency=settings.provided.input_resolve_concurrency,
     )
 
     # -- Event Bus --
     # In-process async pub/sub for graph mutation fan-out.
     # App layer calls `await bus.connect()` at startup, subscribes by sid.
     event_bus: providers.Singleton[GraphEventBus] = providers.Singleton(
-        GraphEventBus
+        GraphEventBus,
+        flush_window=settings.provided.event_bus_flush_window,
+        queue_size=settings.provided.event_bus_queue_size,
+        overflow=settings.provided.event_bus_overflow,
+    )
+
+    # -- Context Snapshots --
+    # Materialized DialecticalContext dumps, patched from event_bus effects.
+    # Only served while the bus is connected; otherwise every resolve
+    # renders in full.
+    context_snapshots: providers.Singleton[ContextSnapshotStore] = providers.Singleton(
+        ContextSnapshotStore,
+        event_bus=event_bus,
+    )
+
+    # -- Statement similarity index --
+    # Per-sid MinHash index picking the dedup candidates shown to the LLM.
+    statement_index: providers.Singleton[StatementIndexStore] = providers.Singleton(
+        StatementIndexStore
     )
 
     # -- Scope ID (sid) --
@@ -235,6 +416,14 @@ class DialecticalReasoning(containers.DeclarativeContainer):
         get_current_sid
     )
 
+    # -- Graph Session --
+    # Per-turn identity map + relationship cache, read from contextvar.
+    # Agents open it via `with graph_session():`; outside a session this
+    # resolves to None and reads go straight to the database.
+    graph_session: providers.Callable[Optional[GraphSession]] = providers.Callable(
+        get_current_session
+    )
+
     # -- Wiring --
 
     @staticmethod
@@ -253,6 +442,6 @@ class DialecticalReasoning(containers.DeclarativeContainer):
             # Fallback to empty list if package can't be imported
             return []
 
-    wiring_config = containers.WiringConfiguration(
-        modules=_discover_modules(),
-    )
+    # Wired by setup(): lazily (each framework module as it is imported, see
+    # utils/lazy_wiring) or, with di_wiring="eager", every module up front.
+    wiring_config = containers.WiringConfiguration(auto_wire=False)
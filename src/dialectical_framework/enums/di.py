@@ -7,6 +7,13 @@ class DI(str, Enum):
     settings = "settings"
     graph_db = "graph_db"
 
+    # Pooled, event-loop-friendly graph access
+    graph_db_pool = "graph_db_pool"
+    async_graph_db = "async_graph_db"
+
+    # Structured LLM response cache (None when disabled)
+    llm_cache = "llm_cache"
+
     # Content resolution (app provides implementation)
     input_resolver = "input_resolver"
 
@@ -15,3 +22,12 @@ class DI(str, Enum):
 
     # Event bus for graph mutation fan-out
     event_bus = "event_bus"
+
+    # Materialized DialecticalContext dumps, fed by the event bus
+    context_snapshots = "context_snapshots"
+
+    # Per-turn identity map / relationship cache - reads from contextvar
+    graph_session = "graph_session"
+
+    # Per-sid lexical index of statements for deduplication candidates
+    statement_index = "statement_index"
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from enum import Enum
+
+
+class ToolConcurrency(str, Enum):
+    """How a tool's calls may overlap with other calls in the same round."""
+
+    READ_ONLY = "read_only"
+    NODE_WRITE = "node_write"
+    EXCLUSIVE = "exclusive"
@@ -14,3 +14,24 @@ class GraphEvent:
     sid: str
     effect: Effect
     timestamp: float
+    # seq of the GraphEventBatch that carried it (0 = not from a batch)
+    seq: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class GraphEventBatch:
+    """
+    Ordered envelope of the effects one `sid` emitted in a flush window (or
+    one report). `seq` increases by one per envelope of a sid, so a consumer
+    can tell a gap from a quiet period.
+    """
+
+    sid: str
+    seq: int
+    effects: tuple[Effect, ...]
+    timestamp: float
+
+    def events(self) -> tuple[GraphEvent, ...]:
+        return tuple(
+            GraphEvent(self.sid, effect, self.timestamp, self.seq) for effect in self.effects
+        )
@@ -1,15 +1,153 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import threading
 import time
-from typing import TYPE_CHECKING
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Literal, Optional
 
-from broadcaster import Broadcast
+from broadcaster import Broadcast, Event
 
-from dialectical_framework.events.graph_event import GraphEvent
+from dialectical_framework.events.graph_event import GraphEvent, GraphEventBatch
 
 if TYPE_CHECKING:
     from dialectical_framework.agents.execution_report import Effect
 
+logger = logging.getLogger(__name__)
+
+# What a full subscriber queue does with one more event:
+# - drop_oldest: discard the oldest queued event
+# - coalesce: fold it into a queued event on the same node (patches merge,
+#   a deletion supersedes), else discard the oldest
+# - disconnect: end the subscription with SubscriberOverflow (consumer resyncs)
+OverflowPolicy = Literal["drop_oldest", "coalesce", "disconnect"]
+
+OVERFLOW_POLICIES: tuple[str, ...] = ("drop_oldest", "coalesce", "disconnect")
+
+
+class SubscriberOverflow(Exception):
+    """A 'disconnect'-policy subscriber fell too far behind; resync and resubscribe."""
+
+
+class GraphEventSubscriber:
+    """
+    One consumer's bounded view of a sid channel.
+
+    Iterating yields broadcaster-style events (`event.message` is a
+    GraphEvent), one per effect, in publish order. `get_batch()` returns
+    everything queued at once — one SSE frame instead of one per effect.
+    """
+
+    def __init__(self, sid: str, maxsize: int, overflow: OverflowPolicy) -> None:
+        self.sid = sid
+        self.maxsize = max(1, maxsize)
+        self.overflow = overflow
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+        self._queue: deque[GraphEvent] = deque()
+        self._ready = asyncio.Event()
+        self._closed = False
+        self._overflowed = False
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def offer(self, event: GraphEvent) -> str:
+        """
+        Queue an event without blocking, applying the overflow policy.
+
+        Returns:
+            "queued", "dropped" (oldest discarded), "coalesced", or
+            "disconnected"; "closed" when the subscription has ended
+        """
+        if self._closed:
+            return "closed"
+        outcome = "queued"
+        if len(self._queue) >= self.maxsize:
+            if self.overflow == "disconnect":
+                self._overflowed = True
+                self._queue.clear()
+                self.close()
+                return "disconnected"
+            if self.overflow == "coalesce" and self._coalesce(event):
+                self.coalesced += 1
+                self._ready.set()
+                return "coalesced"
+            self._queue.popleft()
+            self.dropped += 1
+            outcome = "dropped"
+        self._queue.append(event)
+        self.max_depth = max(self.max_depth, len(self._queue))
+        self._ready.set()
+        return outcome
+
+    def close(self) -> None:
+        self._closed = True
+        self._ready.set()
+
+    async def get(self) -> Event:
+        """
+        Next event, waiting if none is queued.
+
+        Raises:
+            SubscriberOverflow: The queue overflowed under the 'disconnect' policy
+            StopAsyncIteration: The subscription ended
+        """
+        (event,) = await self._take(1)
+        return Event(channel=self.sid, message=event)
+
+    async def get_batch(self, max_items: Optional[int] = None) -> list[GraphEvent]:
+        """Every queued event (up to max_items), waiting for at least one."""
+        return await self._take(max_items)
+
+    async def __aiter__(self) -> AsyncIterator[Event]:
+        while True:
+            try:
+                yield await self.get()
+            except StopAsyncIteration:
+                return
+
+    async def _take(self, max_items: Optional[int]) -> list[GraphEvent]:
+        while not self._queue:
+            if self._overflowed:
+                raise SubscriberOverflow(
+                    f"Subscriber on {self.sid} overflowed its queue ({self.maxsize} events)"
+                )
+            if self._closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+        count = len(self._queue) if max_items is None else min(max_items, len(self._queue))
+        return [self._queue.popleft() for _ in range(count)]
+
+    def _coalesce(self, event: GraphEvent) -> bool:
+        node = event.effect.node
+        if node is None or node.hash is None:
+            return False
+        for i in range(len(self._queue) - 1, -1, -1):
+            queued = self._queue[i]
+            if queued.effect.node is None or queued.effect.node.hash != node.hash:
+                continue
+            if event.effect.effect_type == "node_deleted":
+                # Superseded: the node is gone, keep only the deletion (in order)
+                del self._queue[i]
+                self._queue.append(event)
+                return True
+            if event.effect.effect_type == "node_updated" and queued.effect.effect_type in (
+                "node_created", "node_committed", "node_updated"
+            ):
+                merged = queued.effect.model_copy(
+                    update={"patch": {**queued.effect.patch, **event.effect.patch}}
+                )
+                self._queue[i] = GraphEvent(queued.sid, merged, event.timestamp, event.seq)
+                return True
+            return False
+        return False
+
 
 class GraphEventBus:
     """
@@ -17,14 +155,24 @@ class GraphEventBus:
 
     Uses broadcaster with memory backend. Channel = sid.
 
+    Effects are not published one task each: `emit()` buffers them per sid
+    and a flush (after `flush_window` seconds, or explicitly — e.g. when a
+    report finalizes) turns the buffer into one ordered GraphEventBatch
+    envelope. A single sender task publishes envelopes in order. On the
+    receiving side one pump per sid fans envelopes out into bounded
+    per-subscriber queues, so a slow consumer only ever backs up its own
+    queue (see OverflowPolicy).
+
     Lifecycle:
         bus = GraphEventBus()
         await bus.connect()      # at app startup
         ...
-        await bus.disconnect()   # at app shutdown
+        await bus.disconnect()   # at app shutdown (flushes pending effects
+                                 # and ExecutionReport's effect log)
 
-    Publishing (async, called from flush):
-        await bus.publish(sid, effect)
+    Publishing:
+        bus.emit(sid, effect)          # sync, buffered (ExecutionReport)
+        await bus.publish(sid, effect) # immediate single-effect envelope
 
     Subscribing (app/UI layer):
         async with bus.subscribe(sid) as subscriber:
@@ -32,24 +180,260 @@ class GraphEventBus:
                 event.message  # GraphEvent
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        flush_window: float = 0.05,
+        queue_size: int = 1000,
+        overflow: OverflowPolicy = "drop_oldest",
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow!r}; use one of {OVERFLOW_POLICIES}")
         self._broadcast = Broadcast(url="memory://")
         self._connected = False
+        self._flush_window = flush_window
+        self._queue_size = queue_size
+        self._overflow: OverflowPolicy = overflow
+
+        # emit() may be called from worker threads: pending effects and flush
+        # timers are guarded, and timers always live on the owning loop.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self._pending: dict[str, list[Effect]] = {}
+        self._scheduled: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.TimerHandle]] = {}
+        self._seqs: dict[str, int] = {}
+        self._outbox: deque[GraphEventBatch] = deque()
+        self._sender: Optional[asyncio.Task[None]] = None
+
+        self._subscribers: dict[str, set[GraphEventSubscriber]] = {}
+        self._pumps: dict[str, tuple[asyncio.Task[None], asyncio.Event]] = {}
+
+        self.envelopes = 0
+        self.effects = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.disconnected = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
 
     async def connect(self) -> None:
         await self._broadcast.connect()
+        self._loop = asyncio.get_running_loop()
         self._connected = True
 
     async def disconnect(self) -> None:
-        await self._broadcast.disconnect()
+        self.flush()
+        await self._drain_outbox()
         self._connected = False
+        pumps = [task for task, _ in self._pumps.values()]
+        self._pumps.clear()
+        for task in pumps:
+            task.cancel()
+        await asyncio.gather(*pumps, return_exceptions=True)
+        for subscribers in self._subscribers.values():
+            for subscriber in subscribers:
+                subscriber.close()
+        await self._broadcast.disconnect()
+        await self._close_effect_log()
+
+    @staticmethod
+    async def _close_effect_log() -> None:
+        """Write out the effect log's queued records while the loop still runs."""
+        from dialectical_framework.agents.execution_report import ExecutionReport
+
+        effect_logger = ExecutionReport._effect_logger
+        if effect_logger is None:
+            return
+        try:
+            await effect_logger.aclose()
+        except Exception:
+            logger.exception("Closing the effect log failed")
+
+    # --- Publishing ---
+
+    def emit(self, sid: str, effect: Effect) -> None:
+        """
+        Buffer an effect for the sid's next envelope (non-blocking).
+
+        Thread-safe: calls from other threads or loops schedule the flush on
+        the loop the bus was connected on. No-op when the bus is not
+        connected or that loop has closed.
+        """
+        loop = self._loop
+        if not self._connected or loop is None or loop.is_closed():
+            return
+        with self._lock:
+            self._pending.setdefault(sid, []).append(effect)
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._schedule_flush(sid)
+            return
+        try:
+            loop.call_soon_threadsafe(self._schedule_flush, sid)
+        except RuntimeError:
+            pass  # Closed meanwhile; disconnect() flushed what it could
+
+    def _schedule_flush(self, sid: str) -> None:
+        """Start the sid's flush timer unless one is live (runs on the owning loop)."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if sid not in self._pending:
+                return  # Already flushed
+            scheduled = self._scheduled.get(sid)
+            if scheduled is not None:
+                owner, handle = scheduled
+                if owner is loop and not handle.cancelled():
+                    return
+                # Orphaned on a previous (possibly closed) loop: it would never fire
+                handle.cancel()
+            self._scheduled[sid] = (loop, loop.call_later(self._flush_window, self.flush, sid))
+
+    def flush(self, sid: Optional[str] = None) -> None:
+        """Close the current envelope of one sid (or all) and queue it for sending."""
+        with self._lock:
+            flushed = {}
+            for key in [sid] if sid is not None else list(self._pending):
+                scheduled = self._scheduled.pop(key, None)
+                if scheduled is not None:
+                    scheduled[1].cancel()
+                effects = self._pending.pop(key, None)
+                if effects:
+                    flushed[key] = effects
+        for key, effects in flushed.items():
+            self._enqueue(key, effects)
+
+    def last_seq(self, sid: str) -> int:
+        """seq of the sid's most recent envelope (0 = none yet)."""
+        return self._seqs.get(sid, 0)
+
+    async def settle(self, sid: str) -> int:
+        """
+        Flush the sid's buffered effects and send everything queued.
+
+        Returns:
+            seq of the sid's last envelope; subscribers have seen every
+            effect emitted so far once they have consumed it
+        """
+        self.flush(sid)
+        await self._drain_outbox()
+        return self.last_seq(sid)
 
     async def publish(self, sid: str, effect: Effect) -> None:
+        """Publish one effect now, after anything already buffered for the sid."""
         if not self._connected:
             return
-        event = GraphEvent(sid=sid, effect=effect, timestamp=time.time())
-        await self._broadcast.publish(channel=sid, message=event)
+        self.flush(sid)
+        self._enqueue(sid, [effect])
+        await self._drain_outbox()
+
+    def _enqueue(self, sid: str, effects: list[Effect]) -> None:
+        seq = self._seqs.get(sid, 0) + 1
+        self._seqs[sid] = seq
+        self._outbox.append(
+            GraphEventBatch(sid=sid, seq=seq, effects=tuple(effects), timestamp=time.time())
+        )
+        self.envelopes += 1
+        self.effects += len(effects)
+        if self._sender is None or self._sender.done():
+            self._sender = asyncio.get_running_loop().create_task(self._send())
+
+    async def _send(self) -> None:
+        while self._outbox:
+            batch = self._outbox.popleft()
+            try:
+                await self._broadcast.publish(channel=batch.sid, message=batch)
+            except Exception:
+                logger.exception("Publishing graph events for %s failed", batch.sid)
+
+    async def _drain_outbox(self) -> None:
+        sender = self._sender
+        if sender is not None and not sender.done():
+            await asyncio.shield(sender)
+
+    # --- Subscribing ---
+
+    @asynccontextmanager
+    async def subscribe(
+        self,
+        sid: str,
+        queue_size: Optional[int] = None,
+        overflow: Optional[OverflowPolicy] = None,
+    ) -> AsyncIterator[GraphEventSubscriber]:
+        """
+        Subscribe to graph events for a given `sid` (scope). Use as async context manager.
+
+        Args:
+            sid: Channel to follow
+            queue_size: Events buffered for this subscriber (default: the bus's)
+            overflow: Policy when that buffer is full (default: the bus's)
+        """
+        subscriber = GraphEventSubscriber(
+            sid, queue_size or self._queue_size, overflow or self._overflow
+        )
+        self._subscribers.setdefault(sid, set()).add(subscriber)
+        try:
+            await self._ensure_pump(sid)
+            yield subscriber
+        finally:
+            subscriber.close()
+            subscribers = self._subscribers.get(sid)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._subscribers[sid]
+                    pump = self._pumps.pop(sid, None)
+                    if pump is not None:
+                        pump[0].cancel()
+                        await asyncio.gather(pump[0], return_exceptions=True)
+
+    async def _ensure_pump(self, sid: str) -> None:
+        pump = self._pumps.get(sid)
+        if pump is None or pump[0].done():
+            ready = asyncio.Event()
+            pump = (asyncio.get_running_loop().create_task(self._pump(sid, ready)), ready)
+            self._pumps[sid] = pump
+        task, ready = pump
+        waiter = asyncio.ensure_future(ready.wait())
+        await asyncio.wait({task, waiter}, return_when=asyncio.FIRST_COMPLETED)
+        waiter.cancel()
+        if not ready.is_set():
+            task.result()  # Surface why the pump could not subscribe
+
+    async def _pump(self, sid: str, ready: asyncio.Event) -> None:
+        """Fan one sid's envelopes out into its subscribers' bounded queues."""
+        async with self._broadcast.subscribe(sid) as upstream:
+            ready.set()
+            async for event in upstream:
+                batch: GraphEventBatch = event.message
+                for subscriber in list(self._subscribers.get(sid, ())):
+                    for graph_event in batch.events():
+                        outcome = subscriber.offer(graph_event)
+                        if outcome == "dropped":
+                            self.dropped += 1
+                        elif outcome == "coalesced":
+                            self.coalesced += 1
+                        elif outcome == "disconnected":
+                            self.disconnected += 1
+                            break
+
+    # --- Metrics ---
 
-    def subscribe(self, sid: str):
-        """Subscribe to graph events for a given `sid` (scope). Use as async context manager."""
-        return self._broadcast.subscribe(channel=sid)
+    def stats(self) -> dict[str, Any]:
+        """Publish-side and subscriber-queue counters (JSON-friendly)."""
+        subscribers = [s for group in self._subscribers.values() for s in group]
+        return {
+            "pending_effects": sum(len(effects) for effects in self._pending.values()),
+            "outbox": len(self._outbox),
+            "envelopes": self.envelopes,
+            "effects": self.effects,
+            "subscribers": len(subscribers),
+            "queue_depth": max((s.depth for s in subscribers), default=0),
+            "max_queue_depth": max((s.max_depth for s in subscribers), default=0),
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "disconnected": self.disconnected,
+        }
@@ -25,3 +25,22 @@ class MissingScopeError(RuntimeError):
     create them; conversational turns never legitimately run unscoped.
     """
 
+
+
+class AmbiguousHashError(ValueError):
+    """Raised when a short hash or hash prefix matches more than one node.
+
+    Carries the matching candidates as (full hash, node type) pairs, so
+    callers can list them instead of only asking for a longer prefix.
+    """
+
+    def __init__(self, prefix: str, candidates: list[tuple[str, str]]) -> None:
+        self.prefix = prefix
+        self.candidates = candidates
+        shown = ", ".join(f"{h[:12]} ({node_type})" for h, node_type in candidates[:5])
+        if len(candidates) > 5:
+            shown += ", ..."
+        super().__init__(
+            f"Ambiguous hash '{prefix}': matches {len(candidates)} nodes "
+            f"[{shown}]. Use a longer prefix."
+        )
@@ -0,0 +1,525 @@
+"""
+Batch committer: stage many leaf nodes and relationships, write them in bulk.
+
+Committing a Transition or Rationale one at a time costs a find_by_hash
+lookup, one or two save_node round trips, and per connect() a cardinality
+count(), an inverse-cardinality count() and a CREATE. Building a layer of
+wheels multiplies that into thousands of tiny writes.
+
+A BatchCommitter keeps the same semantics but moves the I/O to flush():
+- commit() computes the Merkle hash locally (no database access) and stages
+  the node together with its transient structural refs (set_source(),
+  set_explanation_target(), ...)
+- connect() runs the in-memory validations (structural immutability, scope)
+  and stages the relationship
+- flush() resolves (hash, sid) dedup in one lookup per scope, checks max and
+  inverse cardinality for every touched manager in one query per
+  relationship kind, then writes nodes and relationships with a few
+  `UNWIND $rows ... MERGE` statements
+
+Scope: content/leaf nodes committed through BaseNode-style commits
+(Transition, Statement, Rationale). Containers built incrementally (Wheel,
+Cycle, Transformation) keep using save()/commit() — their hashes are derived
+from persisted children — and connections that trigger graph-dependent
+validation or auto-created semantic relationships (Cycle <-> Wheel,
+component-to-Polarity/Perspective, component-to-component semantics) must
+go through manager.connect().
+
+Usage:
+    from dialectical_framework.graph.batch_committer import BatchCommitter
+
+    with BatchCommitter() as batch:
+        for source, target in pairs:
+            transition = Transition()
+            transition.set_source(source).set_target(target)
+            batch.commit(transition)
+            batch.connect(transition.cycle, wheel)
+    # flushed here; every staged node now has its _id
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from dependency_injector.wiring import Provide, inject
+from gqlalchemy import Memgraph, Neo4j
+
+from dialectical_framework.enums.di import DI
+from dialectical_framework.graph.nodes.base_node import ImmutableNodeError
+
+if TYPE_CHECKING:
+    from gqlalchemy.models import Relationship as GQLRelationship
+
+    from dialectical_framework.graph.graph_session import GraphSession
+    from dialectical_framework.graph.nodes.base_node import BaseNode
+    from dialectical_framework.graph.relationship_manager import BoundRelationshipManager
+
+# Statement -> Statement relationship types validated against Perspective structure
+_SEMANTIC_TYPES = frozenset({"OPPOSITE_OF", "CONTRADICTION_OF", "POSITIVE_SIDE_OF", "NEGATIVE_SIDE_OF"})
+# Container -> component types that auto-create semantic relationships on connect()
+_POLARITY_TYPES = frozenset({"T", "A"})
+_ASPECT_TYPES = frozenset({"T_PLUS", "T_MINUS", "A_PLUS", "A_MINUS"})
+
+
+def _row_properties(obj: Any) -> dict[str, Any]:
+    """
+    Property map for a node or relationship, as gqlalchemy would persist it.
+
+    Mirrors GraphObject._get_cypher_set_properties(): None values and
+    on-disk fields are skipped.
+    """
+    props: dict[str, Any] = {}
+    for name, field in obj.__fields__.items():
+        if field.field_info.extra.get("on_disk", False):
+            continue
+        value = getattr(obj, name)
+        if value is None:
+            continue
+        props[name] = value.value if isinstance(value, Enum) else value
+    return props
+
+
+def _extra_labels(graph_db: Union[Memgraph, Neo4j]) -> str:
+    """
+    `:Label` suffix for the labels a client stamps on every node it saves
+    (its `extra_node_labels`, e.g. the test wrapper's cleanup label). Raw
+    MERGE writes bypass save_node() and add them through this.
+    """
+    return "".join(f":{label}" for label in getattr(graph_db, "extra_node_labels", ()))
+
+
+@dataclass
+class _StagedRelationship:
+    """A relationship waiting for flush()."""
+
+    manager: BoundRelationshipManager
+    target: BaseNode
+    relationship: Optional[GQLRelationship]
+    properties: Optional[dict]
+
+
+class BatchCommitter:
+    """
+    Stages leaf-node commits and relationships, then flushes them in bulk.
+
+    Staged nodes are hashed (is_committed is True) but have no `_id` until
+    flush(). Leaving the `with` block flushes; an exception discards the
+    batch without writing.
+    """
+
+    def __init__(self) -> None:
+        self._nodes: list[BaseNode] = []
+        self._relationships: list[_StagedRelationship] = []
+        # id(staged duplicate) -> first staged node with the same (sid, hash)
+        self._duplicates: dict[int, BaseNode] = {}
+
+    def __enter__(self) -> BatchCommitter:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.flush()
+        else:
+            self.discard()
+
+    @property
+    def staged_nodes(self) -> list[BaseNode]:
+        """Nodes committed into this batch, in staging order."""
+        return list(self._nodes)
+
+    # --- Staging ---
+
+    def commit(self, node: BaseNode) -> BaseNode:
+        """
+        Commit a leaf node into the batch: stage its structural refs and
+        compute its hash locally.
+
+        Follows the node's own commit() ordering: identity relationships are
+        staged before the hash is set, analytical ones (Rationale targets)
+        after.
+
+        Returns:
+            The node (hash set, `_id` assigned on flush)
+
+        Raises:
+            ImmutableNodeError: If the node is already committed
+            ValueError: If the node is an incrementally built container, or
+                fails its own pre-commit checks
+        """
+        from dialectical_framework.graph.mixins.incremental_build_mixin import IncrementalBuildMixin
+        from dialectical_framework.graph.nodes.rationale import Rationale
+        from dialectical_framework.graph.nodes.statement import Statement
+        from dialectical_framework.graph.nodes.transition import Transition
+
+        if node.is_committed:
+            raise ImmutableNodeError(
+                f"Node already committed with hash {node.hash[:7]}..."
+            )
+        if isinstance(node, IncrementalBuildMixin):
+            raise ValueError(
+                f"{node.__class__.__name__} is built incrementally; "
+                f"use save()/commit() instead of a batch."
+            )
+
+        if isinstance(node, Statement):
+            if not node.text:
+                raise ValueError("Cannot commit Statement without 'text'.")
+            if not node.meaning:
+                raise ValueError("Cannot commit Statement without 'meaning'.")
+
+        if isinstance(node, Transition):
+            if node._source_ref:
+                self.connect(node.source, node._source_ref)
+                node._source_ref = None
+            if node._target_ref:
+                self.connect(node.target, node._target_ref)
+                node._target_ref = None
+
+        if isinstance(node, Rationale) and node._critiques_target_ref is not None:
+            target_committed_at = node._critiques_target_ref.committed_at
+            current_time = time.time()
+            if target_committed_at is not None and target_committed_at >= current_time:
+                raise ValueError(
+                    f"Cannot critique a rationale from the future. "
+                    f"Target committed_at ({target_committed_at}) >= current time ({current_time})."
+                )
+
+        node.committed_at = time.time()
+        node.hash = node.compute_hash()
+        self._nodes.append(node)
+
+        if isinstance(node, Rationale):
+            if node._explanation_ref:
+                self.connect(node.explains, node._explanation_ref)
+                node._explanation_ref = None
+            if node._critiques_target_ref:
+                self.connect(node._critiques_target, node._critiques_target_ref)
+                node._critiques_target_ref = None
+
+        return node
+
+    def connect(
+        self,
+        manager: BoundRelationshipManager,
+        target_node: BaseNode,
+        properties: Optional[dict] = None,
+        relationship: Optional[GQLRelationship] = None,
+    ) -> None:
+        """
+        Stage `manager.connect(target_node, ...)` for flush().
+
+        Either endpoint may be staged in this batch or already persisted.
+        Structural immutability and scope are validated immediately;
+        cardinality is validated in bulk by flush().
+
+        Raises:
+            ImmutableNodeError: If modifying a structural relationship illegally
+            ValueError: On scope mismatch, or for connections that need
+                manager.connect() (graph-dependent validation or
+                auto-created semantic relationships)
+        """
+        self._reject_unbatchable(manager, target_node)
+        manager._validate_structural_immutability(target_node, "connect")
+        manager._validate_scope_compatibility(target_node)
+        self._relationships.append(
+            _StagedRelationship(manager, target_node, relationship, properties)
+        )
+
+    def discard(self) -> None:
+        """Drop everything staged without writing."""
+        self._nodes.clear()
+        self._relationships.clear()
+        self._duplicates.clear()
+
+    @staticmethod
+    def _reject_unbatchable(manager: BoundRelationshipManager, target_node: BaseNode) -> None:
+        """Refuse connections whose connect() side effects read the graph."""
+        from dialectical_framework.graph.nodes.cycle import Cycle
+        from dialectical_framework.graph.nodes.perspective import Perspective
+        from dialectical_framework.graph.nodes.polarity import Polarity
+        from dialectical_framework.graph.nodes.statement import Statement
+        from dialectical_framework.graph.nodes.wheel import Wheel
+
+        source = manager.source_node
+        rel_type = manager.relationship_type
+        unbatchable = (
+            (isinstance(source, Cycle) and isinstance(target_node, Wheel))
+            or (isinstance(source, Wheel) and isinstance(target_node, Cycle))
+            or (isinstance(source, Polarity) and isinstance(target_node, Statement) and rel_type in _POLARITY_TYPES)
+            or (isinstance(source, Perspective) and isinstance(target_node, Statement) and rel_type in _ASPECT_TYPES)
+            or (isinstance(source, Statement) and isinstance(target_node, Statement) and rel_type in _SEMANTIC_TYPES)
+        )
+        if unbatchable:
+            raise ValueError(
+                f"{source.__class__.__name__} -[{rel_type}]- {target_node.__class__.__name__} "
+                f"cannot be batched; use manager.connect()."
+            )
+
+    # --- Flush ---
+
+    @inject
+    def flush(
+        self,
+        graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db],
+        session: Optional[GraphSession] = Provide[DI.graph_session],
+    ) -> None:
+        """
+        Write everything staged, then reset the batch.
+
+        Order: dedup lookup and cardinality checks (reads only, so a
+        violation leaves the graph untouched), node MERGEs, relationship
+        MERGEs, session invalidation.
+
+        Raises:
+            ValueError: If a cardinality constraint would be violated, or a
+                Statement collides with an existing Input
+        """
+        if not self._nodes and not self._relationships:
+            return
+
+        new_nodes = self._resolve_existing(graph_db)
+        self._validate_cardinalities(graph_db)
+        self._write_nodes(new_nodes, graph_db)
+        touched = self._write_relationships(graph_db)
+
+        if session is not None:
+            for node in self._nodes:
+                session.invalidate_node(node._id)
+            for node_id in touched:
+                session.invalidate_node(node_id)
+        self.discard()
+
+    def _resolve_existing(self, graph_db: Union[Memgraph, Neo4j]) -> list[BaseNode]:
+        """
+        Bulk (hash, sid) dedup: staged nodes matching a persisted node (or an
+        earlier staged duplicate) adopt its `_id`. Returns the nodes to create.
+        """
+        from dialectical_framework.graph.nodes.statement import Statement
+
+        by_sid: dict[Optional[str], list[str]] = {}
+        for node in self._nodes:
+            by_sid.setdefault(node.sid, []).append(node.hash)
+
+        existing: dict[tuple[Optional[str], str], tuple[int, list[str]]] = {}
+        for sid, hashes in by_sid.items():
+            if sid:
+                query = """
+                    UNWIND $hashes AS h
+                    MATCH (n:Node) WHERE n.hash = h AND n.sid = $sid
+                    RETURN n.hash AS hash, id(n) AS node_id, labels(n) AS labels
+                """
+            else:
+                query = """
+                    UNWIND $hashes AS h
+                    MATCH (n:Node) WHERE n.hash = h
+                    RETURN n.hash AS hash, id(n) AS node_id, labels(n) AS labels
+                """
+            params = {"hashes": list(dict.fromkeys(hashes)), "sid": sid}
+            for row in graph_db.execute_and_fetch(query, params):
+                existing[(sid, row["hash"])] = (row["node_id"], row["labels"])
+
+        new_nodes: list[BaseNode] = []
+        first_staged: dict[tuple[Optional[str], str], BaseNode] = {}
+        for node in self._nodes:
+            key = (node.sid, node.hash)
+            if key in existing:
+                node_id, labels = existing[key]
+                if isinstance(node, Statement) and "Input" in labels:
+                    raise ValueError(
+                        f"Cannot commit Statement: hash collision with existing Input "
+                        f"(hash={node.hash[:7]}...)."
+                    )
+                node._id = node_id
+            elif key in first_staged:
+                self._duplicates[id(node)] = first_staged[key]
+            else:
+                first_staged[key] = node
+                new_nodes.append(node)
+        return new_nodes
+
+    def _validate_cardinalities(self, graph_db: Union[Memgraph, Neo4j]) -> None:
+        """
+        Check max cardinality of every touched manager, on both ends.
+
+        Count per manager = persisted neighbours ∪ staged neighbours, so a
+        staged relationship that already exists (MERGE no-op) is not counted
+        twice. Persisted neighbours are read with one query per relationship
+        kind.
+        """
+        from dialectical_framework.graph.relationship_manager import (
+            BoundRelationshipManager,
+            _find_inverse_manager,
+        )
+
+        # (endpoint identity, type, direction, target labels) -> group
+        groups: dict[tuple[Any, str, str, str], dict[str, Any]] = {}
+
+        def identity(node: BaseNode) -> tuple[str, int]:
+            node = self._duplicates.get(id(node), node)
+            if node._id is not None:
+                return ("id", node._id)
+            return ("obj", id(node))
+
+        def add(manager: BoundRelationshipManager, other: BaseNode, name: str) -> None:
+            if manager.cardinality is None or manager.cardinality[1] is None:
+                return
+            key = (
+                identity(manager.source_node),
+                manager.relationship_type,
+                manager.direction,
+                manager.target_class_name,
+            )
+            group = groups.setdefault(key, {"manager": manager, "name": name, "others": set()})
+            group["others"].add(identity(other))
+
+        for staged in self._relationships:
+            manager = staged.manager
+            add(manager, staged.target, manager.relationship_type)
+            inverse = _find_inverse_manager(
+                source_class_name=type(manager.source_node).__name__,
+                target_class=type(staged.target),
+                relationship_type=manager.relationship_type,
+                source_direction=manager.direction,
+            )
+            if inverse is not None:
+                inverse_manager, inverse_attr_name = inverse
+                add(
+                    BoundRelationshipManager(
+                        source_node=staged.target,
+                        target_class_name=inverse_manager.target_class_name,
+                        relationship_type=inverse_manager.relationship_type,
+                        relationship_model=inverse_manager.relationship_model,
+                        direction=inverse_manager.direction,
+                        cardinality=inverse_manager.cardinality,
+                    ),
+                    manager.source_node,
+                    inverse_attr_name,
+                )
+
+        # Persisted neighbours, one query per (type, direction, labels)
+        by_kind: dict[tuple[str, str, str], list[dict[str, Any]]] = {}
+        for (_, rel_type, direction, _), group in groups.items():
+            if group["manager"].source_node._id is None:
+                continue
+            labels = group["manager"]._resolved_target_labels()
+            by_kind.setdefault((rel_type, direction, labels), []).append(group)
+
+        for (rel_type, direction, labels), kind_groups in by_kind.items():
+            pattern = _pattern("source", rel_type, direction, f"target:{labels}")
+            query = f"""
+                UNWIND $ids AS source_id
+                MATCH {pattern}
+                WHERE id(source) = source_id
+                RETURN source_id, id(target) AS target_id
+            """
+            ids = [g["manager"].source_node._id for g in kind_groups]
+            neighbours: dict[int, set] = {}
+            for row in graph_db.execute_and_fetch(query, {"ids": ids}):
+                neighbours.setdefault(row["source_id"], set()).add(("id", row["target_id"]))
+            for g in kind_groups:
+                g["others"] |= neighbours.get(g["manager"].source_node._id, set())
+
+        for group in groups.values():
+            manager = group["manager"]
+            max_card = manager.cardinality[1]
+            count = len(group["others"])
+            if count > max_card:
+                raise ValueError(
+                    f"Cannot add relationship: maximum cardinality {max_card} "
+                    f"exceeded for {manager.source_node.__class__.__name__}."
+                    f"{group['name']} (would have {count})"
+                )
+
+    def _write_nodes(self, new_nodes: list[BaseNode], graph_db: Union[Memgraph, Neo4j]) -> None:
+        """MERGE new nodes on (hash, sid), one statement per label set and scope kind."""
+        groups: dict[tuple[str, bool], list[BaseNode]] = {}
+        for node in new_nodes:
+            groups.setdefault((node._label, node.sid is not None), []).append(node)
+
+        extra = _extra_labels(graph_db)
+        for (label, scoped), nodes in groups.items():
+            key = "{hash: row.hash, sid: row.sid}" if scoped else "{hash: row.hash}"
+            query = f"""
+                UNWIND $rows AS row
+                MERGE (n:{label} {key})
+                ON CREATE SET n += row.props
+                {f"SET n{extra}" if extra else ""}
+                RETURN row.idx AS idx, id(n) AS node_id
+            """
+            rows = [
+                {"idx": idx, "hash": node.hash, "sid": node.sid, "props": _row_properties(node)}
+                for idx, node in enumerate(nodes)
+            ]
+            for row in graph_db.execute_and_fetch(query, {"rows": rows}):
+                nodes[row["idx"]]._id = row["node_id"]
+
+        # In-batch duplicates share the first copy's node
+        by_key = {(node.sid, node.hash): node._id for node in new_nodes}
+        for node in self._nodes:
+            if node._id is None:
+                node._id = by_key[(node.sid, node.hash)]
+
+    def _write_relationships(self, graph_db: Union[Memgraph, Neo4j]) -> set[int]:
+        """MERGE staged relationships, one statement per type and direction."""
+        groups: dict[tuple[str, bool], list[dict[str, Any]]] = {}
+        touched: set[int] = set()
+
+        for staged in self._relationships:
+            manager = staged.manager
+            source_id = _node_id(manager.source_node)
+            target_id = _node_id(staged.target)
+            if manager.direction == "incoming":
+                start_id, end_id = target_id, source_id
+            else:
+                start_id, end_id = source_id, target_id
+
+            if staged.relationship is not None:
+                staged.relationship._start_node_id = start_id
+                staged.relationship._end_node_id = end_id
+                props = _row_properties(staged.relationship)
+            elif manager.relationship_model is not None:
+                props = _row_properties(manager.relationship_model(
+                    _start_node_id=start_id,
+                    _end_node_id=end_id,
+                    **(staged.properties or {}),
+                ))
+            else:
+                props = dict(staged.properties or {})
+
+            groups.setdefault(
+                (manager.relationship_type, manager.direction == "any"), []
+            ).append({"start": start_id, "end": end_id, "props": props})
+            touched.update((start_id, end_id))
+
+        for (rel_type, undirected), rows in groups.items():
+            arrow = "-" if undirected else "->"
+            query = f"""
+                UNWIND $rows AS row
+                MATCH (a) WHERE id(a) = row.start
+                MATCH (b) WHERE id(b) = row.end
+                MERGE (a)-[r:{rel_type}]{arrow}(b)
+                ON CREATE SET r += row.props
+            """
+            graph_db.execute(query, {"rows": rows})
+
+        return touched
+
+
+def _node_id(node: BaseNode) -> int:
+    if node._id is None:
+        raise ValueError(
+            f"{node.__class__.__name__} has no _id: save it, or commit it into the batch."
+        )
+    return node._id
+
+
+def _pattern(source: str, rel_type: str, direction: str, target: str) -> str:
+    """Cypher pattern for a manager's direction."""
+    if direction == "outgoing":
+        return f"({source})-[:{rel_type}]->({target})"
+    if direction == "incoming":
+        return f"({source})<-[:{rel_type}]-({target})"
+    return f"({source})-[:{rel_type}]-({target})"
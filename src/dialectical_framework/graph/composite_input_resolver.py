@@ -6,11 +6,17 @@ scheme-specific resolvers based on the content format:
 - dx://  -> DialexityInputResolver (internal graph references)
 - data:  -> VerbatimInputResolver (data URIs)
 - (else) -> VerbatimInputResolver (plain text)
+
+Plain text and data: resolutions are cached by Input content hash (see
+ResolvedInputCache), so a data: payload is decoded once, not per concern.
+dx:// references are never cached: the hash carries no sid, so a cached
+resolution would bypass the scoped lookup (the security boundary), and the
+referenced node can change after the first read.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 from dialectical_framework.graph.dialexity_input_resolver import DialexityInputResolver
 from dialectical_framework.graph.verbatim_input_resolver import VerbatimInputResolver
@@ -21,6 +27,8 @@ if TYPE_CHECKING:
 
     from dialectical_framework.graph.nodes.case import Case
     from dialectical_framework.graph.nodes.input import Input
+    from dialectical_framework.utils.resolved_input_cache import \
+        ResolvedInputCache
 
 
 class CompositeInputResolver(InputResolver):
@@ -56,6 +64,8 @@ class CompositeInputResolver(InputResolver):
         self,
         verbatim_resolver: VerbatimInputResolver,
         dialexity_resolver: DialexityInputResolver,
+        cache: Optional[ResolvedInputCache] = None,
+        max_concurrency: int = 8,
     ) -> None:
         """
         Initialize with scheme-specific resolvers.
@@ -63,9 +73,13 @@ class CompositeInputResolver(InputResolver):
         Args:
             verbatim_resolver: Handles plain text and data: URIs
             dialexity_resolver: Handles dx:// URIs (internal graph references)
+            cache: Resolved plain/data: content by Input hash. None = resolve every time.
+            max_concurrency: Inputs resolved at once by resolve_all()
         """
         self._verbatim = verbatim_resolver
         self._dialexity = dialexity_resolver
+        self._cache = cache
+        self.max_concurrency = max_concurrency
 
     async def resolve(self, input_node: Input) -> str:
         """
@@ -84,6 +98,15 @@ class CompositeInputResolver(InputResolver):
         if not content:
             return ""
 
+        # dx:// always goes through the scoped graph lookup (module docstring)
+        if self._cache is not None and input_node.hash and not content.startswith("dx://"):
+            return await self._cache.get_or_resolve(
+                ("text", input_node.hash), lambda: self._resolve(input_node)
+            )
+        return await self._resolve(input_node)
+
+    async def _resolve(self, input_node: Input) -> str:
+        content = input_node.content
         if content.startswith("dx://"):
             return await self._dialexity.resolve(content)
 
@@ -110,8 +133,13 @@ class CompositeInputResolver(InputResolver):
             return ""
 
         if content.startswith("dx://"):
-            return await self._dialexity.resolve(content)
+            return await self.resolve(input_node)
 
+        if self._cache is not None and input_node.hash:
+            return await self._cache.get_or_resolve(
+                ("native", input_node.hash),
+                lambda: self._verbatim.resolve_native(input_node),
+            )
         return await self._verbatim.resolve_native(input_node)
 
     async def resolve_all(self, source: Union[Case, list[Input]]) -> str:
@@ -143,11 +171,9 @@ class CompositeInputResolver(InputResolver):
             raise ValueError("No inputs provided to resolve")
 
         # Combine all inputs with delineation (skip inputs with no content)
-        parts = []
-        for input_node in inputs:
-            if not input_node.content:
-                continue  # Skip inputs with None/empty content
-            resolved_text = await self.resolve(input_node)
-            parts.append(f'<Input id="{input_node.hash}">\n{resolved_text}\n</Input>')
-
-        return "\n\n".join(parts)
+        inputs = [i for i in inputs if i.content]
+        resolved = await self.resolve_many(inputs)
+        return "\n\n".join(
+            f'<Input id="{input_node.hash}">\n{resolved_text}\n</Input>'
+            for input_node, resolved_text in zip(inputs, resolved)
+        )
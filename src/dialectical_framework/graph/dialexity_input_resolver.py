@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from dialectical_framework.exceptions.node_errors import AmbiguousHashError
 from dialectical_framework.exceptions.resolver_errors import (
     AmbiguousHashPrefixError, MalformedDxUriError, NodeNotFoundError,
     ScopeMismatchError, UnsupportedNodeTypeError)
@@ -142,9 +143,9 @@ class DialexityInputResolver:
         # Try hash lookup (supports both full hash and prefix)
         try:
             node = self._hash_repo.find_by_hash(hash_or_prefix)
+        except AmbiguousHashError as e:
+            raise AmbiguousHashPrefixError(str(e)) from e
         except ValueError as e:
-            if "Ambiguous" in str(e):
-                raise AmbiguousHashPrefixError(str(e)) from e
             raise NodeNotFoundError(str(e)) from e
 
         if node is None:
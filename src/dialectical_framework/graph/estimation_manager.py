@@ -2,18 +2,23 @@
 Manages creation and updates of Estimation nodes.
 
 This module handles graph operations for storing domain estimation values
-as separate Estimation nodes connected to AssessableEntity nodes.
+as separate Estimation nodes connected to AssessableEntity nodes, and keeps
+the denormalized `est_<type>` value property on the assessed node in step
+(see Estimation.property_name()).
 """
 
 from __future__ import annotations
 
-from typing import Optional, Union, TYPE_CHECKING, TypeVar, Type, Sequence
+import time
+from typing import Any, Optional, Union, TYPE_CHECKING, TypeVar, Type, Sequence
 
 from dependency_injector.wiring import inject, Provide
 from gqlalchemy import Memgraph, Neo4j
 
 from dialectical_framework.graph.nodes.estimation import Estimation
 from dialectical_framework.enums.di import DI
+from dialectical_framework.graph.graph_session import invalidate_current_session
+from dialectical_framework.graph.relationship_manager import relationship_registry
 
 if TYPE_CHECKING:
     from dialectical_framework.graph.nodes.assessable_entity import AssessableEntity
@@ -33,6 +38,7 @@ class EstimationManager:
     - Creates new Estimation nodes when needed
     - Replaces existing Estimation nodes when value changes
     - Deletes estimations when clearing
+    - Mirrors the value into `est_<type>` on the node (None when cleared)
     - Uses dependency injection for graph_db
     """
 
@@ -43,6 +49,7 @@ class EstimationManager:
         estimation_type: Type[T],
         value: Optional[float],
         provider: Optional[Rationale] = None,
+        attributes: Optional[dict[str, Any]] = None,
         graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db]
     ) -> Optional[T]:
         """
@@ -58,6 +65,7 @@ class EstimationManager:
             estimation_type: Type of estimation (any Estimation subclass)
             value: Estimation value (0.0-1.0) or None (None deletes the estimation)
             provider: Optional Rationale that provides this estimation (provenance)
+            attributes: Extra fields of a newly created estimation (e.g. sub-scores)
             graph_db: Database connection (injected)
 
         Returns:
@@ -74,12 +82,17 @@ class EstimationManager:
             old_value = existing.value
             if old_value != value:
                 node.estimations.disconnect(existing)
-                estimation = self._get_or_create_estimation(estimation_type, value, node, graph_db, provider)
+                estimation = self._get_or_create_estimation(
+                    estimation_type, value, node, graph_db, provider, attributes
+                )
             else:
                 estimation = existing
         else:
-            estimation = self._get_or_create_estimation(estimation_type, value, node, graph_db, provider)
+            estimation = self._get_or_create_estimation(
+                estimation_type, value, node, graph_db, provider, attributes
+            )
 
+        self._denormalize(node, estimation_type, value, graph_db)
         return estimation
 
     @inject
@@ -103,6 +116,86 @@ class EstimationManager:
             for estimation_type in estimation_types:
                 self._delete_estimations(node, estimation_type, graph_db)
 
+    @inject
+    def replace_estimations_bulk(
+        self,
+        estimation_type: Type[T],
+        values: Sequence[tuple[AssessableEntity, float]],
+        graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db],
+    ) -> list[T]:
+        """
+        Replace the estimation of one type on many nodes in a single statement.
+
+        Equivalent to clear_estimations() + upsert_estimation() per node, but
+        batched: prior estimations of this type are detached and deleted, and
+        the new ones are merged on (hash, sid) with their ESTIMATES edge —
+        one UNWIND round trip for the whole set. No provider is recorded.
+
+        Args:
+            estimation_type: Type of estimation (any Estimation subclass)
+            values: (committed, persisted node, new value) pairs
+            graph_db: Database connection (injected)
+
+        Returns:
+            The estimation nodes, committed and persisted, in input order
+        """
+        from dialectical_framework.graph.batch_committer import (
+            _extra_labels, _row_properties)
+
+        if not values:
+            return []
+
+        estimations: list[T] = []
+        rows: list[dict] = []
+        now = time.time()
+        for node, value in values:
+            if node._id is None:
+                raise ValueError(
+                    f"{node.__class__.__name__} must be persisted before bulk estimation."
+                )
+            estimation = estimation_type(value=value)
+            estimation.set_target(node)
+            estimation._target_ref = None
+            estimation.committed_at = now
+            estimation.hash = estimation.compute_hash()
+            estimations.append(estimation)
+            rows.append({
+                "idx": len(rows),
+                "target_id": node._id,
+                "hash": estimation.hash,
+                "sid": estimation.sid,
+                "value": value,
+                "props": _row_properties(estimation),
+            })
+
+        label = estimation_type.label
+        prop = estimation_type.property_name()
+        node_labels = estimations[0]._label
+        scoped = all(row["sid"] is not None for row in rows)
+        key = "{hash: row.hash, sid: row.sid}" if scoped else "{hash: row.hash}"
+        extra = _extra_labels(graph_db)
+        query = f"""
+            UNWIND $rows AS row
+            MATCH (n) WHERE id(n) = row.target_id
+            SET n.{prop} = row.value
+            WITH row, n
+            OPTIONAL MATCH (old:{label})-[:ESTIMATES]->(n)
+            WITH row, n, collect(old) AS olds
+            FOREACH (o IN olds | DETACH DELETE o)
+            MERGE (e:{node_labels} {key})
+            ON CREATE SET e += row.props
+            {f"SET e{extra}" if extra else ""}
+            MERGE (e)-[:ESTIMATES]->(n)
+            RETURN row.idx AS idx, id(e) AS estimation_id
+        """
+        for row in graph_db.execute_and_fetch(query, {"rows": rows}):
+            estimations[row["idx"]]._id = row["estimation_id"]
+
+        for node, value in values:
+            setattr(node, prop, value)
+            invalidate_current_session(node)
+        return estimations
+
     def _delete_all_estimations(
         self,
         node: AssessableEntity,
@@ -112,12 +205,23 @@ class EstimationManager:
         if node._id is None:
             return
 
-        query = """
-            MATCH (e:Estimation)-[:ESTIMATES]->(n)
-            WHERE id(n) = $node_id
-            DETACH DELETE e
+        props = [
+            estimation_type.property_name()
+            for estimation_type in relationship_registry.subclasses(Estimation)
+        ]
+        cleared = ", ".join(f"n.{prop} = null" for prop in props)
+        query = f"""
+            MATCH (n) WHERE id(n) = $node_id
+            {f"SET {cleared}" if cleared else ""}
+            WITH n
+            OPTIONAL MATCH (e:Estimation)-[:ESTIMATES]->(n)
+            WITH collect(e) AS olds
+            FOREACH (o IN olds | DETACH DELETE o)
         """
         graph_db.execute(query, {"node_id": node._id})
+        for prop in props:
+            setattr(node, prop, None)
+        invalidate_current_session(node)
 
     def _get_scoring_estimation(
         self,
@@ -143,7 +247,8 @@ class EstimationManager:
         value: float,
         target: AssessableEntity,
         graph_db: Union[Memgraph, Neo4j],
-        provider: Optional[Rationale] = None
+        provider: Optional[Rationale] = None,
+        attributes: Optional[dict[str, Any]] = None,
     ) -> T:
         """
         Get existing estimation by content, or create new one.
@@ -151,7 +256,7 @@ class EstimationManager:
         Estimations are content-identified by (type, value, target) tuple.
         """
         if target._id is None:
-            estimation = estimation_class(value=value)
+            estimation = estimation_class(value=value, **(attributes or {}))
             estimation.set_target(target)
             if provider:
                 estimation.set_provider(provider)
@@ -175,7 +280,7 @@ class EstimationManager:
             return result[0]["e"]
 
         # Create new
-        estimation = estimation_class(value=value)
+        estimation = estimation_class(value=value, **(attributes or {}))
         estimation.set_target(target)
         if provider:
             estimation.set_provider(provider)
@@ -194,8 +299,31 @@ class EstimationManager:
 
         label = estimation_class.label
         query = f"""
-            MATCH (e:{label})-[:ESTIMATES]->(n)
-            WHERE id(n) = $node_id
-            DETACH DELETE e
+            MATCH (n) WHERE id(n) = $node_id
+            SET n.{estimation_class.property_name()} = null
+            WITH n
+            OPTIONAL MATCH (e:{label})-[:ESTIMATES]->(n)
+            WITH collect(e) AS olds
+            FOREACH (o IN olds | DETACH DELETE o)
         """
         graph_db.execute(query, {"node_id": node._id})
+        setattr(node, estimation_class.property_name(), None)
+        invalidate_current_session(node)
+
+    def _denormalize(
+        self,
+        node: AssessableEntity,
+        estimation_class: Type[Estimation],
+        value: float,
+        graph_db: Union[Memgraph, Neo4j]
+    ) -> None:
+        """Mirror an estimation value into the node's `est_<type>` property."""
+        prop = estimation_class.property_name()
+        setattr(node, prop, value)
+        if node._id is None:
+            return  # Saving writes model fields only; readers of the saved node fall back
+
+        graph_db.execute(
+            f"MATCH (n) WHERE id(n) = $node_id SET n.{prop} = $value",
+            {"node_id": node._id, "value": value},
+        )
@@ -0,0 +1,240 @@
+"""
+Bounded graph connection pool and async graph adapter.
+
+GQLAlchemy clients (Memgraph/Neo4j) are synchronous and hold one cached
+connection each, so the shared `graph_db` singleton serializes every query
+and blocks the event loop while it waits on Bolt. This module provides:
+
+- GraphDbPool: a bounded, thread-safe pool of GQLAlchemy clients with an
+  acquire timeout and a max connection lifetime
+- AsyncGraphDb: runs synchronous graph work (single queries or whole
+  repository/concern blocks) on a dedicated executor, with a pooled
+  connection bound for the duration of the call
+
+While work runs through AsyncGraphDb, the `graph_db` provider resolves to the
+connection bound for that call, so repositories, RelationshipManager and
+nodes pick it up through their usual `Provide[DI.graph_db]` injection —
+no signature changes. Context variables (sid, GraphSession, agent scope) are
+copied into the worker.
+
+Usage:
+    @inject
+    async def _persist(self, ..., async_graph_db: AsyncGraphDb = Provide[DI.async_graph_db]):
+        return await async_graph_db.run(self._create_transformation, nexus, edge, ...)
+
+    rows = await async_graph_db.execute_and_fetch("MATCH (n:Wheel) RETURN n")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Optional, TypeVar, Union
+
+from gqlalchemy import Memgraph, Neo4j
+
+T = TypeVar("T")
+
+GraphDb = Union[Memgraph, Neo4j]
+
+
+class GraphDbPoolTimeout(TimeoutError):
+    """Raised when no pooled connection frees up within the acquire timeout."""
+
+
+_bound_graph_db: contextvars.ContextVar[Optional[GraphDb]] = contextvars.ContextVar(
+    'bound_graph_db', default=None
+)
+
+
+def get_bound_graph_db(default: GraphDb) -> GraphDb:
+    """
+    Resolve the graph client for the current call.
+
+    This is the DI-compatible function behind the `graph_db` provider:
+    inside AsyncGraphDb work it returns the pooled connection bound to that
+    call, otherwise the shared default client.
+    """
+    bound = _bound_graph_db.get()
+    return bound if bound is not None else default
+
+
+@dataclass
+class _PooledConnection:
+    db: GraphDb
+    created_at: float = field(default_factory=time.monotonic)
+
+
+def _close(db: GraphDb) -> None:
+    """Close a client's cached connection; best effort (it may already be gone)."""
+    connection = getattr(db, "_cached_connection", None)
+    raw = getattr(connection, "_connection", None)
+    try:
+        close = getattr(raw, "close", None)
+        if callable(close):
+            close()
+    except Exception:
+        pass
+    db._cached_connection = None
+
+
+class GraphDbPool:
+    """
+    Bounded pool of GQLAlchemy clients.
+
+    Clients are created lazily up to `size`. A client older than
+    `max_lifetime` seconds is closed and replaced on its next checkout.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], GraphDb],
+        size: int = 8,
+        acquire_timeout: float = 30.0,
+        max_lifetime: float = 3600.0,
+    ) -> None:
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+        self._connect = connect
+        self.size = size
+        self.acquire_timeout = acquire_timeout
+        self.max_lifetime = max_lifetime
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: queue.LifoQueue[_PooledConnection] = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = False
+
+    @property
+    def created(self) -> int:
+        """Number of clients currently owned by the pool (idle or checked out)."""
+        return self._created
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator[GraphDb]:
+        """
+        Check out a client for the duration of the block.
+
+        Raises:
+            GraphDbPoolTimeout: If all clients stay busy for `timeout`
+                (defaults to the pool's acquire timeout)
+            RuntimeError: If the pool is closed
+        """
+        if self._closed:
+            raise RuntimeError("Graph connection pool is closed")
+        wait = self.acquire_timeout if timeout is None else timeout
+        if not self._slots.acquire(timeout=wait):
+            raise GraphDbPoolTimeout(
+                f"No graph connection available within {wait}s "
+                f"(pool size {self.size})"
+            )
+        try:
+            pooled = self._checkout()
+        except BaseException:
+            self._slots.release()
+            raise
+        try:
+            yield pooled.db
+        finally:
+            self._checkin(pooled)
+            self._slots.release()
+
+    def _checkout(self) -> _PooledConnection:
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if self._expired(pooled):
+                self._discard(pooled)
+                continue
+            return pooled
+        pooled = _PooledConnection(self._connect())
+        with self._lock:
+            self._created += 1
+        return pooled
+
+    def _checkin(self, pooled: _PooledConnection) -> None:
+        if self._closed or self._expired(pooled):
+            self._discard(pooled)
+        else:
+            self._idle.put(pooled)
+
+    def _expired(self, pooled: _PooledConnection) -> bool:
+        return bool(self.max_lifetime) and time.monotonic() - pooled.created_at > self.max_lifetime
+
+    def _discard(self, pooled: _PooledConnection) -> None:
+        _close(pooled.db)
+        with self._lock:
+            self._created -= 1
+
+    def close(self) -> None:
+        """Close idle clients; checked-out ones are closed when returned."""
+        self._closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+
+class AsyncGraphDb:
+    """
+    Async-capable graph adapter: offloads synchronous graph work to a
+    bounded executor, one pooled connection per call.
+    """
+
+    def __init__(self, pool: GraphDbPool, executor: Optional[ThreadPoolExecutor] = None) -> None:
+        self.pool = pool
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=pool.size, thread_name_prefix="graph-db"
+        )
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run `fn(*args, **kwargs)` off the event loop with a pooled connection
+        bound as `graph_db`. Called from work that already holds a bound
+        connection (e.g. nested inside other offloaded work), `fn` runs inline on it
+        instead of waiting for a second one.
+
+        Raises:
+            GraphDbPoolTimeout: If no connection frees up in time
+        """
+        if _bound_graph_db.get() is not None:
+            return fn(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, self._call_bound, fn, args, kwargs)
+        return await loop.run_in_executor(self._executor, call)
+
+    def _call_bound(self, fn: Callable[..., T], args: tuple, kwargs: dict) -> T:
+        with self.pool.acquire() as db:
+            token = _bound_graph_db.set(db)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _bound_graph_db.reset(token)
+
+    async def execute(self, query: str, parameters: Optional[dict[str, Any]] = None) -> None:
+        """Execute a write query without blocking the event loop."""
+        await self.run(lambda: _bound_graph_db.get().execute(query, parameters or {}))
+
+    async def execute_and_fetch(
+        self, query: str, parameters: Optional[dict[str, Any]] = None
+    ) -> list[dict[str, Any]]:
+        """Run a read query without blocking the event loop; rows are materialized."""
+        return await self.run(
+            lambda: list(_bound_graph_db.get().execute_and_fetch(query, parameters or {}))
+        )
+
+    def shutdown(self) -> None:
+        """Stop the executor and close pooled connections."""
+        self._executor.shutdown(wait=True)
+        self.pool.close()
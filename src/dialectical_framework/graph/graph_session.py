@@ -0,0 +1,208 @@
+"""
+Graph session (identity map / unit of work) for the dialectical framework.
+
+Within one agent turn the same nodes and relationship lists are read many
+times (find_by_hash, relationship .all(), nexus/index lookups). A GraphSession
+keeps, for the duration of a `with graph_session():` block:
+
+- an identity map: one Python instance per persisted node (`_id`), plus a
+  (sid, hash) index so exact-hash lookups skip the database entirely
+- a relationship cache: BoundRelationshipManager.all() results keyed by
+  (source id, relationship type, direction, target class names)
+
+Writes that go through the framework (connect, disconnect, update_properties,
+save, commit, repository deletes) invalidate the affected entries, so reads
+after a write always see the write. Raw Cypher writes outside the framework
+must call `invalidate_current_session()`.
+
+Usage (inside agent chat methods):
+    from dialectical_framework.graph.graph_session import graph_session
+
+    with agent_scope("analyst"), graph_session():
+        result = await self._conversation.submit(...)
+
+Framework code never reads the contextvar directly; it injects the session:
+    @inject
+    def all(self, session: Optional[GraphSession] = Provide[DI.graph_session]):
+        ...
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from dialectical_framework.graph.nodes.base_node import BaseNode
+
+RelationshipKey = tuple[int, str, str, str]
+
+# Full sha256 hex digest length — only exact hashes are served from the map
+_FULL_HASH_LENGTH = 64
+
+
+_current_session: contextvars.ContextVar[Optional[GraphSession]] = contextvars.ContextVar(
+    'current_graph_session', default=None
+)
+
+
+class GraphSession:
+    """
+    Per-turn identity map and relationship cache.
+
+    Thread-safe: graph work offloaded to worker threads (AsyncGraphDb.run)
+    shares the session through the copied context.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._nodes: dict[int, BaseNode] = {}
+        self._by_hash: dict[tuple[Optional[str], str], BaseNode] = {}
+        self._relationships: dict[RelationshipKey, list[tuple[Any, Any]]] = {}
+        # node id -> relationship keys whose source or targets include it
+        self._keys_by_node: dict[int, set[RelationshipKey]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    # --- Identity map ---
+
+    def adopt(self, node: Optional[BaseNode]) -> Optional[BaseNode]:
+        """
+        Return the canonical instance for a freshly loaded node.
+
+        The first instance seen for an `_id` becomes canonical; later loads
+        of the same node resolve to it.
+        """
+        if node is None or node._id is None:
+            return node
+        with self._lock:
+            existing = self._nodes.get(node._id)
+            if existing is not None and type(existing) is type(node):
+                return existing
+            self._nodes[node._id] = node
+            if node.hash:
+                self._by_hash[(node.sid, node.hash)] = node
+            return node
+
+    def find_by_hash(self, hash: str, sid: Optional[str]) -> Optional[BaseNode]:
+        """Look up a node by exact (full) hash; prefixes always miss."""
+        if len(hash) != _FULL_HASH_LENGTH:
+            return None
+        with self._lock:
+            node = self._by_hash.get((sid, hash))
+            if node is not None:
+                self.hits += 1
+            return node
+
+    # --- Relationship cache ---
+
+    def get_relationships(self, key: RelationshipKey) -> Optional[list[tuple[Any, Any]]]:
+        """Cached .all() result for a bound manager, or None on miss."""
+        with self._lock:
+            cached = self._relationships.get(key)
+            if cached is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return list(cached)
+
+    def put_relationships(
+        self, key: RelationshipKey, results: list[tuple[Any, Any]]
+    ) -> list[tuple[Any, Any]]:
+        """Store an .all() result, canonicalizing target nodes; returns the stored list."""
+        with self._lock:
+            canonical = [(self.adopt(target), rel) for target, rel in results]
+            self._relationships[key] = canonical
+            self._keys_by_node.setdefault(key[0], set()).add(key)
+            for target, _ in canonical:
+                if target is not None and target._id is not None:
+                    self._keys_by_node.setdefault(target._id, set()).add(key)
+            return list(canonical)
+
+    # --- Invalidation ---
+
+    def invalidate_node(self, node_or_id: BaseNode | int | None) -> None:
+        """
+        Drop everything that may be stale after a write touching this node:
+        its identity-map entry and every relationship list it sources or
+        appears in.
+        """
+        node_id = node_or_id if isinstance(node_or_id, int) or node_or_id is None else node_or_id._id
+        if node_id is None:
+            return
+        with self._lock:
+            stale = self._nodes.pop(node_id, None)
+            if stale is not None and stale.hash:
+                self._by_hash.pop((stale.sid, stale.hash), None)
+            for key in self._keys_by_node.pop(node_id, set()):
+                self._relationships.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached state (use after raw Cypher writes)."""
+        with self._lock:
+            self._nodes.clear()
+            self._by_hash.clear()
+            self._relationships.clear()
+            self._keys_by_node.clear()
+
+
+def get_current_session() -> Optional[GraphSession]:
+    """
+    Get the active GraphSession from context.
+
+    This is the DI-compatible function for injecting the session.
+    Returns None outside a `with graph_session():` block (no caching).
+    """
+    return _current_session.get()
+
+
+def invalidate_current_session(node_or_id: BaseNode | int | None = None) -> None:
+    """
+    Invalidate the active session after a write.
+
+    Args:
+        node_or_id: The node (or node id) touched by the write. When omitted,
+            the whole session is cleared.
+    """
+    session = _current_session.get()
+    if session is None:
+        return
+    if node_or_id is None:
+        session.clear()
+    else:
+        session.invalidate_node(node_or_id)
+
+
+class _GraphSessionContextManager:
+    """Internal context manager for session boundaries."""
+
+    def __init__(self) -> None:
+        self._token: Optional[contextvars.Token] = None
+
+    def __enter__(self) -> GraphSession:
+        """Enter a session, reusing the enclosing one when nested."""
+        existing = _current_session.get()
+        if existing is not None:
+            return existing
+        session = GraphSession()
+        self._token = _current_session.set(session)
+        return session
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit session context, restoring the previous state."""
+        if self._token is not None:
+            _current_session.reset(self._token)
+
+
+def graph_session() -> _GraphSessionContextManager:
+    """
+    Context manager opening a per-turn GraphSession.
+
+    Nested calls reuse the outer session, so concerns can open one
+    defensively without fragmenting the cache.
+
+    Returns:
+        Context manager that sets/restores the session
+    """
+    return _GraphSessionContextManager()
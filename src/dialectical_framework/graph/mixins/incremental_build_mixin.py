@@ -22,6 +22,7 @@ from dependency_injector.wiring import Provide, inject
 from gqlalchemy import Memgraph, Neo4j
 
 from dialectical_framework.enums.di import DI
+from dialectical_framework.graph.graph_session import invalidate_current_session
 from dialectical_framework.graph.nodes.base_node import ImmutableNodeError
 from dialectical_framework.graph.mixins.persistable_mixin import PersistableMixin
 
@@ -137,6 +138,7 @@ class IncrementalBuildMixin(PersistableMixin):
         # No dedup for container nodes - they have relationships attached by commit time.
         # If duplicate content exists, the unique constraint on hash will throw.
         graph_db.save_node(self)
+        invalidate_current_session(self)
         return self
 
     def _validate_all_cardinalities(self) -> None:
@@ -144,24 +146,24 @@ class IncrementalBuildMixin(PersistableMixin):
         Validate cardinality constraints for all relationship managers.
 
         Iterates through all RelationshipManager attributes on this class
-        and validates that minimum cardinality constraints are satisfied.
+        (from the relationship registry) and validates that minimum cardinality constraints are satisfied.
 
         Raises:
             ValueError: If any cardinality constraint is violated
         """
-        from dialectical_framework.graph.relationship_manager import RelationshipManager
+        from dialectical_framework.graph.relationship_manager import relationship_registry
 
         errors = []
 
-        # Find all RelationshipManager attributes on this class
-        for attr_name in dir(self.__class__):
-            attr = getattr(self.__class__, attr_name, None)
-            if isinstance(attr, RelationshipManager):
-                # Get bound manager for this instance
-                bound_manager = getattr(self, attr_name)
-                is_valid, error_msg = bound_manager.validate_cardinality()
-                if not is_valid:
-                    errors.append(f"{attr_name}: {error_msg}")
+        # All RelationshipManager attributes on this class (declared via __set_name__)
+        for attr_name, manager in relationship_registry.managers(type(self)):
+            if manager.cardinality is None:
+                continue  # Nothing to validate, skip the count query
+            # Get bound manager for this instance
+            bound_manager = getattr(self, attr_name)
+            is_valid, error_msg = bound_manager.validate_cardinality()
+            if not is_valid:
+                errors.append(f"{attr_name}: {error_msg}")
 
         if errors:
             raise ValueError(
@@ -79,6 +79,26 @@ class AssessableEntity(BaseNode, label="Assessable"):
         # Fallback: return first rationale if none have ratings
         return rationales[0] if rationales else None
 
+    def estimation_value(self, estimation_type: type[Estimation]) -> Optional[float]:
+        """
+        Value of this entity's estimation of the given type, or None.
+
+        Served from the denormalized `est_<type>` property when the node
+        carries it (written by EstimationManager); otherwise read from the
+        estimation subgraph. For many entities use
+        EstimationRepository.get_values() instead.
+        """
+        prop = estimation_type.property_name()
+        if prop in self.__dict__:
+            return self.__dict__[prop]
+
+        from dialectical_framework.graph.repositories.estimation_repository import (
+            EstimationRepository,
+        )
+
+        values = EstimationRepository().get_values([self], [estimation_type])
+        return values.get(self._id, {}).get(estimation_type)
+
     def __repr__(self) -> str:
         """String representation of the assessable entity."""
         hash_str = self.hash[:7] if self.is_committed else "uncommitted"
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import hashlib
 import time
-from typing import Any, Optional, Union, Self
+from typing import TYPE_CHECKING, Any, Optional, Union, Self
 
 from dependency_injector.wiring import Provide, inject
 from gqlalchemy import Memgraph, Neo4j, Node
@@ -22,6 +22,13 @@ from dialectical_framework.graph.mixins.intent_mixin import IntentMixin
 from dialectical_framework.exceptions.node_errors import ImmutableNodeError
 
 from dialectical_framework.graph.mixins.persistable_mixin import PersistableMixin
+from dialectical_framework.graph.relationship_manager import relationship_registry
+
+if TYPE_CHECKING:
+    from dialectical_framework.graph.graph_session import GraphSession
+
+# Length of the abbreviated hash quoted to users and LLMs (stored as short_hash)
+SHORT_HASH_LENGTH = 7
 
 
 class MixinAwareNodeMeta(NodeMetaclass):
@@ -61,7 +68,10 @@ class MixinAwareNodeMeta(NodeMetaclass):
                     else:
                         namespace[field_name] = None
 
-        return super().__new__(mcs, name, bases, namespace, **kwargs)
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        # A new node class changes label unions and inverse lookups
+        relationship_registry.invalidate()
+        return cls
 
 
 class BaseNode(Node, label="Node", metaclass=MixinAwareNodeMeta):
@@ -77,12 +87,15 @@ class BaseNode(Node, label="Node", metaclass=MixinAwareNodeMeta):
 
     Attributes:
         hash: Primary identity - sha256 of structure + intent + committed_at
+        short_hash: First 7 characters of hash, kept in step with it and
+                    indexed, so quoted short hashes resolve by equality.
         sid: Scope ID - the UUID of the root Case.
         committed_at: Unix timestamp (seconds since epoch) when node was committed.
                       Part of hash for structural nodes to ensure temporal ordering.
     """
 
     hash: Optional[str] = None
+    short_hash: Optional[str] = None  # Derived from hash (see __setattr__), never hashed
     committed_at: Optional[float] = None  # Set at commit time, included in hash for structural nodes
 
     # metadata
@@ -105,18 +118,22 @@ class BaseNode(Node, label="Node", metaclass=MixinAwareNodeMeta):
             from dialectical_framework.graph.scope_context import get_current_sid
             data["sid"] = get_current_sid()
 
+        # Nodes loaded from before short_hash was stored (or built from a hash)
+        if data.get("hash") and not data.get("short_hash"):
+            data["short_hash"] = data["hash"][:SHORT_HASH_LENGTH]
+
         super().__init__(**data)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "hash":
+            super().__setattr__("short_hash", value[:SHORT_HASH_LENGTH] if value else None)
+
     @property
     def is_committed(self) -> bool:
         """Check if this node has been committed (has hash)."""
         return self.hash is not None
 
-    @property
-    def short_hash(self) -> Optional[str]:
-        """Get the first 7 characters of the hash, or None if not committed."""
-        return self.hash[:7] if self.hash else None
-
     def _collect_structure_hash_parts(self) -> list[str]:
         """
         Collect the parts that make up this node's structure hash.
@@ -173,7 +190,8 @@ class BaseNode(Node, label="Node", metaclass=MixinAwareNodeMeta):
     @inject
     def save(
         self,
-        graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db]
+        graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db],
+        session: Optional[GraphSession] = Provide[DI.graph_session],
     ) -> Self:
         """
         Persist this node to the database.
@@ -222,6 +240,9 @@ class BaseNode(Node, label="Node", metaclass=MixinAwareNodeMeta):
         # GQLAlchemy returns a new node object with _id set - capture it
         if result is not None and result._id is not None:
             self._id = result._id
+        # Cached instances of this node (and lists holding them) are now stale
+        if session is not None:
+            session.invalidate_node(self._id)
         return self
 
     @inject
@@ -286,7 +307,7 @@ class BaseNode(Node, label="Node", metaclass=MixinAwareNodeMeta):
             raise ValueError("Cannot clone uncommitted node. Call commit() first.")
 
         data: dict[str, Any] = {}
-        excluded_fields = {'hash', '_id', 'committed_at'}
+        excluded_fields = {'hash', 'short_hash', '_id', 'committed_at'}
 
         for field_name in self.__fields__:
             if field_name not in excluded_fields:
@@ -19,6 +19,7 @@ from dialectical_framework.graph.relationship_manager import (
     RelationshipBoth,
     RelationshipManager,
 )
+from dialectical_framework.graph import rotation_keys
 from dialectical_framework.graph.relationships.has_wheel_relationship import (
     HasWheelRelationship,
 )
@@ -78,6 +79,11 @@ class Cycle(IntentMixin, AssessableEntity, label="Cycle"):
     # Ordered list of Perspective hashes - defines the T-cycle order
     perspective_hashes: list[str] = []
 
+    # Indexed lookup keys derived from perspective_hashes (graph.rotation_keys):
+    # same Perspective set -> same layer_key; same circular order -> same signature
+    layer_key: Optional[str] = None
+    rotation_signature: Optional[str] = None
+
     # Transient refs for setting PPs before commit (not persisted)
     _pp_refs: Optional[list[Perspective]] = None
 
@@ -130,6 +136,8 @@ class Cycle(IntentMixin, AssessableEntity, label="Cycle"):
             )
 
         self.perspective_hashes = hashes
+        self.layer_key = rotation_keys.layer_key(hashes)
+        self.rotation_signature = rotation_keys.rotation_signature(hashes)
         self._pp_refs = perspectives  # Keep refs for potential use
         return self
 
@@ -8,6 +8,7 @@ quantitative measurements associated with assessable entities.
 from __future__ import annotations
 
 import hashlib
+import re
 from typing import ClassVar, Optional, TYPE_CHECKING, Union, Self
 
 from dependency_injector.wiring import Provide, inject
@@ -104,6 +105,17 @@ class Estimation(BaseNode, label="Estimation"):
     # Transient ref for auto-connecting after commit (not persisted)
     _provider_ref: Optional[Rationale] = None
 
+    @classmethod
+    def property_name(cls) -> str:
+        """
+        Name of the denormalized value property on the assessed node.
+
+        EstimationManager keeps `est_<type>` (e.g. est_causality_probability)
+        on the target in step with the estimation it writes, so readers holding
+        the node can skip the estimation subgraph.
+        """
+        return "est_" + re.sub(r"(?<!^)(?=[A-Z])", "_", cls.label).lower()
+
     def set_provider(self, rationale: Rationale) -> Estimation:
         """
         Set the Rationale that provides this estimation (optional, before commit).
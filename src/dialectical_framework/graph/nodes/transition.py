@@ -15,6 +15,7 @@ from dependency_injector.wiring import Provide, inject
 from gqlalchemy import Memgraph, Neo4j
 
 from dialectical_framework.enums.di import DI
+from dialectical_framework.graph.graph_session import invalidate_current_session
 
 from dialectical_framework.graph.nodes.assessable_entity import AssessableEntity
 from dialectical_framework.graph.relationship_manager import RelationshipFrom, RelationshipTo, RelationshipManager
@@ -293,6 +294,7 @@ class Transition(AssessableEntity, label="Transition"):
 
         # Update in DB with hash
         graph_db.save_node(self)
+        invalidate_current_session(self)
 
         return self
 
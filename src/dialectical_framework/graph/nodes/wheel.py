@@ -34,6 +34,7 @@ from dialectical_framework.graph.nodes.perspective import (
     POSITION_A_PLUS,
     POSITION_A_MINUS,
 )
+from dialectical_framework.graph import rotation_keys
 from dialectical_framework.utils.order_transitions import order_transitions
 
 if TYPE_CHECKING:
@@ -45,6 +46,7 @@ if TYPE_CHECKING:
     from dialectical_framework.graph.nodes.cycle import Cycle
     from dialectical_framework.graph.nodes.transition import Transition
     from dialectical_framework.graph.nodes.transformation import Transformation
+    from dialectical_framework.graph.repositories.wheel_repository import WheelSubgraph
 
     # Type alias for flexible wheel segment references (no integer indexing in graph-native)
     WheelSegmentReference = Union[str, WheelSegment, Statement]
@@ -102,6 +104,14 @@ class Wheel(IncrementalBuildMixin, IntentMixin, AssessableEntity, label="Wheel")
         super().__init__(**data)
         # Cache for polar pairs: pp_key:polarity -> WheelSegmentPolarPair
         self._polar_pair_cache: dict[str, WheelSegmentPolarPair] = {}
+        # Prefetched read-only neighbourhood (see prefetch())
+        self._subgraph: Optional[WheelSubgraph] = None
+
+    # Indexed lookup keys, set at commit (graph.rotation_keys):
+    # layer_key of the parent Cycle, and the rotation-invariant signature
+    # of the component (Statement) sequence
+    layer_key: Optional[str] = None
+    rotation_signature: Optional[str] = None
 
     # Parent Cycle (required)
     # Parent→child: Cycle has this Wheel
@@ -132,6 +142,42 @@ class Wheel(IncrementalBuildMixin, IntentMixin, AssessableEntity, label="Wheel")
         cardinality=(0, None)  # Zero or more synthesis alternatives
     )
 
+    def prefetch(self) -> Wheel:
+        """
+        Load this wheel's cycle, edges, edge endpoints and perspective
+        memberships in one query and serve derived views from memory.
+
+        Only committed wheels can be prefetched: their structure is part of
+        the hash and therefore immutable, so the snapshot cannot go stale.
+
+        Returns:
+            self, for chaining
+
+        Raises:
+            ValueError: If the wheel is not committed
+        """
+        from dialectical_framework.graph.repositories.wheel_repository import WheelRepository
+
+        if not self.is_committed:
+            raise ValueError("Only committed wheels can be prefetched.")
+        if self._subgraph is None:
+            self._subgraph = WheelRepository().load_subgraph(self)
+        return self
+
+    def _edge_source(self, edge: Transition) -> Optional[Statement]:
+        """Source Statement of an edge, served from the prefetched subgraph if present."""
+        if self._subgraph is not None:
+            return self._subgraph.source_of(edge)
+        result = edge.source.get()
+        return result[0] if result else None
+
+    def _edge_target(self, edge: Transition) -> Optional[Statement]:
+        """Target Statement of an edge, served from the prefetched subgraph if present."""
+        if self._subgraph is not None:
+            return self._subgraph.target_of(edge)
+        result = edge.target.get()
+        return result[0] if result else None
+
     @property
     def edges(self) -> list[Transition]:
         """
@@ -143,6 +189,8 @@ class Wheel(IncrementalBuildMixin, IntentMixin, AssessableEntity, label="Wheel")
         Returns:
             List of Transition nodes in order, or empty list if no edges
         """
+        if self._subgraph is not None:
+            return list(self._subgraph.edges)
         all_edges = [edge for edge, _ in self._edges.all()]
         return order_transitions(all_edges)
 
@@ -189,6 +237,9 @@ class Wheel(IncrementalBuildMixin, IntentMixin, AssessableEntity, label="Wheel")
         """
         from dialectical_framework.graph.repositories.perspective_repository import PerspectiveRepository
 
+        if self._subgraph is not None:
+            return list(self._subgraph.perspectives)
+
         seen_hashes: set[str] = set()
         result: list[Perspective] = []
         pp_repo = PerspectiveRepository()
@@ -220,6 +271,26 @@ class Wheel(IncrementalBuildMixin, IntentMixin, AssessableEntity, label="Wheel")
 
         return result
 
+    def commit(self, *args, **kwargs) -> Wheel:
+        """
+        Commit this wheel (see IncrementalBuildMixin.commit), deriving its
+        lookup keys first. A rotation_signature set by the builder (which
+        already knows the component sequence) is kept.
+        """
+        if not self.is_committed:
+            if self.layer_key is None:
+                cycle_result = self.cycle.get()
+                if cycle_result:
+                    cycle_obj, _ = cycle_result
+                    self.layer_key = cycle_obj.layer_key or rotation_keys.layer_key(
+                        cycle_obj.perspective_hashes
+                    ) or None
+            if self.rotation_signature is None:
+                self.rotation_signature = rotation_keys.rotation_signature(
+                    [c.hash for c in self.statements]
+                ) or None
+        return super().commit(*args, **kwargs)
+
     def _get_commit_dependents(self):
         """
         Get edges for hash computation.
@@ -567,6 +638,45 @@ class Wheel(IncrementalBuildMixin, IntentMixin, AssessableEntity, label="Wheel")
 
         return self._derive_polar_segments_from_edges()
 
+    def _component_to_pp_map(self) -> dict[str, tuple[Perspective, str]]:
+        """
+        Build a lookup map: component_hash -> (perspective, position).
+
+        Later perspectives win when a component is shared, matching the
+        order in which _perspectives is walked.
+        """
+        positions = [
+            POSITION_T, POSITION_T_PLUS, POSITION_T_MINUS,
+            POSITION_A, POSITION_A_PLUS, POSITION_A_MINUS,
+        ]
+        component_to_pp_map: dict[str, tuple[Perspective, str]] = {}
+
+        if self._subgraph is not None:
+            by_hash = {pp.hash: pp for pp in self._subgraph.perspectives}
+            order = {h: i for i, h in enumerate(by_hash)}
+            for comp_hash, members in self._subgraph.memberships.items():
+                known = [(pp.hash, pos) for pp, pos in members if pp.hash in order]
+                if known:
+                    pp_hash, position = max(
+                        known, key=lambda m: (order[m[0]], positions.index(m[1]))
+                    )
+                    component_to_pp_map[comp_hash] = (by_hash[pp_hash], position)
+            return component_to_pp_map
+
+        for pp in self._perspectives:
+            managers = [
+                (POSITION_T, pp.t),
+                (POSITION_T_PLUS, pp.t_plus),
+                (POSITION_T_MINUS, pp.t_minus),
+                (POSITION_A, pp.a),
+                (POSITION_A_PLUS, pp.a_plus),
+                (POSITION_A_MINUS, pp.a_minus),
+            ]
+            for position, manager in managers:
+                for comp, _ in manager.all():
+                    component_to_pp_map[comp.hash] = (pp, position)
+        return component_to_pp_map
+
     def _derive_polar_segments_from_edges(self) -> list[WheelSegmentPolarPair]:
         """
         Derive polar pair orientations from edges.
@@ -589,29 +699,16 @@ class Wheel(IncrementalBuildMixin, IntentMixin, AssessableEntity, label="Wheel")
             ]
 
         # Build a lookup map: component_hash -> (perspective, position)
-        component_to_pp_map = {}
-        for pp in self._perspectives:
-            positions = [
-                (POSITION_T, pp.t),
-                (POSITION_T_PLUS, pp.t_plus),
-                (POSITION_T_MINUS, pp.t_minus),
-                (POSITION_A, pp.a),
-                (POSITION_A_PLUS, pp.a_plus),
-                (POSITION_A_MINUS, pp.a_minus),
-            ]
-            for position, manager in positions:
-                for comp, _ in manager.all():
-                    component_to_pp_map[comp.hash] = (pp, position)
+        component_to_pp_map = self._component_to_pp_map()
 
         seen_perspectives = set()
         pairs = []
 
         for edge in ordered_edges:
-            source_result = edge.source.get()
-            if not source_result:
+            source_component = self._edge_source(edge)
+            if source_component is None:
                 continue
 
-            source_component, _ = source_result
             pp_info = component_to_pp_map.get(source_component.hash)
             if pp_info is None:
                 continue
@@ -672,16 +769,35 @@ class Wheel(IncrementalBuildMixin, IntentMixin, AssessableEntity, label="Wheel")
         segments = []
         seen_segments = set()
 
+        perspectives = self._perspectives
+
         for edge in ordered_edges:
             # Get source component
-            source_result = edge.source.get()
-            if not source_result:
+            source_component = self._edge_source(edge)
+            if source_component is None:
                 continue
 
-            source_component, _ = source_result
+            if self._subgraph is not None:
+                # Membership is already known; pick the first PP in wheel order
+                positions = {
+                    pp.hash: position
+                    for pp, position in self._subgraph.memberships.get(source_component.hash, [])
+                }
+                for pp in perspectives:
+                    position = positions.get(pp.hash)
+                    if position is None:
+                        continue
+                    pp_key = pp._id if pp._id is not None else id(pp)
+                    seg = pp.segment_t if position in (POSITION_T, POSITION_T_PLUS, POSITION_T_MINUS) else pp.segment_a
+                    seg_key = (pp_key, seg.side)
+                    if seg_key not in seen_segments:
+                        segments.append(seg)
+                        seen_segments.add(seg_key)
+                    break
+                continue
 
             # Find which segment this component belongs to
-            for pp in self._perspectives:
+            for pp in perspectives:
                 # Use _id for tracking since uncommitted nodes have hash=None
                 pp_key = pp._id if pp._id is not None else id(pp)
 
@@ -923,11 +1039,11 @@ class Wheel(IncrementalBuildMixin, IntentMixin, AssessableEntity, label="Wheel")
 
         pairs = []
         for edge in ordered_edges:
-            source_result = edge.source.get()
-            target_result = edge.target.get()
-            if source_result and target_result:
-                src_alias = _get_alias(source_result[0])
-                tgt_alias = _get_alias(target_result[0])
+            source_comp = self._edge_source(edge)
+            target_comp = self._edge_target(edge)
+            if source_comp is not None and target_comp is not None:
+                src_alias = _get_alias(source_comp)
+                tgt_alias = _get_alias(target_comp)
                 pairs.append(f"{src_alias} → {tgt_alias}")
 
         return ", ".join(pairs)
@@ -947,15 +1063,12 @@ class Wheel(IncrementalBuildMixin, IntentMixin, AssessableEntity, label="Wheel")
             return []
 
         for i, trans in enumerate(transitions):
-            source_result = trans.source.get()
-            target_result = trans.target.get()
+            source_comp = self._edge_source(trans)
+            target_comp = self._edge_target(trans)
 
-            if not source_result or not target_result:
+            if source_comp is None or target_comp is None:
                 continue
 
-            source_comp, _ = source_result
-            target_comp, _ = target_result
-
             components.append(source_comp)
 
             is_last = i == len(transitions) - 1
@@ -965,10 +1078,9 @@ class Wheel(IncrementalBuildMixin, IntentMixin, AssessableEntity, label="Wheel")
                     components.append(target_comp)
             else:
                 next_trans = transitions[i + 1]
-                next_source_result = next_trans.source.get()
+                next_source_comp = self._edge_source(next_trans)
 
-                if next_source_result:
-                    next_source_comp, _ = next_source_result
+                if next_source_comp is not None:
                     if target_comp._id != next_source_comp._id:
                         components.append(target_comp)
                 else:
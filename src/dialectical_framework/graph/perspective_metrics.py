@@ -0,0 +1,157 @@
+"""
+PerspectiveMetrics: batch scoring table for many Perspectives at once.
+
+The per-instance properties on Perspective (diff_t, diff_a, area,
+rectangularity, area_normalized) each resolve their aspect relationships
+one by one — fine for a single tetrad, slow for a Case with hundreds.
+PerspectiveMetrics holds the raw inputs (KS per aspect, antithesis HS, DV)
+for N perspectives as NumPy arrays and derives the same metrics
+vectorized, with NaN standing in for "missing" (the properties' None).
+
+Load it with one query via PerspectiveRepository.load_metrics:
+
+    metrics = PerspectiveRepository().load_metrics(perspectives)
+    keep = metrics.quality_mask(min_hs=0.5, min_sp=0.3, min_dv=0.5)
+    row = metrics.row(pp._id)   # PerspectiveMetricsRow or None
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+# Column order of the KS matrix
+KS_COLUMNS = ("T+", "T-", "A+", "A-")
+_TP, _TM, _AP, _AM = range(4)
+
+
+class PerspectiveMetricsRow(NamedTuple):
+    """One perspective's scores; None where the inputs are missing."""
+
+    id: int
+    hs: Optional[float]
+    dv: Optional[float]
+    diff_t: Optional[float]
+    diff_a: Optional[float]
+    area: Optional[float]
+    area_normalized: Optional[float]
+    rectangularity: Optional[float]
+    validation_failed: bool
+
+
+def _opt(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
+class PerspectiveMetrics:
+    """
+    Column-oriented score table for a batch of Perspectives.
+
+    Arrays are aligned by row; `ids` holds the Perspective `_id` per row.
+    Formulas match the Perspective properties exactly:
+        diff_t          = KS(T+) - KS(T-)
+        diff_a          = KS(A+) - KS(A-)
+        area (SP)       = diff_t + diff_a
+        area_normalized = area / 2
+        rectangularity  = (KS(T+) - KS(A+))² + (KS(T-) - KS(A-))²
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[int],
+        ks: np.ndarray,
+        hs: np.ndarray,
+        dv: np.ndarray,
+        validation_failed: np.ndarray,
+    ) -> None:
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.ks = np.asarray(ks, dtype=float).reshape(len(self.ids), len(KS_COLUMNS))
+        self.hs = np.asarray(hs, dtype=float)
+        self.dv = np.asarray(dv, dtype=float)
+        self.validation_failed = np.asarray(validation_failed, dtype=bool)
+        self._index = {int(pp_id): i for i, pp_id in enumerate(self.ids)}
+
+        self.diff_t = self.ks[:, _TP] - self.ks[:, _TM]
+        self.diff_a = self.ks[:, _AP] - self.ks[:, _AM]
+        self.area = self.diff_t + self.diff_a
+        self.area_normalized = self.area / 2
+        self.rectangularity = (self.ks[:, _TP] - self.ks[:, _AP]) ** 2 + (
+            self.ks[:, _TM] - self.ks[:, _AM]
+        ) ** 2
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[tuple[int, dict[str, Optional[float]], Optional[float], Optional[float], Optional[str]]],
+    ) -> PerspectiveMetrics:
+        """
+        Build from (id, {position: KS}, hs, dv, validation) records, where
+        position is one of KS_COLUMNS. Missing values become NaN.
+        """
+        ids: list[int] = []
+        ks_rows: list[list[float]] = []
+        hs: list[float] = []
+        dv: list[float] = []
+        failed: list[bool] = []
+        for pp_id, ks_by_position, hs_value, dv_value, validation in records:
+            ids.append(pp_id)
+            ks_rows.append([
+                np.nan if ks_by_position.get(col) is None else ks_by_position[col]
+                for col in KS_COLUMNS
+            ])
+            hs.append(np.nan if hs_value is None else hs_value)
+            dv.append(np.nan if dv_value is None else dv_value)
+            failed.append(bool(validation) and validation.startswith("failed"))
+        return cls(
+            ids,
+            np.array(ks_rows, dtype=float).reshape(len(ids), len(KS_COLUMNS)),
+            np.array(hs, dtype=float),
+            np.array(dv, dtype=float),
+            np.array(failed, dtype=bool),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, pp_id: object) -> bool:
+        return pp_id in self._index
+
+    def quality_mask(
+        self, min_hs: float = 0.0, min_sp: float = 0.0, min_dv: float = 0.0
+    ) -> np.ndarray:
+        """
+        Boolean keep-mask for the quality floor: False where validation
+        failed or HS / SP (`area`) / DV is below its floor. Missing scores
+        never suppress (unscored ≠ bad); a floor of 0 disables its check.
+        """
+        keep = ~self.validation_failed
+        # NaN comparisons are False, so missing values pass every floor
+        if min_hs > 0:
+            keep &= ~(self.hs < min_hs)
+        if min_sp > 0:
+            keep &= ~(self.area < min_sp)
+        if min_dv > 0:
+            keep &= ~(self.dv < min_dv)
+        return keep
+
+    def row(self, pp_id: int) -> Optional[PerspectiveMetricsRow]:
+        """Scores for one perspective by `_id`, or None if not in the batch."""
+        i = self._index.get(pp_id)
+        if i is None:
+            return None
+        return PerspectiveMetricsRow(
+            id=int(self.ids[i]),
+            hs=_opt(self.hs[i]),
+            dv=_opt(self.dv[i]),
+            diff_t=_opt(self.diff_t[i]),
+            diff_a=_opt(self.diff_a[i]),
+            area=_opt(self.area[i]),
+            area_normalized=_opt(self.area_normalized[i]),
+            rectangularity=_opt(self.rectangularity[i]),
+            validation_failed=bool(self.validation_failed[i]),
+        )
+
+    def rows(self) -> Iterator[PerspectiveMetricsRow]:
+        for pp_id in self.ids:
+            yield self.row(int(pp_id))
@@ -0,0 +1,253 @@
+"""
+Graph query profiler: count Cypher round trips per tool call and per agent.
+
+GQLAlchemy clients are instrumented once at creation (instrument_graph_db):
+their `execute` / `execute_and_fetch` record into every QueryProfile active
+in the current context. Profiles nest — a skill's profile includes the
+queries of the concerns it runs — and follow context variables into
+AsyncGraphDb workers.
+
+Profiles are opened automatically around every ReasonableConcern.resolve()
+(publish_queries: `report.artifacts["graph_queries"]` and the Langfuse span)
+and every agent_scope. Ad-hoc use:
+
+    with profile_queries() as profile:
+        WheelRepository().find_by_layer(perspectives)
+    profile.count, profile.summary()
+
+Budget assertion (tests — fails N+1 regressions):
+
+    with query_budget(3):
+        PerspectiveRepository().load_metrics(perspectives)
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# Slowest query shapes kept in summaries
+DEFAULT_TOP_N = 5
+
+_active_profiles: contextvars.ContextVar[tuple[QueryProfile, ...]] = contextvars.ContextVar(
+    'active_query_profiles', default=()
+)
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_LIST_OF_PLACEHOLDERS = re.compile(r"\[\s*\?(?:\s*,\s*\?)*\s*\]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """
+    Reduce a Cypher query to its shape: literals become `?`, literal lists
+    `[?]`, whitespace collapses. Parameterized queries are already shapes.
+    """
+    shape = _STRING_LITERAL.sub("?", query)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _LIST_OF_PLACEHOLDERS.sub("[?]", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+@dataclass
+class QueryShapeStats:
+    """Aggregate for one normalized query shape."""
+
+    shape: str
+    count: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    rows: int = 0
+
+
+class QueryProfile:
+    """
+    Query statistics for one scope (a tool call, an agent turn, a test block).
+
+    Thread-safe: AsyncGraphDb workers record into the same profile.
+    """
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        self.name = name
+        self.count = 0
+        self.total_time = 0.0
+        self.rows = 0
+        self._shapes: dict[str, QueryShapeStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, query: str, elapsed: float, rows: int) -> None:
+        shape = normalize_query(query)
+        with self._lock:
+            self.count += 1
+            self.total_time += elapsed
+            self.rows += rows
+            stats = self._shapes.get(shape)
+            if stats is None:
+                stats = self._shapes[shape] = QueryShapeStats(shape)
+            stats.count += 1
+            stats.total_time += elapsed
+            stats.max_time = max(stats.max_time, elapsed)
+            stats.rows += rows
+
+    def slowest(self, n: int = DEFAULT_TOP_N) -> list[QueryShapeStats]:
+        """Top-n shapes by total time spent (an N+1 shows up as one hot shape)."""
+        with self._lock:
+            shapes = list(self._shapes.values())
+        return sorted(shapes, key=lambda s: s.total_time, reverse=True)[:n]
+
+    def summary(self, top_n: int = DEFAULT_TOP_N) -> dict[str, Any]:
+        """Compact, JSON-friendly summary (times in milliseconds)."""
+        return {
+            "count": self.count,
+            "time_ms": round(self.total_time * 1000, 2),
+            "rows": self.rows,
+            "slowest": [
+                {
+                    "query": s.shape,
+                    "count": s.count,
+                    "time_ms": round(s.total_time * 1000, 2),
+                    "max_ms": round(s.max_time * 1000, 2),
+                    "rows": s.rows,
+                }
+                for s in self.slowest(top_n)
+            ],
+        }
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised by query_budget when a block issues more queries than allowed."""
+
+
+@contextmanager
+def profile_queries(name: Optional[str] = None) -> Iterator[QueryProfile]:
+    """Record every graph query issued inside the block (nests with outer profiles)."""
+    profile = QueryProfile(name)
+    token = _active_profiles.set(_active_profiles.get() + (profile,))
+    try:
+        yield profile
+    finally:
+        _active_profiles.reset(token)
+
+
+@contextmanager
+def query_budget(max_queries: int, name: Optional[str] = None) -> Iterator[QueryProfile]:
+    """
+    Fail when the block issues more than `max_queries` graph queries.
+
+    Raises:
+        QueryBudgetExceeded: On exit, with the hottest query shapes in the message
+    """
+    with profile_queries(name) as profile:
+        yield profile
+    if profile.count > max_queries:
+        hottest = "\n".join(
+            f"  {s.count}x {s.shape}" for s in profile.slowest()
+        )
+        raise QueryBudgetExceeded(
+            f"{name or 'Block'} issued {profile.count} graph queries "
+            f"(budget {max_queries}):\n{hottest}"
+        )
+
+
+def publish_queries(
+    profile: QueryProfile, artifacts: Optional[dict[str, Any]] = None
+) -> None:
+    """
+    Publish a profile's summary: into `artifacts` (e.g. an ExecutionReport's)
+    when given, and onto the current Langfuse span. No-op without queries.
+    """
+    if not profile.count:
+        return
+    summary = profile.summary()
+    logger.debug(
+        "%s issued %d graph queries (%.1f ms)",
+        profile.name or "Block", summary["count"], summary["time_ms"],
+    )
+    if artifacts is not None:
+        artifacts["graph_queries"] = summary
+    try:
+        from langfuse import get_client
+
+        if get_client().get_current_trace_id():
+            get_client().update_current_span(metadata={"graph_queries": summary})
+    except Exception as e:
+        logger.debug("Langfuse trace failed: %s", e)
+
+
+def _record(profiles: tuple[QueryProfile, ...], query: str, elapsed: float, rows: int) -> None:
+    for profile in profiles:
+        profile.record(query, elapsed, rows)
+
+
+def _profiled_rows(
+    rows: Iterator[T], profiles: tuple[QueryProfile, ...], query: str, elapsed: float
+) -> Iterator[T]:
+    """Pass rows through, adding fetch time and the row count on exhaustion/close."""
+    count = 0
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                row = next(rows)
+            except StopIteration:
+                elapsed += time.perf_counter() - start
+                return
+            elapsed += time.perf_counter() - start
+            count += 1
+            yield row
+    finally:
+        _record(profiles, query, elapsed, count)
+
+
+def instrument_graph_db(db: T) -> T:
+    """
+    Route a GQLAlchemy client's `execute` / `execute_and_fetch` through the
+    profiler. Idempotent; costs one context-variable read per query while
+    no profile is active. Instance-level, so internal calls (save_node,
+    load_relationship, ...) are counted too and isinstance checks still hold.
+    """
+    if getattr(db, "_query_profiler", False):
+        return db
+
+    execute = db.execute
+    execute_and_fetch = db.execute_and_fetch
+
+    def profiled_execute(query: str, *args: Any, **kwargs: Any) -> None:
+        profiles = _active_profiles.get()
+        if not profiles:
+            return execute(query, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return execute(query, *args, **kwargs)
+        finally:
+            _record(profiles, query, time.perf_counter() - start, 0)
+
+    def profiled_execute_and_fetch(
+        query: str, *args: Any, **kwargs: Any
+    ) -> Iterator[dict[str, Any]]:
+        profiles = _active_profiles.get()
+        if not profiles:
+            return execute_and_fetch(query, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            rows = execute_and_fetch(query, *args, **kwargs)
+        except BaseException:
+            _record(profiles, query, time.perf_counter() - start, 0)
+            raise
+        return _profiled_rows(iter(rows), profiles, query, time.perf_counter() - start)
+
+    db.execute = profiled_execute
+    db.execute_and_fetch = profiled_execute_and_fetch
+    db._query_profiler = True
+    return db
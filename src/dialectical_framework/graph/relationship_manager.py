@@ -16,6 +16,8 @@ Usage:
 
 from __future__ import annotations
 
+import threading
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Generic, Optional, Type, TypeVar, Union, overload
 
 from dependency_injector.wiring import Provide, inject
@@ -25,115 +27,268 @@ from gqlalchemy import Relationship as GQLRelationship
 from dialectical_framework.enums.di import DI
 
 if TYPE_CHECKING:
+    from dialectical_framework.graph.graph_session import GraphSession
     from dialectical_framework.graph.nodes.base_node import BaseNode
 
 T = TypeVar("T", bound="BaseNode")
 
-# Cache for inverse relationship lookup
-# Key: (source_class_name, target_class_name, relationship_type)
-# Value: (inverse_manager, attr_name) or None if no inverse exists
-_inverse_cache: dict[tuple[str, str, str], tuple[RelationshipManager, str] | None] = {}
 
+def _match_clause(relationship_type: str, direction: str, target: str = "target") -> str:
+    """`(source)-[r:TYPE]->(target)` oriented by the manager's direction."""
+    if direction == "outgoing":
+        return f"(source)-[r:{relationship_type}]->({target})"
+    if direction == "incoming":
+        return f"(source)<-[r:{relationship_type}]-({target})"
+    return f"(source)-[r:{relationship_type}]-({target})"
 
-def _get_all_subclasses(cls: type) -> dict[str, type]:
-    """Recursively collect all subclasses of a class."""
-    result = {}
-    for subclass in cls.__subclasses__():
-        result[subclass.__name__] = subclass
-        result.update(_get_all_subclasses(subclass))
-    return result
 
+@dataclass(frozen=True)
+class CompiledRelationship:
+    """Cypher for one (relationship type, direction, target) triple, built once."""
 
-def _get_node_class_by_name(name: str) -> type | None:
-    """Resolve a node class by name by searching BaseNode subclasses."""
-    from dialectical_framework.graph.nodes.base_node import BaseNode
-    from gqlalchemy import Node
-
-    # Special case for base types
-    if name == "Node":
-        return Node
-    if name == "BaseNode":
-        return BaseNode
+    label_expr: str
+    all_query: str
+    count_query: str
+    # MATCH ... WHERE on both endpoint ids; disconnect/update/connect append to it
+    pair_match: str
+    disconnect_query: str
 
-    # Dynamically discover all node subclasses
-    all_classes = _get_all_subclasses(BaseNode)
-    return all_classes.get(name)
-
-
-def _get_label_for_class_name(class_name: str) -> str:
-    """
-    Get the database label for a class name (resolves class and gets its label).
 
-    Used to convert class names like 'Statement' to their
-    database labels like 'Statement'.
+class RelationshipRegistry:
     """
-    node_class = _get_node_class_by_name(class_name)
-    if node_class is not None:
-        return getattr(node_class, 'label', class_name)
-    return class_name  # Fallback to class name if not found
+    Relationship metadata compiled once instead of reflected per call.
 
+    Relationship managers declare themselves through `__set_name__`; the node
+    metaclass calls `invalidate()` whenever a node class is defined. Until
+    then, everything a bound manager needs is looked up, not recomputed:
 
-def _get_all_labels_for_class_name(class_name: str) -> list[str]:
+    - node classes by name, and the label union of a class + its subclasses
+    - Cypher for .all() / .count() / .disconnect() per (type, direction, target)
+    - the managers declared on a class (cardinality validation)
+    - the inverse manager of a relationship (inverse cardinality)
+    - the generic relationship model per untyped relationship type
     """
-    Get database labels for a class AND all its subclasses.
-
-    Handles polymorphic relationships where the target might be any subclass.
-    For example, 'Estimation' returns ['Estimation', 'Probability', 'Relevance',
-    'Feasibility', 'Mode', 'Arousal'].
 
-    Args:
-        class_name: The class name to resolve
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self.generation = 0
+        self._declared: dict[type, dict[str, RelationshipManager]] = {}
+        self._classes: Optional[dict[str, type]] = None
+        self._subclasses: dict[type, tuple[type, ...]] = {}
+        self._labels: dict[str, tuple[str, ...]] = {}
+        self._label_exprs: dict[str, str] = {}
+        self._compiled: dict[tuple[str, str, str], CompiledRelationship] = {}
+        self._managers: dict[type, tuple[tuple[str, RelationshipManager], ...]] = {}
+        self._inverses: dict[tuple[str, str, str, str], tuple[RelationshipManager, str] | None] = {}
+        self._relationship_classes: dict[str, type[GQLRelationship]] = {}
+
+    def declare(self, owner: type, name: str, manager: RelationshipManager) -> None:
+        with self._lock:
+            self._declared.setdefault(owner, {})[name] = manager
+            self._managers.pop(owner, None)
+
+    def invalidate(self) -> None:
+        """Drop everything derived from the class hierarchy (a class was defined)."""
+        with self._lock:
+            self.generation += 1
+            self._classes = None
+            self._subclasses.clear()
+            self._labels.clear()
+            self._label_exprs.clear()
+            self._compiled.clear()
+            self._managers.clear()
+            self._inverses.clear()
+
+    # --- Classes and labels ---
+
+    def node_class(self, name: str) -> type | None:
+        """Resolve a node class by name (BaseNode and its subclasses)."""
+        classes = self._classes
+        if classes is None:
+            from dialectical_framework.graph.nodes.base_node import BaseNode
+
+            with self._lock:
+                classes = {"Node": Node, "BaseNode": BaseNode}
+                classes.update(
+                    (subclass.__name__, subclass) for subclass in self.subclasses(BaseNode)
+                )
+                self._classes = classes
+        return classes.get(name)
+
+    def subclasses(self, cls: type) -> tuple[type, ...]:
+        """All subclasses of `cls`, depth first."""
+        cached = self._subclasses.get(cls)
+        if cached is None:
+            found: dict[str, type] = {}
+            stack = list(reversed(cls.__subclasses__()))
+            while stack:
+                subclass = stack.pop()
+                found[subclass.__name__] = subclass
+                stack.extend(reversed(subclass.__subclasses__()))
+            cached = self._subclasses[cls] = tuple(found.values())
+        return cached
+
+    def labels(self, class_name: str) -> tuple[str, ...]:
+        """
+        Database labels for a class AND all its subclasses.
 
-    Returns:
-        List of all applicable database labels
-    """
-    node_class = _get_node_class_by_name(class_name)
-    if node_class is None:
-        return [class_name]
+        Handles polymorphic relationships where the target might be any subclass.
+        For example, 'Estimation' returns ('Estimation', 'Probability', 'Relevance',
+        'Feasibility', 'Mode', 'Arousal').
+        """
+        cached = self._labels.get(class_name)
+        if cached is not None:
+            return cached
+        node_class = self.node_class(class_name)
+        if node_class is None:
+            labels = [class_name]
+        else:
+            labels = [getattr(node_class, 'label', class_name)]
+            for subclass in self.subclasses(node_class):
+                subclass_label = getattr(subclass, 'label', subclass.__name__)
+                if subclass_label not in labels:
+                    labels.append(subclass_label)
+        cached = self._labels[class_name] = tuple(labels)
+        return cached
+
+    def label_expr(self, target_class_name: str) -> str:
+        """Cypher label expression for a (pipe-separated) target, e.g. "Statement|Input"."""
+        cached = self._label_exprs.get(target_class_name)
+        if cached is None:
+            all_labels: list[str] = []
+            for cn in target_class_name.split("|"):
+                all_labels.extend(self.labels(cn))
+            # Deduplicate while preserving order
+            cached = self._label_exprs[target_class_name] = "|".join(dict.fromkeys(all_labels))
+        return cached
+
+    def is_compatible(self, source_class_name: str, target_class_names: list[str]) -> bool:
+        """Whether the source class is (a subclass of) any of the target classes."""
+        if source_class_name in target_class_names:
+            return True
+        source_class = self.node_class(source_class_name)
+        if source_class is None:
+            return False
+        for target_name in target_class_names:
+            target_class = self.node_class(target_name)
+            if target_class is not None and issubclass(source_class, target_class):
+                return True
+        return False
 
-    labels = []
+    # --- Compiled queries ---
 
-    # Add the class's own label
-    own_label = getattr(node_class, 'label', class_name)
-    labels.append(own_label)
+    def compiled(
+        self, relationship_type: str, direction: str, target_class_name: str
+    ) -> CompiledRelationship:
+        key = (relationship_type, direction, target_class_name)
+        cached = self._compiled.get(key)
+        if cached is not None:
+            return cached
 
-    # Add labels of all subclasses
-    for subclass in _get_all_subclasses(node_class).values():
-        subclass_label = getattr(subclass, 'label', subclass.__name__)
-        if subclass_label not in labels:
-            labels.append(subclass_label)
+        labels = self.label_expr(target_class_name)
 
-    return labels
+        # Deterministic ordering: without ORDER BY, Cypher result order is
+        # unspecified (stable only by accident of current storage) — but
+        # consumers like build_pp_index treat this ordering as canonical
+        # (T1/T2 indices, cycle sequences). committed_at gives temporal
+        # order; id(target) tiebreaks same-second commits and uncommitted
+        # targets (NULL committed_at sorts consistently within a vendor).
+        all_query = f"""
+        MATCH {_match_clause(relationship_type, direction, f"target:{labels}")}
+        WHERE id(source) = $source_id
+        RETURN target, r as relationship
+        ORDER BY target.committed_at ASC, id(target) ASC
+        """
+        count_query = f"""
+        MATCH {_match_clause(relationship_type, direction, f":{labels}")}
+        WHERE id(source) = $source_id
+        RETURN count(*) as cnt
+        """
+        pair_match = f"""
+        MATCH {_match_clause(relationship_type, direction)}
+        WHERE id(source) = $source_id AND id(target) = $target_id"""
+        cached = self._compiled[key] = CompiledRelationship(
+            label_expr=labels,
+            all_query=all_query,
+            count_query=count_query,
+            pair_match=pair_match,
+            disconnect_query=f"""{pair_match}
+            DELETE r
+            RETURN count(r) as deleted
+            """,
+        )
+        return cached
+
+    def relationship_class(self, relationship_type: str) -> type[GQLRelationship]:
+        """Generic relationship model for managers without a typed one."""
+        cls = self._relationship_classes.get(relationship_type)
+        if cls is None:
+            with self._lock:
+                cls = self._relationship_classes.get(relationship_type)
+                if cls is None:
+                    cls = self._relationship_classes[relationship_type] = type(
+                        f"{relationship_type}_Rel",
+                        (GQLRelationship,),
+                        {"__module__": __name__},
+                        type=relationship_type,
+                    )
+        return cls
+
+    # --- Declared managers ---
+
+    def managers(self, cls: type) -> tuple[tuple[str, RelationshipManager], ...]:
+        """(attribute name, manager) of every relationship declared on `cls` or its bases."""
+        cached = self._managers.get(cls)
+        if cached is None:
+            found: dict[str, RelationshipManager] = {}
+            for klass in cls.__mro__:
+                for name, manager in self._declared.get(klass, {}).items():
+                    found.setdefault(name, manager)
+            cached = self._managers[cls] = tuple(sorted(found.items()))
+        return cached
+
+    def inverse(
+        self,
+        source_class_name: str,
+        target_class: type,
+        relationship_type: str,
+        source_direction: str,
+    ) -> tuple[RelationshipManager, str] | None:
+        """
+        The inverse RelationshipManager on target_class.
 
+        Returns:
+            Tuple of (inverse RelationshipManager, attribute name) or None if not found.
+            None means no cardinality constraint on the target side (implicit 0, None).
+        """
+        key = (source_class_name, target_class.__name__, relationship_type, source_direction)
+        if key in self._inverses:
+            return self._inverses[key]
 
-def _is_class_compatible(source_class_name: str, target_class_names: list[str]) -> bool:
-    """
-    Check if source_class_name is compatible with any of the target_class_names.
+        opposite_direction = {"outgoing": "incoming", "incoming": "outgoing"}.get(source_direction)
+        result = None
+        if opposite_direction is not None:  # "any" - cannot determine inverse
+            for attr_name, attr in self.managers(target_class):
+                if (attr.relationship_type == relationship_type and
+                    attr.direction == opposite_direction and
+                    self.is_compatible(source_class_name, attr.target_class_names)):
+                    result = (attr, attr_name)
+                    break
+        self._inverses[key] = result
+        return result
 
-    This handles inheritance - e.g., Statement is compatible with
-    AssessableEntity because it's a subclass.
 
-    Args:
-        source_class_name: The name of the class to check
-        target_class_names: List of class names that are acceptable targets
+relationship_registry = RelationshipRegistry()
 
-    Returns:
-        True if source_class_name matches exactly or is a subclass of any target
-    """
-    # Quick exact match check
-    if source_class_name in target_class_names:
-        return True
 
-    source_class = _get_node_class_by_name(source_class_name)
-    if source_class is None:
-        return False
+def _get_node_class_by_name(name: str) -> type | None:
+    """Resolve a node class by name by searching BaseNode subclasses."""
+    return relationship_registry.node_class(name)
 
-    for target_name in target_class_names:
-        target_class = _get_node_class_by_name(target_name)
-        if target_class is not None and issubclass(source_class, target_class):
-            return True
 
-    return False
+def _get_all_labels_for_class_name(class_name: str) -> list[str]:
+    """Get database labels for a class AND all its subclasses."""
+    return list(relationship_registry.labels(class_name))
 
 
 def _find_inverse_manager(
@@ -155,37 +310,9 @@ def _find_inverse_manager(
         Tuple of (inverse RelationshipManager, attribute name) or None if not found.
         None means no cardinality constraint on the target side (implicit 0, None).
     """
-    target_class_name = target_class.__name__
-    cache_key = (source_class_name, target_class_name, relationship_type)
-
-    if cache_key in _inverse_cache:
-        return _inverse_cache[cache_key]
-
-    # Determine opposite direction
-    if source_direction == "outgoing":
-        opposite_direction = "incoming"
-    elif source_direction == "incoming":
-        opposite_direction = "outgoing"
-    else:  # "any" - cannot determine inverse
-        _inverse_cache[cache_key] = None
-        return None
-
-    # Search target class for inverse (include private _attrs)
-    for attr_name in dir(target_class):
-        attr = getattr(target_class, attr_name, None)
-        if not isinstance(attr, RelationshipManager):
-            continue
-
-        if (attr.relationship_type == relationship_type and
-            attr.direction == opposite_direction and
-            _is_class_compatible(source_class_name, attr.target_class_names)):
-            result = (attr, attr_name)
-            _inverse_cache[cache_key] = result
-            return result
-
-    # No inverse found = no cardinality constraint on target side (implicit 0, None)
-    _inverse_cache[cache_key] = None
-    return None
+    return relationship_registry.inverse(
+        source_class_name, target_class, relationship_type, source_direction
+    )
 
 
 class RelationshipManager(Generic[T]):
@@ -277,6 +404,7 @@ class RelationshipManager(Generic[T]):
     def __set_name__(self, owner, name):
         """Called when the descriptor is assigned to a class attribute."""
         self.name = name
+        relationship_registry.declare(owner, name, self)
 
     @overload
     def __get__(self, instance: None, owner: type) -> RelationshipManager[T]:
@@ -326,6 +454,30 @@ class BoundRelationshipManager(Generic[T]):
         self.direction = direction
         self.cardinality = cardinality
 
+    def _session_key(self) -> tuple[int, str, str, str]:
+        """GraphSession cache key for this manager's .all() result."""
+        return (
+            self.source_node._id,
+            self.relationship_type,
+            self.direction,
+            self.target_class_name,
+        )
+
+    def _resolved_target_labels(self) -> str:
+        """
+        Cypher label expression for the target side, e.g. "Statement|Input".
+
+        Resolves class names to labels, including subclass labels for
+        polymorphic queries (target_class_name may be pipe-separated for
+        union types).
+        """
+        return relationship_registry.label_expr(self.target_class_name)
+
+    def _compiled(self) -> CompiledRelationship:
+        return relationship_registry.compiled(
+            self.relationship_type, self.direction, self.target_class_name
+        )
+
     def _validate_scope_compatibility(self, target_node: BaseNode) -> None:
         """
         Validate that connected nodes belong to the same scope (Case).
@@ -860,6 +1012,7 @@ class BoundRelationshipManager(Generic[T]):
         properties: Optional[dict] = None,
         relationship: Optional[GQLRelationship] = None,
         graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db],
+        session: Optional[GraphSession] = Provide[DI.graph_session],
     ) -> GQLRelationship:
         """
         Internal connect method that skips validation.
@@ -908,9 +1061,7 @@ class BoundRelationshipManager(Generic[T]):
         # For symmetric relationships (direction="any"), check if already connected
         # in either direction. If so, return existing relationship (idempotent).
         if self.direction == "any":
-            query = f"""
-            MATCH (a)-[r:{self.relationship_type}]-(b)
-            WHERE id(a) = $source_id AND id(b) = $target_id
+            query = f"""{self._compiled().pair_match}
             RETURN r as relationship
             LIMIT 1
             """
@@ -998,15 +1149,15 @@ class BoundRelationshipManager(Generic[T]):
                     **properties
                 )
             else:
-                # Use generic Relationship (dynamically created)
-                rel = type(
-                    f"{self.relationship_type}_Rel",
-                    (GQLRelationship,),
-                    {"__module__": __name__},
-                    type=self.relationship_type
-                )(_start_node_id=start_id, _end_node_id=end_id, **properties)
+                # Use generic Relationship (one model per type, see registry)
+                rel = relationship_registry.relationship_class(self.relationship_type)(
+                    _start_node_id=start_id, _end_node_id=end_id, **properties
+                )
 
         db.save_relationship(rel)
+        if session is not None:
+            session.invalidate_node(source_id)
+            session.invalidate_node(target_id)
 
         # Auto-create semantic relationships when connecting components
         self._create_polarity_semantic_relationships(target_node)
@@ -1019,6 +1170,7 @@ class BoundRelationshipManager(Generic[T]):
         self,
         target_node: T,
         graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db],
+        session: Optional[GraphSession] = Provide[DI.graph_session],
     ) -> bool:
         """
         Remove relationship to the target node. It does NOT delete the target node.
@@ -1038,33 +1190,15 @@ class BoundRelationshipManager(Generic[T]):
         # Block disconnection of structural relationships on committed nodes
         self._validate_structural_immutability(target_node, "disconnect")
 
-        # Determine direction
-        if self.direction == "outgoing":
-            query = f"""
-            MATCH (source)-[r:{self.relationship_type}]->(target)
-            WHERE id(source) = $source_id AND id(target) = $target_id
-            DELETE r
-            RETURN count(r) as deleted
-            """
-        elif self.direction == "incoming":
-            query = f"""
-            MATCH (source)<-[r:{self.relationship_type}]-(target)
-            WHERE id(source) = $source_id AND id(target) = $target_id
-            DELETE r
-            RETURN count(r) as deleted
-            """
-        else:  # any
-            query = f"""
-            MATCH (source)-[r:{self.relationship_type}]-(target)
-            WHERE id(source) = $source_id AND id(target) = $target_id
-            DELETE r
-            RETURN count(r) as deleted
-            """
+        query = self._compiled().disconnect_query
 
         result = list(db.execute_and_fetch(
             query,
             {"source_id": self.source_node._id, "target_id": target_node._id}
         ))
+        if session is not None:
+            session.invalidate_node(self.source_node._id)
+            session.invalidate_node(target_node._id)
 
         return result[0]["deleted"] > 0 if result else False
 
@@ -1074,6 +1208,7 @@ class BoundRelationshipManager(Generic[T]):
         target_node: T,
         properties: dict,
         graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db],
+        session: Optional[GraphSession] = Provide[DI.graph_session],
     ) -> bool:
         """
         Update properties on an existing relationship without disconnect/reconnect.
@@ -1097,25 +1232,7 @@ class BoundRelationshipManager(Generic[T]):
         if not set_clauses:
             return False
 
-        # Determine direction
-        if self.direction == "outgoing":
-            query = f"""
-            MATCH (source)-[r:{self.relationship_type}]->(target)
-            WHERE id(source) = $source_id AND id(target) = $target_id
-            SET {set_clauses}
-            RETURN count(r) as updated
-            """
-        elif self.direction == "incoming":
-            query = f"""
-            MATCH (source)<-[r:{self.relationship_type}]-(target)
-            WHERE id(source) = $source_id AND id(target) = $target_id
-            SET {set_clauses}
-            RETURN count(r) as updated
-            """
-        else:  # any
-            query = f"""
-            MATCH (source)-[r:{self.relationship_type}]-(target)
-            WHERE id(source) = $source_id AND id(target) = $target_id
+        query = f"""{self._compiled().pair_match}
             SET {set_clauses}
             RETURN count(r) as updated
             """
@@ -1124,17 +1241,22 @@ class BoundRelationshipManager(Generic[T]):
         params.update(properties)
 
         result = list(db.execute_and_fetch(query, params))
+        if session is not None:
+            session.invalidate_node(self.source_node._id)
+            session.invalidate_node(target_node._id)
         return result[0]["updated"] > 0 if result else False
 
     @inject
     def all(
         self,
         graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db],
+        session: Optional[GraphSession] = Provide[DI.graph_session],
     ) -> list[tuple[T, GQLRelationship]]:
         """
         Get all connected nodes with their relationship objects.
 
-        Uses dependency injection to get the database connection.
+        Uses dependency injection to get the database connection. Inside a
+        GraphSession the result is served from (and stored in) the session.
 
         Returns:
             List of tuples: (target_node, relationship)
@@ -1145,38 +1267,19 @@ class BoundRelationshipManager(Generic[T]):
         if self.source_node._id is None:
             return []
 
-        # Resolve class names to labels, including subclass labels for polymorphic queries
-        # target_class_name may be pipe-separated for union types
-        class_names = self.target_class_name.split("|")
-        all_labels = []
-        for cn in class_names:
-            all_labels.extend(_get_all_labels_for_class_name(cn))
-        # Deduplicate while preserving order
-        resolved_labels = "|".join(dict.fromkeys(all_labels))
+        if session is not None:
+            cached = session.get_relationships(self._session_key())
+            if cached is not None:
+                return cached
 
-        # Build query based on direction
-        if self.direction == "outgoing":
-            pattern = f"(source)-[r:{self.relationship_type}]->(target:{resolved_labels})"
-        elif self.direction == "incoming":
-            pattern = f"(source)<-[r:{self.relationship_type}]-(target:{resolved_labels})"
-        else:  # any
-            pattern = f"(source)-[r:{self.relationship_type}]-(target:{resolved_labels})"
-
-        # Deterministic ordering: without ORDER BY, Cypher result order is
-        # unspecified (stable only by accident of current storage) — but
-        # consumers like build_pp_index treat this ordering as canonical
-        # (T1/T2 indices, cycle sequences). committed_at gives temporal
-        # order; id(target) tiebreaks same-second commits and uncommitted
-        # targets (NULL committed_at sorts consistently within a vendor).
-        query = f"""
-        MATCH {pattern}
-        WHERE id(source) = $source_id
-        RETURN target, r as relationship
-        ORDER BY target.committed_at ASC, id(target) ASC
-        """
+        # Ordered by committed_at, then id(target) (see RelationshipRegistry.compiled)
+        query = self._compiled().all_query
 
         results = db.execute_and_fetch(query, {"source_id": self.source_node._id})
-        return [(result["target"], result["relationship"]) for result in results]
+        pairs = [(result["target"], result["relationship"]) for result in results]
+        if session is not None:
+            return session.put_relationships(self._session_key(), pairs)
+        return pairs
 
     def get(
         self,
@@ -1223,11 +1326,13 @@ class BoundRelationshipManager(Generic[T]):
     def count(
         self,
         graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db],
+        session: Optional[GraphSession] = Provide[DI.graph_session],
     ) -> int:
         """
         Count connected nodes.
 
-        Uses dependency injection to get the database connection.
+        Uses dependency injection to get the database connection. Inside a
+        GraphSession a cached .all() result answers without a query.
 
         Returns:
             Number of connected nodes
@@ -1236,26 +1341,12 @@ class BoundRelationshipManager(Generic[T]):
         if self.source_node._id is None:
             return 0
 
-        # Resolve class names to labels, including subclass labels for polymorphic queries
-        class_names = self.target_class_name.split("|")
-        all_labels = []
-        for cn in class_names:
-            all_labels.extend(_get_all_labels_for_class_name(cn))
-        # Deduplicate while preserving order
-        resolved_labels = "|".join(dict.fromkeys(all_labels))
+        if session is not None:
+            cached = session.get_relationships(self._session_key())
+            if cached is not None:
+                return len(cached)
 
-        if self.direction == "outgoing":
-            pattern = f"(source)-[:{self.relationship_type}]->(:{resolved_labels})"
-        elif self.direction == "incoming":
-            pattern = f"(source)<-[:{self.relationship_type}]-(:{resolved_labels})"
-        else:
-            pattern = f"(source)-[:{self.relationship_type}]-(:{resolved_labels})"
-
-        query = f"""
-        MATCH {pattern}
-        WHERE id(source) = $source_id
-        RETURN count(*) as cnt
-        """
+        query = self._compiled().count_query
 
         result = list(db.execute_and_fetch(query, {"source_id": self.source_node._id}))
         return result[0]["cnt"] if result else 0
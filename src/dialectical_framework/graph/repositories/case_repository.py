@@ -50,3 +50,28 @@ class CaseRepository:
 
         return results[0]["c"]
 
+
+    @inject
+    def fingerprint(
+        self,
+        sid: Optional[str] = Provide[DI.sid],
+        graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db],
+    ) -> Optional[tuple[int, Optional[float]]]:
+        """
+        Cheap change detector for the current scope: node count and latest
+        committed_at. Any new or re-committed node changes it.
+
+        Returns:
+            (node_count, latest_committed_at), or None without a scope
+        """
+        if not sid:
+            return None
+
+        query = """
+        MATCH (n {sid: $sid})
+        RETURN count(n) AS nodes, max(n.committed_at) AS latest
+        """
+        results = list(graph_db.execute_and_fetch(query, {"sid": sid}))
+        if not results:
+            return (0, None)
+        return (results[0]["nodes"], results[0]["latest"])
@@ -12,6 +12,7 @@ from dependency_injector.wiring import Provide, inject
 from gqlalchemy import Memgraph, Neo4j
 
 from dialectical_framework.enums.di import DI
+from dialectical_framework.graph.rotation_keys import layer_key, rotation_signature
 
 if TYPE_CHECKING:
     from dialectical_framework.graph.nodes.cycle import Cycle
@@ -35,15 +36,9 @@ class CycleRepository:
             hashes: List of hashes in order
 
         Returns:
-            Canonical string signature (colon-joined, lex-smallest rotation)
+            Canonical signature, as persisted in Cycle.rotation_signature
         """
-        if not hashes:
-            return ""
-
-        # Find canonical rotation (lexicographically smallest)
-        rotations = [hashes[i:] + hashes[:i] for i in range(len(hashes))]
-        canonical = min(rotations)
-        return ":".join(canonical)
+        return rotation_signature(hashes)
 
     @inject
     def find_by_perspectives(
@@ -67,40 +62,25 @@ class CycleRepository:
         Returns:
             List of matching Cycle nodes
         """
-        from dialectical_framework.graph.nodes.cycle import Cycle
-
         if not perspectives:
             return []
 
         pp_hashes = [pp.hash for pp in perspectives]
 
         if exact_order:
-            # Query cycles with exactly the same number of Perspectives
-            # Then filter by signature match in Python
+            # Indexed equality on the persisted rotation-invariant signature
             query = """
                 MATCH (c:Cycle)
-                WHERE c.sid = $sid
-                AND size(c.perspective_hashes) = $hash_count
-                AND ALL(h IN $pp_hashes WHERE h IN c.perspective_hashes)
+                WHERE c.rotation_signature = $signature
+                AND c.sid = $sid
                 RETURN c
                 ORDER BY c.committed_at ASC, id(c) ASC
             """
-            results = list(graph_db.execute_and_fetch(query, {
+            results = graph_db.execute_and_fetch(query, {
                 "sid": sid,
-                "pp_hashes": pp_hashes,
-                "hash_count": len(pp_hashes),
-            }))
-
-            # Filter by canonical signature (rotation-invariant)
-            target_signature = self._get_canonical_signature(pp_hashes)
-            matching_cycles = []
-            for row in results:
-                cycle: Cycle = row["c"]
-                cycle_signature = self._get_canonical_signature(cycle.perspective_hashes)
-                if cycle_signature == target_signature:
-                    matching_cycles.append(cycle)
-
-            return matching_cycles
+                "signature": self._get_canonical_signature(pp_hashes),
+            })
+            return [row["c"] for row in results]
         else:
             # Return cycles containing ANY of these Perspectives
             query = """
@@ -148,27 +128,25 @@ class CycleRepository:
         if not perspectives:
             return []
 
-        pp_hashes = sorted([pp.hash for pp in perspectives])  # Sort for set comparison
+        pp_hashes = [pp.hash for pp in perspectives]
+
+        if nexus is not None:
+            # The layer is exactly pp_hashes: either all of it lies within the
+            # Nexus (every layer Cycle qualifies) or none of its Cycles do
+            nexus_pp_hashes = {pp.hash for pp, _ in nexus.perspectives.all()}
+            if not set(pp_hashes) <= nexus_pp_hashes:
+                return []
 
         query = """
             MATCH (c:Cycle)
-            WHERE c.sid = $sid
-            AND size(c.perspective_hashes) = $hash_count
-            AND ALL(h IN $pp_hashes WHERE h IN c.perspective_hashes)
+            WHERE c.layer_key = $layer_key
+            AND c.sid = $sid
+            RETURN c
+            ORDER BY c.committed_at ASC, id(c) ASC
         """
-        params: dict = {
+        results = graph_db.execute_and_fetch(query, {
             "sid": sid,
-            "pp_hashes": pp_hashes,
-            "hash_count": len(pp_hashes),
-        }
-
-        if nexus is not None:
-            nexus_pp_hashes = [pp.hash for pp, _ in nexus.perspectives.all()]
-            query += "    AND ALL(h IN c.perspective_hashes WHERE h IN $nexus_pp_hashes)\n"
-            params["nexus_pp_hashes"] = nexus_pp_hashes
-
-        query += "    RETURN c\n    ORDER BY c.committed_at ASC, id(c) ASC"
-
-        results = list(graph_db.execute_and_fetch(query, params))
+            "layer_key": layer_key(pp_hashes),
+        })
 
         return [row["c"] for row in results]
@@ -0,0 +1,102 @@
+"""
+Repository for batched Estimation value reads.
+
+All queries are scoped by sid (injected from DI context) to prevent cross-user data leaks.
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Sequence, Union, TYPE_CHECKING
+
+from dependency_injector.wiring import Provide, inject
+from gqlalchemy import Memgraph, Neo4j
+
+from dialectical_framework.enums.di import DI
+
+if TYPE_CHECKING:
+    from dialectical_framework.graph.nodes.assessable_entity import AssessableEntity
+    from dialectical_framework.graph.nodes.estimation import Estimation
+
+
+class EstimationRepository:
+    """
+    Repository for Estimation value reads.
+
+    Reading one number through `entity.estimations.all()` costs a query and
+    the hydration of every estimation node, per entity. get_values() serves
+    the denormalized `est_<type>` properties the nodes carry, and reads the
+    rest for many entities and estimation types in one query.
+
+    Example:
+        values = EstimationRepository().get_values(
+            wheels, [CausalityProbabilityEstimation]
+        )
+        p = values[wheel._id][CausalityProbabilityEstimation]  # float or None
+    """
+
+    @inject
+    def get_values(
+        self,
+        entities: Sequence[AssessableEntity],
+        types: Sequence[type[Estimation]],
+        sid: Optional[str] = Provide[DI.sid],
+        graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db],
+    ) -> dict[int, dict[type[Estimation], Optional[float]]]:
+        """
+        Estimation values of many entities in one query.
+
+        The map is dense: every saved entity gets a row with every requested
+        type, None where it has no such estimation. Values the entity carries
+        as `est_<type>` (kept by EstimationManager) are taken as-is. Where an entity carries
+        several estimations of one type, the earliest committed wins (the
+        order of `estimations.all()`). Unsaved entities (no _id) are left out;
+        out-of-scope ones get an all-None row.
+
+        Args:
+            entities: Assessable entities to read
+            types: Estimation classes to read (a base class matches its subclasses)
+            sid: Case ID (injected from DI context)
+
+        Returns:
+            {entity _id: {estimation type: value or None}}
+        """
+        values: dict[int, dict[type[Estimation], Optional[float]]] = {}
+        missing: dict[int, set[type[Estimation]]] = {}
+        for entity in entities:
+            if entity._id is None:
+                continue
+            row_values = values.setdefault(entity._id, dict.fromkeys(types))
+            if sid and entity.sid != sid:
+                continue
+            for estimation_type in types:
+                prop = estimation_type.property_name()
+                if prop in entity.__dict__:
+                    row_values[estimation_type] = entity.__dict__[prop]
+                else:
+                    missing.setdefault(entity._id, set()).add(estimation_type)
+        if not missing:
+            return values
+
+        ids = list(missing)
+        by_label = {
+            estimation_type.label: estimation_type
+            for estimation_type in set().union(*missing.values())
+        }
+        query = """
+        UNWIND $ids AS node_id
+        MATCH (e:Estimation)-[:ESTIMATES]->(n)
+        WHERE id(n) = node_id AND any(label IN labels(e) WHERE label IN $labels)
+        RETURN node_id AS id, labels(e) AS labels, e.value AS value
+        ORDER BY e.committed_at ASC, id(e) ASC
+        """
+        rows = graph_db.execute_and_fetch(
+            query, {"ids": ids, "labels": list(by_label)}
+        )
+        for row in rows:
+            row_values = values[row["id"]]
+            for label in row["labels"]:
+                estimation_type = by_label.get(label)
+                if estimation_type in missing[row["id"]]:
+                    missing[row["id"]].discard(estimation_type)
+                    row_values[estimation_type] = row["value"]
+        return values
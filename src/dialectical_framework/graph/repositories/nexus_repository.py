@@ -12,6 +12,8 @@ from dependency_injector.wiring import inject, Provide
 from gqlalchemy import Memgraph, Neo4j
 
 from dialectical_framework.enums.di import DI
+from dialectical_framework.exceptions.node_errors import AmbiguousHashError
+from dialectical_framework.graph.repositories.node_repository import hash_predicate
 
 if TYPE_CHECKING:
     from dialectical_framework.graph.nodes.nexus import Nexus
@@ -41,25 +43,25 @@ class NexusRepository:
             The Nexus if exactly one match found, None if no matches
 
         Raises:
-            ValueError: If multiple Nexuses match (ambiguous prefix)
+            AmbiguousHashError: If multiple Nexuses match (ambiguous prefix)
         """
         if not sid:
             return None
 
-        query = """
+        predicate, params = hash_predicate(hash_prefix)
+        query = f"""
         MATCH (n:Nexus)
-        WHERE n.hash STARTS WITH $hash AND n.sid = $sid
+        WHERE {predicate} AND n.sid = $sid
         RETURN n
         """
-        results = list(graph_db.execute_and_fetch(query, {"hash": hash_prefix, "sid": sid}))
+        results = list(graph_db.execute_and_fetch(query, {**params, "sid": sid}))
 
         if not results:
             return None
 
         if len(results) > 1:
-            raise ValueError(
-                f"Ambiguous nexus hash '{hash_prefix}': "
-                f"matches {len(results)} nexuses"
+            raise AmbiguousHashError(
+                hash_prefix, [(r["n"].hash, "Nexus") for r in results]
             )
 
         return results[0]["n"]
@@ -12,13 +12,45 @@ from dependency_injector.wiring import Provide, inject
 from gqlalchemy import Memgraph, Neo4j
 
 from dialectical_framework.enums.di import DI
+from dialectical_framework.exceptions.node_errors import AmbiguousHashError
+from dialectical_framework.graph.graph_session import (
+    _FULL_HASH_LENGTH, invalidate_current_session)
+from dialectical_framework.graph.nodes.base_node import SHORT_HASH_LENGTH
 
 if TYPE_CHECKING:
+    from dialectical_framework.graph.graph_session import GraphSession
     from dialectical_framework.graph.nodes.base_node import BaseNode
 
 T = TypeVar("T", bound="BaseNode")
 
 
+def hash_predicate(hash: str, var: str = "n") -> tuple[str, dict]:
+    """
+    WHERE predicate (and its parameters) matching a full hash or a prefix.
+
+    - Full hash: equality on hash, served by the (hash, sid) index
+    - 7+ characters: equality on the indexed short_hash, narrowed by prefix
+    - Shorter prefixes: STARTS WITH on hash (a scan; too short to index)
+
+    Args:
+        hash: Full hash or hash prefix
+        var: Cypher variable of the node
+
+    Returns:
+        (predicate, params) to AND into a WHERE clause
+    """
+    if len(hash) == _FULL_HASH_LENGTH:
+        return f"{var}.hash = $hash", {"hash": hash}
+    if len(hash) == SHORT_HASH_LENGTH:
+        return f"{var}.short_hash = $short_hash", {"short_hash": hash}
+    if len(hash) > SHORT_HASH_LENGTH:
+        return (
+            f"{var}.short_hash = $short_hash AND {var}.hash STARTS WITH $hash",
+            {"short_hash": hash[:SHORT_HASH_LENGTH], "hash": hash},
+        )
+    return f"{var}.hash STARTS WITH $hash", {"hash": hash}
+
+
 class NodeRepository:
     """
     Repository for content-hash based node lookups.
@@ -41,6 +73,7 @@ class NodeRepository:
         node_type: type[T] | None = None,
         sid: str | None = Provide[DI.sid],
         graph_db: Memgraph | Neo4j = Provide[DI.graph_db],
+        session: Optional[GraphSession] = Provide[DI.graph_session],
     ) -> list[T]:
         """
         Find nodes by a list of full hashes within the current scope.
@@ -75,7 +108,10 @@ class NodeRepository:
         results = list(
             graph_db.execute_and_fetch(query, {"hashes": hashes, "sid": sid})
         )
-        return [record["n"] for record in results if record["n"] is not None]
+        nodes = [record["n"] for record in results if record["n"] is not None]
+        if session is not None:
+            nodes = [session.adopt(node) for node in nodes]
+        return nodes
 
     @inject
     def find_by_hash(
@@ -84,13 +120,17 @@ class NodeRepository:
         node_type: Optional[type[T]] = None,
         sid: Optional[str] = Provide[DI.sid],
         graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db],
+        session: Optional[GraphSession] = Provide[DI.graph_session],
     ) -> Optional[T]:
         """
         Find a node by hash or hash prefix within the current scope.
 
-        Uses STARTS WITH matching, which works for both:
-        - Full hash: exact match (single result)
-        - Hash prefix: prefix match (may have multiple results)
+        Full hashes (commit-time dedup, internal lookups) match by equality;
+        short hashes and longer prefixes go through the indexed short_hash
+        (see hash_predicate).
+
+        Inside a GraphSession, full hashes already seen this turn are served
+        from the identity map.
 
         Args:
             hash: The hash or hash prefix to search for
@@ -101,40 +141,78 @@ class NodeRepository:
             The node if exactly one match found, None if no matches
 
         Raises:
-            ValueError: If multiple nodes match (ambiguous prefix)
+            AmbiguousHashError: If multiple nodes match (ambiguous prefix)
             TypeError: If node_type is provided and the found node is not of that type
         """
+        if session is not None:
+            cached = session.find_by_hash(hash, sid)
+            if cached is not None:
+                if node_type is not None and not isinstance(cached, node_type):
+                    raise TypeError(f"Expected {node_type.__name__}, got {type(cached).__name__}")
+                return cached
+
+        predicate, params = hash_predicate(hash)
         if sid:
-            query = """
+            query = f"""
                 MATCH (n:Node)
-                WHERE n.hash STARTS WITH $hash AND n.sid = $sid
+                WHERE {predicate} AND n.sid = $sid
                 RETURN n
             """
-            results = list(
-                graph_db.execute_and_fetch(query, {"hash": hash, "sid": sid})
-            )
+            params["sid"] = sid
         else:
-            query = """
+            query = f"""
                 MATCH (n:Node)
-                WHERE n.hash STARTS WITH $hash
+                WHERE {predicate}
                 RETURN n
             """
-            results = list(graph_db.execute_and_fetch(query, {"hash": hash}))
+        results = list(graph_db.execute_and_fetch(query, params))
 
         if not results:
             return None
 
         if len(results) > 1:
-            raise ValueError(
-                f"Ambiguous hash '{hash}': matches {len(results)} nodes. "
-                f"Use a longer prefix."
+            raise AmbiguousHashError(
+                hash, [(r["n"].hash, type(r["n"]).__name__) for r in results]
             )
 
         node = results[0]["n"]
+        if session is not None:
+            node = session.adopt(node)
         if node_type is not None and not isinstance(node, node_type):
             raise TypeError(f"Expected {node_type.__name__}, got {type(node).__name__}")
         return node
 
+    @inject
+    def find_causality_scores(
+        self,
+        hashes: list[str],
+        sid: Optional[str] = Provide[DI.sid],
+        graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db],
+    ) -> dict[str, float]:
+        """
+        Read the raw CausalityProbability score of many nodes in one query.
+
+        Args:
+            hashes: Full hashes of Cycles and/or Wheels
+            sid: Case ID (injected from DI context)
+
+        Returns:
+            Score by node hash; nodes without an estimation are absent
+        """
+        if not sid or not hashes:
+            return {}
+
+        query = """
+            MATCH (raw:CausalityProbability)-[:ESTIMATES]->(n:Node)
+            WHERE n.hash IN $hashes AND n.sid = $sid
+            RETURN n.hash AS hash, raw.value AS value
+        """
+        scores: dict[str, float] = {}
+        for row in graph_db.execute_and_fetch(query, {"hashes": hashes, "sid": sid}):
+            if row["value"] is not None:
+                scores.setdefault(row["hash"], row["value"])
+        return scores
+
     @inject
     def delete_explanation_rationales(
         self,
@@ -174,4 +252,5 @@ class NodeRepository:
         RETURN rat_hash
         """
         results = list(graph_db.execute_and_fetch(query, {"node_id": node._id}))
+        invalidate_current_session(node)
         return [r["rat_hash"] for r in results if r["rat_hash"] is not None]
@@ -12,11 +12,16 @@ from dependency_injector.wiring import inject, Provide
 from gqlalchemy import Memgraph, Neo4j
 
 from dialectical_framework.enums.di import DI
+from dialectical_framework.graph.graph_session import invalidate_current_session
 
 if TYPE_CHECKING:
     from dialectical_framework.graph.nodes.perspective import Perspective
     from dialectical_framework.graph.nodes.statement import Statement
     from dialectical_framework.graph.nodes.polarity import Polarity
+    from dialectical_framework.graph.perspective_metrics import PerspectiveMetrics
+
+# Aspect relationship type → KS column of PerspectiveMetrics
+_ASPECT_POSITIONS = {"T_PLUS": "T+", "T_MINUS": "T-", "A_PLUS": "A+", "A_MINUS": "A-"}
 
 
 class PerspectiveRepository:
@@ -53,6 +58,74 @@ class PerspectiveRepository:
         except Exception:
             return []
 
+    @inject
+    def load_metrics(
+        self,
+        perspectives: list[Perspective],
+        sid: Optional[str] = Provide[DI.sid],
+        graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db],
+    ) -> PerspectiveMetrics:
+        """
+        Load the scoring inputs of many Perspectives in one query.
+
+        Reads complementarity (K_T, K_A) on the four aspect relationships,
+        the antithesis HS (on the Polarity's A relationship) and the
+        DialecticalValidity estimation, and returns them as a
+        PerspectiveMetrics table. Validation verdicts come from the passed
+        instances. Unsaved Perspectives (no _id) are left out; out-of-scope
+        ones get an all-missing row.
+
+        Args:
+            perspectives: Perspectives to score
+            sid: Case ID (injected from DI context)
+
+        Returns:
+            PerspectiveMetrics with one row per saved Perspective, in input order
+        """
+        from dialectical_framework.graph.perspective_metrics import (
+            PerspectiveMetrics,
+        )
+
+        ids = [
+            pp._id for pp in perspectives
+            if pp._id is not None and (not sid or pp.sid == sid)
+        ]
+        fetched: dict[int, tuple[dict, Optional[float], Optional[float]]] = {}
+        if ids:
+            query = """
+            UNWIND $ids AS pp_id
+            MATCH (pp:Perspective) WHERE id(pp) = pp_id
+            OPTIONAL MATCH (:Statement)-[ar]->(pp)
+            WHERE type(ar) IN ['T_PLUS', 'T_MINUS', 'A_PLUS', 'A_MINUS']
+            WITH pp, collect({
+                rel: type(ar), kt: ar.complementarity_t, ka: ar.complementarity_a
+            }) AS aspects
+            OPTIONAL MATCH (pp)-[:HAS_POLARITY]->(:Polarity)<-[a:A]-(:Statement)
+            WITH pp, aspects, collect(a.heuristic_similarity) AS hs
+            OPTIONAL MATCH (dv:DialecticalValidity)-[:ESTIMATES]->(pp)
+            RETURN id(pp) AS id, aspects, hs, collect(dv.value) AS dv
+            """
+            for row in graph_db.execute_and_fetch(query, {"ids": ids}):
+                ks: dict[str, Optional[float]] = {}
+                for aspect in row["aspects"] or []:
+                    position = _ASPECT_POSITIONS.get(aspect.get("rel"))
+                    kt, ka = aspect.get("kt"), aspect.get("ka")
+                    if position and kt is not None and ka is not None:
+                        ks[position] = (kt + ka) / 2
+                hs = row["hs"] or []
+                dv = row["dv"] or []
+                fetched[row["id"]] = (
+                    ks,
+                    hs[0] if hs else None,
+                    dv[0] if dv else None,
+                )
+
+        return PerspectiveMetrics.from_records(
+            (pp._id, *fetched.get(pp._id, ({}, None, None)), pp.validation)
+            for pp in perspectives
+            if pp._id is not None
+        )
+
     @inject
     def is_in_use_by_cycle(
         self,
@@ -193,6 +266,7 @@ class PerspectiveRepository:
             "MATCH (n) WHERE id(n) = $node_id DETACH DELETE n",
             {"node_id": perspective._id},
         )
+        invalidate_current_session(perspective)
         return True
 
 
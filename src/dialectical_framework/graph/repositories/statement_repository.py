@@ -12,6 +12,7 @@ from dependency_injector.wiring import inject, Provide
 from gqlalchemy import Memgraph, Neo4j
 
 from dialectical_framework.enums.di import DI
+from dialectical_framework.graph.graph_session import invalidate_current_session
 
 if TYPE_CHECKING:
     from dialectical_framework.graph.nodes.statement import Statement
@@ -157,6 +158,7 @@ class StatementRepository:
         DETACH DELETE rat, c
         """
         graph_db.execute(delete_query, {"comp_id": component._id})
+        invalidate_current_session(component)
         return True
 
     @inject
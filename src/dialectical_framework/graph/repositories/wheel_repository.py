@@ -6,12 +6,14 @@ All queries are scoped by sid (injected from DI context) to prevent cross-user d
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from typing import Optional, Union, TYPE_CHECKING
 
 from dependency_injector.wiring import Provide, inject
 from gqlalchemy import Memgraph, Neo4j
 
 from dialectical_framework.enums.di import DI
+from dialectical_framework.graph.rotation_keys import layer_key, rotation_signature
 
 if TYPE_CHECKING:
     from dialectical_framework.graph.nodes.wheel import Wheel
@@ -19,6 +21,58 @@ if TYPE_CHECKING:
     from dialectical_framework.graph.nodes.nexus import Nexus
     from dialectical_framework.graph.nodes.transformation import Transformation
     from dialectical_framework.graph.nodes.perspective import Perspective
+    from dialectical_framework.graph.nodes.cycle import Cycle
+    from dialectical_framework.graph.nodes.transition import Transition
+
+
+# Relationship types linking a Statement to its Perspective, mapped to positions
+_MEMBER_REL_TO_POSITION: dict[str, str] = {
+    "T": "T",
+    "A": "A",
+    "T_PLUS": "T+",
+    "T_MINUS": "T-",
+    "A_PLUS": "A+",
+    "A_MINUS": "A-",
+}
+
+
+@dataclass
+class WheelCausality:
+    """
+    A layer Wheel with its raw causality score and the current normalized
+    CausalityProbability values on its edge Transitions.
+    """
+
+    wheel: Wheel
+    raw_score: Optional[float]
+    # (edge Transition, current CausalityProbability values on it)
+    edges: list[tuple[Transition, list[float]]] = field(default_factory=list)
+
+
+@dataclass
+class WheelSubgraph:
+    """
+    In-memory snapshot of a committed Wheel's read-only neighbourhood.
+
+    Holds everything the Wheel's derived views (edges, perspectives,
+    statements, segments) would otherwise fetch edge by edge.
+    """
+
+    cycle: Optional[Cycle]
+    edges: list[Transition]
+    sources: dict[int, Statement] = field(default_factory=dict)
+    targets: dict[int, Statement] = field(default_factory=dict)
+    perspectives: list[Perspective] = field(default_factory=list)
+    # statement hash -> [(Perspective, position)] in cycle perspective order
+    memberships: dict[str, list[tuple[Perspective, str]]] = field(default_factory=dict)
+
+    def source_of(self, transition: Transition) -> Optional[Statement]:
+        """Source Statement of a prefetched edge."""
+        return self.sources.get(transition._id)
+
+    def target_of(self, transition: Transition) -> Optional[Statement]:
+        """Target Statement of a prefetched edge."""
+        return self.targets.get(transition._id)
 
 
 class WheelRepository:
@@ -37,15 +91,26 @@ class WheelRepository:
             hashes: List of hashes in order
 
         Returns:
-            Canonical string signature (colon-joined, lex-smallest rotation)
+            Canonical signature, as persisted in Wheel.rotation_signature
         """
-        if not hashes:
-            return ""
+        return rotation_signature(hashes)
 
-        # Find canonical rotation (lexicographically smallest)
-        rotations = [hashes[i:] + hashes[:i] for i in range(len(hashes))]
-        canonical = min(rotations)
-        return ":".join(canonical)
+    @staticmethod
+    def _layer_key_within(
+        perspectives: list[Perspective], nexus: Optional[Nexus]
+    ) -> Optional[str]:
+        """
+        layer_key of the Perspectives, or None when a Nexus is given and the
+        layer reaches outside it (then no Wheel of the layer belongs to it).
+        """
+        pp_hashes = [pp.hash for pp in perspectives if pp.hash is not None]
+        if not pp_hashes:
+            return None
+        if nexus is not None:
+            nexus_pp_hashes = {pp.hash for pp, _ in nexus.perspectives.all()}
+            if not set(pp_hashes) <= nexus_pp_hashes:
+                return None
+        return layer_key(pp_hashes)
 
     @inject
     def find_by_component_sequence(
@@ -65,37 +130,23 @@ class WheelRepository:
         Returns:
             Existing Wheel if found, None otherwise
         """
-        from dialectical_framework.graph.nodes.wheel import Wheel
-
         if not components:
             return None
 
-        comp_hashes = [c.hash for c in components]
-        target_signature = self._get_canonical_signature(comp_hashes)
-
-        # Query wheels that have the right number of transitions
-        # A wheel with N components has N transitions (circular)
+        # Indexed equality on the persisted rotation-invariant signature
         query = """
-            MATCH (w:Wheel)<-[:BELONGS_TO_CYCLE]-(t:Transition)
-            WHERE w.sid = $sid
-            WITH w, count(t) as trans_count
-            WHERE trans_count = $expected_count
+            MATCH (w:Wheel)
+            WHERE w.rotation_signature = $signature
+            AND w.sid = $sid
             RETURN w
+            ORDER BY w.committed_at ASC, id(w) ASC
+            LIMIT 1
         """
-        results = list(graph_db.execute_and_fetch(query, {
+        for row in graph_db.execute_and_fetch(query, {
             "sid": sid,
-            "expected_count": len(comp_hashes),
-        }))
-
-        # Filter by canonical signature match
-        for row in results:
-            wheel: Wheel = row["w"]
-            wheel_components = wheel.statements
-            if wheel_components:
-                wheel_hashes = [c.hash for c in wheel_components]
-                wheel_signature = self._get_canonical_signature(wheel_hashes)
-                if wheel_signature == target_signature:
-                    return wheel
+            "signature": self._get_canonical_signature([c.hash for c in components]),
+        }):
+            return row["w"]
 
         return None
 
@@ -177,29 +228,210 @@ class WheelRepository:
         if not perspectives:
             return []
 
-        pp_hashes = sorted([pp.hash for pp in perspectives if pp.hash is not None])
+        key = self._layer_key_within(perspectives, nexus)
+        if key is None:
+            return []
 
-        # Find all Wheels belonging to Cycles with exactly these Perspective hashes
         query = """
-            MATCH (c:Cycle)-[:HAS_WHEEL]->(w:Wheel)
-            WHERE w.sid = $sid
-            AND size(c.perspective_hashes) = $hash_count
-            AND ALL(h IN $pp_hashes WHERE h IN c.perspective_hashes)
+            MATCH (w:Wheel)
+            WHERE w.layer_key = $layer_key
+            AND w.sid = $sid
+            RETURN w
+            ORDER BY w.committed_at ASC, id(w) ASC
         """
-        params: dict = {
-            "sid": sid,
-            "pp_hashes": pp_hashes,
-            "hash_count": len(pp_hashes),
-        }
+        results = graph_db.execute_and_fetch(query, {"sid": sid, "layer_key": key})
 
-        if nexus is not None:
-            nexus_pp_hashes = [pp.hash for pp, _ in nexus.perspectives.all()]
-            query += "    AND ALL(h IN c.perspective_hashes WHERE h IN $nexus_pp_hashes)\n"
-            params["nexus_pp_hashes"] = nexus_pp_hashes
+        return [row["w"] for row in results]
 
-        query += "    RETURN w\n    ORDER BY w.committed_at ASC, id(w) ASC"
+    @inject
+    def find_layer_causality(
+        self,
+        perspectives: list[Perspective],
+        nexus: Optional[Nexus] = None,
+        graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db],
+        sid: Optional[str] = Provide[DI.sid],
+    ) -> list[WheelCausality]:
+        """
+        Read a layer's causality state in one query: every Wheel of the layer
+        (as in find_by_layer), its raw CausalityProbability score, and the
+        current CausalityProbability values on each of its edge Transitions.
 
-        results = list(graph_db.execute_and_fetch(query, params))
+        Used by incremental normalization to diff in memory instead of
+        rewriting every edge estimation.
 
-        return [row["w"] for row in results]
+        Args:
+            perspectives: List of Perspectives defining the layer
+            nexus: Optional Nexus to scope results to
+            graph_db: Graph database (injected)
+            sid: Case ID (injected from DI context)
 
+        Returns:
+            WheelCausality per Wheel, ordered like find_by_layer
+        """
+        if not perspectives:
+            return []
+
+        key = self._layer_key_within(perspectives, nexus)
+        if key is None:
+            return []
+
+        query = """
+            MATCH (w:Wheel)
+            WHERE w.layer_key = $layer_key
+            AND w.sid = $sid
+            OPTIONAL MATCH (raw:CausalityProbability)-[:ESTIMATES]->(w)
+            WITH w, collect(raw.value) AS raw_values
+            OPTIONAL MATCH (t:Transition)-[:BELONGS_TO_CYCLE]->(w)
+            OPTIONAL MATCH (cur:CausalityProbability)-[:ESTIMATES]->(t)
+            WITH w, raw_values, t, collect(cur.value) AS current
+            RETURN w, raw_values, t, current
+            ORDER BY w.committed_at ASC, id(w) ASC, t.committed_at ASC, id(t) ASC
+        """
+
+        layer: dict[int, WheelCausality] = {}
+        for row in graph_db.execute_and_fetch(query, {"sid": sid, "layer_key": key}):
+            wheel = row["w"]
+            entry = layer.get(wheel._id)
+            if entry is None:
+                raw_values = row["raw_values"] or []
+                entry = WheelCausality(
+                    wheel=wheel,
+                    raw_score=raw_values[0] if raw_values else None,
+                )
+                layer[wheel._id] = entry
+            if row["t"] is not None:
+                entry.edges.append((row["t"], list(row["current"] or [])))
+
+        return list(layer.values())
+
+    @inject
+    def load_subgraph(
+        self,
+        wheel: Wheel,
+        graph_db: Union[Memgraph, Neo4j] = Provide[DI.graph_db],
+        sid: Optional[str] = Provide[DI.sid],
+    ) -> Optional[WheelSubgraph]:
+        """
+        Load a Wheel's parent Cycle, edges, edge endpoints and Perspective
+        memberships in a single round trip.
+
+        Edges are returned in the same order as ``wheel._edges.all()``
+        (committed_at, then id) and then chained via ``order_transitions``.
+        Perspectives are restricted to the parent Cycle's ``perspective_hashes``
+        and ordered by first appearance along the edge chain.
+
+        Args:
+            wheel: The Wheel to load
+            graph_db: Graph database (injected)
+            sid: Case ID (injected from DI context)
+
+        Returns:
+            WheelSubgraph snapshot, or None if the wheel is not persisted or
+            belongs to another scope
+        """
+        from dialectical_framework.utils.order_transitions import order_transitions
+
+        if wheel._id is None:
+            return None
+        if sid and wheel.sid != sid:
+            return None
+
+        query = """
+        MATCH (c:Cycle)-[:HAS_WHEEL]->(w:Wheel)
+        WHERE id(w) = $wheel_id
+        RETURN 'cycle' AS kind, c AS node, null AS source, null AS target, null AS position
+
+        UNION ALL
+
+        MATCH (t:Transition)-[:BELONGS_TO_CYCLE]->(w:Wheel)
+        WHERE id(w) = $wheel_id
+        OPTIONAL MATCH (s:Statement)-[:IS_SOURCE_OF]->(t)
+        OPTIONAL MATCH (t)-[:IS_TARGET_OF]->(g:Statement)
+        RETURN 'edge' AS kind, t AS node, s AS source, g AS target, null AS position
+
+        UNION ALL
+
+        // Aspect positions (T+, T-, A+, A-) directly on Perspective
+        MATCH (w:Wheel)<-[:BELONGS_TO_CYCLE]-(:Transition)-[:IS_SOURCE_OF|IS_TARGET_OF]-(s:Statement)
+        WHERE id(w) = $wheel_id
+        OPTIONAL MATCH (c:Cycle)-[:HAS_WHEEL]->(w)
+        WITH DISTINCT s, c
+        MATCH (s)-[r]->(pp:Perspective)
+        WHERE type(r) IN ['T_PLUS', 'T_MINUS', 'A_PLUS', 'A_MINUS']
+        AND (c IS NULL OR pp.hash IN c.perspective_hashes)
+        RETURN 'member' AS kind, pp AS node, s AS source, null AS target, type(r) AS position
+
+        UNION ALL
+
+        // T and A positions via Polarity
+        MATCH (w:Wheel)<-[:BELONGS_TO_CYCLE]-(:Transition)-[:IS_SOURCE_OF|IS_TARGET_OF]-(s:Statement)
+        WHERE id(w) = $wheel_id
+        OPTIONAL MATCH (c:Cycle)-[:HAS_WHEEL]->(w)
+        WITH DISTINCT s, c
+        MATCH (s)-[r]->(:Polarity)<-[:HAS_POLARITY]-(pp:Perspective)
+        WHERE type(r) IN ['T', 'A']
+        AND (c IS NULL OR pp.hash IN c.perspective_hashes)
+        RETURN 'member' AS kind, pp AS node, s AS source, null AS target, type(r) AS position
+        """
+        rows = list(graph_db.execute_and_fetch(query, {"wheel_id": wheel._id}))
+
+        cycle: Optional[Cycle] = None
+        edges: list[Transition] = []
+        sources: dict[int, Statement] = {}
+        targets: dict[int, Statement] = {}
+        member_rows: list[tuple[Statement, Perspective, str]] = []
+
+        for row in rows:
+            kind = row["kind"]
+            if kind == "cycle":
+                cycle = row["node"]
+            elif kind == "edge":
+                edge = row["node"]
+                edges.append(edge)
+                if row["source"] is not None:
+                    sources[edge._id] = row["source"]
+                if row["target"] is not None:
+                    targets[edge._id] = row["target"]
+            elif kind == "member":
+                position = _MEMBER_REL_TO_POSITION.get(row["position"])
+                if position is not None:
+                    member_rows.append((row["source"], row["node"], position))
+
+        # Mirror RelationshipManager.all() ordering before chaining
+        edges.sort(key=lambda e: (e.committed_at is None, e.committed_at or 0.0, e._id))
+        ordered = order_transitions(
+            edges,
+            source_of=lambda t: sources.get(t._id),
+            target_of=lambda t: targets.get(t._id),
+        )
+
+        # Order perspectives within a statement by the cycle's T-cycle order
+        rank: dict[str, int] = {}
+        if cycle is not None:
+            rank = {h: i for i, h in enumerate(cycle.perspective_hashes or [])}
+        member_rows.sort(key=lambda m: rank.get(m[1].hash, len(rank)))
+
+        memberships: dict[str, list[tuple[Perspective, str]]] = {}
+        for statement, pp, position in member_rows:
+            memberships.setdefault(statement.hash, []).append((pp, position))
+
+        perspectives: list[Perspective] = []
+        seen_hashes: set[str] = set()
+        for edge in ordered:
+            for component in (sources.get(edge._id), targets.get(edge._id)):
+                if component is None:
+                    continue
+                for pp, _ in memberships.get(component.hash, []):
+                    if pp.hash in seen_hashes:
+                        continue
+                    seen_hashes.add(pp.hash)
+                    perspectives.append(pp)
+
+        return WheelSubgraph(
+            cycle=cycle,
+            edges=ordered,
+            sources=sources,
+            targets=targets,
+            perspectives=perspectives,
+            memberships=memberships,
+        )
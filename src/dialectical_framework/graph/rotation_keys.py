@@ -0,0 +1,194 @@
+"""
+Precomputed lookup keys for Cycles and Wheels.
+
+Both are circular sequences: a Cycle of Perspective hashes, a Wheel of
+Statement hashes. Two keys are persisted (and indexed, see
+DialecticalReasoning._ensure_schema) so that repository lookups are
+equality matches instead of scans:
+
+- layer_key: order-independent — every Cycle/Wheel over the same
+  Perspective set shares it ("all cycles on this layer")
+- rotation_signature: rotation-invariant — the sequence read from its
+  least rotation ("does this wheel already exist")
+
+Keys are sha256 digests so index entries stay short on wide wheels.
+
+Cycles and Wheels committed before the keys existed are found by
+missing_rotation_keys() and keyed by write_rotation_keys(); schema setup
+runs both (DialecticalReasoning._backfill_rotation_keys).
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING, Any, Optional, Sequence, TypeVar, Union
+
+if TYPE_CHECKING:
+    from gqlalchemy import Memgraph, Neo4j
+
+T = TypeVar("T")
+
+
+def least_rotation(seq: Sequence[T]) -> int:
+    """
+    Start index of the lexicographically least rotation (Booth's algorithm, O(n)).
+
+    Args:
+        seq: Sequence of mutually comparable items
+
+    Returns:
+        Index k such that seq[k:] + seq[:k] is the least rotation (0 if empty)
+    """
+    n = len(seq)
+    doubled = list(seq) * 2
+    failure = [-1] * (2 * n)
+    k = 0
+    for j in range(1, 2 * n):
+        i = failure[j - k - 1]
+        while i != -1 and doubled[j] != doubled[k + i + 1]:
+            if doubled[j] < doubled[k + i + 1]:
+                k = j - i - 1
+            i = failure[i]
+        if i == -1 and doubled[j] != doubled[k]:
+            if doubled[j] < doubled[k]:
+                k = j
+            failure[j - k] = -1
+        else:
+            failure[j - k] = i + 1
+    return k
+
+
+def _digest(parts: Sequence[str]) -> str:
+    return hashlib.sha256(":".join(parts).encode("utf-8")).hexdigest()
+
+
+def rotation_signature(hashes: Sequence[str]) -> str:
+    """
+    Rotation-invariant key of a circular hash sequence.
+
+    Returns:
+        Digest of the least rotation ("" for an empty sequence)
+    """
+    if not hashes:
+        return ""
+    k = least_rotation(hashes)
+    return _digest([*hashes[k:], *hashes[:k]])
+
+
+def layer_key(hashes: Sequence[str]) -> str:
+    """
+    Order-independent key of a Perspective hash set.
+
+    Returns:
+        Digest of the sorted hashes ("" for an empty sequence)
+    """
+    if not hashes:
+        return ""
+    return _digest(sorted(hashes))
+
+
+def edge_chain(edges: Sequence[Sequence[Optional[str]]]) -> Optional[list[str]]:
+    """
+    Component sequence of a circular chain of (source, target) edges.
+
+    Returns:
+        The sequence from an arbitrary start, or None if the edges don't
+        form a single cycle
+    """
+    successors = {source: target for source, target in edges if source and target}
+    if not successors or len(successors) != len(edges):
+        return None
+    start = next(iter(successors))
+    sequence = [start]
+    current = successors[start]
+    while current != start:
+        if current not in successors or len(sequence) > len(successors):
+            return None
+        sequence.append(current)
+        current = successors[current]
+    return sequence if len(sequence) == len(successors) else None
+
+
+def missing_rotation_keys(
+    graph_db: Union[Memgraph, Neo4j], sid: Optional[str] = None
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], int]:
+    """
+    Keys for committed Cycles and Wheels that lack them, derived exactly as
+    at commit time: a Cycle from its perspective_hashes, a Wheel from its
+    parent Cycle's perspective_hashes and its edge chain's Statements.
+
+    Args:
+        graph_db: Database connection
+        sid: Limit to one Case (None: every case)
+
+    Returns:
+        (cycle rows, wheel rows, wheels skipped for lack of a parent Cycle
+        or a broken edge chain); rows are {id, layer_key, rotation_signature}
+    """
+    params = {"sid": sid}
+    sid_filter = "AND n.sid = $sid" if sid else ""
+
+    cycle_rows = [
+        {
+            "id": r["id"],
+            "layer_key": layer_key(r["ph"]),
+            "rotation_signature": rotation_signature(r["ph"]),
+        }
+        for r in graph_db.execute_and_fetch(
+            f"""
+            MATCH (n:Cycle)
+            WHERE n.hash IS NOT NULL {sid_filter}
+            AND (n.layer_key IS NULL OR n.rotation_signature IS NULL)
+            RETURN id(n) AS id, n.perspective_hashes AS ph
+            """,
+            params,
+        )
+        if r["ph"]
+    ]
+
+    wheel_rows = []
+    skipped = 0
+    for r in graph_db.execute_and_fetch(
+        f"""
+        MATCH (n:Wheel)
+        WHERE n.hash IS NOT NULL {sid_filter}
+        AND (n.layer_key IS NULL OR n.rotation_signature IS NULL)
+        OPTIONAL MATCH (c:Cycle)-[:HAS_WHEEL]->(n)
+        WITH n, head(collect(c.perspective_hashes)) AS ph
+        OPTIONAL MATCH (s:Statement)-[:IS_SOURCE_OF]->(t:Transition)-[:BELONGS_TO_CYCLE]->(n)
+        OPTIONAL MATCH (t)-[:IS_TARGET_OF]->(g:Statement)
+        WITH n, ph, collect(CASE WHEN t IS NULL THEN NULL ELSE [s.hash, g.hash] END) AS edges
+        RETURN id(n) AS id, ph, edges
+        """,
+        params,
+    ):
+        sequence = edge_chain(r["edges"] or [])
+        if not r["ph"] or sequence is None:
+            skipped += 1
+            continue
+        wheel_rows.append(
+            {
+                "id": r["id"],
+                "layer_key": layer_key(r["ph"]),
+                "rotation_signature": rotation_signature(sequence),
+            }
+        )
+
+    return cycle_rows, wheel_rows, skipped
+
+
+def write_rotation_keys(
+    graph_db: Union[Memgraph, Neo4j], label: str, rows: Sequence[dict[str, Any]]
+) -> None:
+    """Set the keys computed by missing_rotation_keys() on nodes of `label`."""
+    if not rows:
+        return
+    graph_db.execute(
+        f"""
+        UNWIND $rows AS row
+        MATCH (n:{label}) WHERE id(n) = row.id
+        SET n.layer_key = row.layer_key,
+            n.rotation_signature = row.rotation_signature
+        """,
+        {"rows": list(rows)},
+    )
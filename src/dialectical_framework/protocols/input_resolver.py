@@ -4,6 +4,7 @@ Abstract base class for resolving Input nodes to text content.
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
@@ -35,6 +36,9 @@ class InputResolver(ABC):
         container.input_resolver.override(providers.Singleton(MyAppResolver))
     """
 
+    # Inputs resolved at once by resolve_many()
+    max_concurrency: int = 8
+
     @abstractmethod
     async def resolve(self, input_node: Input) -> str:
         """
@@ -79,6 +83,27 @@ class InputResolver(ABC):
         """
         return await self.resolve(input_node)
 
+    async def resolve_many(self, inputs: list[Input]) -> list[str]:
+        """
+        Resolve several Inputs concurrently (at most `max_concurrency` at a time).
+
+        Args:
+            inputs: Input nodes to resolve
+
+        Returns:
+            Resolved text per input, in input order
+
+        Raises:
+            The first resolver exception, if any
+        """
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def _resolve(input_node: Input) -> str:
+            async with semaphore:
+                return await self.resolve(input_node)
+
+        return list(await asyncio.gather(*(_resolve(i) for i in inputs)))
+
     @abstractmethod
     async def resolve_all(self, source: Case | list[Input]) -> str:
         """
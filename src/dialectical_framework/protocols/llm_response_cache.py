@@ -0,0 +1,45 @@
+"""
+Abstract base class for LLM response cache backends.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class LlmResponseCache(ABC):
+    """
+    Content-addressed store for structured LLM responses.
+
+    Keys are sha256 hex digests of (model, messages, format schema, params),
+    computed by use_brain; values are the parsed response serialized as JSON.
+    Backends own eviction (TTL, size bound) and keep hit/miss counters.
+
+    Example:
+        class RedisLlmCache(LlmResponseCache):
+            def get(self, key: str) -> Optional[str]:
+                ...
+
+        container.llm_cache.override(providers.Singleton(RedisLlmCache))
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return the cached value for key, or None when absent or expired.
+
+        Implementations update `hits`/`misses`.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        """Store a value, evicting as needed to stay within bounds."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop all entries."""
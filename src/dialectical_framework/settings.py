@@ -18,6 +18,10 @@ class Settings(BaseModel):
     component_length: int = Field(default=7, description="Approximate length in words of the statement.")
     transition_length: int = Field(default=15, description="Approximate maximum length in words of a transition statement (fuller than a component headline).")
     max_wheel_layer: int = Field(default=4, description="Maximum wheel layer (PP count per wheel) to build. Layers above this are skipped regardless of nexus size.")
+    max_wheels_per_cycle: int = Field(default=0, description="Maximum wheel arrangements built per cycle ordering; enumeration stops there. 0 = unlimited.")
+    wheel_beam_width: int = Field(default=0, description="Progressive layer building: after a layer is built and estimated, keep only the top-N cycles and top-N wheels (by normalized causality) and extend only their Perspective sets to the next layer. 0 = build every layer in full.")
+    causality_batch_token_budget: int = Field(default=0, description="Token budget per causality estimation call. When set, sequences over the same Perspective set are scored K at a time in one call (K packed to fit the budget), falling back to per-sequence calls for any a batch misses. 0 = one call per sequence.")
+    dedup_top_k: int = Field(default=8, description="Statement deduplication: nearest existing statements (lexical MinHash index) shown to the LLM per new statement. Bounds the prompt regardless of case size.")
     cycle_preset: str = Field(default=CausalityPreset.AUTO, description="Default preset for causality estimation (e.g., preset:auto, preset:realistic, preset:desirable, preset:feasible, preset:balanced).")
 
     # Context-dump quality filter (DialecticalContext). Perspectives below
@@ -44,6 +48,10 @@ class Settings(BaseModel):
     # and ignores this.
     advisor_max_perspectives_per_exploration: int = Field(default=2, description="Max perspectives woven per silent Advisor explore call; excess is reported as deferred (weave in a follow-up call), never silently dropped. 0 = unlimited.")
 
+    # DI wiring: "lazy" wires each framework module when it is first imported;
+    # "eager" imports and wires the whole package at container setup.
+    di_wiring: str = Field(default="lazy", description="DI wiring mode: 'lazy' (wire modules on first import) or 'eager' (import and wire every module at setup).")
+
     # Graph database configuration (Memgraph or Neo4j)
     graph_db_vendor: str = Field(default="memgraph", description="Graph database vendor: 'memgraph' or 'neo4j'")
     graph_db_host: str = Field(default="127.0.0.1", description="Graph database host")
@@ -52,10 +60,46 @@ class Settings(BaseModel):
     graph_db_password: Optional[str] = Field(default=None, description="Graph database password (required for Neo4j, optional for Memgraph)")
     graph_db_encrypted: bool = Field(default=False, description="Use encrypted connection (SSL/TLS)")
     graph_db_client_name: str = Field(default="dialectical_framework", description="Client name for connection identification")
+    # Connection pool behind the async graph adapter (async_graph_db provider)
+    graph_db_pool_size: int = Field(default=8, description="Max pooled graph connections (and offload worker threads) for async graph access")
+    graph_db_pool_acquire_timeout: float = Field(default=30.0, description="Seconds to wait for a free pooled connection before raising")
+    graph_db_pool_max_lifetime: float = Field(default=3600.0, description="Seconds after which a pooled connection is closed and replaced. 0 = never recycle.")
 
     # Effect logging: directory for JSONL effect logs. None = disabled.
     # When set, graph mutations and tool calls are logged to <dir>/<sid>/<agent>.jsonl
     effect_log_dir: Optional[str] = Field(default=None, description="Directory for effect JSONL logs. None = disabled.")
+    effect_log_queue_size: int = Field(default=10000, description="Effect records buffered in memory before new ones are dropped (and counted).")
+    effect_log_batch_size: int = Field(default=500, description="Buffered effect records that trigger a write before the flush interval is up.")
+    effect_log_flush_interval: float = Field(default=1.0, description="Max seconds an effect record waits in the buffer before it is written.")
+    effect_log_max_bytes: int = Field(default=0, description="Rotate an effect log file before it would exceed this size. 0 = never.")
+    effect_log_max_age: float = Field(default=0.0, description="Rotate an effect log file this many seconds after it was opened. 0 = never.")
+    effect_log_compression: Optional[str] = Field(default=None, description="Compress rotated effect logs: 'gzip', 'zstd' (needs the zstandard package) or None.")
+
+    # Graph event bus: effects are sent per sid as one envelope per flush window
+    # (or per finalized report); each subscriber has a bounded queue.
+    event_bus_flush_window: float = Field(default=0.05, description="Seconds effects of one sid are collected into a single event envelope.")
+    event_bus_queue_size: int = Field(default=1000, description="Events buffered per subscriber before the overflow policy applies.")
+    event_bus_overflow: str = Field(default="drop_oldest", description="Full subscriber queue policy: 'drop_oldest', 'coalesce' (merge by node hash) or 'disconnect'.")
+
+    # LLM response cache for structured use_brain calls. None = disabled.
+    # "memory" = in-process LRU; "sqlite" = on-disk at llm_cache_path, shared across runs.
+    llm_cache_backend: Optional[str] = Field(default=None, description="LLM response cache backend: 'memory', 'sqlite', or None (disabled).")
+    llm_cache_path: Optional[str] = Field(default=None, description="SQLite file for the 'sqlite' LLM cache backend.")
+    llm_cache_ttl: Optional[float] = Field(default=None, description="Seconds before a cached LLM response expires. None = never.")
+    llm_cache_max_entries: int = Field(default=10000, description="Max cached LLM responses; least recently used are evicted first.")
+
+    # Resolved Input content (plain text, decoded data: URIs; never dx://), cached by Input hash.
+    input_cache_max_bytes: int = Field(default=64 * 1024 * 1024, description="Max total size of cached resolved Input content; least recently used are evicted first. 0 = disabled.")
+    input_resolve_concurrency: int = Field(default=8, description="Inputs resolved concurrently when building source text.")
+
+    # Tool calls of one agentic round run concurrently where their declared
+    # concurrency classes allow (see agents/tool_scheduler).
+    tool_concurrency: int = Field(default=4, description="Max tool calls of one round running at once.")
+
+    # Single-pass structured answers: agents end their tool loop by calling a
+    # terminal `respond` tool carrying the response model, instead of paying a
+    # separate full-context extraction call per turn.
+    single_pass_responses: bool = Field(default=False, description="Let agents deliver their structured final answer through a terminal 'respond' tool in the round that stops calling tools. Falls back to the extraction call when the model answers in plain text or the arguments don't validate.")
 
     # Extended thinking: None = disabled, or one of the levels below.
     # Levels map to provider-specific token budgets (% of max_tokens for Anthropic):
@@ -122,12 +166,17 @@ class Settings(BaseModel):
             component_length=int(os.getenv("DIALEXITY_DEFAULT_COMPONENT_LENGTH", 7)),
             transition_length=int(os.getenv("DIALEXITY_DEFAULT_TRANSITION_LENGTH", 15)),
             max_wheel_layer=int(os.getenv("DIALEXITY_MAX_WHEEL_LAYER", 4)),
+            max_wheels_per_cycle=int(os.getenv("DIALEXITY_MAX_WHEELS_PER_CYCLE", 0)),
+            wheel_beam_width=int(os.getenv("DIALEXITY_WHEEL_BEAM_WIDTH", 0)),
+            causality_batch_token_budget=int(os.getenv("DIALEXITY_CAUSALITY_BATCH_TOKEN_BUDGET", 0)),
+            dedup_top_k=int(os.getenv("DIALEXITY_DEDUP_TOP_K", 8)),
             cycle_preset=CausalityPreset.AUTO,
             advisor_polarity_quality_min_hs=float(os.getenv("DIALEXITY_ADVISOR_POLARITY_QUALITY_MIN_HS", 0.5)),
             advisor_perspective_quality_min_sp=float(os.getenv("DIALEXITY_ADVISOR_PERSPECTIVE_QUALITY_MIN_SP", 0.3)),
             advisor_perspective_quality_min_dv=float(os.getenv("DIALEXITY_ADVISOR_PERSPECTIVE_QUALITY_MIN_DV", 0.3)),
             advisor_wheel_quality_top_plausible=int(os.getenv("DIALEXITY_ADVISOR_WHEEL_QUALITY_TOP_PLAUSIBLE", 3)),
             advisor_max_perspectives_per_exploration=int(os.getenv("DIALEXITY_ADVISOR_MAX_PERSPECTIVES_PER_EXPLORATION", 2)),
+            di_wiring=os.getenv("DIALEXITY_DI_WIRING", "lazy"),
             graph_db_vendor=os.getenv("DIALEXITY_GRAPH_DB_VENDOR", "memgraph"),
             graph_db_host=os.getenv("DIALEXITY_GRAPH_DB_HOST", "127.0.0.1"),
             graph_db_port=int(os.getenv("DIALEXITY_GRAPH_DB_PORT", 7687)),
@@ -135,6 +184,26 @@ class Settings(BaseModel):
             graph_db_password=os.getenv("DIALEXITY_GRAPH_DB_PASSWORD"),
             graph_db_encrypted=os.getenv("DIALEXITY_GRAPH_DB_ENCRYPTED", "false").lower() == "true",
             graph_db_client_name=os.getenv("DIALEXITY_GRAPH_DB_CLIENT_NAME", "dialectical_framework"),
+            graph_db_pool_size=int(os.getenv("DIALEXITY_GRAPH_DB_POOL_SIZE", 8)),
+            graph_db_pool_acquire_timeout=float(os.getenv("DIALEXITY_GRAPH_DB_POOL_ACQUIRE_TIMEOUT", 30.0)),
+            graph_db_pool_max_lifetime=float(os.getenv("DIALEXITY_GRAPH_DB_POOL_MAX_LIFETIME", 3600.0)),
             thinking_level=os.getenv("DIALEXITY_THINKING_LEVEL"),
             effect_log_dir=os.getenv("DIALEXITY_GRAPH_LOG_DIR"),
+            effect_log_queue_size=int(os.getenv("DIALEXITY_GRAPH_LOG_QUEUE_SIZE", 10000)),
+            effect_log_batch_size=int(os.getenv("DIALEXITY_GRAPH_LOG_BATCH_SIZE", 500)),
+            effect_log_flush_interval=float(os.getenv("DIALEXITY_GRAPH_LOG_FLUSH_INTERVAL", 1.0)),
+            effect_log_max_bytes=int(os.getenv("DIALEXITY_GRAPH_LOG_MAX_BYTES", 0)),
+            effect_log_max_age=float(os.getenv("DIALEXITY_GRAPH_LOG_MAX_AGE", 0.0)),
+            effect_log_compression=os.getenv("DIALEXITY_GRAPH_LOG_COMPRESSION") or None,
+            event_bus_flush_window=float(os.getenv("DIALEXITY_EVENT_BUS_FLUSH_WINDOW", 0.05)),
+            event_bus_queue_size=int(os.getenv("DIALEXITY_EVENT_BUS_QUEUE_SIZE", 1000)),
+            event_bus_overflow=os.getenv("DIALEXITY_EVENT_BUS_OVERFLOW", "drop_oldest"),
+            llm_cache_backend=os.getenv("DIALEXITY_LLM_CACHE_BACKEND") or None,
+            llm_cache_path=os.getenv("DIALEXITY_LLM_CACHE_PATH"),
+            llm_cache_ttl=float(os.environ["DIALEXITY_LLM_CACHE_TTL"]) if os.getenv("DIALEXITY_LLM_CACHE_TTL") else None,
+            llm_cache_max_entries=int(os.getenv("DIALEXITY_LLM_CACHE_MAX_ENTRIES", 10000)),
+            input_cache_max_bytes=int(os.getenv("DIALEXITY_INPUT_CACHE_MAX_BYTES", 64 * 1024 * 1024)),
+            input_resolve_concurrency=int(os.getenv("DIALEXITY_INPUT_RESOLVE_CONCURRENCY", 8)),
+            tool_concurrency=int(os.getenv("DIALEXITY_TOOL_CONCURRENCY", 4)),
+            single_pass_responses=os.getenv("DIALEXITY_SINGLE_PASS_RESPONSES", "false").lower() == "true",
         )
\ No newline at end of file
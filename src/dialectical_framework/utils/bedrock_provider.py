@@ -11,6 +11,8 @@ from mirascope.llm.providers.anthropic.provider import AnthropicProvider
 from mirascope.llm.responses import AsyncResponse, AsyncStreamResponse, Response
 from typing_extensions import Unpack
 
+from dialectical_framework.utils.prompt_cache import apply_cache_breakpoints
+
 if TYPE_CHECKING:
     from mirascope.llm.formatting import FormatSpec, FormattableT
     from mirascope.llm.messages import Message
@@ -31,6 +33,9 @@ class BedrockAnthropicProvider(AnthropicProvider):
 
     Bedrock does not support the beta structured output API (client.beta.messages.parse),
     so we override _call_async to always use the standard path.
+
+    Messages marked with prompt_cache.cache_breakpoint get Bedrock prompt-caching
+    breakpoints (the same `cache_control` blocks as the Anthropic API).
     """
 
     id = "bedrock"
@@ -60,6 +65,7 @@ class BedrockAnthropicProvider(AnthropicProvider):
             params=params,
         )
         kwargs["model"] = _bedrock_model_name(model_id)
+        apply_cache_breakpoints(messages, kwargs)
         anthropic_response = cast(
             AnthropicMessage, await self.async_client.messages.create(**kwargs)
         )
@@ -99,6 +105,7 @@ class BedrockAnthropicProvider(AnthropicProvider):
             params=params,
         )
         kwargs["model"] = _bedrock_model_name(model_id)
+        apply_cache_breakpoints(messages, kwargs)
         anthropic_stream = self.async_client.messages.stream(**kwargs)
         include_thoughts = _utils.get_include_thoughts(params)
         chunk_iterator = _utils.decode_async_stream(
@@ -133,6 +140,7 @@ class BedrockAnthropicProvider(AnthropicProvider):
             params=params,
         )
         kwargs["model"] = _bedrock_model_name(model_id)
+        apply_cache_breakpoints(messages, kwargs)
         anthropic_response = cast(
             AnthropicMessage, self.client.messages.create(**kwargs)
         )
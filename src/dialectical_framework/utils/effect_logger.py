@@ -3,53 +3,137 @@ EffectLogger: File-based JSONL logger for graph mutation effects.
 
 Writes one JSON object per line to: <log_dir>/<sid>/<agent_name>.jsonl
 
+Inside an event loop, log calls only serialize the record and append it to a
+bounded in-memory queue; a background task drains the queue in batches (on
+batch size or flush interval) and writes them off the loop thread, keeping
+one open handle per file. When the queue is full the record is dropped and
+counted — logging never blocks or fails the pipeline. Outside an event loop
+(scripts, sync tests) records are written immediately.
+
+Files rotate by size and/or age to <agent>.<timestamp>.jsonl, optionally
+compressed (gzip, or zstd with the `zstandard` package installed).
+
 Lifecycle:
     logger = EffectLogger(log_dir="/tmp/effects")
     ExecutionReport.set_effect_logger(logger)
     # ... effects are logged automatically ...
+    await logger.aclose()  # flush pending records, close files
     ExecutionReport.set_effect_logger(None)  # teardown
+
+GraphEventBus.disconnect() (the app's shutdown hook) awaits aclose() on the
+logger set on ExecutionReport, while its loop is still running. Records
+still queued at interpreter exit are flushed by an atexit hook.
 """
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import gzip
 import json
+import logging
+import shutil
 import threading
 import time
+import weakref
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
     from dialectical_framework.agents.execution_report import Effect
 
+logger = logging.getLogger(__name__)
+
+COMPRESSIONS = ("gzip", "zstd")
+
+# Open file handles kept between batches (least recently written closed first)
+_MAX_OPEN_FILES = 64
+
+_open_loggers: weakref.WeakSet[EffectLogger] = weakref.WeakSet()
+
+
+@dataclass
+class _OpenFile:
+    handle: IO[str]
+    size: int
+    opened_at: float
+
 
 class EffectLogger:
     """
-    Synchronous file-based effect logger.
+    Buffered, asynchronous file-based effect logger.
+
+    Thread-safe: records may be submitted from any thread; file writes are
+    serialized by one I/O lock. Creates directories lazily.
 
-    Thread-safe via a per-file lock dict. Creates directories lazily.
+    Counters (see stats()): written, dropped, rotations, and lag — the time a
+    record spent queued before it reached the file.
     """
 
-    def __init__(self, log_dir: str) -> None:
+    def __init__(
+        self,
+        log_dir: str,
+        *,
+        max_queue: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_bytes: int = 0,
+        max_age: float = 0.0,
+        compression: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            log_dir: Root directory of the logs
+            max_queue: Records buffered before new ones are dropped
+            batch_size: Queued records that trigger a write before the interval
+            flush_interval: Max seconds a record waits in the queue
+            max_bytes: Rotate a file before it would exceed this size. 0 = never.
+            max_age: Rotate a file this many seconds after it was opened. 0 = never.
+            compression: Compress rotated files: 'gzip', 'zstd' or None
+
+        Raises:
+            ValueError: Unknown compression, or 'zstd' without `zstandard`
+        """
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(
+                f"Unknown effect log compression {compression!r}; use one of {COMPRESSIONS}"
+            )
+        if compression == "zstd":
+            try:
+                import zstandard  # noqa: F401
+            except ImportError as e:
+                raise ValueError(
+                    "zstd effect log compression requires the 'zstandard' package"
+                ) from e
+
         self._log_dir = Path(log_dir).resolve()
-        self._locks: dict[Path, threading.Lock] = {}
-        self._global_lock = threading.Lock()
+        self._max_queue = max_queue
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval
+        self._max_bytes = max_bytes
+        self._max_age = max_age
+        self._compression = compression
 
-    def _get_lock(self, path: Path) -> threading.Lock:
-        with self._global_lock:
-            if path not in self._locks:
-                self._locks[path] = threading.Lock()
-            return self._locks[path]
+        # (path, line, enqueued_at); deque appends/pops are atomic across threads
+        self._queue: deque[tuple[Path, str, float]] = deque()
+        self._files: OrderedDict[Path, _OpenFile] = OrderedDict()
+        self._io_lock = threading.Lock()
 
-    def _resolve_path(self, sid: str, agent: str) -> Path:
-        return self._log_dir / sid / f"{agent}.jsonl"
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._writer: Optional[asyncio.Task[None]] = None
+        self._wake: Optional[asyncio.Event] = None
 
-    def _write_line(self, path: Path, record: dict[str, Any]) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        line = json.dumps(record, default=str) + "\n"
-        lock = self._get_lock(path)
-        with lock:
-            with open(path, "a") as f:
-                f.write(line)
+        self.written = 0
+        self.dropped = 0
+        self.rotations = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+        _open_loggers.add(self)
+
+    # --- Public API ---
 
     def log_effect(
         self,
@@ -105,3 +189,214 @@ class EffectLogger:
             "effect_count": effect_count,
         }
         self._write_line(path, record)
+
+    async def flush(self) -> None:
+        """Write every queued record now (off the event loop thread)."""
+        if self._queue:
+            await asyncio.to_thread(self._drain)
+
+    async def aclose(self) -> None:
+        """Flush queued records and close all files. The logger stays usable."""
+        writer = self._writer
+        if (
+            writer is not None
+            and not writer.done()
+            and self._wake is not None
+            and self._loop is asyncio.get_running_loop()
+        ):
+            self._wake.set()
+            await writer
+        await self.flush()
+        await asyncio.to_thread(self.close)
+
+    def close(self) -> None:
+        """Synchronously flush queued records and close all files."""
+        self._drain()
+        with self._io_lock:
+            for open_file in self._files.values():
+                open_file.handle.close()
+            self._files.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Writer health counters (JSON-friendly, lag in milliseconds)."""
+        return {
+            "queued": len(self._queue),
+            "written": self.written,
+            "dropped": self.dropped,
+            "rotations": self.rotations,
+            "lag_ms": round(self.last_lag * 1000, 2),
+            "max_lag_ms": round(self.max_lag * 1000, 2),
+        }
+
+    # --- Queueing ---
+
+    def _resolve_path(self, sid: str, agent: str) -> Path:
+        return self._log_dir / sid / f"{agent}.jsonl"
+
+    def _write_line(self, path: Path, record: dict[str, Any]) -> None:
+        # Serialized now: the record must reflect the effect as it was emitted
+        line = json.dumps(record, default=str) + "\n"
+        loop = self._writer_loop()
+        if loop is None:
+            self._queue.append((path, line, time.monotonic()))
+            self._drain()
+            return
+        if len(self._queue) >= self._max_queue:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(
+                    "Effect log queue full (%d records): %d records dropped so far",
+                    self._max_queue, self.dropped,
+                )
+            return
+        self._queue.append((path, line, time.monotonic()))
+        if len(self._queue) >= self._batch_size:
+            self._wake_writer(loop)
+
+    def _writer_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """
+        The loop whose writer task drains the queue, started on demand.
+        None means write synchronously: no running loop on this thread and
+        no live writer elsewhere.
+        """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        writer_alive = self._writer is not None and not self._writer.done()
+        if writer_alive and self._loop is not None and not self._loop.is_closed():
+            return self._loop
+        if running is None:
+            return None
+        self._loop = running
+        self._wake = asyncio.Event()
+        self._writer = running.create_task(self._run_writer())
+        return running
+
+    def _wake_writer(self, loop: asyncio.AbstractEventLoop) -> None:
+        wake = self._wake
+        if wake is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            wake.set()
+        else:
+            loop.call_soon_threadsafe(wake.set)
+
+    async def _run_writer(self) -> None:
+        """Drain the queue in batches; exits once idle (restarted on demand)."""
+        assert self._wake is not None
+        while self._queue:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await asyncio.to_thread(self._drain)
+            except Exception:
+                logger.exception("Effect log write failed")
+
+    # --- File I/O (any thread, under the I/O lock) ---
+
+    def _drain(self) -> None:
+        with self._io_lock:
+            batch: dict[Path, list[str]] = {}
+            oldest: Optional[float] = None
+            count = 0
+            while True:
+                try:
+                    path, line, enqueued_at = self._queue.popleft()
+                except IndexError:
+                    break
+                batch.setdefault(path, []).append(line)
+                oldest = enqueued_at if oldest is None else min(oldest, enqueued_at)
+                count += 1
+            if not count:
+                return
+            for path, lines in batch.items():
+                self._append(path, "".join(lines))
+            self.written += count
+            if oldest is not None:
+                self.last_lag = time.monotonic() - oldest
+                self.max_lag = max(self.max_lag, self.last_lag)
+
+    def _append(self, path: Path, data: str) -> None:
+        open_file = self._open(path)
+        size = len(data.encode())
+        if self._should_rotate(open_file, size):
+            self._rotate(path)
+            open_file = self._open(path)
+        open_file.handle.write(data)
+        open_file.handle.flush()
+        open_file.size += size
+
+    def _open(self, path: Path) -> _OpenFile:
+        open_file = self._files.get(path)
+        if open_file is not None:
+            self._files.move_to_end(path)
+            return open_file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(path, "a")
+        # Age counts from when this process (re)opened the file
+        open_file = self._files[path] = _OpenFile(handle, path.stat().st_size, time.time())
+        while len(self._files) > _MAX_OPEN_FILES:
+            _, evicted = self._files.popitem(last=False)
+            evicted.handle.close()
+        return open_file
+
+    def _should_rotate(self, open_file: _OpenFile, incoming: int) -> bool:
+        if not open_file.size:
+            return False
+        if self._max_bytes and open_file.size + incoming > self._max_bytes:
+            return True
+        return bool(self._max_age) and time.time() - open_file.opened_at >= self._max_age
+
+    def _rotate(self, path: Path) -> None:
+        open_file = self._files.pop(path)
+        open_file.handle.close()
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+        target = path.with_name(f"{path.stem}.{stamp}{path.suffix}")
+        n = 1
+        while target.exists() or _compressed_name(target, self._compression).exists():
+            target = path.with_name(f"{path.stem}.{stamp}-{n}{path.suffix}")
+            n += 1
+        path.rename(target)
+        if self._compression:
+            _compress(target, self._compression)
+        self.rotations += 1
+
+
+def _compressed_name(path: Path, compression: Optional[str]) -> Path:
+    if compression == "gzip":
+        return path.with_name(path.name + ".gz")
+    if compression == "zstd":
+        return path.with_name(path.name + ".zst")
+    return path
+
+
+def _compress(path: Path, compression: str) -> None:
+    """Compress a rotated file next to itself and remove the original."""
+    target = _compressed_name(path, compression)
+    if compression == "gzip":
+        with open(path, "rb") as src, gzip.open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+    else:
+        import zstandard
+
+        with open(path, "rb") as src, open(target, "wb") as dst:
+            zstandard.ZstdCompressor().copy_stream(src, dst)
+    path.unlink()
+
+
+@atexit.register
+def _close_open_loggers() -> None:
+    for effect_logger in list(_open_loggers):
+        try:
+            effect_logger.close()
+        except Exception:
+            logger.debug("Effect log close failed", exc_info=True)
@@ -36,12 +36,13 @@ async def input_context(
     if not inputs:
         return ""
 
+    # Inputs without a digest yet are resolved concurrently
+    undigested = [i for i in inputs if not i.digest]
+    resolved = dict(zip(map(id, undigested), await input_resolver.resolve_many(undigested)))
+
     parts = []
     for input_node in inputs:
-        if input_node.digest:
-            text = input_node.digest
-        else:
-            text = await input_resolver.resolve(input_node)
+        text = input_node.digest or resolved[id(input_node)]
 
         if not text:
             continue
@@ -0,0 +1,148 @@
+"""
+Lazy DI wiring: wire framework modules when they are imported, not up front.
+
+Eager wiring (walk the package, import every module, wire each) puts every
+concern, agent, tool and provider SDK on the critical path of process start.
+Lazy wiring instead:
+
+1. imports the graph model (node and relationship modules) — importing a
+   node class is what registers it with GQLAlchemy and the relationship
+   registry, so rows must never be hydrated before all of them are loaded,
+2. wires the framework modules already imported when the container is set up,
+3. installs a meta-path hook that wires every framework module imported
+   afterwards, right after its body executes.
+
+Modules are wired to the most recently registered container — the same
+"last wiring wins" rule as calling `container.wire()` again.
+
+    container = DialecticalReasoning.setup(settings)  # registers itself
+    ...
+    lazy_wiring.unregister(container)  # teardown (tests)
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.abc
+import logging
+import pkgutil
+import sys
+import threading
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+if TYPE_CHECKING:
+    from importlib.machinery import ModuleSpec
+
+    from dependency_injector.containers import Container
+
+logger = logging.getLogger(__name__)
+
+PACKAGE = "dialectical_framework"
+
+# Packages imported in full at registration (see module docstring)
+MODEL_PACKAGES = (
+    f"{PACKAGE}.graph.nodes",
+    f"{PACKAGE}.graph.relationships",
+)
+
+_lock = threading.RLock()
+_container: Optional[Container] = None
+_finder: Optional[_WiringFinder] = None
+
+
+def register(container: Container) -> None:
+    """Wire already-imported framework modules and wire later imports on load."""
+    global _container, _finder
+    with _lock:
+        _container = container
+        import_model_packages()
+        modules = [
+            module for name, module in list(sys.modules.items())
+            if _in_package(name) and isinstance(module, ModuleType)
+        ]
+        container.wire(modules=modules)
+        if _finder is None:
+            _finder = _WiringFinder()
+            sys.meta_path.insert(0, _finder)
+
+
+def import_model_packages() -> None:
+    """Import every node and relationship module (idempotent)."""
+    for package_name in MODEL_PACKAGES:
+        package = importlib.import_module(package_name)
+        for module in pkgutil.iter_modules(package.__path__, package_name + "."):
+            importlib.import_module(module.name)
+
+
+def unregister(container: Container) -> None:
+    """Stop wiring new imports to `container` (and remove the hook)."""
+    global _container, _finder
+    with _lock:
+        if _container is not container:
+            return
+        _container = None
+        if _finder is not None and _finder in sys.meta_path:
+            sys.meta_path.remove(_finder)
+        _finder = None
+
+
+def is_installed() -> bool:
+    return _finder is not None and _finder in sys.meta_path
+
+
+def _in_package(name: str) -> bool:
+    return name == PACKAGE or name.startswith(PACKAGE + ".")
+
+
+def _wire(module: ModuleType) -> None:
+    with _lock:
+        container = _container
+        if container is None:
+            return
+        try:
+            container.wire(modules=[module])
+        except Exception:
+            logger.exception("Wiring %s failed", module.__name__)
+
+
+class _WiringFinder(importlib.abc.MetaPathFinder):
+    """Finds framework modules through the rest of sys.meta_path, wraps their loader."""
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]],
+        target: Optional[ModuleType] = None,
+    ) -> Optional[ModuleSpec]:
+        if not _in_package(fullname):
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _WiringLoader(spec.loader)
+        return spec
+
+
+class _WiringLoader(importlib.abc.Loader):
+    """Delegating loader that wires the module once its body has run."""
+
+    def __init__(self, loader: Any) -> None:
+        self._loader = loader
+
+    def create_module(self, spec: ModuleSpec) -> Optional[ModuleType]:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._loader.exec_module(module)
+        _wire(module)
+
+    def __getattr__(self, name: str) -> Any:
+        # get_source, get_resource_reader, is_package, ... (inspect, importlib.resources)
+        return getattr(self._loader, name)
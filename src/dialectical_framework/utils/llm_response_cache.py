@@ -0,0 +1,150 @@
+"""
+LLM response cache backends and key derivation for use_brain.
+
+Two backends ship with the framework:
+- MemoryLlmCache: in-process LRU, lost on restart (tests, single runs)
+- SqliteLlmCache: on-disk, shared across runs (replaying a case, re-estimating
+  a layer after a normalization change)
+
+Both evict by TTL (on read) and by size (least recently used first).
+
+Enable via Settings (llm_cache_backend="memory" | "sqlite"), or override the
+`llm_cache` provider with any LlmResponseCache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from dialectical_framework.protocols.llm_response_cache import LlmResponseCache
+
+
+def llm_cache_key(
+    model: str,
+    messages: list[dict[str, Any]],
+    format_schema: Optional[dict[str, Any]],
+    params: dict[str, Any],
+) -> str:
+    """
+    sha256 over the canonical JSON of everything that determines a response.
+
+    Args:
+        model: Resolved model id
+        messages: Serialized prompt messages
+        format_schema: JSON schema of the structured output format
+        params: Remaining call params (temperature, thinking, ...)
+    """
+    payload = json.dumps(
+        {"model": model, "messages": messages, "format": format_schema, "params": params},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class MemoryLlmCache(LlmResponseCache):
+    """Thread-safe in-memory LRU with optional TTL."""
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None) -> None:
+        super().__init__()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl and time.time() - entry[0] > self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SqliteLlmCache(LlmResponseCache):
+    """
+    On-disk cache in a single SQLite file.
+
+    Entries record creation time (TTL) and last access (LRU eviction).
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000, ttl: Optional[float] = None) -> None:
+        super().__init__()
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS llm_cache_accessed ON llm_cache (accessed_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self.ttl and now - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            self._conn.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                "SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
@@ -0,0 +1,424 @@
+"""
+Adaptive, token-aware scheduler for LLM calls.
+
+Replaces the single process-wide semaphore. Every structured/tool call made
+through use_brain takes a slot from the scheduler, which enforces per-model:
+
+- a concurrency window, adapted AIMD-style: halved when the provider rate
+  limits us, grown by ~1 per window of successful calls (up to the ceiling)
+- requests-per-minute and tokens-per-minute budgets over a sliding 60s window
+  (token cost is estimated from the model's recent average, then corrected
+  with the real usage once the response arrives)
+- a shared cooldown after a rate limit, so every caller of that model pauses
+  instead of each one hammering the provider with its own backoff
+
+Waiters are served by priority class first (interactive chat ahead of
+background exploration), then fairly across sids within a class
+(start-time fair queuing: each sid gets its turn, so one tenant's wheel build
+cannot starve another tenant's chat turn).
+
+Configuration (environment, all optional; 0 = unbounded):
+    DIALEXITY_MAX_CONCURRENT_LLM_CALLS   concurrency ceiling per model
+    DIALEXITY_LLM_RPM                    requests per minute per model
+    DIALEXITY_LLM_TPM                    tokens per minute per model
+    DIALEXITY_LLM_BUDGETS                JSON per-model overrides, e.g.
+        {"bedrock/global.anthropic.claude-sonnet-4-5": {"rpm": 200, "tpm": 400000}}
+
+Priority is carried in a context variable:
+    with llm_priority(LLMPriority.BACKGROUND):
+        await explore_tr.resolve()
+
+    @with_llm_priority(LLMPriority.BACKGROUND)
+    async def run_deepen(...): ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import json
+import logging
+import math
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import wraps
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional, TypeVar
+
+from dialectical_framework.graph.scope_context import get_current_sid
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+_WINDOW = 60.0
+_DEFAULT_TOKEN_ESTIMATE = 2000
+_COOLDOWN_BASE = 5.0
+_COOLDOWN_MAX = 60.0
+
+
+class LLMPriority(IntEnum):
+    """Scheduling class; lower values are served first."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+_current_priority: contextvars.ContextVar[LLMPriority] = contextvars.ContextVar(
+    'llm_priority', default=LLMPriority.NORMAL
+)
+
+
+def get_current_priority() -> LLMPriority:
+    return _current_priority.get()
+
+
+@contextmanager
+def llm_priority(priority: LLMPriority) -> Iterator[None]:
+    """Run LLM calls made within the block (and tasks spawned from it) at `priority`."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def with_llm_priority(priority: LLMPriority) -> Callable[[F], F]:
+    """Decorator: run an async function's LLM calls at `priority`."""
+
+    def decorator(fn: F) -> F:
+        @wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with llm_priority(priority):
+                return await fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@dataclass(frozen=True)
+class ModelBudget:
+    """Per-model limits. 0 means unbounded."""
+
+    max_concurrent: int = 0
+    rpm: int = 0
+    tpm: int = 0
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    vtime: int
+    seq: int
+    sid: Optional[str] = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    tokens: int = field(compare=False)
+
+
+class LLMLease:
+    """A granted slot. Report the outcome so the scheduler can adapt."""
+
+    def __init__(self, state: _ModelState, entry: list) -> None:
+        self._state = state
+        self._entry = entry
+
+    def complete(self, tokens: Optional[int] = None) -> None:
+        """The call succeeded; `tokens` is the real usage (input + output), if known."""
+        if tokens is not None:
+            self._state.correct_tokens(self._entry, tokens)
+        self._state.on_success()
+
+    def rate_limited(self) -> None:
+        """The provider rejected the call for rate/throttling reasons."""
+        self._state.on_rate_limit()
+
+
+class _ModelState:
+    """Queue, sliding window and AIMD state for one model."""
+
+    def __init__(self, model: str, budget: ModelBudget) -> None:
+        self.model = model
+        self.budget = budget
+        self.ceiling = float(budget.max_concurrent) if budget.max_concurrent > 0 else math.inf
+        self.limit = self.ceiling
+        self.in_flight = 0
+        self.queue: list[_Waiter] = []
+        # Sliding window entries: [timestamp, tokens]
+        self.window: deque[list] = deque()
+        self.token_estimate = float(_DEFAULT_TOKEN_ESTIMATE)
+        self.cooldown_until = 0.0
+        self.cooldown = _COOLDOWN_BASE
+        # Start-time fair queuing across sids. A sid is forgotten once it has
+        # no queued or in-flight calls and the clock has caught up with it.
+        self.vclock = 0
+        self.sid_vtime: dict[Optional[str], int] = {}
+        self.sid_active: dict[Optional[str], int] = {}
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.timer_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # -- Admission --
+
+    def next_vtime(self, sid: Optional[str]) -> int:
+        vtime = max(self.vclock, self.sid_vtime.get(sid, 0))
+        self.sid_vtime[sid] = vtime + 1
+        self.sid_active[sid] = self.sid_active.get(sid, 0) + 1
+        return vtime
+
+    def withdraw(self, waiter: _Waiter) -> None:
+        """A queued call left unserved; its vtime is handed back if it was the sid's latest."""
+        if self.sid_vtime.get(waiter.sid) == waiter.vtime + 1:
+            self.sid_vtime[waiter.sid] = waiter.vtime
+        self.finish(waiter.sid)
+
+    def finish(self, sid: Optional[str]) -> None:
+        """One of the sid's calls finished or left the queue."""
+        active = self.sid_active.get(sid, 0) - 1
+        if active > 0:
+            self.sid_active[sid] = active
+            return
+        self.sid_active.pop(sid, None)
+        if self.sid_vtime.get(sid, 0) <= self.vclock:
+            self.sid_vtime.pop(sid, None)
+
+    def _forget_idle(self) -> None:
+        # An idle sid the clock has caught up with would restart at vclock
+        # anyway; forgetting it loses no fairness.
+        idle = [
+            sid for sid, vtime in self.sid_vtime.items()
+            if vtime <= self.vclock and sid not in self.sid_active
+        ]
+        for sid in idle:
+            del self.sid_vtime[sid]
+
+    def _prune(self, now: float) -> None:
+        while self.window and now - self.window[0][0] >= _WINDOW:
+            self.window.popleft()
+
+    def wait_time(self, tokens: int, now: float) -> float:
+        """Seconds until a call of `tokens` fits the budgets (0 = now)."""
+        if now < self.cooldown_until:
+            return self.cooldown_until - now
+        self._prune(now)
+        if not self.window:
+            return 0.0
+        oldest = self.window[0][0] + _WINDOW - now
+        if self.budget.rpm and len(self.window) >= self.budget.rpm:
+            return max(oldest, 0.0)
+        if self.budget.tpm:
+            used = sum(entry[1] for entry in self.window)
+            if used + tokens > self.budget.tpm:
+                return max(oldest, 0.0)
+        return 0.0
+
+    def admit(self, waiter: _Waiter, now: float) -> list:
+        self.in_flight += 1
+        # The clock moves to the admitted call's virtual finish time, so an
+        # idle sid's own next vtime is never ahead of it
+        if waiter.vtime + 1 > self.vclock:
+            self.vclock = waiter.vtime + 1
+            self._forget_idle()
+        entry = [now, waiter.tokens]
+        self.window.append(entry)
+        return entry
+
+    # -- Feedback --
+
+    def correct_tokens(self, entry: list, tokens: int) -> None:
+        entry[1] = tokens
+        self.token_estimate = 0.8 * self.token_estimate + 0.2 * tokens
+
+    def on_success(self) -> None:
+        self.cooldown = _COOLDOWN_BASE
+        if self.limit < self.ceiling:
+            self.limit = min(self.ceiling, self.limit + 1.0 / max(self.limit, 1.0))
+
+    def on_rate_limit(self) -> None:
+        # Multiplicative decrease from what was actually running, not from an
+        # unbounded ceiling, so the first 429 already produces a real window.
+        self.limit = max(1.0, min(self.limit, float(max(self.in_flight, 1))) / 2.0)
+        now = time.monotonic()
+        if now >= self.cooldown_until:
+            self.cooldown_until = now + self.cooldown
+            self.cooldown = min(self.cooldown * 2.0, _COOLDOWN_MAX)
+        logging.getLogger(__name__).warning(
+            "Rate limit on %s: concurrency window -> %.1f, pausing %.0fs",
+            self.model, self.limit, self.cooldown_until - now,
+        )
+
+
+class LLMScheduler:
+    """
+    Schedules LLM calls per model by priority, fairness across sids, and
+    rate/token budgets, adapting concurrency to provider rate limits.
+    """
+
+    def __init__(
+        self,
+        default_budget: Optional[ModelBudget] = None,
+        budgets: Optional[dict[str, ModelBudget]] = None,
+    ) -> None:
+        self.default_budget = default_budget or ModelBudget()
+        self.budgets = dict(budgets or {})
+        self._models: dict[str, _ModelState] = {}
+        self._seq = itertools.count()
+
+    @classmethod
+    def from_env(cls) -> LLMScheduler:
+        def _int(name: str) -> int:
+            try:
+                return max(0, int(os.environ.get(name, "0")))
+            except ValueError:
+                return 0
+
+        default = ModelBudget(
+            max_concurrent=_int("DIALEXITY_MAX_CONCURRENT_LLM_CALLS"),
+            rpm=_int("DIALEXITY_LLM_RPM"),
+            tpm=_int("DIALEXITY_LLM_TPM"),
+        )
+        budgets: dict[str, ModelBudget] = {}
+        raw = os.environ.get("DIALEXITY_LLM_BUDGETS")
+        if raw:
+            try:
+                for model, spec in json.loads(raw).items():
+                    budgets[model] = ModelBudget(
+                        max_concurrent=int(spec.get("max_concurrent", default.max_concurrent)),
+                        rpm=int(spec.get("rpm", default.rpm)),
+                        tpm=int(spec.get("tpm", default.tpm)),
+                    )
+            except (ValueError, AttributeError, TypeError) as e:
+                logging.getLogger(__name__).warning("Ignoring invalid DIALEXITY_LLM_BUDGETS: %s", e)
+        return cls(default, budgets)
+
+    def set_budget(self, model: str, budget: ModelBudget) -> None:
+        """Set (or replace) a model's budget; resets its adaptive state."""
+        self.budgets[model] = budget
+        self._models.pop(model, None)
+
+    def _state(self, model: str) -> _ModelState:
+        state = self._models.get(model)
+        if state is None:
+            state = _ModelState(model, self.budgets.get(model, self.default_budget))
+            self._models[model] = state
+        return state
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        model: str,
+        priority: Optional[LLMPriority] = None,
+        sid: Optional[str] = None,
+    ) -> AsyncIterator[LLMLease]:
+        """
+        Wait for a slot for one call to `model`.
+
+        Priority and sid default to the current context (llm_priority(),
+        scope()).
+        """
+        state = self._state(model)
+        if priority is None:
+            priority = get_current_priority()
+        if sid is None:
+            sid = get_current_sid()
+
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(
+            priority=int(priority),
+            vtime=state.next_vtime(sid),
+            seq=next(self._seq),
+            sid=sid,
+            future=loop.create_future(),
+            tokens=int(state.token_estimate),
+        )
+        heapq.heappush(state.queue, waiter)
+        self._pump(state)
+        try:
+            entry = await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted just as we were cancelled: hand the slot back.
+                self._release(state, sid)
+            else:
+                state.withdraw(waiter)
+            raise
+        try:
+            yield LLMLease(state, entry)
+        finally:
+            self._release(state, sid)
+
+    def _release(self, state: _ModelState, sid: Optional[str]) -> None:
+        state.in_flight -= 1
+        state.finish(sid)
+        self._pump(state)
+
+    def _pump(self, state: _ModelState) -> None:
+        """Grant queued waiters while the window and budgets allow."""
+        now = time.monotonic()
+        while state.queue:
+            head = state.queue[0]
+            if head.future.done():
+                # Cancelled while queued (slot() already accounted for it)
+                heapq.heappop(state.queue)
+                continue
+            if head.future.get_loop().is_closed():
+                # Orphaned by a closed event loop: slot() never resumes
+                heapq.heappop(state.queue)
+                state.withdraw(head)
+                continue
+            if state.limit != math.inf and state.in_flight >= max(1, int(state.limit)):
+                return
+            delay = state.wait_time(head.tokens, now)
+            if delay > 0:
+                self._wake_later(state, delay)
+                return
+            heapq.heappop(state.queue)
+            head.future.set_result(state.admit(head, now))
+
+    def _wake_later(self, state: _ModelState, delay: float) -> None:
+        loop = asyncio.get_running_loop()
+        if state.timer is not None and state.timer_loop is loop and not state.timer.cancelled():
+            return
+
+        def _wake() -> None:
+            state.timer = None
+            self._pump(state)
+
+        state.timer = loop.call_later(delay, _wake)
+        state.timer_loop = loop
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Current per-model state, for diagnostics and tracing."""
+        now = time.monotonic()
+        result: dict[str, dict[str, float]] = {}
+        for model, state in self._models.items():
+            state._prune(now)
+            result[model] = {
+                "in_flight": state.in_flight,
+                "limit": state.limit,
+                "queued": sum(1 for w in state.queue if not w.future.done()),
+                "requests_last_minute": len(state.window),
+                "tokens_last_minute": sum(entry[1] for entry in state.window),
+                "cooldown_remaining": max(0.0, state.cooldown_until - now),
+            }
+        return result
+
+
+_scheduler: Optional[LLMScheduler] = None
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """Process-wide scheduler, configured from the environment on first use."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = LLMScheduler.from_env()
+    return _scheduler
+
+
+def set_llm_scheduler(scheduler: Optional[LLMScheduler]) -> None:
+    """Install a custom scheduler (None = rebuild from the environment on next use)."""
+    global _scheduler
+    _scheduler = scheduler
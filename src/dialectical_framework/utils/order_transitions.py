@@ -4,13 +4,30 @@ Utility functions for ordering transitions in cycles.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import Callable, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from dialectical_framework.graph.nodes.statement import Statement
     from dialectical_framework.graph.nodes.transition import Transition
 
+    EndpointLookup = Callable[[Transition], Optional[Statement]]
 
-def order_transitions(transitions: list[Transition]) -> list[Transition]:
+
+def _source_via_graph(trans: Transition) -> Optional[Statement]:
+    result = trans.source.get()
+    return result[0] if result else None
+
+
+def _target_via_graph(trans: Transition) -> Optional[Statement]:
+    result = trans.target.get()
+    return result[0] if result else None
+
+
+def order_transitions(
+    transitions: list[Transition],
+    source_of: Optional[EndpointLookup] = None,
+    target_of: Optional[EndpointLookup] = None,
+) -> list[Transition]:
     """
     Order transitions by following the source→target chain.
 
@@ -24,6 +41,10 @@ def order_transitions(transitions: list[Transition]) -> list[Transition]:
 
     Args:
         transitions: List of Transition nodes to order
+        source_of: Optional lookup for a transition's source Statement
+            (e.g. from a prefetched subgraph); defaults to a graph query
+        target_of: Optional lookup for a transition's target Statement;
+            defaults to a graph query
 
     Returns:
         List of Transition nodes in order, or empty list if no transitions
@@ -34,12 +55,14 @@ def order_transitions(transitions: list[Transition]) -> list[Transition]:
     if not transitions:
         return []
 
+    source_of = source_of or _source_via_graph
+    target_of = target_of or _target_via_graph
+
     # Build map: source_id -> transition
     source_map = {}
     for trans in transitions:
-        source_result = trans.source.get()
-        if source_result:
-            source_comp, _ = source_result
+        source_comp = source_of(trans)
+        if source_comp is not None:
             source_map[source_comp._id] = trans
 
     # Start with first transition
@@ -49,16 +72,15 @@ def order_transitions(transitions: list[Transition]) -> list[Transition]:
     # Follow chain: current target → find transition with that source
     while len(ordered) < len(transitions):
         current_trans = ordered[-1]
-        target_result = current_trans.target.get()
+        target_comp = target_of(current_trans)
 
-        if not target_result:
+        if target_comp is None:
             # Can't continue chain, add remaining in original order
             for trans in transitions:
                 if trans._id not in used_ids:
                     ordered.append(trans)
             break
 
-        target_comp, _ = target_result
         next_trans = source_map.get(target_comp._id)
 
         if next_trans and next_trans._id not in used_ids:
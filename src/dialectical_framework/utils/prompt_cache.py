@@ -0,0 +1,234 @@
+"""
+Provider prompt-prefix caching: mark stable prompt prefixes, account cache usage.
+
+Most input tokens of a long Advisor conversation or a layer-wide estimation
+fan-out are identical across calls: the app preamble and engine prompt, the
+source text, the shared statement context, the conversation history up to a
+fan-out point. Prompt builders lay those out first and mark where the stable
+part ends:
+
+    tpl = [llm.messages.user(source_text), cache_breakpoint(llm.messages.assistant(...))]
+    system = cache_breakpoint(llm.messages.system(prompt), at=len(stable_prefix))
+
+Markers are plain attributes on the message objects, so providers that do not
+support caching ignore them. Providers that do (BedrockAnthropicProvider)
+call apply_cache_breakpoints() on the encoded request, which adds Anthropic
+`cache_control` blocks within the provider's limit of MAX_BREAKPOINTS per
+request (mirascope already marks the system prompt, the last tool and, in
+multi-turn conversations, the last message).
+
+Cache read/write tokens of every use_brain call are recorded into each
+PromptCacheUsage active in the context. Trackers are opened around every
+ReasonableConcern.resolve() (published as `report.artifacts["prompt_cache"]`
+and on the Langfuse span) and every agent_scope. Ad-hoc use:
+
+    with track_prompt_cache() as usage:
+        await CausalityEstimation().resolve(...)
+    usage.summary()
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Anthropic rejects requests with more cache_control blocks than this
+MAX_BREAKPOINTS = 4
+
+_MARKER = "_dialexity_cache_breakpoint"
+_EPHEMERAL = {"type": "ephemeral"}
+
+_active_trackers: contextvars.ContextVar[tuple[PromptCacheUsage, ...]] = contextvars.ContextVar(
+    'active_prompt_cache_trackers', default=()
+)
+
+
+def cache_breakpoint(message: Any, at: Optional[int] = None) -> Any:
+    """
+    Mark the end of `message` as the end of a stable, cacheable prefix.
+
+    Args:
+        message: A mirascope message (returned for inline use in prompt lists)
+        at: System messages only — additionally cache the first `at`
+            characters on their own (e.g. preamble + engine prompt ahead of a
+            per-case context dump), so that prefix is shared across cases
+
+    Returns:
+        The same message
+    """
+    setattr(message, _MARKER, at if at is not None else True)
+    return message
+
+
+def is_cache_breakpoint(message: Any) -> bool:
+    return getattr(message, _MARKER, None) is not None
+
+
+def apply_cache_breakpoints(messages: Sequence[Any], kwargs: dict[str, Any]) -> int:
+    """
+    Add `cache_control` to the encoded request for every marked message.
+
+    Newest breakpoints win when the request would exceed MAX_BREAKPOINTS:
+    a later prefix contains every earlier one. A system prefix split (`at`)
+    is applied last, only if room remains. Encoded blocks are copied, never
+    mutated — mirascope may hand back stored raw assistant messages.
+
+    Args:
+        messages: The mirascope messages the request was encoded from
+        kwargs: Anthropic `messages.create` kwargs from encode_request
+
+    Returns:
+        Number of breakpoints added
+    """
+    encoded = kwargs.get("messages")
+    if not isinstance(encoded, list):
+        return 0
+    conversation = [m for m in messages if getattr(m, "role", None) != "system"]
+    if len(conversation) != len(encoded):
+        return 0  # Encoding reshaped the conversation; positions are unknown
+
+    used = _count_breakpoints(kwargs)
+    added = 0
+    for index in range(len(conversation) - 1, -1, -1):
+        if used >= MAX_BREAKPOINTS:
+            break
+        if not is_cache_breakpoint(conversation[index]):
+            continue
+        marked = _mark_last_block(encoded[index])
+        if marked is not None:
+            encoded[index] = marked
+            used += 1
+            added += 1
+
+    system_message = next(
+        (m for m in messages if getattr(m, "role", None) == "system"), None
+    )
+    at = getattr(system_message, _MARKER, None)
+    if isinstance(at, int) and not isinstance(at, bool) and used < MAX_BREAKPOINTS:
+        split = _split_system(kwargs.get("system"), at)
+        if split is not None:
+            kwargs["system"] = split
+            added += 1
+    return added
+
+
+def _count_breakpoints(kwargs: dict[str, Any]) -> int:
+    blocks: list[Any] = []
+    if isinstance(kwargs.get("system"), list):
+        blocks.extend(kwargs["system"])
+    blocks.extend(kwargs.get("tools") or [])
+    for message in kwargs.get("messages") or []:
+        content = message.get("content") if isinstance(message, dict) else None
+        if isinstance(content, list):
+            blocks.extend(content)
+    return sum(1 for b in blocks if isinstance(b, dict) and b.get("cache_control"))
+
+
+def _mark_last_block(message: Any) -> Optional[dict[str, Any]]:
+    """Copy of an encoded message with cache_control on its last cacheable block."""
+    if not isinstance(message, dict):
+        return None
+    content = message.get("content")
+    if isinstance(content, str):
+        if not content:
+            return None
+        return {
+            **message,
+            "content": [{"type": "text", "text": content, "cache_control": _EPHEMERAL}],
+        }
+    if not isinstance(content, list):
+        return None
+    for i in range(len(content) - 1, -1, -1):
+        block = content[i]
+        # Thinking blocks cannot carry cache_control
+        if not isinstance(block, dict) or block.get("type") in ("thinking", "redacted_thinking"):
+            continue
+        if block.get("cache_control"):
+            return None  # Already a breakpoint (e.g. mirascope's last-message one)
+        blocks = list(content)
+        blocks[i] = {**block, "cache_control": _EPHEMERAL}
+        return {**message, "content": blocks}
+    return None
+
+
+def _split_system(system: Any, at: int) -> Optional[list[dict[str, Any]]]:
+    """Split a single-block system prompt into cached prefix + remainder."""
+    if not isinstance(system, list) or len(system) != 1:
+        return None
+    block = system[0]
+    text = block.get("text") if isinstance(block, dict) else None
+    if not isinstance(text, str) or not 0 < at < len(text):
+        return None
+    return [
+        {"type": "text", "text": text[:at], "cache_control": _EPHEMERAL},
+        {**block, "text": text[at:]},
+    ]
+
+
+class PromptCacheUsage:
+    """
+    Prompt-cache accounting for one scope (a tool call, an agent turn, a test block).
+
+    `input_tokens` is the full prompt size, cached tokens included.
+    """
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        self.name = name
+        self.calls = 0
+        self.input_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_write_tokens = 0
+        self._lock = threading.Lock()
+
+    def record(self, usage: Any) -> None:
+        with self._lock:
+            self.calls += 1
+            self.input_tokens += _tokens(usage, "input_tokens")
+            self.cache_read_tokens += _tokens(usage, "cache_read_tokens")
+            self.cache_write_tokens += _tokens(usage, "cache_write_tokens")
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of input tokens served from the cache."""
+        return self.cache_read_tokens / self.input_tokens if self.input_tokens else 0.0
+
+    def summary(self) -> dict[str, Any]:
+        """Compact, JSON-friendly summary."""
+        return {
+            "calls": self.calls,
+            "input_tokens": self.input_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
+            "hit_rate": round(self.hit_rate, 3),
+        }
+
+
+@contextmanager
+def track_prompt_cache(name: Optional[str] = None) -> Iterator[PromptCacheUsage]:
+    """Record the prompt-cache usage of every LLM call inside the block (nests)."""
+    usage = PromptCacheUsage(name)
+    token = _active_trackers.set(_active_trackers.get() + (usage,))
+    try:
+        yield usage
+    finally:
+        _active_trackers.reset(token)
+
+
+def record_prompt_cache(usage: Any) -> None:
+    """Record one call's usage (mirascope Usage) into every active tracker."""
+    if usage is None:
+        return
+    for tracker in _active_trackers.get():
+        tracker.record(usage)
+
+
+def _tokens(usage: Any, field: str) -> int:
+    try:
+        return int(getattr(usage, field, 0) or 0)
+    except (TypeError, ValueError):
+        return 0
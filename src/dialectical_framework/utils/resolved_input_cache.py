@@ -0,0 +1,116 @@
+"""
+In-process cache of resolved Input content, keyed by the Input content hash.
+
+Every concern that needs source text (each causality estimator call of a
+layer, every skill's input context) resolves the same Inputs: decoding the
+same base64 `data:` payloads and looking up the same `dx://` nodes again.
+Input identity is its content (sha256), so a resolution never goes stale.
+
+Entries are evicted least recently used first once their total size exceeds
+`max_bytes`; text and native parts (base64 Image/Document) are cached
+separately, as their sizes differ. Concurrent misses for the same key share
+one resolution.
+
+    cache = ResolvedInputCache(max_bytes=64 * 1024 * 1024)
+    text = await cache.get_or_resolve(("text", input_node.hash), resolve)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+
+class ResolvedInputCache:
+    """Thread-safe size-bounded LRU with single-flight resolution."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        size = content_size(value)
+        if size > self.max_bytes:
+            return  # Would evict everything else and still not fit
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous[1]
+            self._entries[key] = (value, size)
+            self.size += size
+            while self.size > self.max_bytes and self._entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.size -= evicted
+
+    async def get_or_resolve(
+        self, key: Hashable, resolve: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Cached value, or the result of `resolve()` (shared by concurrent callers)."""
+        value = self.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight.get_loop() is asyncio.get_running_loop():
+            self.hits += 1
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await resolve()
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Waiters re-raise it; nobody else needs to see it
+            raise
+        else:
+            future.set_result(value)
+            self.set(key, value)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def content_size(value: Any) -> int:
+    """Approximate in-memory size of resolved content: text, parts, or lists of them."""
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, list):
+        return sum(content_size(v) for v in value)
+    source = getattr(value, "source", None)
+    data = getattr(source, "data", None)
+    if isinstance(data, (str, bytes)):
+        return len(data)
+    return sys.getsizeof(value)
@@ -3,12 +3,21 @@ Utility functions for generating statement sequences.
 
 These functions produce ordered arrangements of Statements for
 cycle generation in the causality sequencing pipeline.
+
+Wheel arrangements are enumerated lazily: iter_compatible_sequences yields
+one arrangement at a time, and ArrangementEnumerator wraps each in its
+canonical (rotation-invariant) form, drops duplicates, applies a pluggable
+prefilter and a per-cycle cap. Each Arrangement carries the signature of its
+opposite direction, so twins pair up by hash lookup as they are generated.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from itertools import permutations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
+
+from dialectical_framework.graph.rotation_keys import rotation_signature
 
 if TYPE_CHECKING:
     from dialectical_framework.graph.nodes.statement import Statement
@@ -56,6 +65,27 @@ def generate_compatible_sequences(
     """
     Generate circular arrangements with diagonal symmetry for thesis/antithesis pairs.
 
+    Eager form of iter_compatible_sequences (see there for the constraints).
+
+    Args:
+        ordered_perspectives: Perspectives in desired priority order. Each must have
+            both T and A components connected.
+
+    Returns:
+        List of valid arrangements.
+
+    Raises:
+        ValueError: If any Perspective is missing its T or A component.
+    """
+    return list(iter_compatible_sequences(ordered_perspectives))
+
+
+def iter_compatible_sequences(
+    ordered_perspectives: list[Perspective],
+) -> Iterator[list[Statement]]:
+    """
+    Lazily generate circular arrangements with diagonal symmetry for thesis/antithesis pairs.
+
     Each Perspective contains a thesis (T) and antithesis (A). This function arranges
     all T/A components around a conceptual circle of size 2n (where n = number of units)
     such that:
@@ -73,13 +103,14 @@ def generate_compatible_sequences(
         ordered_perspectives: Perspectives in desired priority order. Each must have
             both T and A components connected.
 
-    Returns:
-        List of valid arrangements. Each arrangement is a list of 2n components where
-        positions 0 to n-1 form the "top half" and positions n to 2n-1 form the "bottom
-        half" (diagonally mirrored).
+    Yields:
+        Valid arrangements, one at a time. Each is a list of 2n components where
+        positions 0 to n-1 form the "top half" and positions n to 2n-1 form the
+        "bottom half" (diagonally mirrored).
 
     Raises:
-        ValueError: If any Perspective is missing its T or A component.
+        ValueError: If any Perspective is missing its T or A component (raised
+            on first iteration).
 
     Example:
         For units [PP1(T1/A1), PP2(T2/A2), PP3(T3/A3), PP4(T4/A4)], a valid output:
@@ -92,8 +123,8 @@ def generate_compatible_sequences(
         Here T1↔A1, T2↔A2, T3↔A3, T4↔A4 are all diagonal pairs.
 
     Note:
-        The number of valid arrangements grows combinatorially. For practical use,
-        this function is designed for small unit counts (2-4 units).
+        The number of valid arrangements grows combinatorially. Consume lazily
+        (ArrangementEnumerator) to stop early instead of materializing them all.
     """
     n = len(ordered_perspectives)
 
@@ -117,9 +148,7 @@ def generate_compatible_sequences(
 
     size = 2 * n
 
-    results: list[list[Statement]] = []
-
-    def backtrack(t_positions: list[int], next_t_idx: int) -> None:
+    def backtrack(t_positions: list[int], next_t_idx: int) -> Iterator[list[Statement]]:
         """Recursively place theses while respecting constraints."""
         if next_t_idx == n:
             # All theses placed - build the complete arrangement
@@ -129,7 +158,7 @@ def generate_compatible_sequences(
                 diag = (pos + n) % size
                 arrangement[diag] = as_[t_idx]
             # Type narrowing: we know all positions are filled
-            results.append([c for c in arrangement if c is not None])
+            yield [c for c in arrangement if c is not None]
             return
 
         # Try placing next thesis at each valid position after the previous thesis
@@ -151,8 +180,93 @@ def generate_compatible_sequences(
                 continue
 
             # Place next T at pos, corresponding A at diag
-            backtrack(t_positions + [pos], next_t_idx + 1)
+            yield from backtrack(t_positions + [pos], next_t_idx + 1)
 
     # T1 fixed at position 0, start recursion for remaining theses
-    backtrack([0], 1)
-    return results
+    yield from backtrack([0], 1)
+
+
+@dataclass(frozen=True)
+class Arrangement:
+    """
+    One wheel arrangement in canonical form.
+
+    Fields:
+        components: Statements in circular order.
+        signature: Rotation-invariant signature (= Wheel.rotation_signature).
+        reverse_signature: Signature of the opposite direction (the sequence
+            reversed); equals `signature` when the circle is its own reverse.
+    """
+
+    components: tuple[Statement, ...]
+    signature: str
+    reverse_signature: str
+
+    @classmethod
+    def of(cls, components: list[Statement]) -> Arrangement:
+        hashes = [c.hash for c in components]
+        return cls(
+            components=tuple(components),
+            signature=rotation_signature(hashes),
+            reverse_signature=rotation_signature(hashes[::-1]),
+        )
+
+    @property
+    def is_self_reverse(self) -> bool:
+        return self.signature == self.reverse_signature
+
+
+# Decides whether an arrangement is worth persisting (False = pruned)
+ArrangementFilter = Callable[[Arrangement], bool]
+
+
+class ArrangementEnumerator:
+    """
+    Lazy, deduplicated wheel arrangement stream for one layer.
+
+    Arrangements whose signature was already yielded (by this enumerator)
+    are skipped — a guard, since fixing T1 at position 0 already removes
+    rotations. A prefilter may prune uninteresting arrangements before
+    anything is persisted, and `max_per_cycle` caps how many one cycle
+    ordering yields (enumeration stops there).
+
+    Usage:
+        enumerator = ArrangementEnumerator(prefilter=..., max_per_cycle=6)
+        for arrangement in enumerator.arrangements(cycle.perspectives):
+            wheel = wheels_by_signature.get(arrangement.signature)
+            twin = wheels_by_signature.get(arrangement.reverse_signature)
+    """
+
+    def __init__(
+        self,
+        prefilter: Optional[ArrangementFilter] = None,
+        max_per_cycle: int = 0,
+    ) -> None:
+        self._prefilter = prefilter
+        self._max_per_cycle = max_per_cycle
+        self._seen: set[str] = set()
+        # Arrangements dropped by the prefilter / cycle orderings cut by the cap
+        self.pruned = 0
+        self.capped = 0
+
+    def arrangements(self, ordered_perspectives: list[Perspective]) -> Iterator[Arrangement]:
+        """
+        Yield the new canonical arrangements of one cycle ordering.
+
+        Raises:
+            ValueError: If any Perspective is missing its T or A component
+        """
+        yielded = 0
+        for components in iter_compatible_sequences(ordered_perspectives):
+            if self._max_per_cycle and yielded >= self._max_per_cycle:
+                self.capped += 1
+                break
+            arrangement = Arrangement.of(components)
+            if arrangement.signature in self._seen:
+                continue
+            if self._prefilter is not None and not self._prefilter(arrangement):
+                self.pruned += 1
+                continue
+            self._seen.add(arrangement.signature)
+            yielded += 1
+            yield arrangement
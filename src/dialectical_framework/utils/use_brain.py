@@ -11,9 +11,12 @@ from mirascope import llm
 from mirascope.llm.exceptions import ParseError
 
 from dialectical_framework.enums.di import DI
+from dialectical_framework.protocols.llm_response_cache import LlmResponseCache
 from dialectical_framework.settings import Settings
 from dialectical_framework.utils.bedrock_provider import ensure_bedrock_provider
-from dialectical_framework.utils.concurrency import llm_concurrency_slot
+from dialectical_framework.utils.llm_response_cache import llm_cache_key
+from dialectical_framework.utils.llm_scheduler import get_llm_scheduler
+from dialectical_framework.utils.prompt_cache import record_prompt_cache
 
 if TYPE_CHECKING:
     from mirascope.llm.calls import AsyncCall
@@ -32,6 +35,7 @@ def use_brain(
     tools: Optional[list[Any]] = ...,
     thinking: Optional[str | dict[str, Any]] = ...,
     raw_call: bool = ...,
+    cache: bool = ...,
     **llm_call_kwargs: Any,
 ) -> Callable[[F], Callable[..., Awaitable[T]]]: ...
 
@@ -68,17 +72,25 @@ def use_brain(
     tools: Optional[list[Any]] = None,
     thinking: Optional[str | dict[str, Any]] = None,
     raw_call: bool = False,
+    cache: bool = True,
     **llm_call_kwargs: Any,
 ) -> Callable[[F], Callable[..., Any]]:
     """
     Decorator factory for Mirascope v2 LLM calls.
 
     Retries on ParseError (validation failures) with exponential backoff.
-    Automatically traces all LLM calls via Langfuse when configured.
+    Automatically traces all LLM calls via Langfuse when configured, with
+    provider prompt-cache read/write tokens in the usage details; the same
+    counts go to the active prompt_cache trackers (ExecutionReport artifacts).
 
     When ``format`` is provided, returns the parsed model instance.
     Otherwise returns the raw AsyncResponse (useful for tool calls).
 
+    Structured calls (``format`` set, no tools) go through the LLM response
+    cache when one is configured (``llm_cache`` provider): identical model,
+    prompt, format schema and params return the cached parse without a
+    provider call.
+
     Args:
         ai_model: Model ID (e.g., 'bedrock/anthropic/claude-...'). Reads from DI if not provided.
         retry_max: Maximum attempts (default: 10). Set to 1 to disable retries.
@@ -87,6 +99,8 @@ def use_brain(
         thinking: Extended thinking level string ("medium", "high", etc.)
             or a dict ({"level": "high", ...}). include_thoughts=True is added automatically.
         raw_call: If True, returns AsyncCall for caller to .stream() or await.
+        cache: Set False to always call the provider (e.g. sampling diversity
+            across identical prompts). Only structured calls are ever cached.
         **llm_call_kwargs: Additional kwargs for @llm.call (temperature, max_tokens, etc.)
     """
 
@@ -121,8 +135,39 @@ def use_brain(
             has_format = "format" in call_params
             format_name = call_params["format"].__name__ if has_format else None
 
+            # Content-addressed cache for structured calls: the prompt is built
+            # once up front so it can be hashed, then reused for the LLM call.
+            llm_cache = _get_llm_cache() if cache and not raw_call else None
+            cache_key: Optional[str] = None
+            prompt: Any = None
+            if (
+                llm_cache is not None
+                and has_format
+                and tools is None
+                and hasattr(format, "model_json_schema")
+            ):
+                prompt = await method(*args, **kwargs)
+                cache_key = llm_cache_key(
+                    model=resolved,
+                    messages=_serialize_prompt(prompt),
+                    format_schema=format.model_json_schema(),
+                    params={k: v for k, v in call_params.items() if k != "format"},
+                )
+                cached = llm_cache.get(cache_key)
+                if cached is not None:
+                    _trace_cache_hit(
+                        model=resolved,
+                        format_name=format_name,
+                        caller=method.__qualname__,
+                        cached=cached,
+                        llm_cache=llm_cache,
+                    )
+                    return format.model_validate_json(cached)
+
             @llm.call(resolved, **call_params)
             async def _llm_call() -> Any:
+                if cache_key is not None:
+                    return prompt
                 return await method(*args, **kwargs)
 
             # raw_call mode: return the AsyncCall for caller to .stream() or await.
@@ -136,22 +181,33 @@ def use_brain(
 
             attempts = max(1, retry_max)
             parse_delay = 10.0
-            rate_delay = 10.0
             last_error: Exception | None = None
+            scheduler = get_llm_scheduler()
 
             for attempt in range(attempts):
                 try:
-                    async with llm_concurrency_slot():
-                        response = await _llm_call()
+                    async with scheduler.slot(resolved) as lease:
+                        try:
+                            response = await _llm_call()
+                        except Exception as e:
+                            if _is_rate_limit_error(e):
+                                lease.rate_limited()
+                            raise
+                        lease.complete(_response_tokens(response))
+                    record_prompt_cache(getattr(response, "usage", None))
                     _trace_generation(
                         response=response,
                         model=resolved,
                         format_name=format_name,
                         caller=method.__qualname__,
                         attempt=attempt + 1,
+                        llm_cache=llm_cache if cache_key is not None else None,
                     )
                     if has_format:
-                        return response.parse()
+                        parsed = response.parse()
+                        if cache_key is not None:
+                            llm_cache.set(cache_key, parsed.model_dump_json())
+                        return parsed
                     return response
                 except ParseError as e:
                     last_error = e
@@ -160,14 +216,13 @@ def use_brain(
                         parse_delay = min(parse_delay * 2.0, 120.0)
                 except Exception as e:
                     if _is_rate_limit_error(e):
+                        # No local sleep: the scheduler already shrank the
+                        # model's window and paused it; the retry re-queues.
                         last_error = e
                         logging.getLogger(__name__).warning(
-                            "Rate limit hit (attempt %d/%d), backing off %.0fs: %s",
-                            attempt + 1, attempts, rate_delay, e,
+                            "Rate limit hit (attempt %d/%d), re-queueing: %s",
+                            attempt + 1, attempts, e,
                         )
-                        if attempt < attempts - 1:
-                            await asyncio.sleep(rate_delay)
-                            rate_delay = min(rate_delay * 2.0, 60.0)
                     else:
                         raise
 
@@ -184,6 +239,7 @@ def _trace_generation(
     format_name: Optional[str],
     caller: str,
     attempt: int,
+    llm_cache: Optional[LlmResponseCache] = None,
 ) -> None:
     """Report a completed LLM generation to Langfuse (if active)."""
     try:
@@ -206,6 +262,8 @@ def _trace_generation(
         metadata: dict[str, Any] = {"caller": caller, "attempt": attempt}
         if format_name:
             metadata["format"] = format_name
+        if llm_cache is not None:
+            metadata.update(_cache_metadata("miss", llm_cache))
 
         lf.update_current_generation(
             model=model,
@@ -218,6 +276,45 @@ def _trace_generation(
         logging.getLogger(__name__).debug("Langfuse trace failed: %s", e)
 
 
+def _trace_cache_hit(
+    model: str,
+    format_name: Optional[str],
+    caller: str,
+    cached: str,
+    llm_cache: LlmResponseCache,
+) -> None:
+    """Report a cache-served generation to Langfuse (no tokens spent)."""
+    try:
+        metadata: dict[str, Any] = {"caller": caller, **_cache_metadata("hit", llm_cache)}
+        if format_name:
+            metadata["format"] = format_name
+        get_client().update_current_generation(
+            model=model,
+            output=cached,
+            usage_details={"input": 0, "output": 0},
+            metadata=metadata,
+        )
+    except Exception as e:
+        logging.getLogger(__name__).debug("Langfuse trace failed: %s", e)
+
+
+def _cache_metadata(status: str, llm_cache: LlmResponseCache) -> dict[str, Any]:
+    return {
+        "cache": status,
+        "cache_hits": llm_cache.hits,
+        "cache_misses": llm_cache.misses,
+    }
+
+
+def _serialize_prompt(prompt: Any) -> list[dict[str, Any]]:
+    """Serialize whatever a prompt method returned (str, message, or list)."""
+    if isinstance(prompt, str):
+        return [{"role": "user", "content": prompt}]
+    if isinstance(prompt, (list, tuple)):
+        return [_serialize_message(m) for m in prompt]
+    return [_serialize_message(prompt)]
+
+
 def _serialize_message(msg: Any) -> dict[str, Any]:
     """Best-effort serialization of a Mirascope message for Langfuse."""
     if isinstance(msg, dict):
@@ -236,6 +333,17 @@ def _serialize_message(msg: Any) -> dict[str, Any]:
     return {"content": str(msg)}
 
 
+def _response_tokens(response: Any) -> Optional[int]:
+    """Total tokens billed for a response (input + output), if reported."""
+    usage = getattr(response, "usage", None)
+    if not usage:
+        return None
+    try:
+        return int(usage.input_tokens or 0) + int(usage.output_tokens or 0)
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
 def _is_rate_limit_error(e: Exception) -> bool:
     """Detect rate-limit / throttling errors from various providers."""
     if hasattr(e, "status_code") and getattr(e, "status_code", None) == 429:
@@ -251,3 +359,10 @@ def _is_rate_limit_error(e: Exception) -> bool:
 @inject
 def _get_ai_model(settings: Settings = Provide[DI.settings]) -> str:
     return settings.ai_model
+
+
+@inject
+def _get_llm_cache(
+    llm_cache: Optional[LlmResponseCache] = Provide[DI.llm_cache],
+) -> Optional[LlmResponseCache]:
+    return llm_cache
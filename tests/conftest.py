@@ -9,7 +9,9 @@ from dependency_injector import providers
 from langfuse import observe
 
 from dialectical_framework.dialectical_reasoning import DialecticalReasoning
+from dialectical_framework.graph.query_profiler import instrument_graph_db
 from dialectical_framework.settings import Settings
+from dialectical_framework.utils import lazy_wiring
 
 
 def traced(fn):
@@ -51,6 +53,9 @@ class TestMemgraph(Memgraph):
     This allows tests to coexist with production data safely by adding a special label.
     """
 
+    # Raw bulk writes (BatchCommitter, replace_estimations_bulk) add these
+    extra_node_labels = (TEST_LABEL,)
+
     def save_node(self, node):
         """Save node and add test label.
 
@@ -121,6 +126,9 @@ class TestNeo4j(Neo4j):
     This allows tests to coexist with production data safely by adding a special label.
     """
 
+    # Raw bulk writes (BatchCommitter, replace_estimations_bulk) add these
+    extra_node_labels = (TEST_LABEL,)
+
     def save_node(self, node):
         """Save node and add test label.
 
@@ -229,9 +237,9 @@ def _create_test_graph_db(settings: Settings):
             f"Supported vendors: 'memgraph', 'neo4j'"
         )
 
-    # Ensure schema indexes exist (same as production)
-    DialecticalReasoning._ensure_schema(db)
-    return db
+    # Schema is ensured once per session (graph_schema), not per connection.
+    # Same query profiling as production clients (query_budget in tests)
+    return instrument_graph_db(db)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -239,16 +247,24 @@ def di_container():
     """Set up DI container context for all tests with Test wrapper."""
     container = DialecticalReasoning.setup(Settings.from_env())
 
-    # Override graph_db factory to use Test wrapper (TestMemgraph or TestNeo4j)
-    container.graph_db.override(
+    # Override graph_db factories to use Test wrapper (TestMemgraph or TestNeo4j):
+    # the shared client and the pooled connections behind async_graph_db
+    container.shared_graph_db.override(
         providers.Singleton(
             _create_test_graph_db,
             settings=container.settings
         )
     )
+    container.graph_db_connection.override(
+        providers.Factory(
+            _create_test_graph_db,
+            settings=container.settings
+        )
+    )
 
     yield container
     container.unwire()
+    lazy_wiring.unregister(container)
 
 
 def pytest_addoption(parser):
@@ -375,8 +391,15 @@ def graph_db_available(di_container)-> bool:
     return is_graph_db_available(settings)
 
 
+@pytest.fixture(scope="session")
+def graph_schema(graph_db_available, di_container) -> None:
+    """Ensure indexes and run the schema backfills once per session (same as production)."""
+    if graph_db_available:
+        DialecticalReasoning._ensure_schema(di_container.shared_graph_db())
+
+
 @pytest.fixture(autouse=True)
-def cleanup_graph_db(graph_db_available, di_container):
+def cleanup_graph_db(graph_db_available, graph_schema, di_container):
     """
     Auto-cleanup fixture for all graph DB tests.
 
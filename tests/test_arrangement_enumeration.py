@@ -0,0 +1,114 @@
+"""Tests for lazy wheel arrangement enumeration (canonical forms, twins, pruning)."""
+
+from __future__ import annotations
+
+import inspect
+from dataclasses import dataclass
+
+import pytest
+
+from dialectical_framework.utils.sequence_generation import (
+    Arrangement,
+    ArrangementEnumerator,
+    generate_compatible_sequences,
+    iter_compatible_sequences,
+)
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+@dataclass(frozen=True)
+class _Stmt:
+    hash: str
+
+
+class _One:
+    """Stands in for a single-cardinality relationship manager."""
+
+    def __init__(self, node: _Stmt) -> None:
+        self._node = node
+
+    def get(self):
+        return self._node, None
+
+
+class _PP:
+    def __init__(self, i: int) -> None:
+        self.hash = f"pp{i}"
+        self.t = _One(_Stmt(f"T{i}"))
+        self.a = _One(_Stmt(f"A{i}"))
+
+
+def _names(arrangement) -> list[str]:
+    return [c.hash for c in arrangement]
+
+
+class TestLazyGeneration:
+    def test_lazy_stream_matches_eager_list(self):
+        pps = [_PP(i) for i in range(1, 4)]
+
+        stream = iter_compatible_sequences(pps)
+
+        assert inspect.isgenerator(stream)
+        assert list(stream) == generate_compatible_sequences(pps)
+
+    def test_two_perspectives(self):
+        pps = [_PP(1), _PP(2)]
+
+        assert [_names(a) for a in iter_compatible_sequences(pps)] == [
+            ["T1", "T2", "A1", "A2"],
+            ["T1", "A2", "A1", "T2"],
+        ]
+
+
+class TestArrangementEnumerator:
+    def test_opposite_directions_pair_by_signature(self):
+        first, second = ArrangementEnumerator().arrangements([_PP(1), _PP(2)])
+
+        # T1→T2→A1→A2 read backwards is a rotation of T1→A2→A1→T2
+        assert first.reverse_signature == second.signature
+        assert second.reverse_signature == first.signature
+        assert not first.is_self_reverse
+
+    def test_single_perspective_is_its_own_reverse(self):
+        (only,) = ArrangementEnumerator().arrangements([_PP(1)])
+
+        assert only.is_self_reverse
+
+    def test_signature_is_rotation_invariant(self):
+        stmts = [_Stmt(h) for h in ("T1", "T2", "A1", "A2")]
+
+        assert Arrangement.of(stmts).signature == Arrangement.of(stmts[2:] + stmts[:2]).signature
+
+    def test_prefilter_prunes_before_yield(self):
+        pps = [_PP(i) for i in range(1, 4)]
+        enumerator = ArrangementEnumerator(
+            prefilter=lambda arr: _names(arr.components)[1] == "T2"
+        )
+
+        kept = list(enumerator.arrangements(pps))
+
+        assert kept and all(_names(a.components)[1] == "T2" for a in kept)
+        assert len(kept) + enumerator.pruned == len(generate_compatible_sequences(pps))
+
+    def test_cap_stops_enumeration(self):
+        pps = [_PP(i) for i in range(1, 5)]
+        enumerator = ArrangementEnumerator(max_per_cycle=3)
+
+        assert len(list(enumerator.arrangements(pps))) == 3
+        assert enumerator.capped == 1
+
+    def test_repeated_ordering_yields_nothing_new(self):
+        pps = [_PP(1), _PP(2)]
+        enumerator = ArrangementEnumerator()
+
+        assert len(list(enumerator.arrangements(pps))) == 2
+        assert list(enumerator.arrangements(pps)) == []
@@ -0,0 +1,169 @@
+"""Tests for BatchCommitter (bulk staging of leaf nodes and relationships)."""
+
+from __future__ import annotations
+
+import pytest
+
+from dialectical_framework.graph.batch_committer import BatchCommitter
+from dialectical_framework.graph.graph_session import GraphSession
+from dialectical_framework.graph.nodes.base_node import ImmutableNodeError
+from dialectical_framework.graph.nodes.rationale import Rationale
+from dialectical_framework.graph.nodes.statement import Statement
+from dialectical_framework.graph.nodes.transition import Transition
+from dialectical_framework.graph.nodes.wheel import Wheel
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+class _RecordingDb:
+    """graph_db double: answers the batch's bulk queries and records writes."""
+
+    def __init__(self, existing: dict[str, int] | None = None, neighbours: list[dict] | None = None):
+        self.existing = existing or {}
+        self.neighbours = neighbours or []
+        self.next_id = 1000
+        self.queries: list[str] = []
+        self.node_rows: list[dict] = []
+        self.relationship_rows: list[dict] = []
+
+    def execute_and_fetch(self, query, params=None):
+        self.queries.append(query)
+        if "labels(n)" in query:
+            return iter([
+                {"hash": h, "node_id": self.existing[h], "labels": ["Node"]}
+                for h in params["hashes"] if h in self.existing
+            ])
+        if "UNWIND $ids" in query:
+            return iter(self.neighbours)
+        if "MERGE (n:" in query:
+            rows = []
+            for row in params["rows"]:
+                self.node_rows.append(row)
+                self.next_id += 1
+                rows.append({"idx": row["idx"], "node_id": self.next_id})
+            return iter(rows)
+        raise AssertionError(f"unexpected query: {query}")
+
+    def execute(self, query, params=None):
+        self.queries.append(query)
+        self.relationship_rows.extend(params["rows"])
+
+
+def _statement(node_id: int, text: str) -> Statement:
+    statement = Statement(text=text, meaning="test:meaning")
+    statement.committed_at = 1.0
+    statement.hash = statement.compute_hash()
+    statement._id = node_id
+    return statement
+
+
+def _transition(source: Statement, target: Statement) -> Transition:
+    return Transition().set_source(source).set_target(target)
+
+
+class TestStaging:
+    def test_commit_hashes_locally_without_id(self):
+        batch = BatchCommitter()
+        transition = batch.commit(_transition(_statement(1, "a"), _statement(2, "b")))
+
+        assert transition.is_committed
+        assert transition._id is None
+        assert transition._source_ref is None and transition._target_ref is None
+        assert transition.hash == transition.compute_hash()
+
+    def test_rejects_committed_and_container_nodes(self):
+        batch = BatchCommitter()
+        with pytest.raises(ImmutableNodeError):
+            batch.commit(_statement(1, "a"))
+        with pytest.raises(ValueError):
+            batch.commit(Wheel(intent="w"))
+
+    def test_exception_discards_batch(self):
+        with pytest.raises(RuntimeError):
+            with BatchCommitter() as batch:
+                batch.commit(_transition(_statement(1, "a"), _statement(2, "b")))
+                raise RuntimeError("boom")
+        assert batch.staged_nodes == []
+
+
+class TestFlush:
+    def test_flush_writes_in_bulk(self):
+        a, b, c = _statement(1, "a"), _statement(2, "b"), _statement(3, "c")
+        batch = BatchCommitter()
+        transitions = [batch.commit(_transition(x, y)) for x, y in [(a, b), (b, c), (c, a)]]
+        for transition in transitions:
+            rationale = Rationale(text="because")
+            rationale.set_explanation_target(transition)
+            batch.commit(rationale)
+
+        db = _RecordingDb()
+        batch.flush(graph_db=db, session=None)
+
+        assert all(t._id is not None for t in transitions)
+        assert len(db.node_rows) == 6
+        # 3 transitions x (source + target) + 3 EXPLAINS
+        assert len(db.relationship_rows) == 9
+        # dedup lookup + neighbour reads + one MERGE per label + one per relationship type
+        assert len(db.queries) <= 8
+        assert batch.staged_nodes == []
+
+    def test_client_marker_labels_are_set_on_written_nodes(self):
+        batch = BatchCommitter()
+        batch.commit(_transition(_statement(1, "a"), _statement(2, "b")))
+
+        db = _RecordingDb()
+        db.extra_node_labels = ("Marker",)
+        batch.flush(graph_db=db, session=None)
+
+        merge = next(q for q in db.queries if "MERGE (n:" in q)
+        assert "SET n:Marker" in merge
+
+    def test_existing_hash_is_reused(self):
+        a, b = _statement(1, "a"), _statement(2, "b")
+        batch = BatchCommitter()
+        transition = batch.commit(_transition(a, b))
+        rationale = Rationale(text="because")
+        rationale.set_explanation_target(transition)
+        batch.commit(rationale)
+
+        db = _RecordingDb(existing={rationale.hash: 42})
+        batch.flush(graph_db=db, session=None)
+
+        assert rationale._id == 42
+        assert [row["hash"] for row in db.node_rows] == [transition.hash]
+
+    def test_max_cardinality_checked_before_writes(self):
+        a, b = _statement(1, "a"), _statement(2, "b")
+        wheel = Wheel(intent="w")
+        wheel._id = 7
+        batch = BatchCommitter()
+        transition = batch.commit(_transition(a, b))
+        batch.connect(transition.cycle, wheel)
+        other = Wheel(intent="w2")
+        other._id = 8
+        batch.connect(transition.cycle, other)
+
+        db = _RecordingDb()
+        with pytest.raises(ValueError, match="maximum cardinality"):
+            batch.flush(graph_db=db, session=None)
+        assert db.node_rows == [] and db.relationship_rows == []
+
+    def test_flush_invalidates_session(self):
+        a, b = _statement(1, "a"), _statement(2, "b")
+        session = GraphSession()
+        key = (1, "IS_SOURCE_OF", "outgoing", "Transition")
+        session.put_relationships(key, [])
+
+        batch = BatchCommitter()
+        batch.commit(_transition(a, b))
+        batch.flush(graph_db=_RecordingDb(), session=session)
+
+        assert session.get_relationships(key) is None
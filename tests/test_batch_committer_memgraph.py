@@ -0,0 +1,64 @@
+"""BatchCommitter against the configured graph database (bulk MERGE writes)."""
+
+from __future__ import annotations
+
+from conftest import TEST_LABEL, cleanup_test_data
+
+from dialectical_framework.graph.batch_committer import BatchCommitter
+from dialectical_framework.graph.nodes.case import Case
+from dialectical_framework.graph.nodes.rationale import Rationale
+from dialectical_framework.graph.nodes.statement import Statement
+from dialectical_framework.graph.nodes.transition import Transition
+from dialectical_framework.graph.scope_context import scope
+
+
+def _new_sid() -> str:
+    case = Case()
+    case.commit()
+    return case.sid
+
+
+def _statement(text: str) -> Statement:
+    statement = Statement(text=text, meaning="test:meaning")
+    statement.commit()
+    return statement
+
+
+class TestBatchCommitterWrites:
+    def test_flush_persists_nodes_and_relationships(self, di_container):
+        with scope(_new_sid()):
+            a, b = _statement("a"), _statement("b")
+            with BatchCommitter() as batch:
+                transition = batch.commit(Transition().set_source(a).set_target(b))
+                rationale = Rationale(text="because")
+                rationale.set_explanation_target(transition)
+                batch.commit(rationale)
+
+            rows = list(di_container.graph_db().execute_and_fetch(
+                """
+                MATCH (r:Rationale)-[:EXPLAINS]->(t:Transition)<-[:IS_SOURCE_OF]-(s)
+                WHERE id(t) = $id
+                RETURN id(r) AS rationale_id, id(s) AS source_id
+                """,
+                {"id": transition._id},
+            ))
+
+        assert rows == [{"rationale_id": rationale._id, "source_id": a._id}]
+
+    def test_bulk_written_nodes_carry_the_test_label(self, di_container):
+        db = di_container.graph_db()
+        with scope(_new_sid()):
+            a, b = _statement("a"), _statement("b")
+            with BatchCommitter() as batch:
+                transition = batch.commit(Transition().set_source(a).set_target(b))
+
+        labelled = list(db.execute_and_fetch(
+            f"MATCH (n:{TEST_LABEL}) WHERE id(n) = $id RETURN n", {"id": transition._id}
+        ))
+        assert len(labelled) == 1
+
+        cleanup_test_data(db)
+        remaining = list(db.execute_and_fetch(
+            "MATCH (n) WHERE id(n) = $id RETURN n", {"id": transition._id}
+        ))
+        assert remaining == []
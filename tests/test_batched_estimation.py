@@ -0,0 +1,187 @@
+"""Tests for multi-sequence causality estimation calls and the token-budget packer."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from dialectical_framework.concerns.causality import \
+    causality_estimator_balanced as ceb_mod
+from dialectical_framework.concerns.causality.causality_estimator_balanced import (
+    CausalCycleAssessmentDto, CausalCyclesAssessmentDto,
+    CausalityEstimatorBalanced, SequenceAssessmentDto, pack_sequences)
+from dialectical_framework.concerns.causality.causality_estimator_realistic import \
+    CausalityEstimatorRealistic
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+@contextmanager
+def _settings(di_container, **overrides):
+    current = di_container.settings()
+    di_container.settings.override(current.model_copy(update=overrides))
+    try:
+        yield
+    finally:
+        di_container.settings.reset_override()
+        di_container.settings.override(current)
+
+
+class _NoRationales:
+    def all(self):
+        return []
+
+
+def _stmt(name: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        hash=f"h-{name}", text=name, prompt_text=name, rationales=_NoRationales()
+    )
+
+
+class _FakeBrain:
+    """Stands in for use_brain: batch calls answer all but `drop` sequences."""
+
+    def __init__(self, drop: frozenset[int] = frozenset(), fail: bool = False) -> None:
+        self.drop = drop
+        self.fail = fail
+        self.batch_calls: list[list[int]] = []
+        self.single_calls = 0
+
+    def __call__(self, *, format=None, **kwargs):
+        def decorator(method):
+            async def wrapper():
+                messages = await method()
+                prompt = "".join(part.text for part in messages[-1].content)
+                if format is CausalCyclesAssessmentDto:
+                    numbers = [
+                        int(line.split(":")[0].split()[1])
+                        for line in prompt.splitlines()
+                        if line.startswith("Sequence ")
+                    ]
+                    self.batch_calls.append(numbers)
+                    if self.fail:
+                        raise ValueError("unparseable response")
+                    return CausalCyclesAssessmentDto(assessments=[
+                        SequenceAssessmentDto(sequence=n, probability=n / 10)
+                        for n in numbers
+                        if n not in self.drop
+                    ])
+                self.single_calls += 1
+                return CausalCycleAssessmentDto(probability=0.99)
+
+            return wrapper
+
+        return decorator
+
+
+def _sequences() -> list[list[SimpleNamespace]]:
+    t1, t2, a1, a2 = (_stmt(n) for n in ("T1", "T2", "A1", "A2"))
+    other = [_stmt("T3"), _stmt("A3")]
+    return [
+        [t1, t2, a1, a2],
+        [t1, a2, a1, t2],
+        [t2, t1, a2, a1],
+        other,
+    ]
+
+
+class TestPackSequences:
+    def test_packs_greedily_in_order(self):
+        assert pack_sequences([3, 3, 3, 3], shared=4, budget=10) == [[0, 1], [2, 3]]
+
+    def test_oversized_sequence_gets_its_own_call(self):
+        assert pack_sequences([2, 20, 2], shared=4, budget=10) == [[0], [1], [2]]
+
+    def test_everything_fits(self):
+        assert pack_sequences([1, 1, 1], shared=0, budget=100) == [[0, 1, 2]]
+
+
+class TestBatchedPrompt:
+    def test_numbered_sequences_keep_the_variant_lens(self):
+        messages = CausalityEstimatorRealistic().prompt_assess_sequences(
+            sequences=[(1, "X → Y → X..."), (3, "Y → X → Y...")]
+        )
+        text = "".join(part.text for part in messages[0].content)
+
+        assert "Sequence 1: X → Y → X..." in text
+        assert "Sequence 3: Y → X → Y..." in text
+        assert "for realism, i.e. what typically happens in natural systems" in text
+        assert "labelled with its sequence number" in text
+
+    def test_batched_and_single_prompts_share_their_instructions(self):
+        estimator = CausalityEstimatorRealistic()
+        single = "".join(
+            part.text
+            for part in estimator.prompt_assess_single_sequence(sequence="X → Y → X...")[0].content
+        )
+        batched = "".join(
+            part.text
+            for part in estimator.prompt_assess_sequences(sequences=[(1, "X → Y → X...")])[0].content
+        )
+
+        for section in ("<formatting>", "1) For each consecutive step", "2) Only then"):
+            assert single[single.index(section):].split("\n")[0] in batched
+
+
+class TestSequenceLabel:
+    def test_unlabelled_assessment_is_rejected(self):
+        with pytest.raises(ValidationError):
+            CausalCyclesAssessmentDto.model_validate({"assessments": [{"probability": 0.4}]})
+
+
+class TestBatchedEstimation:
+    async def _run(self, di_container, monkeypatch, brain, budget):
+        monkeypatch.setattr(ceb_mod, "use_brain", brain)
+        with _settings(di_container, causality_batch_token_budget=budget):
+            deck = await CausalityEstimatorBalanced()._estimate_cycles(
+                sequences=_sequences(), text=""
+            )
+        return {c.aliases[0]: c.probability for c in deck.causal_cycles}
+
+    async def test_one_call_per_statement_set(self, di_container, monkeypatch):
+        brain = _FakeBrain()
+
+        scores = await self._run(di_container, monkeypatch, brain, budget=100_000)
+
+        # The three orderings of T1/T2/A1/A2 share a call; T3/A3 goes alone
+        assert brain.batch_calls == [[1, 2, 3]]
+        assert brain.single_calls == 1
+        assert scores == {"C1_1": 0.1, "C2_1": 0.2, "C3_1": 0.3, "C4_1": 0.99}
+
+    async def test_missing_sequences_fall_back_to_single_calls(
+        self, di_container, monkeypatch
+    ):
+        brain = _FakeBrain(drop=frozenset({2}))
+
+        scores = await self._run(di_container, monkeypatch, brain, budget=100_000)
+
+        assert brain.single_calls == 2  # sequence 2 + the lone T3/A3 one
+        assert scores["C2_1"] == 0.99
+        assert scores["C1_1"] == 0.1
+
+    async def test_failed_batch_falls_back_entirely(self, di_container, monkeypatch):
+        brain = _FakeBrain(fail=True)
+
+        scores = await self._run(di_container, monkeypatch, brain, budget=100_000)
+
+        assert brain.single_calls == 4
+        assert set(scores.values()) == {0.99}
+
+    async def test_budget_off_keeps_per_sequence_calls(self, di_container, monkeypatch):
+        brain = _FakeBrain()
+
+        await self._run(di_container, monkeypatch, brain, budget=0)
+
+        assert brain.batch_calls == []
+        assert brain.single_calls == 4
@@ -0,0 +1,89 @@
+"""Tests for beam selection and branch extension in progressive layer building."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import combinations
+
+import pytest
+
+from dialectical_framework.concerns.perspective_combination import (
+    _extensions,
+    select_beam,
+)
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+@dataclass(frozen=True)
+class _PP:
+    hash: str
+
+
+def _hashes(combo) -> list[str]:
+    return [pp.hash for pp in combo]
+
+
+class TestSelectBeam:
+    def test_keeps_top_width_and_reports_the_rest(self):
+        surviving, pruned = select_beam(
+            [("ab", 0.2), ("ac", 0.6), ("bc", 0.2)], width=1
+        )
+
+        assert surviving == {"ac": pytest.approx(0.6)}
+        assert pruned == {"ab": pytest.approx(0.2), "bc": pytest.approx(0.2)}
+
+    def test_branch_survives_through_its_best_structure(self):
+        # Two wheels of "ab": the strong one keeps the branch, the weak one
+        # must not report it as pruned
+        surviving, pruned = select_beam(
+            [("ab", 0.1), ("ac", 0.3), ("ab", 0.6)], width=1
+        )
+
+        assert set(surviving) == {"ab"}
+        assert set(pruned) == {"ac"}
+
+    def test_missing_scores_rank_last_and_zero_total_is_uniform(self):
+        surviving, _ = select_beam([("ab", None), ("ac", 0.4)], width=1)
+        assert set(surviving) == {"ac"}
+
+        surviving, pruned = select_beam([("ab", None), ("ac", None)], width=1)
+        assert surviving == {"ab": 0.5}  # ties keep input order
+        assert pruned == {"ac": 0.5}
+
+    def test_zero_width_keeps_everything(self):
+        surviving, pruned = select_beam([("ab", 0.1), ("ac", 0.9)], width=0)
+
+        assert set(surviving) == {"ab", "ac"}
+        assert pruned == {}
+
+
+class TestExtensions:
+    def test_extensions_match_combinations_order(self):
+        pps = [_PP(h) for h in "abcd"]
+
+        extended = [_hashes(c) for c in _extensions(pps, [frozenset("bd")], 3)]
+
+        assert extended == [["a", "b", "d"], ["b", "c", "d"]]
+        every = [_hashes(c) for c in combinations(pps, 3)]
+        assert all(combo in every for combo in extended)
+
+    def test_shared_extensions_are_built_once(self):
+        pps = [_PP(h) for h in "abc"]
+
+        extended = list(_extensions(pps, [frozenset("ab"), frozenset("bc")], 3))
+
+        assert [_hashes(c) for c in extended] == [["a", "b", "c"]]
+
+    def test_branches_of_other_sizes_or_unknown_pps_are_ignored(self):
+        pps = [_PP(h) for h in "abc"]
+
+        assert list(_extensions(pps, [frozenset("a"), frozenset("ax")], 3)) == []
@@ -495,6 +495,44 @@ class TestPersistStepCausations:
             assert len(deleted) == 5
             assert len(created) == 5
 
+    @pytest.mark.asyncio
+    async def test_incremental_normalization_matches_full(self, case_node, monkeypatch):
+        from dialectical_framework.concerns.causality.causality_normalizer import \
+            CausalityNormalizer
+        from dialectical_framework.concerns.causality_estimation import \
+            CausalityEstimation
+        from dialectical_framework.graph.nodes.estimation import \
+            CausalityProbabilityEstimation
+        from dialectical_framework.graph.repositories.wheel_repository import \
+            WheelRepository
+
+        def edge_values(wheels):
+            values = {}
+            for w in wheels:
+                for edge in w.edges:
+                    values[edge.hash] = [
+                        e.value for e, _ in edge.estimations.all()
+                        if isinstance(e, CausalityProbabilityEstimation)
+                    ]
+            return values
+
+        with scope(case_node.sid):
+            _, wheel = await self._build(case_node)
+            _install_fake_estimator(monkeypatch)
+            await CausalityEstimation().resolve([wheel])
+
+            layer_wheels = WheelRepository().find_by_layer(wheel._perspectives)
+            incremental = edge_values(layer_wheels)
+            assert all(len(v) == 1 for v in incremental.values())
+
+            # A settled layer needs no writes
+            layer = WheelRepository().find_layer_causality(wheel._perspectives)
+            assert CausalityNormalizer().normalize_layer(layer) == []
+
+            # Full rewrite produces the same values
+            await CausalityEstimation(incremental=False).resolve([wheel])
+            assert edge_values(layer_wheels) == incremental
+
 
 class TestNexusPresetIntentSeparation:
     """Tests for Nexus intent/preset separation."""
@@ -729,6 +767,72 @@ class TestBuildWheels:
             assert len(result.new_cycles) == 8  # 3 + 3 + 2
             assert len(result.new_wheels) >= 8  # Multiple wheels per cycle
 
+    @pytest.mark.asyncio
+    async def test_build_wheels_beam_extends_only_survivors(
+        self, case_node, di_container, monkeypatch
+    ):
+        """With a beam, only the best-scored pair is extended to layer 3; the
+        other pairs are reported as pruned and can be expanded later."""
+        from dialectical_framework.concerns.causality.causality_estimator import \
+            EstimationStructured
+        from dialectical_framework.graph.rotation_keys import layer_key
+
+        current = di_container.settings()
+        di_container.settings.override(
+            current.model_copy(update={"wheel_beam_width": 1, "max_wheel_layer": 3})
+        )
+        try:
+            with scope(case_node.sid):
+                pps = [create_complete_perspective(i) for i in range(1, 5)]
+                strong = layer_key([pps[0].hash, pps[1].hash])
+
+                async def fake_estimate(self, structures):
+                    return {
+                        s.hash: EstimationStructured(
+                            probability=0.9 if s.layer_key == strong else 0.1,
+                            reasoning="test reasoning",
+                            argumentation="test contexts",
+                        )
+                        for s in structures
+                    }
+
+                monkeypatch.setattr(CausalityEstimatorBalanced, "estimate", fake_estimate)
+
+                nexus = Nexus(sid=case_node.sid, preset=CausalityPreset.BALANCED)
+                nexus.commit()
+                agent = BuildWheels(
+                    nexus_hash=nexus.hash, perspective_hashes=[pp.hash for pp in pps]
+                )
+                result = await agent.resolve()
+
+                # {1,2} extended by pp3 and by pp4: 2 PP sets x 2 orderings
+                layer3 = [c for c in result.new_cycles if c.perspective_count == 3]
+                assert len(layer3) == 4
+                assert all(
+                    {pps[0].hash, pps[1].hash} <= set(c.perspective_hashes)
+                    for c in layer3
+                )
+                assert {b.layer for b in result.pruned_branches} == {2}
+                assert len(result.pruned_branches) == 5
+                assert agent.report.artifacts["pruned_branches"]
+
+                # Expand a pruned branch on demand: {3,4} + pp1, {3,4} + pp2
+                expand = BuildWheels(
+                    nexus_hash=nexus.hash,
+                    branches=[[pps[2].short_hash, pps[3].short_hash]],
+                )
+                expanded = await expand.resolve()
+
+                layer3 = [c for c in expanded.new_cycles if c.perspective_count == 3]
+                assert len(layer3) == 4
+                assert all(
+                    {pps[2].hash, pps[3].hash} <= set(c.perspective_hashes)
+                    for c in layer3
+                )
+        finally:
+            di_container.settings.reset_override()
+            di_container.settings.override(current)
+
     @pytest.mark.asyncio
     async def test_build_wheels_graceful_when_all_combined(self, case_node):
         """Test BuildWheels is graceful when all structures already exist."""
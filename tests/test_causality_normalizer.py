@@ -0,0 +1,133 @@
+"""Tests for incremental layer normalization (CausalityNormalizer.normalize_layer)."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+from dialectical_framework.concerns.causality.causality_normalizer import (
+    CausalityNormalizer,
+)
+from dialectical_framework.concerns.causality_estimation import CausalityEstimation
+from dialectical_framework.graph.estimation_manager import EstimationManager
+from dialectical_framework.graph.nodes.wheel import Wheel
+from dialectical_framework.graph.repositories.wheel_repository import WheelCausality
+from dialectical_framework.utils.decompose_probability_uniformly import (
+    decompose_probability_uniformly,
+)
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+@dataclass
+class _Node:
+    hash: str
+
+
+@pytest.fixture
+def written(monkeypatch) -> list[tuple]:
+    calls: list[tuple] = []
+
+    def fake_bulk(self, estimation_type, values):
+        calls.extend(values)
+        return []
+
+    monkeypatch.setattr(EstimationManager, "replace_estimations_bulk", fake_bulk)
+    return calls
+
+
+def _entry(name: str, raw: float | None, current: list[list[float]]) -> WheelCausality:
+    return WheelCausality(
+        wheel=_Node(hash=name),
+        raw_score=raw,
+        edges=[(_Node(hash=f"{name}-e{i}"), values) for i, values in enumerate(current)],
+    )
+
+
+class TestNormalizeLayer:
+    def test_writes_every_edge_of_fresh_layer(self, written):
+        layer = [_entry("w1", 0.6, [[], []]), _entry("w2", 0.2, [[], []])]
+
+        changed = CausalityNormalizer().normalize_layer(layer)
+
+        assert len(changed) == 4
+        values = {t.hash: v for t, v in written}
+        assert values["w1-e0"] == pytest.approx(decompose_probability_uniformly(0.75, 2))
+        assert values["w2-e0"] == pytest.approx(decompose_probability_uniformly(0.25, 2))
+
+    def test_unchanged_edges_are_not_rewritten(self, written):
+        stable = decompose_probability_uniformly(0.75, 2)
+        layer = [
+            _entry("w1", 0.6, [[stable], [stable]]),
+            _entry("w2", 0.2, [[decompose_probability_uniformly(0.25, 2)]] * 2),
+        ]
+
+        assert CausalityNormalizer().normalize_layer(layer) == []
+        assert written == []
+
+    def test_new_wheel_shifts_existing_shares(self, written):
+        # Two equal wheels already normalized at 0.5; a third equal one joins
+        half = decompose_probability_uniformly(0.5, 2)
+        layer = [
+            _entry("w1", 0.4, [[half], [half]]),
+            _entry("w2", 0.4, [[half], [half]]),
+            _entry("w3", 0.4, [[], []]),
+        ]
+
+        changed = CausalityNormalizer().normalize_layer(layer)
+
+        # Every share moved from 0.5 to ~0.333, so all six edges change
+        assert len(changed) == 6
+
+    def test_unscored_wheels_are_skipped(self, written):
+        layer = [_entry("w1", None, [[], []]), _entry("w2", 0.3, [[], []])]
+
+        changed = CausalityNormalizer().normalize_layer(layer)
+
+        assert {t.hash for t in changed} == {"w2-e0", "w2-e1"}
+        assert all(v == pytest.approx(1.0) for _, v in written)
+
+
+class _InlineGraphDb:
+    """AsyncGraphDb stand-in: runs the work inline."""
+
+    async def run(self, fn, *args, **kwargs):
+        return fn(*args, **kwargs)
+
+
+class _Estimator:
+    async def estimate(self, structures):
+        return {s.hash: None for s in structures}
+
+
+class TestEstimationReport:
+    async def test_concurrent_layer_counts_are_summed(self, monkeypatch):
+        counts = {"a": (2, 1), "b": (3, 4)}
+        monkeypatch.setattr(CausalityEstimation, "_persist_estimations", lambda self, s, r: None)
+        monkeypatch.setattr(
+            CausalityEstimation, "_normalize_layer_incremental",
+            lambda self, wheels: counts[wheels[0].hash],
+        )
+        concern = CausalityEstimation()
+        wheels = {name: Wheel(intent=name) for name in counts}
+        for name, wheel in wheels.items():
+            wheel.hash = name
+
+        await asyncio.gather(*(
+            concern._estimate_group(("Wheel", 1), [wheel], _Estimator(),
+                                    async_graph_db=_InlineGraphDb())
+            for wheel in wheels.values()
+        ))
+
+        assert concern.report.artifacts["normalized_wheels"] == 5
+        assert concern.report.artifacts["renormalized_transitions"] == 5
@@ -50,8 +50,11 @@ def _settings(di_container, **overrides):
         di_container.settings.override(current)
 
 
-def _perspective_with_hs(a_hs: float, tag: str) -> Perspective:
-    """Committed perspective whose antithesis HS is controllable."""
+def _perspective_with_hs(
+    a_hs: float, tag: str, ks: dict[str, tuple[float, float]] | None = None
+) -> Perspective:
+    """Committed perspective whose antithesis HS is controllable; `ks`
+    optionally sets (K_T, K_A) per aspect position."""
     t = Statement(text=f"Thesis {tag}", meaning="test")
     t.commit()
     a = Statement(text=f"Antithesis {tag}", meaning="test")
@@ -72,8 +75,15 @@ def _perspective_with_hs(a_hs: float, tag: str) -> Perspective:
     ]:
         s = Statement(text=text, meaning="test")
         s.commit()
+        kt, ka = (ks or {}).get(alias, (None, None))
         getattr(pp, attr).connect(
-            s, relationship=rel_cls(alias=alias, heuristic_similarity=0.8)
+            s,
+            relationship=rel_cls(
+                alias=alias,
+                heuristic_similarity=0.8,
+                complementarity_t=kt,
+                complementarity_a=ka,
+            ),
         )
     pp.commit()
     return pp
@@ -216,6 +226,44 @@ class TestPerspectiveQualityFloor:
             assert "suppressed" not in dump
 
 
+class TestBatchMetrics:
+    def test_batch_scores_match_perspective_properties(self):
+        """PerspectiveRepository.load_metrics (one query) must agree with
+        the per-instance properties it replaces in the dump."""
+        from dialectical_framework.graph.query_profiler import query_budget
+        from dialectical_framework.graph.repositories.perspective_repository import \
+            PerspectiveRepository
+
+        sid = _new_sid()
+        with scope(sid):
+            scored = _perspective_with_hs(
+                0.7,
+                "scored",
+                ks={
+                    POSITION_T_PLUS: (0.8, 0.6),
+                    POSITION_T_MINUS: (0.2, 0.3),
+                    POSITION_A_PLUS: (0.5, 0.9),
+                    POSITION_A_MINUS: (0.1, 0.2),
+                },
+            )
+            unscored = _perspective_with_hs(0.4, "unscored")
+
+            with query_budget(1, "load_metrics"):
+                metrics = PerspectiveRepository().load_metrics([scored, unscored])
+
+            row = metrics.row(scored._id)
+            assert row.hs == pytest.approx(0.7)
+            assert row.area == pytest.approx(scored.area)
+            assert row.rectangularity == pytest.approx(scored.rectangularity)
+            assert row.diff_t == pytest.approx(scored.diff_t)
+            assert row.diff_a == pytest.approx(scored.diff_a)
+            assert row.dv is None
+
+            empty = metrics.row(unscored._id)
+            assert empty.hs == pytest.approx(0.4)
+            assert empty.area is None and unscored.area is None
+
+
 class TestWheelCap:
     def _seed_cycle_with_wheels(self, probabilities: list[float]):
         from dialectical_framework.graph.estimation_manager import \
@@ -0,0 +1,247 @@
+"""Tests for materialized context snapshots and their event-driven invalidation."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from dialectical_framework.agents.execution_report import (
+    Effect,
+    NodeRef,
+    RelationshipRef,
+)
+from dialectical_framework.concerns.context_snapshot import (
+    ContextSnapshot,
+    ContextSnapshotStore,
+    nexus_section_key,
+)
+from dialectical_framework.concerns.dialectical_context import DialecticalContext
+from dialectical_framework.events.graph_event_bus import GraphEventBus
+from dialectical_framework.graph.graph_db_pool import AsyncGraphDb, GraphDbPool
+from dialectical_framework.graph.repositories.case_repository import CaseRepository
+from dialectical_framework.graph.scope_context import scope
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+NEXUS_A = nexus_section_key("aaaaaaa")
+NEXUS_B = nexus_section_key("bbbbbbb")
+
+
+def _snapshot() -> ContextSnapshot:
+    snapshot = ContextSnapshot()
+    snapshot.add("inputs", "# Sources")
+    snapshot.add("decisions", None)
+    snapshot.add("standalone", "# Unexplored Tensions", {1})
+    snapshot.add(NEXUS_A, "# Nexus [[aaaaaaa]]", {10, 11, 12})
+    snapshot.add(NEXUS_B, "# Nexus [[bbbbbbb]]", {20, 21})
+    return snapshot
+
+
+def _node_effect(label: str, db_id: int | None, effect_type="node_created", **kwargs) -> Effect:
+    return Effect(
+        seq=0,
+        effect_type=effect_type,
+        node=NodeRef(label=label, db_id=db_id),
+        **kwargs,
+    )
+
+
+def _rel_effect(rel_type: str, source: tuple[str, int], target: tuple[str, int]) -> Effect:
+    return Effect(
+        seq=0,
+        effect_type="relationship_created",
+        relationship=RelationshipRef(
+            type=rel_type,
+            from_node=NodeRef(label=source[0], db_id=source[1]),
+            to_node=NodeRef(label=target[0], db_id=target[1]),
+        ),
+    )
+
+
+class TestSnapshotInvalidation:
+    def test_effect_on_rendered_node_dirties_its_section_only(self):
+        snapshot = _snapshot()
+        snapshot.apply(_rel_effect("ESTIMATES", ("CausalityProbabilityEstimation", 99), ("Wheel", 11)))
+
+        assert snapshot.dirty == {NEXUS_A}
+        assert not snapshot.stale
+
+    def test_unseen_nexus_local_node_dirties_every_nexus(self):
+        snapshot = _snapshot()
+        snapshot.apply(_node_effect("Transformation", 500))
+
+        assert snapshot.dirty == {NEXUS_A, NEXUS_B}
+
+    def test_structural_effects_make_snapshot_stale(self):
+        for effect in [
+            _node_effect("Perspective", 1, effect_type="node_committed"),
+            _rel_effect("BELONGS_TO_NEXUS", ("Perspective", 1), ("Nexus", 10)),
+            _node_effect("Wheel", 11, effect_type="node_deleted"),
+            _node_effect("Wheel", 11, effect_type="node_updated", patch={"discarded": "x"}),
+            _node_effect("SomethingNew", 7),
+        ]:
+            snapshot = _snapshot()
+            snapshot.apply(effect)
+            assert snapshot.stale, effect
+
+    def test_section_labels_route_to_their_section(self):
+        snapshot = _snapshot()
+        snapshot.apply(_node_effect("Input", 300))
+        snapshot.apply(_node_effect("Decision", 301))
+
+        assert snapshot.dirty == {"inputs", "decisions"}
+
+    def test_volatile_snapshot_goes_stale_on_any_effect(self):
+        snapshot = ContextSnapshot(volatile=True)
+        snapshot.add("body", "No prior understanding")
+        snapshot.apply(_node_effect("Input", 300))
+
+        assert snapshot.stale
+
+    def test_text_skips_empty_sections_in_order(self):
+        snapshot = _snapshot()
+        snapshot.replace(NEXUS_A, "# Nexus [[aaaaaaa]] v2", {10})
+
+        assert snapshot.text == "\n\n".join([
+            "# Sources",
+            "# Unexplored Tensions",
+            "# Nexus [[aaaaaaa]] v2",
+            "# Nexus [[bbbbbbb]]",
+        ])
+
+
+class TestSnapshotStore:
+    async def test_disconnected_bus_never_serves_snapshots(self):
+        store = ContextSnapshotStore(GraphEventBus())
+        assert await store.watch("case") is False
+
+    async def test_bus_effects_reach_cached_snapshots(self):
+        bus = GraphEventBus()
+        await bus.connect()
+        store = ContextSnapshotStore(bus)
+        try:
+            assert await store.watch("case") is True
+            store.put("case", None, _snapshot())
+            store.put("other", None, _snapshot())
+
+            await bus.publish("case", _node_effect("Wheel", 20, effect_type="node_updated"))
+            for _ in range(20):
+                if store.get("case", None).dirty:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert store.get("case", None).dirty == {NEXUS_B}
+            assert store.get("other", None).dirty == set()
+        finally:
+            await store.close()
+            await bus.disconnect()
+
+    async def test_catch_up_applies_buffered_effects_before_serving(self):
+        bus = GraphEventBus(flush_window=10.0)
+        await bus.connect()
+        store = ContextSnapshotStore(bus)
+        try:
+            assert await store.watch("case") is True
+            store.put("case", None, _snapshot())
+
+            # Still inside the flush window: nothing has reached the listener
+            bus.emit("case", _node_effect("Statement", 5, effect_type="node_updated",
+                                          patch={"discarded": True}))
+            assert not store.get("case", None).stale
+
+            assert await store.catch_up("case") is True
+            assert store.get("case", None).stale
+        finally:
+            await store.close()
+            await bus.disconnect()
+
+    async def test_catch_up_fails_without_a_listener(self):
+        bus = GraphEventBus()
+        await bus.connect()
+        store = ContextSnapshotStore(bus)
+        try:
+            store.put("case", None, _snapshot())
+
+            assert await store.catch_up("case") is False
+        finally:
+            await bus.disconnect()
+
+    async def test_ended_listener_drops_snapshots(self):
+        bus = GraphEventBus()
+        await bus.connect()
+        store = ContextSnapshotStore(bus)
+        assert await store.watch("case")
+        store.put("case", "abc1234", _snapshot())
+
+        await store.close()
+        await bus.disconnect()
+
+        assert store.get("case", "abc1234") is None
+
+
+class _FakeDb:
+    _cached_connection = None
+
+
+@pytest.fixture
+def offloaded(di_container):
+    adapter = AsyncGraphDb(GraphDbPool(connect=_FakeDb, size=2))
+    di_container.async_graph_db.override(adapter)
+    yield adapter
+    di_container.async_graph_db.reset_override()
+    adapter.shutdown()
+
+
+class TestOffloadedRender:
+    async def test_effects_applied_mid_render_leave_the_snapshot_stale(
+        self, di_container, offloaded, monkeypatch
+    ):
+        bus = GraphEventBus()
+        await bus.connect()
+        store = ContextSnapshotStore(bus)
+        di_container.context_snapshots.override(store)
+        loop = asyncio.get_running_loop()
+        threads: list[threading.Thread] = []
+
+        def render(self) -> ContextSnapshot:
+            threads.append(threading.current_thread())
+            if len(threads) == 1:
+                # A write lands while the first render is off the loop
+                seen = store.applied("case")
+                asyncio.run_coroutine_threadsafe(
+                    bus.publish("case", _node_effect("Wheel", 20, effect_type="node_updated")),
+                    loop,
+                ).result()
+                for _ in range(100):
+                    if store.applied("case") != seen:
+                        break
+                    time.sleep(0.01)
+            snapshot = ContextSnapshot()
+            snapshot.add("body", f"render {len(threads)}")
+            return snapshot
+
+        monkeypatch.setattr(DialecticalContext, "_render", render)
+        monkeypatch.setattr(CaseRepository, "fingerprint", lambda self: "fp")
+        try:
+            with scope("case"):
+                dumps = [await DialecticalContext().resolve() for _ in range(3)]
+        finally:
+            di_container.context_snapshots.reset_override()
+            await store.close()
+            await bus.disconnect()
+
+        assert threading.current_thread() not in threads
+        # Rendered again after the race, then served from the snapshot
+        assert dumps == ["render 1", "render 2", "render 2"]
@@ -283,6 +283,58 @@ class TestDialecticalContextScoped:
             assert "# Unexplored Tensions" in dump
 
 
+class TestDialecticalContextSnapshot:
+    """With the event bus connected, dumps are served from a materialized
+    snapshot: cached when nothing changed, patched per section on effects,
+    re-rendered when the graph changed without an effect."""
+
+    @pytest.fixture
+    async def connected_bus(self, di_container):
+        bus = di_container.event_bus()
+        await bus.connect()
+        yield bus
+        await di_container.context_snapshots().close()
+        await bus.disconnect()
+
+    async def test_cached_patched_and_rerendered(self, connected_bus):
+        import asyncio
+
+        from dialectical_framework.agents.execution_report import (Effect,
+                                                                   NodeRef)
+
+        sid = _new_sid()
+        with scope(sid):
+            nexus_hash = TestDialecticalContextScoped._seed_nexus_and_outside(sid)
+
+            first = DialecticalContext()
+            dump = await first.resolve()
+            assert first.report.artifacts["context_snapshot"] == "rendered"
+
+            again = DialecticalContext()
+            assert await again.resolve() == dump
+            assert again.report.artifacts["context_snapshot"] == "cached"
+
+            # A fresh nexus-local node: only nexus sections re-render
+            await connected_bus.publish(
+                sid,
+                Effect(seq=0, effect_type="node_created",
+                       node=NodeRef(label="Transformation", db_id=-1)),
+            )
+            for _ in range(50):
+                await asyncio.sleep(0.01)
+            patched = DialecticalContext()
+            assert await patched.resolve() == dump
+            assert patched.report.artifacts["rerendered_sections"] == [
+                f"nexus:{nexus_hash[:7]}"
+            ]
+
+            # A mutation that emitted no effect is caught by the fingerprint
+            _create_perspective_with_aspects(thesis_text="Silent")
+            fresh = DialecticalContext()
+            assert "Silent" in await fresh.resolve()
+            assert fresh.report.artifacts["context_snapshot"] == "rendered"
+
+
 class TestDialecticalContextMultiNexus:
     """Multi-exploration dumps: per-nexus index disambiguation + machine-stated
     cross-nexus references (shared perspectives, shared taxonomy branch).
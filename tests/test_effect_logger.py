@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import gzip
 import json
+import time
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -14,7 +17,11 @@ from dialectical_framework.agents.execution_report import (
     ExecutionReport,
     NodeRef,
 )
+from dialectical_framework.dialectical_reasoning import DialecticalReasoning
+from dialectical_framework.events.graph_event_bus import GraphEventBus
 from dialectical_framework.graph.scope_context import scope
+from dialectical_framework.settings import Settings
+from dialectical_framework.utils import lazy_wiring
 from dialectical_framework.utils.effect_logger import EffectLogger
 
 
@@ -242,3 +249,129 @@ class TestExecutionReportLogging:
         log_file = log_dir / "test-sid" / "analyst.jsonl"
         lines = log_file.read_text().strip().split("\n")
         assert len(lines) == 1
+
+
+def _effect(i: int = 0) -> Effect:
+    return Effect(seq=i, effect_type="node_created", node=NodeRef(label="X", hash=f"h{i}"))
+
+
+def _lines(path: Path) -> list[str]:
+    return path.read_text().splitlines() if path.exists() else []
+
+
+class TestBufferedWriter:
+    async def test_in_loop_writes_are_batched_off_the_call(self, log_dir: Path) -> None:
+        logger = EffectLogger(str(log_dir), flush_interval=10)
+        log_file = log_dir / "sid-1" / "analyst.jsonl"
+
+        for i in range(5):
+            logger.log_effect("sid-1", "analyst", "T", _effect(i))
+        assert _lines(log_file) == []
+        assert logger.stats()["queued"] == 5
+
+        await logger.aclose()
+
+        assert [json.loads(line)["seq"] for line in _lines(log_file)] == [0, 1, 2, 3, 4]
+        assert logger.stats()["written"] == 5
+        assert logger.stats()["queued"] == 0
+
+    async def test_flushes_on_interval(self, log_dir: Path) -> None:
+        logger = EffectLogger(str(log_dir), flush_interval=0.01)
+
+        logger.log_effect("sid-1", "analyst", "T", _effect())
+        await asyncio.sleep(0.2)
+
+        assert len(_lines(log_dir / "sid-1" / "analyst.jsonl")) == 1
+        assert logger._writer is not None and logger._writer.done()  # Idle writer exits
+        logger.close()
+
+    async def test_flushes_on_batch_size(self, log_dir: Path) -> None:
+        logger = EffectLogger(str(log_dir), batch_size=3, flush_interval=10)
+
+        for i in range(3):
+            logger.log_effect("sid-1", "analyst", "T", _effect(i))
+        await asyncio.sleep(0.2)
+
+        assert len(_lines(log_dir / "sid-1" / "analyst.jsonl")) == 3
+        await logger.aclose()
+
+    async def test_full_queue_drops_and_counts(self, log_dir: Path) -> None:
+        logger = EffectLogger(str(log_dir), max_queue=2, flush_interval=10)
+
+        for i in range(5):
+            logger.log_effect("sid-1", "analyst", "T", _effect(i))
+        await logger.aclose()
+
+        assert len(_lines(log_dir / "sid-1" / "analyst.jsonl")) == 2
+        assert logger.stats()["dropped"] == 3
+
+    async def test_one_handle_per_file(self, log_dir: Path) -> None:
+        logger = EffectLogger(str(log_dir), flush_interval=10)
+
+        for i in range(4):
+            logger.log_effect("sid-1", "analyst" if i % 2 else "explorer", "T", _effect(i))
+        await logger.flush()
+
+        assert sorted(p.name for p in logger._files) == ["analyst.jsonl", "explorer.jsonl"]
+        await logger.aclose()
+        assert logger._files == {}
+
+    async def test_bus_shutdown_writes_out_queued_records(self, log_dir: Path) -> None:
+        logger = EffectLogger(str(log_dir), flush_interval=10)
+        ExecutionReport.set_effect_logger(logger)
+        bus = GraphEventBus()
+        await bus.connect()
+
+        logger.log_effect("sid-1", "analyst", "T", _effect())
+        await bus.disconnect()
+
+        assert len(_lines(log_dir / "sid-1" / "analyst.jsonl")) == 1
+        assert logger.stats()["queued"] == 0
+        assert logger._files == {}
+
+    def test_batch_size_comes_from_settings(self, log_dir: Path, monkeypatch) -> None:
+        monkeypatch.setenv("DIALEXITY_GRAPH_LOG_DIR", str(log_dir))
+        monkeypatch.setenv("DIALEXITY_GRAPH_LOG_BATCH_SIZE", "7")
+        monkeypatch.setenv("DIALEXITY_DI_WIRING", "lazy")
+        # Keep the session container wired and its bus on ExecutionReport
+        monkeypatch.setattr(lazy_wiring, "register", lambda container: None)
+        monkeypatch.setattr(ExecutionReport, "_event_bus", ExecutionReport._event_bus)
+
+        DialecticalReasoning.setup(Settings.from_env())
+
+        assert ExecutionReport._effect_logger._batch_size == 7
+
+
+class TestRotation:
+    def test_rotates_by_size_and_gzips(self, log_dir: Path) -> None:
+        logger = EffectLogger(str(log_dir), max_bytes=400, compression="gzip")
+
+        for i in range(10):
+            logger.log_effect("sid-1", "analyst", "T", _effect(i))
+        logger.close()
+
+        rotated = sorted((log_dir / "sid-1").glob("analyst.*.jsonl.gz"))
+        assert rotated and logger.stats()["rotations"] == len(rotated)
+        seqs = [
+            json.loads(line)["seq"]
+            for path in rotated
+            for line in gzip.decompress(path.read_bytes()).decode().splitlines()
+        ]
+        seqs += [json.loads(line)["seq"] for line in _lines(log_dir / "sid-1" / "analyst.jsonl")]
+        assert sorted(seqs) == list(range(10))
+        assert (log_dir / "sid-1" / "analyst.jsonl").stat().st_size <= 400
+
+    def test_rotates_by_age(self, log_dir: Path) -> None:
+        logger = EffectLogger(str(log_dir), max_age=0.01)
+
+        logger.log_effect("sid-1", "analyst", "T", _effect(0))
+        time.sleep(0.05)
+        logger.log_effect("sid-1", "analyst", "T", _effect(1))
+        logger.close()
+
+        assert logger.stats()["rotations"] == 1
+        assert len(_lines(log_dir / "sid-1" / "analyst.jsonl")) == 1
+
+    def test_unknown_compression_rejected(self, log_dir: Path) -> None:
+        with pytest.raises(ValueError, match="compression"):
+            EffectLogger(str(log_dir), compression="bz2")
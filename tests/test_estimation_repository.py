@@ -0,0 +1,176 @@
+"""Tests for batched estimation reads and the denormalized est_<type> properties."""
+
+from __future__ import annotations
+
+import pytest
+
+from dialectical_framework.graph.estimation_manager import EstimationManager
+from dialectical_framework.graph.nodes.cycle import Cycle
+from dialectical_framework.graph.nodes.estimation import (
+    CausalityProbabilityEstimation, DialecticalValidityEstimation, Estimation,
+    FeasibilityEstimation)
+from dialectical_framework.graph.repositories.estimation_repository import \
+    EstimationRepository
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+class _FakeGraphDb:
+    """Records queries; answers execute_and_fetch with canned rows."""
+
+    def __init__(self, rows: list[dict] = ()) -> None:
+        self.rows = list(rows)
+        self.queries: list[tuple[str, dict]] = []
+
+    def execute_and_fetch(self, query, params=None):
+        self.queries.append((query, params))
+        return iter(self.rows)
+
+    def execute(self, query, params=None):
+        self.queries.append((query, params))
+
+
+def _entity(node_id, sid="s1", **props) -> Cycle:
+    entity = Cycle(sid=sid, **props)
+    entity._id = node_id
+    return entity
+
+
+class TestPropertyName:
+    def test_snake_cased_label(self):
+        assert CausalityProbabilityEstimation.property_name() == "est_causality_probability"
+        assert DialecticalValidityEstimation.property_name() == "est_dialectical_validity"
+
+
+class TestGetValues:
+    def test_many_entities_and_types_in_one_query(self):
+        db = _FakeGraphDb([
+            {"id": 1, "labels": ["CausalityProbability", "Estimation", "Node"], "value": 0.6},
+            {"id": 1, "labels": ["Feasibility", "Estimation", "Node"], "value": 0.9},
+            {"id": 2, "labels": ["CausalityProbability", "Estimation", "Node"], "value": 0.2},
+            {"id": 2, "labels": ["CausalityProbability", "Estimation", "Node"], "value": 0.7},
+        ])
+        entities = [_entity(1), _entity(2), _entity(3)]
+        types = [CausalityProbabilityEstimation, FeasibilityEstimation]
+
+        values = EstimationRepository().get_values(entities, types, sid="s1", graph_db=db)
+
+        assert len(db.queries) == 1
+        assert sorted(db.queries[0][1]["ids"]) == [1, 2, 3]
+        assert values == {
+            1: {CausalityProbabilityEstimation: 0.6, FeasibilityEstimation: 0.9},
+            # Earliest committed wins, as with estimations.all()
+            2: {CausalityProbabilityEstimation: 0.2, FeasibilityEstimation: None},
+            3: {CausalityProbabilityEstimation: None, FeasibilityEstimation: None},
+        }
+
+    def test_base_type_matches_subclasses(self):
+        db = _FakeGraphDb([
+            {"id": 1, "labels": ["Feasibility", "Estimation", "Node"], "value": 0.4},
+        ])
+
+        values = EstimationRepository().get_values([_entity(1)], [Estimation], sid="s1", graph_db=db)
+
+        assert values[1][Estimation] == 0.4
+
+    def test_unsaved_and_out_of_scope_entities_are_not_queried(self):
+        db = _FakeGraphDb()
+        unsaved = _entity(None)
+        foreign = _entity(7, sid="other")
+
+        values = EstimationRepository().get_values(
+            [unsaved, foreign], [FeasibilityEstimation], sid="s1", graph_db=db
+        )
+
+        assert db.queries == []
+        assert values == {7: {FeasibilityEstimation: None}}
+
+    def test_denormalized_values_are_not_queried(self):
+        db = _FakeGraphDb([
+            {"id": 2, "labels": ["Feasibility", "Estimation", "Node"], "value": 0.9},
+        ])
+        carried = _entity(1, est_causality_probability=0.6, est_feasibility=None)
+        partial = _entity(2, est_causality_probability=0.3)
+        types = [CausalityProbabilityEstimation, FeasibilityEstimation]
+
+        values = EstimationRepository().get_values([carried, partial], types, sid="s1", graph_db=db)
+
+        assert len(db.queries) == 1
+        assert db.queries[0][1] == {"ids": [2], "labels": ["Feasibility"]}
+        assert values == {
+            1: {CausalityProbabilityEstimation: 0.6, FeasibilityEstimation: None},
+            2: {CausalityProbabilityEstimation: 0.3, FeasibilityEstimation: 0.9},
+        }
+
+
+class TestDenormalizedValues:
+    def test_estimation_value_reads_the_node_property(self, di_container):
+        db = _FakeGraphDb()
+        di_container.graph_db.override(db)
+        try:
+            entity = _entity(1, est_feasibility=0.35)
+
+            assert entity.estimation_value(FeasibilityEstimation) == 0.35
+            assert db.queries == []
+        finally:
+            di_container.graph_db.reset_override()
+
+    def test_estimation_value_falls_back_to_the_subgraph(self, di_container):
+        db = _FakeGraphDb([{"id": 1, "labels": ["Feasibility"], "value": 0.5}])
+        di_container.graph_db.override(db)
+        try:
+            entity = _entity(1, sid=None)
+
+            assert entity.estimation_value(FeasibilityEstimation) == 0.5
+            assert len(db.queries) == 1
+        finally:
+            di_container.graph_db.reset_override()
+
+    def test_manager_mirrors_and_clears_the_property(self):
+        db = _FakeGraphDb()
+        entity = _entity(1)
+        manager = EstimationManager()
+
+        manager._denormalize(entity, FeasibilityEstimation, 0.8, db)
+        assert entity.estimation_value(FeasibilityEstimation) == 0.8
+        assert "SET n.est_feasibility = $value" in db.queries[-1][0]
+
+        manager._delete_estimations(entity, FeasibilityEstimation, db)
+        assert entity.estimation_value(FeasibilityEstimation) is None
+        assert "SET n.est_feasibility = null" in db.queries[-1][0]
+
+    def test_manager_creates_estimations_with_attributes(self, monkeypatch):
+        committed = []
+        monkeypatch.setattr(Estimation, "set_target", lambda self, target: None)
+        monkeypatch.setattr(Estimation, "commit", lambda self: committed.append(self))
+
+        estimation = EstimationManager()._get_or_create_estimation(
+            DialecticalValidityEstimation, 0.7, _entity(None), _FakeGraphDb(),
+            attributes={
+                "t_plus_without_a_plus_yields_t_minus": 0.6,
+                "a_plus_without_t_plus_yields_a_minus": 0.8,
+            },
+        )
+
+        assert committed == [estimation]
+        assert estimation.value == 0.7
+        assert estimation.t_plus_without_a_plus_yields_t_minus == 0.6
+        assert estimation.a_plus_without_t_plus_yields_a_minus == 0.8
+
+    def test_bulk_replace_sets_client_marker_labels(self):
+        db = _FakeGraphDb()
+        db.extra_node_labels = ("Marker",)
+
+        EstimationManager().replace_estimations_bulk(
+            FeasibilityEstimation, [(_entity(1, hash="c" * 64), 0.4)], graph_db=db
+        )
+
+        assert "SET e:Marker" in db.queries[-1][0]
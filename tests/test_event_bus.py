@@ -208,3 +208,178 @@ class TestExecutionReportEventIntegration:
             await asyncio.sleep(0.05)
         finally:
             ExecutionReport.set_event_bus(None)
+
+
+def _effect(effect_type: str, node_hash: str, **patch) -> Effect:
+    return Effect(
+        seq=0,
+        effect_type=effect_type,
+        node=NodeRef(label="Statement", hash=node_hash),
+        patch=patch,
+    )
+
+
+class TestEnvelopes:
+
+    @pytest.mark.asyncio
+    async def test_window_effects_arrive_as_one_ordered_envelope(self):
+        bus = GraphEventBus(flush_window=0.02)
+        await bus.connect()
+        try:
+            async with bus.subscribe("sid") as subscriber:
+                for i in range(5):
+                    bus.emit("sid", _effect("node_created", f"h{i}"))
+                events = await asyncio.wait_for(subscriber.get_batch(), timeout=1.0)
+
+            assert [e.effect.node.hash for e in events] == [f"h{i}" for i in range(5)]
+            assert bus.stats()["envelopes"] == 1
+            assert bus.stats()["effects"] == 5
+        finally:
+            await bus.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_envelope_seq_is_per_sid(self):
+        bus = GraphEventBus(flush_window=10)
+        await bus.connect()
+        try:
+            batches = []
+
+            async def listen():
+                async with bus._broadcast.subscribe("sid") as upstream:
+                    async for event in upstream:
+                        batches.append(event.message)
+                        if len(batches) == 2:
+                            return
+
+            task = asyncio.create_task(listen())
+            await asyncio.sleep(0.05)
+            bus.emit("sid", _effect("node_created", "a"))
+            bus.emit("other", _effect("node_created", "b"))
+            bus.flush()
+            bus.emit("sid", _effect("node_created", "c"))
+            bus.flush("sid")
+            await asyncio.wait_for(task, timeout=1.0)
+
+            assert [(b.seq, len(b.effects)) for b in batches] == [(1, 1), (2, 1)]
+        finally:
+            await bus.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_finalized_report_is_flushed_without_waiting_for_the_window(self):
+        from dialectical_framework.graph.scope_context import scope
+
+        bus = GraphEventBus(flush_window=10)
+        await bus.connect()
+        ExecutionReport.set_event_bus(bus)
+        try:
+            async with bus.subscribe("report-sid") as subscriber:
+                with scope("report-sid"):
+                    report = ExecutionReport(tool="test_tool")
+                    bus.emit("report-sid", _effect("node_created", "x"))
+                    bus.emit("report-sid", _effect("node_updated", "x", text="y"))
+                    report.finalize()
+                events = await asyncio.wait_for(subscriber.get_batch(), timeout=1.0)
+
+            assert [e.effect.effect_type for e in events] == ["node_created", "node_updated"]
+        finally:
+            ExecutionReport.set_event_bus(None)
+            await bus.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_emit_from_a_worker_thread_flushes_on_the_owning_loop(self):
+        bus = GraphEventBus(flush_window=0.02)
+        await bus.connect()
+        try:
+            async with bus.subscribe("sid") as subscriber:
+                await asyncio.to_thread(bus.emit, "sid", _effect("node_created", "t"))
+                await asyncio.to_thread(
+                    asyncio.run, _emit_async(bus, _effect("node_created", "u"))
+                )
+                events = await asyncio.wait_for(subscriber.get_batch(), timeout=1.0)
+
+            assert [e.effect.node.hash for e in events] == ["t", "u"]
+        finally:
+            await bus.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_timer_orphaned_on_a_closed_loop_is_replaced(self):
+        bus = GraphEventBus(flush_window=0.02)
+        await bus.connect()
+        try:
+            dead = asyncio.new_event_loop()
+            bus._scheduled["sid"] = (dead, dead.call_later(10, bus.flush, "sid"))
+            dead.close()
+
+            async with bus.subscribe("sid") as subscriber:
+                bus.emit("sid", _effect("node_created", "x"))
+                events = await asyncio.wait_for(subscriber.get_batch(), timeout=1.0)
+
+            assert [e.effect.node.hash for e in events] == ["x"]
+        finally:
+            await bus.disconnect()
+
+
+async def _emit_async(bus: GraphEventBus, effect: Effect) -> None:
+    bus.emit("sid", effect)
+
+
+class TestOverflow:
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_counts_drops(self, bus: GraphEventBus):
+        async with bus.subscribe("sid", queue_size=2) as subscriber:
+            for i in range(5):
+                await bus.publish("sid", _effect("node_created", f"h{i}"))
+            await asyncio.sleep(0.05)
+            events = await subscriber.get_batch()
+            stats = bus.stats()
+
+        assert [e.effect.node.hash for e in events] == ["h3", "h4"]
+        assert stats["dropped"] == 3
+        assert stats["max_queue_depth"] == 2
+
+    @pytest.mark.asyncio
+    async def test_coalesce_merges_updates_of_the_same_node(self, bus: GraphEventBus):
+        async with bus.subscribe("sid", queue_size=2, overflow="coalesce") as subscriber:
+            await bus.publish("sid", _effect("node_created", "a", text="v1"))
+            await bus.publish("sid", _effect("node_created", "b"))
+            await bus.publish("sid", _effect("node_updated", "a", text="v2"))
+            await bus.publish("sid", _effect("node_deleted", "b"))
+            await asyncio.sleep(0.05)
+            events = await subscriber.get_batch()
+
+        assert [(e.effect.effect_type, e.effect.node.hash) for e in events] == [
+            ("node_created", "a"),
+            ("node_deleted", "b"),
+        ]
+        assert events[0].effect.patch == {"text": "v2"}
+        assert bus.stats()["coalesced"] == 2
+        assert bus.stats()["dropped"] == 0
+
+    @pytest.mark.asyncio
+    async def test_disconnect_policy_ends_the_subscription(self, bus: GraphEventBus):
+        from dialectical_framework.events.graph_event_bus import SubscriberOverflow
+
+        async with bus.subscribe("sid", queue_size=2, overflow="disconnect") as subscriber:
+            for i in range(3):
+                await bus.publish("sid", _effect("node_created", f"h{i}"))
+            await asyncio.sleep(0.05)
+            with pytest.raises(SubscriberOverflow):
+                async for _ in subscriber:
+                    pass
+
+        assert bus.stats()["disconnected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_does_not_hold_up_others(self, bus: GraphEventBus):
+        async with bus.subscribe("sid", queue_size=1) as slow, bus.subscribe("sid") as fast:
+            for i in range(3):
+                await bus.publish("sid", _effect("node_created", f"h{i}"))
+            await asyncio.sleep(0.05)
+
+            assert len(await fast.get_batch()) == 3
+            assert slow.dropped == 2
+
+    def test_unknown_policy_is_rejected(self):
+        with pytest.raises(ValueError):
+            GraphEventBus(overflow="block")
@@ -16,28 +16,17 @@ from dialectical_framework.agents.explorer.explorer import (
     ExplorationPipeline, ExplorationResult)
 
 
-class _FakeEstimations:
-    def __init__(self, probability):
-        self._probability = probability
-
-    def all(self):
-        from dialectical_framework.graph.nodes.estimation import \
-            CausalityProbabilityEstimation
-
-        if self._probability is None:
-            return []
-        est = CausalityProbabilityEstimation(value=self._probability)
-        return [(est, None)]
-
-
 class _FakeWheel:
     """Duck-typed wheel: exactly what _select_deep_wheels touches."""
 
     def __init__(self, hash: str, probability=None, polarity_count: int = 2):
         self.hash = hash
-        self.estimations = _FakeEstimations(probability)
+        self._probability = probability
         self._polarity_count = polarity_count
 
+    def estimation_value(self, estimation_type):
+        return self._probability
+
     @property
     def polarity_count(self) -> int:
         if self._polarity_count < 0:
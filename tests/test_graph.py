@@ -1568,6 +1568,52 @@ def test_cycle_rejects_duplicate_perspectives():
     print("✓ Cycle rejects duplicate perspectives")
 
 
+def test_cycle_and_wheel_lookup_keys():
+    """Cycles and Wheels persist layer_key / rotation_signature, and the
+    repositories find them by indexed equality (rotation-invariant)."""
+    from dialectical_framework.graph.repositories.cycle_repository import CycleRepository
+    from dialectical_framework.graph.repositories.wheel_repository import WheelRepository
+    from dialectical_framework.graph.rotation_keys import layer_key
+    from dialectical_framework.graph.nodes.case import Case
+    from dialectical_framework.graph.scope_context import scope
+
+    case = Case()
+    case.commit()
+    with scope(case.sid):
+        pps = []
+        t_components = []
+        for i in range(3):
+            pp, _, components = create_perspective_with_polarity(
+                t_statement=f"Keys thesis {i}", a_statement=f"Keys antithesis {i}",
+                intent=f"keys_pp{i}_{random.random()}",
+            )
+            pp.commit()
+            pps.append(pp)
+            t_components.append(components["t"])
+
+        cycle, wheel, _ = create_cycle_wheel_setup(pps, t_components)
+        wheel.commit()
+
+        assert cycle.layer_key == layer_key([pp.hash for pp in reversed(pps)])
+        assert wheel.layer_key == cycle.layer_key
+        assert wheel.rotation_signature == WheelRepository._get_canonical_signature(
+            [c.hash for c in t_components]
+        )
+
+        cycle_repo = CycleRepository()
+        rotated = pps[1:] + pps[:1]
+        assert [c.hash for c in cycle_repo.find_by_perspectives(rotated)] == [cycle.hash]
+        # The reverse direction of a 3-cycle is a different cycle
+        assert cycle_repo.find_by_perspectives(list(reversed(pps))) == []
+        assert [c.hash for c in cycle_repo.find_by_layer(list(reversed(pps)))] == [cycle.hash]
+
+        wheel_repo = WheelRepository()
+        found = wheel_repo.find_by_component_sequence(t_components[2:] + t_components[:2])
+        assert found is not None and found.hash == wheel.hash
+        assert [w.hash for w in wheel_repo.find_by_layer(rotated)] == [wheel.hash]
+        assert wheel_repo.find_by_layer(pps[:2]) == []
+
+
 def test_perspective_combination_dedups_duplicate_nexus_edge():
     """PerspectiveCombination must not emit degenerate cycles when the Nexus
     has a duplicate BELONGS_TO_NEXUS edge.
@@ -1643,6 +1689,53 @@ def test_perspective_combination_dedups_duplicate_nexus_edge():
     print("✓ PerspectiveCombination dedups duplicate nexus edges")
 
 
+def test_perspective_combination_prunes_and_pairs_twins():
+    """Arrangements rejected by the prefilter are never persisted; layer-2
+    opposite-direction wheels are paired at build time; a rerun reuses
+    every wheel."""
+    from dialectical_framework.graph.nodes.nexus import Nexus
+    from dialectical_framework.graph.nodes.case import Case
+    from dialectical_framework.graph.scope_context import scope
+    from dialectical_framework.concerns.perspective_combination import (
+        PerspectiveCombination,
+    )
+
+    case_node = Case()
+    case_node.commit()
+
+    with scope(case_node.sid):
+        uid = random.random()
+        pps = []
+        for i in (1, 2):
+            pp, _, _ = create_perspective_with_polarity(
+                t_statement=f"Twin thesis {i}", a_statement=f"Twin antithesis {i}",
+                intent=f"twin_pp{i}_{uid}"
+            )
+            pp.commit()
+            pps.append(pp)
+
+        nexus = Nexus(intent=f"twin_nexus_{uid}")
+        nexus.commit()
+
+        # Drop layer-1 wheels only (2 components): layer 2 stays intact
+        combination = PerspectiveCombination(
+            prefilter=lambda arrangement: len(arrangement.components) > 2
+        )
+        result = combination.resolve(nexus=nexus, perspectives=pps)
+
+        assert 1 not in result.wheels_by_layer
+        layer2 = result.wheels_by_layer[2]
+        assert len(layer2) == 2
+        assert combination.report.artifacts["pruned_arrangements"] == 2
+
+        first, second = layer2
+        twins = [w.hash for w, _ in first.opposite_direction.all()]
+        assert twins == [second.hash]
+
+        rerun = PerspectiveCombination().resolve(nexus=nexus, perspectives=pps)
+        assert 2 not in rerun.wheels_by_layer
+
+
 async def test_create_nexus_dedups_repeated_hashes():
     """CreateNexus must not create duplicate BELONGS_TO_NEXUS edges when the
     same perspective hash appears twice in the input list.
@@ -0,0 +1,157 @@
+"""Tests for the bounded graph connection pool and the async graph adapter."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from dialectical_framework.graph.graph_db_pool import (
+    AsyncGraphDb,
+    GraphDbPool,
+    GraphDbPoolTimeout,
+    get_bound_graph_db,
+)
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+class _FakeDb:
+    """Stands in for a GQLAlchemy client."""
+
+    def __init__(self) -> None:
+        self._cached_connection = None
+        self.queries: list[str] = []
+
+    def execute_and_fetch(self, query, parameters=None):
+        self.queries.append(query)
+        return iter([{"q": query}])
+
+    def execute(self, query, parameters=None):
+        self.queries.append(query)
+
+
+def _pool(**kwargs) -> tuple[GraphDbPool, list[_FakeDb]]:
+    created: list[_FakeDb] = []
+
+    def connect() -> _FakeDb:
+        db = _FakeDb()
+        created.append(db)
+        return db
+
+    return GraphDbPool(connect=connect, **kwargs), created
+
+
+class TestGraphDbPool:
+    def test_reuses_idle_connection(self):
+        pool, created = _pool(size=2)
+        with pool.acquire() as first:
+            pass
+        with pool.acquire() as second:
+            pass
+        assert first is second
+        assert len(created) == 1
+
+    def test_acquire_times_out_when_exhausted(self):
+        pool, _ = _pool(size=1, acquire_timeout=0.05)
+        with pool.acquire():
+            with pytest.raises(GraphDbPoolTimeout):
+                with pool.acquire():
+                    pass
+        # Slot released after the timeout
+        with pool.acquire():
+            pass
+
+    def test_expired_connection_is_replaced(self):
+        pool, created = _pool(size=1, max_lifetime=0.01)
+        with pool.acquire() as first:
+            pass
+        time.sleep(0.02)
+        with pool.acquire() as second:
+            pass
+        assert first is not second
+        assert pool.created == 1
+
+    def test_never_exceeds_size(self):
+        pool, created = _pool(size=3)
+        barrier = threading.Barrier(3)
+
+        def worker():
+            with pool.acquire():
+                barrier.wait(timeout=1)
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(created) == 3
+        with pool.acquire():
+            pass
+        assert len(created) == 3
+
+
+class TestAsyncGraphDb:
+    def test_run_binds_pooled_connection(self):
+        pool, created = _pool(size=2)
+        adapter = AsyncGraphDb(pool)
+        shared = _FakeDb()
+
+        async def main():
+            inside = await adapter.run(get_bound_graph_db, shared)
+            return inside, get_bound_graph_db(shared)
+
+        inside, outside = asyncio.run(main())
+        assert inside is created[0]
+        assert outside is shared
+        adapter.shutdown()
+
+    def test_blocking_work_does_not_stall_loop(self):
+        pool, _ = _pool(size=2)
+        adapter = AsyncGraphDb(pool)
+        ticks: list[float] = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def main():
+            await asyncio.gather(adapter.run(time.sleep, 0.1), ticker())
+
+        asyncio.run(main())
+        assert len(ticks) == 5
+        assert ticks[-1] - ticks[0] < 0.1
+        adapter.shutdown()
+
+    def test_execute_and_fetch_materializes_rows(self):
+        pool, created = _pool(size=1)
+        adapter = AsyncGraphDb(pool)
+        rows = asyncio.run(adapter.execute_and_fetch("RETURN 1"))
+        assert rows == [{"q": "RETURN 1"}]
+        assert created[0].queries == ["RETURN 1"]
+        adapter.shutdown()
+
+    def test_nested_run_reuses_the_bound_connection(self):
+        pool, created = _pool(size=1, acquire_timeout=0.05)
+        adapter = AsyncGraphDb(pool)
+        shared = _FakeDb()
+
+        def offloaded_work():
+            # e.g. an offloaded tool call rendering the context
+            return asyncio.run(adapter.run(get_bound_graph_db, shared))
+
+        inner = asyncio.run(adapter.run(offloaded_work))
+        assert inner is created[0]
+        assert len(created) == 1
+        adapter.shutdown()
@@ -0,0 +1,129 @@
+"""Tests for the per-turn GraphSession (identity map + relationship cache)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from dialectical_framework.graph.graph_session import (
+    GraphSession,
+    get_current_session,
+    graph_session,
+    invalidate_current_session,
+)
+from dialectical_framework.graph.relationship_manager import BoundRelationshipManager
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+def _node(node_id: int, hash: str | None = None, sid: str | None = "s1"):
+    return SimpleNamespace(_id=node_id, hash=hash, sid=sid)
+
+
+FULL_HASH = "a" * 64
+
+
+class _CountingDb:
+    """Minimal graph_db double counting execute_and_fetch calls."""
+
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+        self.calls = 0
+
+    def execute_and_fetch(self, query, params=None):
+        self.calls += 1
+        return iter(self.rows)
+
+
+class TestIdentityMap:
+    def test_adopt_returns_first_instance(self):
+        session = GraphSession()
+        first = _node(1, FULL_HASH)
+        second = _node(1, FULL_HASH)
+        assert session.adopt(first) is first
+        assert session.adopt(second) is first
+
+    def test_exact_hash_hit_prefix_miss(self):
+        session = GraphSession()
+        node = session.adopt(_node(1, FULL_HASH))
+        assert session.find_by_hash(FULL_HASH, "s1") is node
+        assert session.find_by_hash(FULL_HASH[:7], "s1") is None
+        assert session.find_by_hash(FULL_HASH, "other") is None
+
+    def test_invalidate_drops_identity_and_lists(self):
+        session = GraphSession()
+        target = _node(2, FULL_HASH)
+        key = (1, "T", "outgoing", "Statement")
+        session.put_relationships(key, [(target, object())])
+
+        session.invalidate_node(2)
+        assert session.get_relationships(key) is None
+        assert session.find_by_hash(FULL_HASH, "s1") is None
+
+
+class TestSessionContext:
+    def test_no_session_by_default(self):
+        assert get_current_session() is None
+
+    def test_nested_sessions_share_state(self):
+        with graph_session() as outer:
+            with graph_session() as inner:
+                assert inner is outer
+            assert get_current_session() is outer
+        assert get_current_session() is None
+
+    def test_invalidate_current_session_clears(self):
+        with graph_session() as session:
+            session.put_relationships((1, "T", "outgoing", "Statement"), [])
+            invalidate_current_session()
+            assert session.get_relationships((1, "T", "outgoing", "Statement")) is None
+
+
+class TestRelationshipCache:
+    def _manager(self) -> BoundRelationshipManager:
+        return BoundRelationshipManager(
+            source_node=_node(1),
+            target_class_name="Statement",
+            relationship_type="T",
+            relationship_model=None,
+            direction="outgoing",
+        )
+
+    def test_all_served_from_session(self):
+        target = _node(2, FULL_HASH)
+        db = _CountingDb([{"target": target, "relationship": "rel"}])
+        session = GraphSession()
+        manager = self._manager()
+
+        first = manager.all(graph_db=db, session=session)
+        second = manager.all(graph_db=db, session=session)
+        assert db.calls == 1
+        assert first == second == [(target, "rel")]
+        assert manager.count(graph_db=db, session=session) == 1
+        assert db.calls == 1
+
+    def test_write_invalidates(self):
+        db = _CountingDb([{"target": _node(2, FULL_HASH), "relationship": "rel"}])
+        session = GraphSession()
+        manager = self._manager()
+
+        manager.all(graph_db=db, session=session)
+        session.invalidate_node(1)
+        manager.all(graph_db=db, session=session)
+        assert db.calls == 2
+
+    def test_without_session_always_queries(self):
+        db = _CountingDb([])
+        manager = self._manager()
+        manager.all(graph_db=db, session=None)
+        manager.all(graph_db=db, session=None)
+        assert db.calls == 2
@@ -0,0 +1,119 @@
+"""Tests for exact-hash lookups and the stored, indexed short_hash."""
+
+from __future__ import annotations
+
+import pytest
+
+from dialectical_framework.dialectical_reasoning import DialecticalReasoning
+from dialectical_framework.exceptions.node_errors import AmbiguousHashError
+from dialectical_framework.graph.batch_committer import _row_properties
+from dialectical_framework.graph.nodes.cycle import Cycle
+from dialectical_framework.graph.nodes.nexus import Nexus
+from dialectical_framework.graph.repositories.nexus_repository import \
+    NexusRepository
+from dialectical_framework.graph.repositories.node_repository import (
+    NodeRepository, hash_predicate)
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+FULL = "abc1234" + "0" * 57
+
+
+class _FakeGraphDb:
+    def __init__(self, results: list[list[dict]]) -> None:
+        self._results = list(results)
+        self.queries: list[tuple[str, dict]] = []
+
+    def execute_and_fetch(self, query, params=None):
+        self.queries.append((query, params))
+        return iter(self._results.pop(0) if self._results else [])
+
+
+class TestShortHashField:
+    def test_follows_hash(self):
+        cycle = Cycle()
+        assert cycle.short_hash is None
+
+        cycle.hash = FULL
+        assert cycle.short_hash == "abc1234"
+        assert _row_properties(cycle)["short_hash"] == "abc1234"
+
+        cycle.hash = None
+        assert cycle.short_hash is None
+
+    def test_derived_for_nodes_loaded_without_it(self):
+        assert Cycle(hash=FULL).short_hash == "abc1234"
+
+    def test_not_copied_to_clones(self):
+        cycle = Cycle(hash=FULL, committed_at=1.0)
+        assert cycle.clone().short_hash is None
+
+
+class TestHashPredicate:
+    def test_full_hash_is_an_equality_on_hash(self):
+        assert hash_predicate(FULL) == ("n.hash = $hash", {"hash": FULL})
+
+    def test_short_hash_is_an_equality_on_short_hash(self):
+        assert hash_predicate("abc1234") == (
+            "n.short_hash = $short_hash", {"short_hash": "abc1234"}
+        )
+
+    def test_longer_prefix_is_narrowed_through_short_hash(self):
+        predicate, params = hash_predicate("abc12340", var="w")
+
+        assert predicate == "w.short_hash = $short_hash AND w.hash STARTS WITH $hash"
+        assert params == {"short_hash": "abc1234", "hash": "abc12340"}
+
+    def test_too_short_prefix_falls_back_to_starts_with(self):
+        assert hash_predicate("abc") == ("n.hash STARTS WITH $hash", {"hash": "abc"})
+
+
+class TestFindByHash:
+    def test_full_hash_uses_equality(self):
+        db = _FakeGraphDb([[{"n": Cycle(hash=FULL)}]])
+
+        node = NodeRepository().find_by_hash(FULL, sid="s1", graph_db=db, session=None)
+
+        assert node.hash == FULL
+        query, params = db.queries[0]
+        assert "n.hash = $hash" in query and "STARTS WITH" not in query
+        assert params == {"hash": FULL, "sid": "s1"}
+
+    def test_ambiguous_short_hash_lists_candidates(self):
+        other = "abc1234" + "1" * 57
+        db = _FakeGraphDb([[{"n": Cycle(hash=FULL)}, {"n": Nexus(hash=other)}]])
+
+        with pytest.raises(AmbiguousHashError) as excinfo:
+            NodeRepository().find_by_hash("abc1234", sid="s1", graph_db=db, session=None)
+
+        assert isinstance(excinfo.value, ValueError)
+        assert excinfo.value.candidates == [(FULL, "Cycle"), (other, "Nexus")]
+        assert "Ambiguous hash 'abc1234'" in str(excinfo.value)
+
+    def test_nexus_prefix_uses_short_hash(self):
+        db = _FakeGraphDb([[{"n": Nexus(hash=FULL)}]])
+
+        nexus = NexusRepository().find_by_hash_prefix("abc1234", sid="s1", graph_db=db)
+
+        assert nexus.hash == FULL
+        assert "n.short_hash = $short_hash" in db.queries[0][0]
+
+
+class TestBackfill:
+    def test_runs_in_batches_until_done(self):
+        db = _FakeGraphDb([[{"updated": 2}], [{"updated": 1}]])
+
+        updated = DialecticalReasoning._backfill_short_hashes(db, batch_size=2)
+
+        assert updated == 3
+        assert len(db.queries) == 2
+        assert "SET n.short_hash = substring(n.hash, 0, 7)" in db.queries[0][0]
@@ -0,0 +1,82 @@
+"""Cold-start budget: container setup must not import the whole package."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+# Seconds for a fresh interpreter to import the container and set it up.
+# Generous for slow CI runners; eager wiring takes several times longer.
+BUDGET = float(os.getenv("DIALEXITY_IMPORT_BUDGET", 2.5))
+
+_COLD_START = """
+import json, sys, time
+start = time.perf_counter()
+from dialectical_framework.dialectical_reasoning import DialecticalReasoning
+from dialectical_framework.settings import Settings
+DialecticalReasoning.setup(Settings.from_env())
+elapsed = time.perf_counter() - start
+framework = sorted(m for m in sys.modules if m.startswith("dialectical_framework"))
+
+# A module imported after setup is wired on import
+from dialectical_framework.concerns.statement_deduplication import _di_statement_index
+wired = type(_di_statement_index()).__name__
+
+# Fetched rows hydrate as their concrete node class
+from gqlalchemy import Node
+hydrated = type(Node.parse_obj({"_id": 1, "_labels": {"Node", "Rationale"}, "text": "x"})).__name__
+
+print(json.dumps({"elapsed": elapsed, "framework": framework, "wired": wired, "hydrated": hydrated}))
+"""
+
+
+def _cold_start(wiring: str) -> dict:
+    env = {
+        **os.environ,
+        "DIALEXITY_DI_WIRING": wiring,
+        "DIALEXITY_DEFAULT_MODEL": os.getenv("DIALEXITY_DEFAULT_MODEL", "anthropic/test-model"),
+    }
+    out = subprocess.run(
+        [sys.executable, "-c", _COLD_START],
+        env=env, capture_output=True, text=True, check=True, timeout=120,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+class TestColdStart:
+    def test_lazy_setup_stays_within_budget(self):
+        result = _cold_start("lazy")
+
+        assert result["elapsed"] < BUDGET, f"cold start took {result['elapsed']:.2f}s"
+        assert "dialectical_framework.agents.advisor.advisor" not in result["framework"]
+        assert "dialectical_framework.concerns.causality.causality_estimator_balanced" not in result["framework"]
+        assert result["wired"] == "StatementIndexStore"
+
+    def test_lazy_setup_registers_every_node_class(self):
+        result = _cold_start("lazy")
+
+        assert result["hydrated"] == "Rationale"
+        assert "dialectical_framework.graph.nodes.decision" in result["framework"]
+        assert "dialectical_framework.graph.relationships.estimates_relationship" in result["framework"]
+
+    def test_eager_setup_still_wires_everything(self):
+        lazy = _cold_start("lazy")
+        eager = _cold_start("eager")
+
+        assert eager["wired"] == "StatementIndexStore"
+        assert len(eager["framework"]) > 2 * len(lazy["framework"])
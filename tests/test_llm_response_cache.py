@@ -0,0 +1,123 @@
+"""Tests for the LLM response cache backends and use_brain's cached path."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from dependency_injector import providers
+from pydantic import BaseModel
+
+from dialectical_framework.utils.llm_response_cache import (
+    MemoryLlmCache,
+    SqliteLlmCache,
+    llm_cache_key,
+)
+from dialectical_framework.utils.use_brain import use_brain
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+class _Verdict(BaseModel):
+    label: str
+    score: float
+
+
+class TestCacheKey:
+    def test_stable_across_param_order(self):
+        messages = [{"role": "user", "content": "hi"}]
+        a = llm_cache_key("m", messages, {"type": "object"}, {"temperature": 0, "seed": 1})
+        b = llm_cache_key("m", messages, {"type": "object"}, {"seed": 1, "temperature": 0})
+        assert a == b
+
+    def test_sensitive_to_every_component(self):
+        messages = [{"role": "user", "content": "hi"}]
+        base = llm_cache_key("m", messages, {"type": "object"}, {})
+        assert base != llm_cache_key("other", messages, {"type": "object"}, {})
+        assert base != llm_cache_key("m", [{"role": "user", "content": "ho"}], {"type": "object"}, {})
+        assert base != llm_cache_key("m", messages, {"type": "array"}, {})
+        assert base != llm_cache_key("m", messages, {"type": "object"}, {"temperature": 1})
+
+
+class TestMemoryLlmCache:
+    def test_lru_eviction(self):
+        cache = MemoryLlmCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        assert cache.get("a") == "1"  # a is now most recent
+        cache.set("c", "3")
+        assert cache.get("b") is None
+        assert cache.get("a") == "1" and cache.get("c") == "3"
+        assert (cache.hits, cache.misses) == (3, 1)
+
+    def test_ttl_expiry(self):
+        cache = MemoryLlmCache(ttl=0.01)
+        cache.set("a", "1")
+        time.sleep(0.02)
+        assert cache.get("a") is None
+
+
+class TestSqliteLlmCache:
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "cache" / "llm.sqlite")
+        SqliteLlmCache(path).set("a", "1")
+        assert SqliteLlmCache(path).get("a") == "1"
+
+    def test_lru_eviction(self, tmp_path):
+        cache = SqliteLlmCache(str(tmp_path / "llm.sqlite"), max_entries=2)
+        cache.set("a", "1")
+        time.sleep(0.001)
+        cache.set("b", "2")
+        time.sleep(0.001)
+        assert cache.get("a") == "1"
+        time.sleep(0.001)
+        cache.set("c", "3")
+        assert cache.get("b") is None
+        assert cache.get("a") == "1" and cache.get("c") == "3"
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = SqliteLlmCache(str(tmp_path / "llm.sqlite"), ttl=0.01)
+        cache.set("a", "1")
+        time.sleep(0.02)
+        assert cache.get("a") is None
+        cache.clear()
+
+
+class TestUseBrainCache:
+    @pytest.fixture
+    def llm_cache(self, di_container):
+        cache = MemoryLlmCache()
+        di_container.llm_cache.override(providers.Object(cache))
+        yield cache
+        di_container.llm_cache.reset_override()
+
+    async def test_hit_skips_provider_call(self, llm_cache):
+        calls = 0
+
+        @use_brain(ai_model="anthropic/test-model", format=_Verdict)
+        async def judge() -> str:
+            nonlocal calls
+            calls += 1
+            return "Judge this."
+
+        key = llm_cache_key(
+            model="anthropic/test-model",
+            messages=[{"role": "user", "content": "Judge this."}],
+            format_schema=_Verdict.model_json_schema(),
+            params={},
+        )
+        llm_cache.set(key, _Verdict(label="ok", score=0.5).model_dump_json())
+
+        result = await judge()
+
+        assert result == _Verdict(label="ok", score=0.5)
+        assert calls == 1  # prompt built once, no provider round-trip
+        assert llm_cache.hits == 1
@@ -0,0 +1,200 @@
+"""Tests for LLMScheduler: priorities, fairness across sids, budgets and AIMD."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+
+import pytest
+
+from dialectical_framework.utils.llm_scheduler import (
+    LLMPriority,
+    LLMScheduler,
+    ModelBudget,
+    llm_priority,
+)
+
+MODEL = "anthropic/test-model"
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+async def _run_order(scheduler: LLMScheduler, calls: list[tuple[str, LLMPriority]]) -> list[str]:
+    """Queue calls behind a held slot, release it, and return service order."""
+    order: list[str] = []
+    gate = asyncio.Event()
+
+    async def holder():
+        async with scheduler.slot(MODEL, sid="holder"):
+            await gate.wait()
+
+    async def call(sid: str, priority: LLMPriority):
+        async with scheduler.slot(MODEL, priority=priority, sid=sid):
+            order.append(sid)
+
+    held = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    tasks = []
+    for sid, priority in calls:
+        tasks.append(asyncio.create_task(call(sid, priority)))
+        await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(held, *tasks)
+    return order
+
+
+class TestOrdering:
+    async def test_interactive_served_before_background(self):
+        scheduler = LLMScheduler(ModelBudget(max_concurrent=1))
+        order = await _run_order(scheduler, [
+            ("bg1", LLMPriority.BACKGROUND),
+            ("bg2", LLMPriority.BACKGROUND),
+            ("chat", LLMPriority.INTERACTIVE),
+        ])
+        assert order[0] == "chat"
+
+    async def test_fair_across_sids(self):
+        scheduler = LLMScheduler(ModelBudget(max_concurrent=1))
+        order = await _run_order(
+            scheduler,
+            [("a", LLMPriority.NORMAL)] * 4 + [("b", LLMPriority.NORMAL)],
+        )
+        # b's single call is not stuck behind all of a's backlog
+        assert order.index("b") <= 2
+
+    async def test_priority_from_context(self):
+        scheduler = LLMScheduler(ModelBudget(max_concurrent=1))
+        order: list[str] = []
+        gate = asyncio.Event()
+
+        async def holder():
+            async with scheduler.slot(MODEL):
+                await gate.wait()
+
+        async def call(name: str):
+            async with scheduler.slot(MODEL):
+                order.append(name)
+
+        async def interactive():
+            with llm_priority(LLMPriority.INTERACTIVE):
+                await call("chat")
+
+        held = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        bg = asyncio.create_task(call("pipeline"))
+        await asyncio.sleep(0)
+        chat = asyncio.create_task(interactive())
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(held, bg, chat)
+        assert order == ["chat", "pipeline"]
+
+
+class TestBudgets:
+    async def test_rpm_defers_excess_requests(self):
+        scheduler = LLMScheduler(ModelBudget(rpm=2))
+        for _ in range(2):
+            async with scheduler.slot(MODEL):
+                pass
+
+        with pytest.raises(asyncio.TimeoutError):
+            async with asyncio.timeout(0.05):
+                async with scheduler.slot(MODEL):
+                    pass
+        assert scheduler.snapshot()[MODEL]["requests_last_minute"] == 2
+
+    async def test_tpm_uses_reported_usage(self):
+        scheduler = LLMScheduler(ModelBudget(tpm=10_000))
+        async with scheduler.slot(MODEL) as lease:
+            lease.complete(tokens=9_999)
+        assert scheduler.snapshot()[MODEL]["tokens_last_minute"] == 9_999
+
+        with pytest.raises(asyncio.TimeoutError):
+            async with asyncio.timeout(0.05):
+                async with scheduler.slot(MODEL):
+                    pass
+
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        scheduler = LLMScheduler(ModelBudget(max_concurrent=1))
+        gate = asyncio.Event()
+
+        async def holder():
+            async with scheduler.slot(MODEL):
+                await gate.wait()
+
+        held = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(scheduler.slot(MODEL).__aenter__())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        gate.set()
+        await held
+        async with scheduler.slot(MODEL):
+            assert scheduler.snapshot()[MODEL]["in_flight"] == 1
+
+
+class TestAdaptation:
+    async def test_rate_limit_halves_window_and_pauses(self):
+        scheduler = LLMScheduler(ModelBudget(max_concurrent=8))
+        async with scheduler.slot(MODEL) as lease:
+            lease.rate_limited()
+        snapshot = scheduler.snapshot()[MODEL]
+        assert snapshot["limit"] == 1.0
+        assert snapshot["cooldown_remaining"] > 0
+
+    async def test_success_grows_window_back_to_ceiling(self):
+        scheduler = LLMScheduler(ModelBudget(max_concurrent=2))
+        state = scheduler._state(MODEL)
+        state.limit = 1.0
+        for _ in range(3):
+            state.on_success()
+        assert state.limit == 2.0
+
+    async def test_unbounded_ceiling(self):
+        scheduler = LLMScheduler()
+        async with scheduler.slot(MODEL), scheduler.slot(MODEL):
+            assert scheduler._state(MODEL).limit == math.inf
+
+
+class TestSidBookkeeping:
+    async def test_idle_sids_are_forgotten(self):
+        scheduler = LLMScheduler(ModelBudget(max_concurrent=1))
+        order = await _run_order(
+            scheduler, [(f"sid-{i}", LLMPriority.NORMAL) for i in range(50)]
+        )
+
+        state = scheduler._models[MODEL]
+        assert len(order) == 50
+        assert state.sid_vtime == {}
+        assert state.sid_active == {}
+
+    async def test_sid_with_queued_calls_is_kept(self):
+        scheduler = LLMScheduler(ModelBudget(max_concurrent=1))
+        gate = asyncio.Event()
+
+        async def holder():
+            async with scheduler.slot(MODEL, sid="a"):
+                await gate.wait()
+
+        held = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(scheduler.slot(MODEL, sid="b").__aenter__())
+        await asyncio.sleep(0)
+
+        state = scheduler._models[MODEL]
+        assert set(state.sid_vtime) == {"a", "b"}
+
+        queued.cancel()
+        gate.set()
+        await held
+        await asyncio.gather(queued, return_exceptions=True)
+        assert state.sid_vtime == {}
+        assert state.sid_active == {}
@@ -0,0 +1,150 @@
+"""Tests for the PerspectiveMetrics batch score table and its loader."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pytest
+
+from dialectical_framework.graph.perspective_metrics import PerspectiveMetrics
+from dialectical_framework.graph.repositories.perspective_repository import (
+    PerspectiveRepository,
+)
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+BALANCED = {"T+": 0.70, "T-": 0.20, "A+": 0.75, "A-": 0.25}
+SKEWED = {"T+": 0.75, "T-": 0.20, "A+": 0.45, "A-": 0.22}
+
+
+def _table(*records) -> PerspectiveMetrics:
+    return PerspectiveMetrics.from_records(records)
+
+
+class TestFormulas:
+    def test_matches_perspective_property_formulas(self):
+        metrics = _table((1, BALANCED, 0.9, 0.8, None), (2, SKEWED, 0.6, None, "passed"))
+
+        balanced = metrics.row(1)
+        assert balanced.diff_t == pytest.approx(0.50)
+        assert balanced.diff_a == pytest.approx(0.50)
+        assert balanced.area == pytest.approx(1.00)
+        assert balanced.area_normalized == pytest.approx(0.50)
+        assert balanced.rectangularity == pytest.approx(0.05**2 + 0.05**2)
+
+        skewed = metrics.row(2)
+        assert skewed.rectangularity == pytest.approx(0.30**2 + 0.02**2)
+        assert skewed.dv is None
+
+    def test_missing_aspect_leaves_derived_scores_empty(self):
+        metrics = _table((1, {"T+": 0.7, "T-": 0.2}, None, None, None))
+
+        row = metrics.row(1)
+        assert row.diff_t == pytest.approx(0.5)
+        assert row.diff_a is None
+        assert row.area is None and row.rectangularity is None
+        assert row.hs is None
+
+    def test_unknown_id_and_empty_table(self):
+        assert _table().row(1) is None
+        assert len(_table()) == 0
+        assert _table().quality_mask(0.5, 0.5, 0.5).shape == (0,)
+
+
+class TestQualityMask:
+    def test_each_floor_suppresses_independently(self):
+        low_area = {"T+": 0.5, "T-": 0.4, "A+": 0.5, "A-": 0.4}
+        metrics = _table(
+            (1, BALANCED, 0.9, 0.9, None),
+            (2, BALANCED, 0.2, 0.9, None),    # weak opposition
+            (3, low_area, 0.9, 0.9, None),    # blurred structure
+            (4, BALANCED, 0.9, 0.1, None),    # distorted framing
+            (5, BALANCED, 0.9, 0.9, "failed: Differential minimum"),
+        )
+
+        keep = metrics.quality_mask(min_hs=0.5, min_sp=0.5, min_dv=0.5)
+
+        assert metrics.ids[keep].tolist() == [1]
+
+    def test_missing_scores_never_suppress(self):
+        metrics = _table((1, {}, None, None, "passed"))
+        assert metrics.quality_mask(0.5, 0.5, 0.5).tolist() == [True]
+
+    def test_zero_floor_disables_check(self):
+        metrics = _table((1, BALANCED, 0.1, 0.1, None))
+        assert metrics.quality_mask(0.0, 0.0, 0.0).tolist() == [True]
+        assert metrics.quality_mask(min_hs=0.5).tolist() == [False]
+
+
+@dataclass
+class _Perspective:
+    _id: Optional[int]
+    sid: str = "case"
+    validation: Optional[str] = None
+
+
+class _FakeGraphDb:
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+        self.calls: list[dict] = []
+
+    def execute_and_fetch(self, query, params):
+        self.calls.append(params)
+        return iter(self.rows)
+
+
+class TestLoadMetrics:
+    def test_one_query_for_whole_batch(self):
+        db = _FakeGraphDb([
+            {
+                "id": 1,
+                "aspects": [
+                    {"rel": "T_PLUS", "kt": 0.8, "ka": 0.6},
+                    {"rel": "T_MINUS", "kt": 0.2, "ka": 0.2},
+                    {"rel": "A_PLUS", "kt": 0.7, "ka": 0.8},
+                    {"rel": "A_MINUS", "kt": 0.3, "ka": 0.2},
+                ],
+                "hs": [0.9],
+                "dv": [0.75],
+            },
+            # OPTIONAL MATCH miss: a null relationship collected as a map
+            {"id": 2, "aspects": [{"rel": None, "kt": None, "ka": None}], "hs": [], "dv": []},
+        ])
+        perspectives = [
+            _Perspective(1),
+            _Perspective(2, validation="failed: CC"),
+            _Perspective(None),
+        ]
+
+        metrics = PerspectiveRepository().load_metrics(
+            perspectives, sid="case", graph_db=db
+        )
+
+        assert len(db.calls) == 1
+        assert db.calls[0]["ids"] == [1, 2]
+        assert metrics.ids.tolist() == [1, 2]
+        first = metrics.row(1)
+        assert first.area == pytest.approx((0.7 - 0.2) + (0.75 - 0.25))
+        assert (first.hs, first.dv) == (0.9, 0.75)
+        assert metrics.row(2).validation_failed
+        assert np.isnan(metrics.area[1])
+
+    def test_out_of_scope_perspectives_are_not_queried(self):
+        db = _FakeGraphDb([])
+        metrics = PerspectiveRepository().load_metrics(
+            [_Perspective(1, sid="other")], sid="case", graph_db=db
+        )
+
+        assert db.calls == []
+        assert metrics.row(1).area is None
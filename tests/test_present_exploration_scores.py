@@ -19,19 +19,6 @@ from dialectical_framework.graph.nodes.case import Case
 from dialectical_framework.graph.scope_context import scope
 
 
-class _FakeEstimations:
-    def __init__(self, probability):
-        self._probability = probability
-
-    def all(self):
-        from dialectical_framework.graph.nodes.estimation import \
-            CausalityProbabilityEstimation
-
-        if self._probability is None:
-            return []
-        return [(CausalityProbabilityEstimation(value=self._probability), None)]
-
-
 class _FakeCycleRel:
     def __init__(self, cycle_id):
         self._cycle_id = cycle_id
@@ -57,10 +44,13 @@ class _FakeWheel:
         cycle_id: int = 100,
     ):
         self._id = id
-        self.estimations = _FakeEstimations(probability)
+        self._probability = probability
         self.polarity_count = polarity_count
         self.cycle = _FakeCycleRel(cycle_id)
 
+    def estimation_value(self, estimation_type):
+        return self._probability
+
 
 class TestCausalityLabel:
     def test_renders_p_and_percent(self):
@@ -0,0 +1,268 @@
+"""Tests for prompt-cache breakpoints and per-scope cache token accounting."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from anthropic.types import Message as AnthropicMessage
+from mirascope import llm
+from mirascope.llm.providers.anthropic import _utils  # noqa: PLC2701
+from mirascope.llm.tools import Toolkit
+
+from dialectical_framework.agents.conversation_facilitator import \
+    ConversationFacilitator
+from dialectical_framework.agents.reasonable_concern import ReasonableConcern
+from dialectical_framework.concerns.ai_dto.statement_dto import StatementDto
+from dialectical_framework.concerns.causality.causality_estimator_balanced import \
+    _build_thesis_context
+from dialectical_framework.utils.bedrock_provider import BedrockAnthropicProvider
+from dialectical_framework.utils.prompt_cache import (MAX_BREAKPOINTS,
+                                                      apply_cache_breakpoints,
+                                                      cache_breakpoint,
+                                                      is_cache_breakpoint,
+                                                      record_prompt_cache,
+                                                      track_prompt_cache)
+from dialectical_framework.utils.use_brain import use_brain
+
+MODEL = "cachetest/claude-sonnet-4-5"
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+def _encode(messages: list) -> dict:
+    _, _, kwargs = _utils.encode_request(
+        model_id="anthropic/claude-sonnet-4-5",
+        messages=messages,
+        tools=Toolkit(tools=None),
+        format=None,
+        params={},
+    )
+    return kwargs
+
+
+def _breakpoints(kwargs: dict) -> list[str]:
+    """Text (first 12 chars) of every block carrying cache_control, in request order."""
+    blocks = list(kwargs.get("system") or []) + list(kwargs.get("tools") or [])
+    for message in kwargs["messages"]:
+        if isinstance(message["content"], list):
+            blocks.extend(message["content"])
+    return [
+        (b.get("text") or b.get("name") or "")[:12]
+        for b in blocks
+        if b.get("cache_control")
+    ]
+
+
+class _FakeAsyncMessages:
+    def __init__(self, cache_read: int, cache_write: int) -> None:
+        self.requests: list[dict] = []
+        self._cache_read = cache_read
+        self._cache_write = cache_write
+
+    async def create(self, **kwargs):
+        self.requests.append(kwargs)
+        return AnthropicMessage(
+            id="msg_test",
+            type="message",
+            role="assistant",
+            model=kwargs["model"],
+            content=[{"type": "text", "text": "ok"}],
+            stop_reason="end_turn",
+            usage={
+                "input_tokens": 100,
+                "output_tokens": 5,
+                "cache_read_input_tokens": self._cache_read,
+                "cache_creation_input_tokens": self._cache_write,
+            },
+        )
+
+
+class _RecordingProvider(BedrockAnthropicProvider):
+    """Bedrock provider double: real encoding, recorded requests, no network."""
+
+    id = "cachetest"
+    default_scope = "cachetest/"
+
+    def __init__(self, cache_read: int = 0, cache_write: int = 0) -> None:
+        self.messages = _FakeAsyncMessages(cache_read, cache_write)
+        self.client = None
+        self.async_client = SimpleNamespace(messages=self.messages)
+        self._beta_provider = None
+
+
+@pytest.fixture
+def provider():
+    fake = _RecordingProvider(cache_read=800, cache_write=200)
+    llm.register_provider(fake, scope="cachetest/")
+    return fake
+
+
+class TestApplyBreakpoints:
+    def test_marked_messages_and_system_prefix(self):
+        system = cache_breakpoint(llm.messages.system("PREAMBLE. Context dump"), at=10)
+        messages = [
+            system,
+            llm.messages.user("SOURCE text"),
+            cache_breakpoint(llm.messages.assistant("OK-source", model_id=None, provider_id=None)),
+            llm.messages.user("QUESTION"),
+        ]
+        kwargs = _encode(messages)
+
+        added = apply_cache_breakpoints(messages, kwargs)
+
+        assert added == 2
+        assert [b["text"] for b in kwargs["system"]] == ["PREAMBLE. ", "Context dump"]
+        # Prefix split, system end (mirascope), marked message, last message (mirascope)
+        assert _breakpoints(kwargs) == ["PREAMBLE. ", "Context dump", "OK-source", "QUESTION"]
+
+    def test_newest_breakpoints_win_within_the_provider_limit(self):
+        messages = [llm.messages.system("SYSTEM")]
+        for i in range(4):
+            messages.append(llm.messages.user(f"USER-{i}"))
+            messages.append(
+                cache_breakpoint(llm.messages.assistant(f"OK-{i}", model_id=None, provider_id=None))
+            )
+        messages.append(llm.messages.user("QUESTION"))
+        kwargs = _encode(messages)
+
+        apply_cache_breakpoints(messages, kwargs)
+
+        assert len(_breakpoints(kwargs)) == MAX_BREAKPOINTS
+        assert _breakpoints(kwargs) == ["SYSTEM", "OK-2", "OK-3", "QUESTION"]
+
+    def test_encoded_blocks_are_copied_not_mutated(self):
+        messages = [
+            llm.messages.user("SOURCE"),
+            cache_breakpoint(llm.messages.assistant("OK", model_id=None, provider_id=None)),
+            llm.messages.user("QUESTION"),
+        ]
+        kwargs = _encode(messages)
+        original = kwargs["messages"][1]
+        snapshot = json.dumps(original)
+
+        apply_cache_breakpoints(messages, kwargs)
+
+        assert json.dumps(original) == snapshot
+        assert kwargs["messages"][1] is not original
+
+    def test_unmarked_request_is_left_alone(self):
+        messages = [llm.messages.system("SYSTEM"), llm.messages.user("QUESTION")]
+        kwargs = _encode(messages)
+        before = json.dumps(kwargs, default=str)
+
+        assert apply_cache_breakpoints(messages, kwargs) == 0
+        assert json.dumps(kwargs, default=str) == before
+
+
+class TestStablePrefixes:
+    def test_thesis_context_marks_source_text_and_theses(self):
+        theses = [StatementDto(alias="T1", text="Trust"), StatementDto(alias="T2", text="Control")]
+
+        tpl = _build_thesis_context(theses, text="Source")
+
+        assert [is_cache_breakpoint(m) for m in tpl] == [False, True, False, True]
+
+    def test_isolate_marks_the_shared_history(self):
+        facilitator = ConversationFacilitator()
+        facilitator.set_system_prompt("SYSTEM")
+        isolated_system = facilitator.isolate()
+        facilitator.add_user_message("SOURCE").add_assistant_message("OK")
+
+        isolated = facilitator.isolate()
+
+        assert not is_cache_breakpoint(isolated_system._messages[-1])
+        assert is_cache_breakpoint(isolated._messages[-1])
+
+
+class TestProviderDouble:
+    async def test_breakpoints_reach_the_provider_request(self, provider):
+        theses = [StatementDto(alias="T1", text="Trust"), StatementDto(alias="T2", text="Control")]
+
+        @use_brain(ai_model=MODEL, retry_max=1)
+        async def _call() -> list:
+            tpl = _build_thesis_context(theses, text="Source")
+            tpl.append(llm.messages.user("Assess the sequence T1 → T2 → T1..."))
+            return tpl
+
+        with track_prompt_cache("estimate") as usage:
+            await _call()
+
+        (request,) = provider.messages.requests
+        marked = [
+            i
+            for i, message in enumerate(request["messages"])
+            if isinstance(message["content"], list)
+            and message["content"][-1].get("cache_control")
+        ]
+        # Source text answer, theses answer, and mirascope's last message
+        assert marked == [1, 3, 4]
+        assert usage.summary() == {
+            "calls": 1,
+            "input_tokens": 1100,
+            "cache_read_tokens": 800,
+            "cache_write_tokens": 200,
+            "hit_rate": 0.727,
+        }
+
+
+class _CachedConcern(ReasonableConcern[None]):
+    def __init__(self, calls: int) -> None:
+        self._calls = calls
+
+    async def resolve(self) -> None:
+        for _ in range(self._calls):
+            record_prompt_cache(
+                SimpleNamespace(input_tokens=1000, cache_read_tokens=900, cache_write_tokens=0)
+            )
+
+
+class TestConcernTracking:
+    async def test_resolve_publishes_cache_artifact(self):
+        concern = _CachedConcern(calls=2)
+
+        with track_prompt_cache() as outer:
+            await concern.resolve()
+
+        assert concern.report.artifacts["prompt_cache"]["cache_read_tokens"] == 1800
+        assert concern.report.artifacts["prompt_cache"]["hit_rate"] == 0.9
+        assert outer.calls == 2  # Trackers nest
+
+    async def test_cache_artifact_is_not_shown_to_the_model(self):
+        concern = _CachedConcern(calls=1)
+
+        await concern.resolve()
+
+        assert "prompt_cache" not in json.loads(str(concern.report)).get("artifacts", {})
+
+    async def test_no_calls_no_artifact(self):
+        concern = _CachedConcern(calls=0)
+
+        await concern.resolve()
+
+        assert "prompt_cache" not in concern.report.artifacts
+
+
+class TestAdvisorPrompt:
+    def test_preamble_and_engine_are_cached_ahead_of_the_context_dump(self):
+        from dialectical_framework.agents.advisor.advisor import Advisor
+
+        advisor = Advisor(app_preamble="PREAMBLE", dialectical_context="CONTEXT DUMP")
+        system = advisor.messages[0]
+        kwargs = _encode([system, llm.messages.user("Hi")])
+
+        apply_cache_breakpoints([system, llm.messages.user("Hi")], kwargs)
+
+        prefix, rest = (block["text"] for block in kwargs["system"])
+        assert prefix.startswith("PREAMBLE") and "CONTEXT DUMP" not in prefix
+        assert rest.strip().startswith("## Current Understanding")
+        assert rest.endswith("CONTEXT DUMP")
@@ -0,0 +1,145 @@
+"""Tests for the graph query profiler and per-block query budgets."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from dialectical_framework.agents.agent_context import agent_scope
+from dialectical_framework.agents.reasonable_concern import ReasonableConcern
+from dialectical_framework.graph.query_profiler import (
+    QueryBudgetExceeded,
+    instrument_graph_db,
+    normalize_query,
+    profile_queries,
+    query_budget,
+)
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+class _FakeGraphDb:
+    """Stands in for a GQLAlchemy client: lazy row iterators, no server."""
+
+    def __init__(self, rows: int = 2) -> None:
+        self._rows = rows
+        self.executed: list[str] = []
+
+    def execute(self, query: str, parameters=None) -> None:
+        self.executed.append(query)
+
+    def execute_and_fetch(self, query: str, parameters=None):
+        self.executed.append(query)
+        return ({"n": i} for i in range(self._rows))
+
+
+class _LookupConcern(ReasonableConcern[int]):
+    def __init__(self, db: _FakeGraphDb, lookups: int) -> None:
+        self._db = db
+        self._lookups = lookups
+
+    async def resolve(self) -> int:
+        for i in range(self._lookups):
+            list(self._db.execute_and_fetch(f"MATCH (n) WHERE id(n) = {i} RETURN n"))
+        return self._lookups
+
+
+class TestNormalizeQuery:
+    def test_literals_collapse_to_one_shape(self):
+        a = normalize_query("MATCH (n {hash: 'abc'})\n  WHERE id(n) = 12 RETURN n")
+        b = normalize_query('MATCH (n {hash: "def"}) WHERE id(n) = 7 RETURN n')
+
+        assert a == b == "MATCH (n {hash: ?}) WHERE id(n) = ? RETURN n"
+
+    def test_literal_lists_and_parameters(self):
+        assert normalize_query("WHERE id(n) IN [1, 2, 3]") == "WHERE id(n) IN [?]"
+        assert normalize_query("WHERE n.sid = $sid") == "WHERE n.sid = $sid"
+
+
+class TestProfiling:
+    def test_uninstrumented_calls_outside_profiles_pass_through(self):
+        db = instrument_graph_db(_FakeGraphDb())
+
+        assert instrument_graph_db(db) is db
+        assert list(db.execute_and_fetch("RETURN 1")) == [{"n": 0}, {"n": 1}]
+
+    def test_nested_profiles_count_rows_on_exhaustion(self):
+        db = instrument_graph_db(_FakeGraphDb(rows=3))
+
+        with profile_queries("outer") as outer:
+            db.execute("CREATE (n)")
+            with profile_queries("inner") as inner:
+                rows = db.execute_and_fetch("MATCH (n) RETURN n")
+                assert inner.count == 0  # recorded when the rows are consumed
+                list(rows)
+
+        assert (inner.count, inner.rows) == (1, 3)
+        assert (outer.count, outer.rows) == (2, 3)
+
+    def test_budget_reports_hottest_shape(self):
+        db = instrument_graph_db(_FakeGraphDb())
+
+        with pytest.raises(QueryBudgetExceeded) as excinfo:
+            with query_budget(2, "lookups"):
+                for i in range(4):
+                    list(db.execute_and_fetch(f"MATCH (n) WHERE id(n) = {i} RETURN n"))
+
+        message = str(excinfo.value)
+        assert "lookups issued 4 graph queries (budget 2)" in message
+        assert "4x MATCH (n) WHERE id(n) = ? RETURN n" in message
+
+    def test_budget_within_limit(self):
+        db = instrument_graph_db(_FakeGraphDb())
+
+        with query_budget(1) as profile:
+            db.execute("RETURN 1")
+
+        assert profile.count == 1
+
+
+class TestConcernProfiling:
+    async def test_resolve_publishes_summary_artifact(self):
+        db = instrument_graph_db(_FakeGraphDb())
+        concern = _LookupConcern(db, lookups=3)
+
+        await concern.resolve()
+
+        summary = concern.report.artifacts["graph_queries"]
+        assert summary["count"] == 3
+        assert summary["rows"] == 6
+        assert summary["slowest"][0]["count"] == 3
+
+    async def test_summary_is_not_shown_to_the_model(self):
+        concern = _LookupConcern(instrument_graph_db(_FakeGraphDb()), lookups=1)
+        concern.report.artifacts["hash"] = "abc1234"
+
+        await concern.resolve()
+
+        artifacts = json.loads(str(concern.report))["artifacts"]
+        assert artifacts == {"hash": "abc1234"}
+
+    async def test_no_queries_no_artifact(self):
+        concern = _LookupConcern(instrument_graph_db(_FakeGraphDb()), lookups=0)
+
+        await concern.resolve()
+
+        assert "graph_queries" not in concern.report.artifacts
+
+    async def test_agent_scope_includes_tool_queries(self):
+        db = instrument_graph_db(_FakeGraphDb())
+        scope = agent_scope("analyst")
+
+        with scope:
+            await _LookupConcern(db, lookups=2).resolve()
+            db.execute("RETURN 1")
+
+        assert scope.queries.count == 3
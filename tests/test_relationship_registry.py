@@ -0,0 +1,93 @@
+"""Tests for the compiled relationship metadata registry."""
+
+from __future__ import annotations
+
+import pytest
+
+from dialectical_framework.graph.nodes.base_node import BaseNode
+from dialectical_framework.graph.nodes.cycle import Cycle
+from dialectical_framework.graph.nodes.estimation import Estimation
+from dialectical_framework.graph.nodes.wheel import Wheel
+from dialectical_framework.graph.relationship_manager import (
+    RelationshipManager, relationship_registry)
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+def _reflected_managers(cls: type) -> list[tuple[str, RelationshipManager]]:
+    found = []
+    for name in dir(cls):
+        if name.startswith("__"):
+            continue
+        attr = getattr(cls, name, None)
+        if isinstance(attr, RelationshipManager):
+            found.append((name, attr))
+    return sorted(found, key=lambda item: item[0])
+
+
+class TestLabels:
+    def test_label_union_includes_subclasses(self):
+        labels = relationship_registry.labels(Estimation.__name__)
+
+        assert labels[0] == "Estimation"
+        assert {"Feasibility", "CausalityProbability"} <= set(labels)
+
+    def test_unknown_class_falls_back_to_its_name(self):
+        assert relationship_registry.labels("NoSuchNode") == ("NoSuchNode",)
+
+
+class TestCompiledQueries:
+    def test_compiled_once_per_type_direction_target(self):
+        compiled = relationship_registry.compiled("HAS_WHEEL", "outgoing", "Wheel")
+
+        assert relationship_registry.compiled("HAS_WHEEL", "outgoing", "Wheel") is compiled
+        assert relationship_registry.compiled("HAS_WHEEL", "incoming", "Wheel") is not compiled
+        assert "(source)-[r:HAS_WHEEL]->(target:Wheel" in compiled.all_query
+        assert "ORDER BY target.committed_at ASC" in compiled.all_query
+        assert "count(*)" in compiled.count_query
+        assert compiled.disconnect_query.startswith(compiled.pair_match)
+
+    def test_bound_manager_uses_compiled_labels(self):
+        bound = Cycle().wheels
+
+        assert bound._resolved_target_labels() == relationship_registry.label_expr("Wheel")
+
+    def test_generic_relationship_class_is_reused(self):
+        first = relationship_registry.relationship_class("REGISTRY_PROBE")
+
+        assert relationship_registry.relationship_class("REGISTRY_PROBE") is first
+
+
+class TestDeclaredManagers:
+    def test_managers_match_reflection(self):
+        for cls in relationship_registry.subclasses(BaseNode):
+            assert list(relationship_registry.managers(cls)) == _reflected_managers(cls), cls
+
+    def test_inverse_depends_on_direction(self):
+        inverse = relationship_registry.inverse("Cycle", Wheel, "HAS_WHEEL", "outgoing")
+
+        assert inverse is not None
+        assert inverse[1] == "cycle"
+        assert relationship_registry.inverse("Cycle", Wheel, "HAS_WHEEL", "incoming") is None
+
+
+class TestInvalidation:
+    def test_defining_a_node_class_invalidates(self):
+        compiled = relationship_registry.compiled("HAS_WHEEL", "outgoing", "Wheel")
+        generation = relationship_registry.generation
+        assert relationship_registry.node_class("RegistryProbeNode") is None
+
+        class RegistryProbeNode(BaseNode, label="RegistryProbeNode"):
+            pass
+
+        assert relationship_registry.generation > generation
+        assert relationship_registry.node_class("RegistryProbeNode") is RegistryProbeNode
+        assert relationship_registry.compiled("HAS_WHEEL", "outgoing", "Wheel") is not compiled
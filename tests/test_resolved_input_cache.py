@@ -0,0 +1,178 @@
+"""Tests for the resolved-input cache and concurrent input resolution."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+from types import SimpleNamespace
+
+import pytest
+
+from dialectical_framework.graph.composite_input_resolver import \
+    CompositeInputResolver
+from dialectical_framework.graph.dialexity_input_resolver import \
+    DialexityInputResolver
+from dialectical_framework.graph.verbatim_input_resolver import \
+    VerbatimInputResolver
+from dialectical_framework.utils.input_context import input_context
+from dialectical_framework.utils.resolved_input_cache import \
+    ResolvedInputCache
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+def _input(content: str, hash: str, digest: str = None) -> SimpleNamespace:
+    return SimpleNamespace(content=content, hash=hash, digest=digest)
+
+
+def _data_uri(text: str, mime: str = "text/plain") -> str:
+    return f"data:{mime};base64,{base64.b64encode(text.encode()).decode()}"
+
+
+class _CountingVerbatim(VerbatimInputResolver):
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+        self._delay = delay
+
+    async def resolve(self, input_node):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self._delay)
+            return await super().resolve(input_node)
+        finally:
+            self.active -= 1
+
+
+def _resolver(verbatim, cache=None, max_concurrency=8) -> CompositeInputResolver:
+    return CompositeInputResolver(
+        verbatim_resolver=verbatim,
+        dialexity_resolver=DialexityInputResolver(),
+        cache=cache,
+        max_concurrency=max_concurrency,
+    )
+
+
+class TestResolvedInputCache:
+    def test_evicts_least_recently_used_by_size(self):
+        cache = ResolvedInputCache(max_bytes=10)
+        cache.set("a", "aaaa")
+        cache.set("b", "bbbb")
+        cache.get("a")
+        cache.set("c", "cccc")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "aaaa"
+        assert cache.size == 8
+
+    def test_oversized_values_are_not_cached(self):
+        cache = ResolvedInputCache(max_bytes=4)
+        cache.set("small", "ab")
+        cache.set("big", "x" * 10)
+
+        assert cache.get("big") is None
+        assert cache.get("small") == "ab"
+
+    async def test_concurrent_misses_share_one_resolution(self):
+        cache = ResolvedInputCache()
+        calls = 0
+
+        async def resolve():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "text"
+
+        results = await asyncio.gather(*(cache.get_or_resolve("k", resolve) for _ in range(5)))
+
+        assert results == ["text"] * 5
+        assert calls == 1
+
+
+class TestCompositeResolverCaching:
+    async def test_data_uri_is_decoded_once_per_input_hash(self):
+        verbatim = _CountingVerbatim()
+        resolver = _resolver(verbatim, cache=ResolvedInputCache())
+        node = _input(_data_uri("Hello"), hash="h1")
+
+        first = await resolver.resolve(node)
+        second = await resolver.resolve(_input(node.content, hash="h1"))
+
+        assert first == second == "Hello"
+        assert verbatim.calls == 1
+
+    async def test_native_parts_are_cached_separately(self):
+        resolver = _resolver(VerbatimInputResolver(), cache=ResolvedInputCache())
+        pdf = _input(_data_uri("%PDF-1.4", "application/pdf"), hash="pdf")
+
+        part = await resolver.resolve_native(pdf)
+
+        assert await resolver.resolve_native(pdf) is part
+        assert resolver._cache.stats()["entries"] == 1
+
+    async def test_dx_references_are_never_cached(self):
+        resolver = _resolver(VerbatimInputResolver(), cache=ResolvedInputCache())
+        calls = []
+
+        async def lookup(uri):
+            calls.append(uri)
+            return "node text"
+
+        resolver._dialexity.resolve = lookup
+        node = _input("dx://case-1/abc1234", hash="h1")
+
+        await resolver.resolve(node)
+        await resolver.resolve(node)
+
+        assert len(calls) == 2
+        assert resolver._cache.stats()["entries"] == 0
+
+    async def test_without_cache_every_call_resolves(self):
+        verbatim = _CountingVerbatim()
+        resolver = _resolver(verbatim)
+        node = _input("plain", hash="h1")
+
+        await resolver.resolve(node)
+        await resolver.resolve(node)
+
+        assert verbatim.calls == 2
+
+
+class TestConcurrentResolution:
+    async def test_resolve_all_is_bounded_and_ordered(self):
+        verbatim = _CountingVerbatim(delay=0.01)
+        resolver = _resolver(verbatim, max_concurrency=2)
+        inputs = [_input(f"text {i}", hash=f"h{i}") for i in range(6)]
+
+        combined = await resolver.resolve_all(inputs)
+
+        assert verbatim.peak == 2
+        assert combined.index("text 0") < combined.index("text 5")
+
+    async def test_input_context_resolves_only_undigested_inputs(self):
+        verbatim = _CountingVerbatim(delay=0.01)
+        resolver = _resolver(verbatim, cache=ResolvedInputCache())
+        inputs = [
+            _input("full one", hash="h1", digest="digest one"),
+            _input("full two", hash="h2"),
+            _input("full three", hash="h3"),
+        ]
+
+        context = await input_context(inputs, resolver)
+
+        assert verbatim.calls == 2
+        assert verbatim.peak == 2
+        assert [line for line in context.splitlines() if line and not line.startswith("<")] == [
+            "digest one", "full two", "full three"
+        ]
@@ -0,0 +1,123 @@
+"""Tests for Cycle/Wheel lookup keys (least rotation, rotation signature, layer key)."""
+
+from __future__ import annotations
+
+import itertools
+import random
+
+import pytest
+
+from dialectical_framework.dialectical_reasoning import DialecticalReasoning
+from dialectical_framework.graph.rotation_keys import (
+    edge_chain,
+    layer_key,
+    least_rotation,
+    rotation_signature,
+)
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+def _brute_force_least(seq: list[str]) -> list[str]:
+    return min(seq[i:] + seq[:i] for i in range(len(seq)))
+
+
+class TestLeastRotation:
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        for _ in range(2000):
+            seq = [rng.choice("abc") for _ in range(rng.randint(1, 9))]
+            k = least_rotation(seq)
+            assert seq[k:] + seq[:k] == _brute_force_least(seq), seq
+
+    def test_periodic_and_trivial_sequences(self):
+        assert least_rotation([]) == 0
+        assert least_rotation(["x"]) == 0
+        assert least_rotation(["b", "a", "b", "a"]) in (1, 3)
+
+
+class TestKeys:
+    def test_rotation_signature_is_rotation_invariant_only(self):
+        hashes = ["h3", "h1", "h4", "h2"]
+        signature = rotation_signature(hashes)
+
+        for i in range(len(hashes)):
+            assert rotation_signature(hashes[i:] + hashes[:i]) == signature
+        # Reversal is the opposite direction, not the same cycle
+        assert rotation_signature(list(reversed(hashes))) != signature
+        assert rotation_signature([]) == ""
+
+    def test_layer_key_ignores_order(self):
+        hashes = ["h3", "h1", "h2"]
+        keys = {layer_key(list(p)) for p in itertools.permutations(hashes)}
+
+        assert len(keys) == 1
+        assert layer_key(hashes) != layer_key(hashes[:2])
+        assert layer_key([]) == ""
+
+
+class TestEdgeChain:
+    def test_follows_edges_around_the_cycle(self):
+        sequence = edge_chain([["b", "c"], ["a", "b"], ["c", "a"]])
+        assert rotation_signature(sequence) == rotation_signature(["a", "b", "c"])
+
+    def test_broken_chains_are_rejected(self):
+        assert edge_chain([]) is None
+        assert edge_chain([["a", "b"], ["b", "c"]]) is None
+        assert edge_chain([["a", "b"], ["b", "a"], ["c", "d"], ["d", "c"]]) is None
+
+
+class _FakeGraphDb:
+    """Answers the backfill reads; records writes."""
+
+    def __init__(self, cycles: list[dict], wheels: list[dict]) -> None:
+        self.cycles = cycles
+        self.wheels = wheels
+        self.writes: list[tuple[str, dict]] = []
+
+    def execute_and_fetch(self, query, params=None):
+        return iter(self.cycles if "MATCH (n:Cycle)" in query else self.wheels)
+
+    def execute(self, query, params=None):
+        self.writes.append((query, params))
+
+
+class TestBackfill:
+    def test_keys_unmigrated_cycles_and_wheels(self):
+        db = _FakeGraphDb(
+            cycles=[{"id": 1, "ph": ["p2", "p1"]}],
+            wheels=[
+                {"id": 2, "ph": ["p1", "p2"], "edges": [["s1", "s2"], ["s2", "s1"]]},
+                {"id": 3, "ph": None, "edges": [["s1", "s2"], ["s2", "s1"]]},
+            ],
+        )
+
+        updated = DialecticalReasoning._backfill_rotation_keys(db)
+
+        assert updated == 2
+        (cycle_query, cycle_params), (wheel_query, wheel_params) = db.writes
+        assert "MATCH (n:Cycle)" in cycle_query and "MATCH (n:Wheel)" in wheel_query
+        assert cycle_params["rows"] == [{
+            "id": 1,
+            "layer_key": layer_key(["p1", "p2"]),
+            "rotation_signature": rotation_signature(["p2", "p1"]),
+        }]
+        assert wheel_params["rows"] == [{
+            "id": 2,
+            "layer_key": layer_key(["p1", "p2"]),
+            "rotation_signature": rotation_signature(["s1", "s2"]),
+        }]
+
+    def test_migrated_graph_is_left_alone(self):
+        db = _FakeGraphDb(cycles=[], wheels=[])
+
+        assert DialecticalReasoning._backfill_rotation_keys(db) == 0
+        assert db.writes == []
@@ -0,0 +1,147 @@
+"""Tests for single-pass structured answers through the terminal respond tool."""
+
+from __future__ import annotations
+
+import json
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from mirascope import llm
+from mirascope.llm import ToolCall
+from pydantic import BaseModel
+
+from dialectical_framework.agents.conversation_facilitator import \
+    ConversationFacilitator
+from dialectical_framework.agents.respond_tool import (RESPOND_TOOL_NAME,
+                                                       respond_tool)
+from dialectical_framework.agents.stream_events import ResponseComplete
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+class Answer(BaseModel):
+    message: str
+    confidence: float = 0.5
+
+
+@contextmanager
+def _settings(di_container, **overrides):
+    current = di_container.settings()
+    di_container.settings.override(current.model_copy(update=overrides))
+    try:
+        yield
+    finally:
+        di_container.settings.reset_override()
+        di_container.settings.override(current)
+
+
+class _Round:
+    """A tool-calling round: its messages end with the assistant turn."""
+
+    def __init__(self, tool_calls: list[ToolCall], history: list) -> None:
+        self.tool_calls = tool_calls
+        self.messages = [*history, llm.messages.assistant("", model_id=None, provider_id=None)]
+
+    async def chunk_stream(self):
+        return
+        yield
+
+
+def _respond_call(**args) -> ToolCall:
+    return ToolCall(id="r1", name=RESPOND_TOOL_NAME, args=json.dumps(args))
+
+
+class TestRespondTool:
+    def test_parameters_are_the_model_fields(self):
+        tool = respond_tool(Answer)
+        params = tool.parameters.model_dump(by_alias=True, exclude_none=True)
+
+        assert tool.name == RESPOND_TOOL_NAME
+        assert set(params["properties"]) == {"message", "confidence"}
+        assert params["required"] == ["message"]
+        assert respond_tool(Answer) is tool
+
+
+@pytest.mark.asyncio
+class TestSubmit:
+    async def test_respond_round_is_the_answer(self, di_container):
+        facilitator = ConversationFacilitator(tools=[lambda: None])
+        extraction = AsyncMock()
+        calls = []
+
+        async def call_with_tools(tools=None):
+            calls.append(tools)
+            return _Round([_respond_call(message="Done.", confidence=0.9)], facilitator._messages)
+
+        with _settings(di_container, single_pass_responses=True), patch.object(
+            facilitator, "_call_with_tools", side_effect=call_with_tools
+        ), patch.object(facilitator, "_call_with_response_model", extraction):
+            result = await facilitator.submit(Answer, "Hi")
+
+        assert result == Answer(message="Done.", confidence=0.9)
+        extraction.assert_not_called()
+        assert calls[0][-1] is respond_tool(Answer)
+        assert facilitator._messages[-1].role == "assistant"
+        assert facilitator._messages[-1].content[0].text == "Done."
+        assert facilitator.last_tool_calls == []
+
+    async def test_invalid_arguments_fall_back_to_extraction(self, di_container):
+        facilitator = ConversationFacilitator(tools=[lambda: None])
+        extraction = AsyncMock(return_value=Answer(message="Extracted."))
+
+        async def call_with_tools(tools=None):
+            return _Round([_respond_call(confidence="high")], facilitator._messages)
+
+        with _settings(di_container, single_pass_responses=True), patch.object(
+            facilitator, "_call_with_tools", side_effect=call_with_tools
+        ), patch.object(facilitator, "_call_with_response_model", extraction):
+            result = await facilitator.submit(Answer, "Hi")
+
+        assert result.message == "Extracted."
+        extraction.assert_awaited_once_with(Answer)
+        # The unanswered respond call is not left in the history
+        assert facilitator._messages[-1].role == "user"
+
+    async def test_respond_is_not_offered_by_default(self, di_container):
+        facilitator = ConversationFacilitator(tools=[lambda: None])
+        calls = []
+
+        async def call_with_tools(tools=None):
+            calls.append(tools)
+            return _Round([], facilitator._messages)
+
+        with _settings(di_container, single_pass_responses=False), patch.object(
+            facilitator, "_call_with_tools", side_effect=call_with_tools
+        ), patch.object(
+            facilitator, "_call_with_response_model", AsyncMock(return_value=Answer(message="x"))
+        ):
+            await facilitator.submit(Answer, "Hi")
+
+        assert calls == [facilitator._tools]
+
+
+@pytest.mark.asyncio
+class TestSubmitStream:
+    async def test_respond_round_completes_the_stream(self, di_container):
+        facilitator = ConversationFacilitator(tools=[lambda: None])
+        extraction = AsyncMock()
+
+        async def open_stream(max_attempts=3, tools=None):
+            return _Round([_respond_call(message="Streamed.")], facilitator._messages)
+
+        with _settings(di_container, single_pass_responses=True), patch.object(
+            facilitator, "_open_stream_with_retry", side_effect=open_stream
+        ), patch.object(facilitator, "_call_with_response_model", extraction):
+            events = [event async for event in facilitator.submit_stream(Answer, "Hi")]
+
+        assert events == [ResponseComplete(result=Answer(message="Streamed."))]
+        extraction.assert_not_called()
@@ -0,0 +1,132 @@
+"""Tests for the MinHash statement index behind deduplication candidates."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from dialectical_framework.concerns.statement_deduplication import (
+    IdeaMatchDto, StatementDeduplication)
+from dialectical_framework.concerns.statement_similarity import (
+    StatementIndexStore, StatementSimilarityIndex, shingles, signature,
+    similarity)
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+_WORDS = (
+    "trust control growth culture freedom order chaos speed quality cost "
+    "risk team market innovation stability budget"
+).split()
+
+
+def _vocabulary(n: int) -> list[dict]:
+    rng = random.Random(7)
+    return [
+        {
+            "hash": f"{i:07d}",
+            "statement": " ".join(rng.choice(_WORDS) for _ in range(6)),
+            "meaning": None,
+            "discarded": None,
+            "rationale": "",
+        }
+        for i in range(n)
+    ]
+
+
+class TestSignatures:
+    def test_signatures_are_stable_and_estimate_overlap(self):
+        a = signature(shingles("Growth requires a clear structure"))
+
+        assert a == signature(shingles("growth requires a clear structure!"))
+        assert similarity(a, signature(shingles("A clear structure is required for growth"))) > 0.3
+        assert similarity(a, signature(shingles("Speed beats quality in new markets"))) < 0.2
+
+    def test_meaning_contributes_taxonomy_levels(self):
+        features = shingles("x", "dx://taxonomy/System(General.v1)/Viability/Fidelity/Modeling")
+
+        assert "m:dx://taxonomy/System(General.v1)/Viability/Fidelity" in features
+        assert "m:dx://taxonomy/System(General.v1)/Viability/Fidelity/Modeling" in features
+
+
+class TestIndex:
+    def test_query_finds_paraphrase_among_many(self):
+        vocabulary = _vocabulary(500)
+        vocabulary.append({"hash": "target1", "statement": "Growth requires a clear organisational structure"})
+        index = StatementSimilarityIndex()
+        index.sync(vocabulary)
+
+        nearest = index.query("A clear organisational structure is required for growth", k=5)
+
+        assert len(nearest) == 5
+        assert nearest[0][0] == "target1"
+
+    def test_sync_is_incremental(self):
+        index = StatementSimilarityIndex()
+        vocabulary = _vocabulary(3)
+        index.sync(vocabulary)
+
+        index.sync(vocabulary[1:] + [{"hash": "new", "statement": "Fresh claim"}])
+
+        assert "0000000" not in index
+        assert "new" in index
+        assert len(index) == 3
+        assert all(h != "0000000" for h, _ in index.query("anything", k=10))
+
+    def test_small_index_backfills_to_k_and_respects_allowed(self):
+        index = StatementSimilarityIndex()
+        index.sync(_vocabulary(4))
+
+        nearest = index.query("zzz unrelated", k=3, allowed={"0000001", "0000002"})
+
+        assert {h for h, _ in nearest} == {"0000001", "0000002"}
+
+    def test_store_keeps_recent_sids(self):
+        store = StatementIndexStore(max_sids=2)
+        first = store.get("a")
+        store.get("b")
+        store.get("c")
+
+        assert store.get("c") is not None
+        assert store.get("a") is not first
+
+
+class _CapturingConversation:
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+
+    async def submit(self, response_model, user_content):
+        self.prompts.append(user_content)
+        return IdeaMatchDto(is_duplicate=False)
+
+
+class TestDeduplicationPrompt:
+    async def test_prompt_holds_top_k_nearest_not_the_first_hundred(self, di_container):
+        vocabulary = _vocabulary(300)
+        vocabulary.append({
+            "hash": "f" * 7,
+            "statement": "Growth requires a clear organisational structure",
+            "meaning": None,
+            "discarded": None,
+            "rationale": "",
+        })
+        deduplicator = StatementDeduplication()
+        conversation = deduplicator._conversation = _CapturingConversation()
+
+        await deduplicator.check_idea(
+            "A clear organisational structure is required for growth", vocabulary
+        )
+
+        (prompt,) = conversation.prompts
+        listed = [line for line in prompt.splitlines() if line.startswith("[")]
+        assert len(listed) == di_container.settings().dedup_top_k
+        assert listed[0].startswith("[fffffff]")
@@ -0,0 +1,236 @@
+"""Tests for concurrent execution of a round's tool calls."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+
+import pytest
+from mirascope import llm
+from mirascope.llm import AsyncToolkit, ToolCall
+
+from dialectical_framework.agents.conversation_facilitator import \
+    ConversationFacilitator
+from dialectical_framework.agents.orchestrator.tools.query_graph import (
+    QueryGraph, query_graph)
+from dialectical_framework.agents.stream_events import ToolResult, ToolStart
+from dialectical_framework.agents.tool_scheduler import (ToolClaim,
+                                                         ToolScheduler,
+                                                         tool_concurrency)
+from dialectical_framework.enums.tool_concurrency import ToolConcurrency
+from dialectical_framework.graph.graph_db_pool import AsyncGraphDb, GraphDbPool
+
+
+@pytest.fixture(autouse=True)
+def cleanup_graph_db():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_graph_data():
+    yield
+
+
+class _Recorder:
+    """Tools that record overlap and finish in a controlled order."""
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.peak = 0
+        self.log: list[str] = []
+        self.gates: dict[str, asyncio.Event] = {}
+
+    async def work(self, label: str) -> str:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        self.log.append(f"start {label}")
+        gate = self.gates.get(label)
+        if gate is not None:
+            await gate.wait()
+        else:
+            await asyncio.sleep(0.01)
+        self.log.append(f"end {label}")
+        self.running -= 1
+        return f"out {label}"
+
+
+def _toolkit(recorder: _Recorder) -> AsyncToolkit:
+    @tool_concurrency(ToolConcurrency.READ_ONLY)
+    @llm.tool
+    async def look(label: str) -> str:
+        """Read."""
+        return await recorder.work(label)
+
+    @tool_concurrency(ToolConcurrency.NODE_WRITE, key="node_hash")
+    @llm.tool
+    async def edit(label: str, node_hash: str) -> str:
+        """Write one node."""
+        return await recorder.work(label)
+
+    @llm.tool
+    async def rebuild(label: str) -> str:
+        """Undeclared: exclusive."""
+        return await recorder.work(label)
+
+    return AsyncToolkit(tools=[look, edit, rebuild])
+
+
+def _call(name: str, **args) -> ToolCall:
+    return ToolCall(id=f"{name}-{args['label']}", name=name, args=json.dumps(args))
+
+
+async def _run(scheduler: ToolScheduler, calls: list[ToolCall]) -> list:
+    return [event async for event in scheduler.run(calls)]
+
+
+class TestDeclarations:
+    def test_orchestrator_read_tools_are_read_only(self):
+        assert query_graph.concurrency is ToolConcurrency.READ_ONLY
+
+    def test_node_write_requires_a_key(self):
+        with pytest.raises(ValueError):
+            tool_concurrency(ToolConcurrency.NODE_WRITE)
+
+    def test_claims(self):
+        scheduler = ToolScheduler(_toolkit(_Recorder()), limit=4)
+
+        assert scheduler.claim(_call("rebuild", label="a")) == ToolClaim(ToolConcurrency.EXCLUSIVE)
+        assert scheduler.claim(_call("missing", label="a")) == ToolClaim(ToolConcurrency.EXCLUSIVE)
+        # One node named by prefixes of different lengths is one claim
+        assert (
+            scheduler.claim(_call("edit", label="a", node_hash="abc1234ffff"))
+            == scheduler.claim(_call("edit", label="b", node_hash="abc1234"))
+        )
+        assert scheduler.claim(
+            ToolCall(id="x", name="edit", args='{"label": "a"}')
+        ) == ToolClaim(ToolConcurrency.EXCLUSIVE)
+
+
+@pytest.mark.asyncio
+class TestScheduling:
+    async def test_reads_overlap_up_to_the_limit(self):
+        recorder = _Recorder()
+        scheduler = ToolScheduler(_toolkit(recorder), limit=2)
+
+        events = await _run(scheduler, [_call("look", label=str(i)) for i in range(5)])
+
+        assert recorder.peak == 2
+        assert sorted(e.index for e in events if e.finished) == [0, 1, 2, 3, 4]
+
+    async def test_exclusive_calls_are_barriers(self):
+        recorder = _Recorder()
+        scheduler = ToolScheduler(_toolkit(recorder), limit=4)
+
+        await _run(scheduler, [
+            _call("look", label="r1"),
+            _call("rebuild", label="w"),
+            _call("look", label="r2"),
+        ])
+
+        assert recorder.log == ["start r1", "end r1", "start w", "end w", "start r2", "end r2"]
+
+    async def test_writes_to_one_node_serialize_and_others_overlap(self):
+        recorder = _Recorder()
+        scheduler = ToolScheduler(_toolkit(recorder), limit=4)
+
+        await _run(scheduler, [
+            _call("edit", label="a1", node_hash="aaaaaaa"),
+            _call("edit", label="b", node_hash="bbbbbbb"),
+            _call("edit", label="a2", node_hash="aaaaaaa"),
+        ])
+
+        assert recorder.log.index("end a1") < recorder.log.index("start a2")
+        assert recorder.log.index("start b") < recorder.log.index("end a1")
+
+    async def test_events_follow_completion_not_call_order(self):
+        recorder = _Recorder()
+        recorder.gates["slow"] = asyncio.Event()
+        scheduler = ToolScheduler(_toolkit(recorder), limit=4)
+
+        seen = []
+        async for event in scheduler.run([_call("look", label="slow"), _call("look", label="fast")]):
+            seen.append((event.index, event.finished))
+            if event.index == 1 and event.finished:
+                recorder.gates["slow"].set()
+
+        assert seen.index((1, True)) < seen.index((0, True))
+        assert seen[-1] == (0, True)
+
+    async def test_calls_run_on_the_callers_loop(self):
+        loop = asyncio.get_running_loop()
+        loops = []
+
+        @tool_concurrency(ToolConcurrency.READ_ONLY)
+        @llm.tool
+        async def look(label: str) -> str:
+            """Read."""
+            loops.append(asyncio.get_running_loop())
+            return f"out {label}"
+
+        scheduler = ToolScheduler(AsyncToolkit(tools=[look]), limit=4)
+
+        events = await _run(scheduler, [_call("look", label="a"), _call("look", label="b")])
+
+        assert loops == [loop, loop]
+        outputs = {e.index: e.output.result for e in events if e.finished}
+        assert outputs == {0: "out a", 1: "out b"}
+
+
+class _ToolkitResponse:
+    """Response carrying a real toolkit, as mirascope's async responses do."""
+
+    def __init__(self, toolkit: AsyncToolkit, tool_calls: list[ToolCall]) -> None:
+        self.toolkit = toolkit
+        self.tool_calls = tool_calls
+
+
+@pytest.mark.asyncio
+class TestFacilitatorRound:
+    async def test_outputs_stay_in_call_order(self):
+        recorder = _Recorder()
+        recorder.gates["slow"] = asyncio.Event()
+        facilitator = ConversationFacilitator(tools=[lambda: None])
+        response = _ToolkitResponse(
+            _toolkit(recorder), [_call("look", label="slow"), _call("look", label="fast")]
+        )
+
+        outputs: list = []
+        events = []
+        async for event in facilitator._execute_tools(response, outputs):
+            events.append(event)
+            if isinstance(event, ToolResult) and "out fast" in event.raw_output:
+                recorder.gates["slow"].set()
+
+        assert [o.result for o in outputs] == ["out slow", "out fast"]
+        assert [type(e) for e in events] == [ToolStart, ToolStart, ToolResult, ToolResult]
+        assert "out fast" in events[2].raw_output
+        assert "out slow" in events[3].raw_output
+
+
+class _FakeDb:
+    """Pooled connection stand-in that records the thread each query ran on."""
+
+    _cached_connection = None
+    threads: list[str] = []
+
+    def execute_and_fetch(self, query, parameters=None):
+        _FakeDb.threads.append(threading.current_thread().name)
+        return iter([{"count": 3}])
+
+
+@pytest.mark.asyncio
+class TestReadOnlyToolGraphWork:
+    async def test_query_runs_on_a_pooled_connection(self, di_container):
+        adapter = AsyncGraphDb(GraphDbPool(connect=_FakeDb, size=1))
+        di_container.async_graph_db.override(adapter)
+        _FakeDb.threads = []
+        try:
+            result = await QueryGraph().resolve(cypher="MATCH (n) RETURN count(n) AS count")
+        finally:
+            di_container.async_graph_db.reset_override()
+            adapter.shutdown()
+
+        assert "count: 3" in result
+        assert len(_FakeDb.threads) == 1
+        assert _FakeDb.threads[0] != threading.current_thread().name
@@ -0,0 +1,119 @@
+"""
+Tests for Wheel.prefetch() — single-query subgraph loading.
+
+A prefetched wheel must expose exactly the same derived views (edges,
+perspectives, statements, segments, polar orientation) as the per-edge
+traversal it replaces.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from dialectical_framework.graph.nodes.case import Case
+from dialectical_framework.graph.nodes.cycle import Cycle
+from dialectical_framework.graph.nodes.transition import Transition
+from dialectical_framework.graph.nodes.wheel import Wheel
+from dialectical_framework.graph.repositories.node_repository import NodeRepository
+from dialectical_framework.graph.scope_context import scope
+from test_dialectical_context import _create_perspective_with_aspects
+
+
+def _new_sid() -> str:
+    case = Case()
+    case.commit()
+    assert case.sid is not None
+    return case.sid
+
+
+def _seed_two_pp_wheel() -> Wheel:
+    """Wheel over two perspectives: T1- → A2+ → A1- → T2+ → T1-."""
+    pp1 = _create_perspective_with_aspects(
+        thesis_text="Prefetch thesis 1",
+        antithesis_text="Prefetch antithesis 1",
+        t_plus_text="P1 T+", t_minus_text="P1 T-",
+        a_plus_text="P1 A+", a_minus_text="P1 A-",
+    )
+    pp2 = _create_perspective_with_aspects(
+        thesis_text="Prefetch thesis 2",
+        antithesis_text="Prefetch antithesis 2",
+        t_plus_text="P2 T+", t_minus_text="P2 T-",
+        a_plus_text="P2 A+", a_minus_text="P2 A-",
+    )
+
+    cycle = Cycle(intent="preset:balanced")
+    cycle.set_perspectives([pp1, pp2])
+    cycle.commit()
+
+    chain = [
+        pp1.t_minus.all()[0][0],
+        pp2.a_plus.all()[0][0],
+        pp1.a_minus.all()[0][0],
+        pp2.t_plus.all()[0][0],
+    ]
+
+    wheel = Wheel(intent="prefetch")
+    wheel.save()
+    for i, source in enumerate(chain):
+        target = chain[(i + 1) % len(chain)]
+        tr = Transition(nonce=f"prefetch_{i}")
+        tr.set_source(source).set_target(target)
+        tr.commit()
+        tr.cycle.connect(wheel)
+    cycle.wheels.connect(wheel)
+    wheel.commit()
+    return wheel
+
+
+def _reload(wheel: Wheel) -> Wheel:
+    fresh = NodeRepository().find_by_hash(wheel.hash)
+    assert isinstance(fresh, Wheel)
+    return fresh
+
+
+class TestWheelPrefetch:
+    def test_uncommitted_wheel_is_rejected(self):
+        with scope(_new_sid()):
+            wheel = Wheel(intent="draft")
+            wheel.save()
+            with pytest.raises(ValueError):
+                wheel.prefetch()
+
+    def test_prefetched_views_match_traversal(self):
+        with scope(_new_sid()):
+            wheel = _seed_two_pp_wheel()
+            plain = _reload(wheel)
+            prefetched = _reload(wheel).prefetch()
+
+            assert [e.hash for e in prefetched.edges] == [e.hash for e in plain.edges]
+            assert [pp.hash for pp in prefetched._perspectives] == [
+                pp.hash for pp in plain._perspectives
+            ]
+            assert [s.hash for s in prefetched.statements] == [
+                s.hash for s in plain.statements
+            ]
+            assert prefetched.polarity_count == plain.polarity_count == 2
+            assert [
+                (seg._perspective.hash, seg._side) for seg in prefetched.segments
+            ] == [(seg._perspective.hash, seg._side) for seg in plain.segments]
+            assert [
+                (p._perspective.hash, p._polarity) for p in prefetched.polar_segments
+            ] == [(p._perspective.hash, p._polarity) for p in plain.polar_segments]
+            assert prefetched._format_edges("spiral") == plain._format_edges("spiral")
+
+    def test_prefetch_serves_edges_without_queries(self, monkeypatch):
+        with scope(_new_sid()):
+            wheel = _reload(_seed_two_pp_wheel()).prefetch()
+
+            def _fail(*args, **kwargs):
+                raise AssertionError("prefetched wheel hit the graph")
+
+            monkeypatch.setattr(type(wheel._edges), "all", _fail, raising=False)
+            from dialectical_framework.graph.repositories.perspective_repository import (
+                PerspectiveRepository,
+            )
+            monkeypatch.setattr(PerspectiveRepository, "find_by_statement", _fail)
+
+            assert len(wheel.edges) == 4
+            assert len(wheel.statements) == 4
+            assert wheel.polarity_count == 2